@@ -90,6 +90,17 @@ def run_pyinstaller() -> None:
     print(f"Bundle size: {total_size / (1024 * 1024):.1f} MB")
 
 
+def compile_bundled_data() -> None:
+    """Refresh resources/data/bundled_data.pickle so the bundle ships a current archive."""
+    print("Compiling bundled data archive")
+    result = subprocess.run(
+        [sys.executable, str(ROOT / "scripts" / "compile_bundled_data.py")], cwd=str(ROOT)
+    )
+    if result.returncode != 0:
+        print("ERROR: Compiling bundled data failed!")
+        sys.exit(1)
+
+
 def run_nsis() -> None:
     """Run NSIS to create the installer."""
     print("\n" + "=" * 60)
@@ -178,6 +189,7 @@ def main() -> None:
 
     if not args.skip_pyinstaller:
         _write_version_module(APP_VERSION)
+        compile_bundled_data()
         run_pyinstaller()
     else:
         print("Skipping PyInstaller (--skip-pyinstaller)")
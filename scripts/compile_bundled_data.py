@@ -0,0 +1,79 @@
+"""Precompile the bundled JSON data files into resources/data/bundled_data.pickle.
+
+Run after editing any file below src/open_garden_planner/resources/data (the
+installer build runs it too). A stale archive is never wrong — the app falls
+back to parsing the edited JSON — but it stops saving any time.
+
+Usage:
+    python scripts/compile_bundled_data.py              # write the archive
+    python scripts/compile_bundled_data.py --benchmark  # and time both paths
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from open_garden_planner.services.bundled_data import (  # noqa: E402
+    DATA_DIR,
+    compile_bundled_data,
+    load_bundled_json,
+    reset_bundled_data_cache,
+)
+
+
+def _time_per_round(load, rounds: int = 200) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        load()
+    return (time.perf_counter() - started) / rounds
+
+
+def benchmark() -> None:
+    """Print the time to load every bundled file: JSON vs. the archive."""
+    paths = sorted(DATA_DIR.rglob("*.json"))
+
+    def from_json() -> None:
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                json.load(f)
+
+    def from_archive() -> None:
+        for path in paths:
+            load_bundled_json(path)
+
+    reset_bundled_data_cache()
+    started = time.perf_counter()
+    from_archive()  # first call also reads the archive itself
+    first = time.perf_counter() - started
+    json_s, archive_s = _time_per_round(from_json), _time_per_round(from_archive)
+    print(f"  {len(paths)} files")
+    print(f"  json.load:       {json_s * 1e3:6.2f} ms")
+    print(f"  archive:         {archive_s * 1e3:6.2f} ms ({json_s / archive_s:.1f}x)")
+    print(f"  archive (first): {first * 1e3:6.2f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--benchmark", action="store_true", help="time JSON vs. archive loads")
+    args = parser.parse_args()
+
+    try:
+        target = compile_bundled_data()
+    except (OSError, json.JSONDecodeError) as exc:
+        print(f"ERROR compiling bundled data: {exc}")
+        return 1
+    print(f"  {target.relative_to(DATA_DIR.parent.parent.parent.parent)} "
+          f"({target.stat().st_size // 1024} KiB)")
+    if args.benchmark:
+        benchmark()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,28 +5,31 @@ open in Open Garden Planner. See Package D / epic #237. This spike (US-D1.1)
 exposes a single read tool over MCP streamable-HTTP.
 
 ``AgentApiServer``/``build_server`` are imported lazily so merely importing this
-package never pulls in ``mcp``/``uvicorn``.
+package never pulls in ``mcp``/``uvicorn``; the pydantic schema models (and
+the helpers built on them) likewise load on first access, so the main window
+can create its ``MainThreadBridge`` at startup without importing pydantic.
 """
 
 from __future__ import annotations
 
+from importlib import import_module
 from typing import TYPE_CHECKING, Any
 
 from open_garden_planner.agent_api.bridge import MainThreadBridge
-from open_garden_planner.agent_api.diagnostics import diagnostics_from_records
-from open_garden_planner.agent_api.mapping import plan_summary_from_snapshot
 from open_garden_planner.agent_api.providers import AgentProviders
-from open_garden_planner.agent_api.schema import (
-    Diagnostic,
-    ExportResult,
-    Measurement,
-    ObjectDetail,
-    ObjectRef,
-    PlanSummary,
-    RenderMeta,
-)
 
 if TYPE_CHECKING:
+    from open_garden_planner.agent_api.diagnostics import diagnostics_from_records
+    from open_garden_planner.agent_api.mapping import plan_summary_from_snapshot
+    from open_garden_planner.agent_api.schema import (
+        Diagnostic,
+        ExportResult,
+        Measurement,
+        ObjectDetail,
+        ObjectRef,
+        PlanSummary,
+        RenderMeta,
+    )
     from open_garden_planner.agent_api.server import (
         AgentApiServer,
         PortInUseError,
@@ -50,13 +53,25 @@ __all__ = [
     "plan_summary_from_snapshot",
 ]
 
-_LAZY = {"AgentApiServer", "PortInUseError", "build_server"}
+_LAZY = {
+    "AgentApiServer": "server",
+    "PortInUseError": "server",
+    "build_server": "server",
+    "Diagnostic": "schema",
+    "ExportResult": "schema",
+    "Measurement": "schema",
+    "ObjectDetail": "schema",
+    "ObjectRef": "schema",
+    "PlanSummary": "schema",
+    "RenderMeta": "schema",
+    "diagnostics_from_records": "diagnostics",
+    "plan_summary_from_snapshot": "mapping",
+}
 
 
 def __getattr__(name: str) -> Any:
-    """Lazily expose server symbols without forcing ``mcp``/``uvicorn`` at import."""
-    if name in _LAZY:
-        from open_garden_planner.agent_api import server as _server
-
-        return getattr(_server, name)
+    """Lazily expose server and schema symbols (``mcp``/``uvicorn``/pydantic)."""
+    module = _LAZY.get(name)
+    if module is not None:
+        return getattr(import_module(f"{__name__}.{module}"), name)
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
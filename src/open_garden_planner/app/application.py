@@ -37,7 +37,7 @@ from open_garden_planner.services.companion_planting_service import (
     BENEFICIAL,
     CompanionPlantingService,
 )
-from open_garden_planner.services.export_service import ExportService
+from open_garden_planner.services.export_service import ExportCancelled, ExportService
 from open_garden_planner.services.soil_service import (
     ALL_PARAMS,
     PARAM_K,
@@ -52,15 +52,10 @@ from open_garden_planner.ui.canvas.canvas_view import CanvasView
 from open_garden_planner.ui.icons import get_icon, get_pixmap
 from open_garden_planner.ui.panels import (
     CompanionPanel,
-    ConstraintsPanel,
     CropRotationPanel,
-    JournalPanel,
     LayersPanel,
-    PestOverviewPanel,
     PlantDatabasePanel,
-    PlantSearchPanel,
     PropertiesPanel,
-    SmartSymbolsPanel,
 )
 from open_garden_planner.ui.theme import (
     ThemeMode,
@@ -68,14 +63,11 @@ from open_garden_planner.ui.theme import (
     set_text_role,
     theme_color,
 )
-from open_garden_planner.ui.views.harvest_view import HarvestView
-from open_garden_planner.ui.views.planting_calendar_view import PlantingCalendarView
-from open_garden_planner.ui.views.seed_inventory_view import SeedInventoryView
-from open_garden_planner.ui.views.tasks_view import TasksView
 from open_garden_planner.ui.widgets import (
     CategoryToolbar,
     CollapsiblePanel,
     ConstraintToolbar,
+    DeferredWidget,
     MainToolbar,
     SidebarController,
     TaskReminderBar,
@@ -84,10 +76,27 @@ from open_garden_planner.ui.widgets import (
 
 if TYPE_CHECKING:
     from open_garden_planner.agent_api import AgentApiServer
+    from open_garden_planner.ui.canvas.sun_heatmap import SunHeatmapController
+    from open_garden_planner.ui.panels import (
+        ConstraintsPanel,
+        JournalPanel,
+        PestOverviewPanel,
+        PlantSearchPanel,
+        SmartSymbolsPanel,
+    )
+    from open_garden_planner.ui.views.harvest_view import HarvestView
+    from open_garden_planner.ui.views.planting_calendar_view import PlantingCalendarView
+    from open_garden_planner.ui.views.seed_inventory_view import SeedInventoryView
+    from open_garden_planner.ui.views.tasks_view import TasksView
 
 logger = logging.getLogger(__name__)
 
 
+def _refresh_view(view: Any) -> None:
+    """DeferredWidget refresh hook for the dashboard tabs and sidebar lists."""
+    view.refresh()
+
+
 def _records_equivalent(a: object, b: object) -> bool:
     """True iff two SoilTestRecord instances match field-by-field, ignoring id and date.
 
@@ -1384,7 +1393,7 @@ class GardenPlannerApp(QMainWindow):
         # Disable when API key not configured; explain why in both status bar
         # and tooltip (QMenu defaults to NOT showing action tooltips, so we
         # turn them on with ``setToolTipsVisible`` below).
-        from open_garden_planner.services.google_maps_service import (  # noqa: PLC0415
+        from open_garden_planner.services.google_maps_key import (  # noqa: PLC0415
             has_api_key as _has_maps_key,
         )
         if not _has_maps_key():
@@ -2320,6 +2329,17 @@ class GardenPlannerApp(QMainWindow):
 
         self._minimap = MinimapWidget(self.canvas_view, self.canvas_scene)
 
+        # Plant sprites of a freshly opened plan render on worker threads;
+        # items paint a placeholder disc until theirs lands.
+        from open_garden_planner.ui.canvas.sprite_prerender import SpritePrerenderer
+
+        self._sprite_prerenderer = SpritePrerenderer(self)
+
+        # PDF reports render from a plan snapshot in a worker process.
+        self._pdf_report_job = None
+        # DXF imports parse on a worker thread.
+        self._dxf_import_worker = None
+
         # ── Sun & shade simulation (US-E3) ─────────────────────────────
         from open_garden_planner.ui.canvas.sun_shadow_controller import (
             SunShadowController,
@@ -2335,6 +2355,7 @@ class GardenPlannerApp(QMainWindow):
         self.addToolBar(self._sun_toolbar)
         self._sun_toolbar.setVisible(False)
         self._sun_toolbar.datetime_changed.connect(self._on_sun_sim_datetime)
+        self._sun_toolbar.animation_toggled.connect(self._on_sun_animation_toggled)
         # Keep the menu action + controller in sync with any visibility change
         # that does not come from the action itself — today that is
         # _enforce_toolbar_visibility() at startup. (It used to be Qt's built-in
@@ -2348,14 +2369,10 @@ class GardenPlannerApp(QMainWindow):
         )
 
         # ── Hours-of-sun heatmap (US-E4) — recompute on demand only ────────
-        from open_garden_planner.ui.canvas.sun_heatmap import SunHeatmapController
-
-        self._sun_heatmap = SunHeatmapController(
-            self.canvas_scene, lambda: self._project_manager.location, self
-        )
-        self._sun_heatmap.finished.connect(self._on_heatmap_finished)
+        # The controller (and numpy with it) is created on first use.
+        self._sun_heatmap_controller: SunHeatmapController | None = None
         self._sun_toolbar.heatmap_requested.connect(self._on_heatmap_requested)
-        self._sun_toolbar.heatmap_cleared.connect(self._sun_heatmap.clear)
+        self._sun_toolbar.heatmap_cleared.connect(self._clear_sun_heatmap)
 
         # ── 3D view (US-E6) — created lazily on first menu use ────────────
         self._view3d_window = None  # the currently-OPEN viewer, or None
@@ -2385,8 +2402,9 @@ class GardenPlannerApp(QMainWindow):
         # can_undo/redo_changed booleans (which fire redundantly and exist only to
         # drive the toolbar Undo/Redo actions, wired at 1086-1087). A single
         # stack_changed wiring collapses the former three-signal fan-out to one
-        # refresh per command and gives correct undo/redo coverage.
-        cmd_mgr.stack_changed.connect(self.constraints_panel.refresh)
+        # refresh per command and gives correct undo/redo coverage. The
+        # connection is live only while the panel is open (DeferredWidget.watch).
+        self._constraints_content.watch(cmd_mgr.stack_changed)
 
         # Sun shadow overlay: metadata-only edits (e.g. an object-height change)
         # repaint nothing, so scene.changed alone would miss them — stack_changed
@@ -2423,32 +2441,34 @@ class GardenPlannerApp(QMainWindow):
         self._tab_widget.addTab(splitter, self.tr("Garden Plan"))
         self._set_tab_icon(splitter, "tab_plan")
 
+        # Tabs 1-4 are DeferredWidgets: each view is built the first time its
+        # tab is shown, and is refreshed once whenever it is shown again rather
+        # than tracking every plan edit while hidden. Use the *_view properties
+        # (they build on demand) and the *_tab placeholders for tab indices.
+
         # Tab 1: Planting Calendar (US-8.5)
-        self.calendar_view = PlantingCalendarView(self.canvas_scene, self._project_manager)
-        self.calendar_view.set_soil_service(self._soil_service)
-        self._tab_widget.addTab(self.calendar_view, self.tr("Planting Calendar"))
-        self._set_tab_icon(self.calendar_view, "tab_calendar")
+        self._calendar_tab = DeferredWidget(self._build_calendar_view, _refresh_view)
+        self._tab_widget.addTab(self._calendar_tab, self.tr("Planting Calendar"))
+        self._set_tab_icon(self._calendar_tab, "tab_calendar")
 
         # Tab 2: Seed Inventory (US-9.4)
-        self.seed_inventory_view = SeedInventoryView()
-        self.seed_inventory_view.set_canvas_scene(self.canvas_scene)  # US-9.6: bidirectional links
-        self._tab_widget.addTab(self.seed_inventory_view, self.tr("Seed Inventory"))
-        self._set_tab_icon(self.seed_inventory_view, "seedling")
+        self._seed_inventory_tab = DeferredWidget(
+            self._build_seed_inventory_view, _refresh_view
+        )
+        self._tab_widget.addTab(self._seed_inventory_tab, self.tr("Seed Inventory"))
+        self._set_tab_icon(self._seed_inventory_tab, "seedling")
 
         # Tab: Tasks (US-C2, #188) — appended last (keeps existing tab indices,
         # the frost-badge setCurrentIndex(1), and Ctrl+1..4 valid).
-        self.tasks_view = TasksView(
-            self.canvas_scene, self._project_manager, cmd_mgr
-        )
-        self.tasks_view.set_soil_service(self._soil_service)
-        self._tab_widget.addTab(self.tasks_view, self.tr("Tasks"))
-        self._set_tab_icon(self.tasks_view, "tab_tasks")
+        self._tasks_tab = DeferredWidget(self._build_tasks_view, _refresh_view)
+        self._tab_widget.addTab(self._tasks_tab, self.tr("Tasks"))
+        self._set_tab_icon(self._tasks_tab, "tab_tasks")
 
         # Tab: Harvest (US-C1, #188) — appended last (keeps existing tab indices
         # and the frost-badge setCurrentIndex(1) valid).
-        self.harvest_view = HarvestView(self.canvas_scene, self._project_manager)
-        self._tab_widget.addTab(self.harvest_view, self.tr("Harvest"))
-        self._set_tab_icon(self.harvest_view, "tab_harvest")
+        self._harvest_tab = DeferredWidget(self._build_harvest_view, _refresh_view)
+        self._tab_widget.addTab(self._harvest_tab, self.tr("Harvest"))
+        self._set_tab_icon(self._harvest_tab, "tab_harvest")
 
         # Keyboard shortcuts: Ctrl+1 / Ctrl+2 / Ctrl+3 to switch tabs.
         # (The "Layout / Paper Space" tab was dropped — `pdf_report_service`
@@ -2467,21 +2487,17 @@ class GardenPlannerApp(QMainWindow):
         tab2_shortcut.triggered.connect(lambda: self._tab_widget.setCurrentIndex(2))
         self.addAction(tab2_shortcut)
 
-        # Refresh calendar on tab switch and on canvas/location/status changes.
-        # The calendar now uses a debounced schedule_refresh() that skips work
-        # while its tab is hidden, so it can be wired to stack_changed (covers
-        # undo/redo) without the heavyweight churn #210 flagged — fixes #225.
-        self._tab_widget.currentChanged.connect(self._on_tab_changed)
-        self._project_manager.location_changed.connect(
-            lambda _: self.calendar_view.schedule_refresh()
-        )
-        self._project_manager.task_states_changed.connect(
-            lambda _: self.calendar_view.schedule_refresh()
-        )
-        cmd_mgr.stack_changed.connect(lambda: self.calendar_view.schedule_refresh())
-
-        # Highlight plant on canvas when user clicks a dashboard task (US-8.6)
-        self.calendar_view.highlight_species.connect(self._on_highlight_species)
+        # Refresh the calendar on canvas/location/status changes while its tab
+        # is showing; a hidden calendar is refreshed once when it is shown
+        # again. schedule_refresh() is debounced, so it can be wired to
+        # stack_changed (covers undo/redo) without the heavyweight churn #210
+        # flagged — fixes #225.
+        for signal in (
+            self._project_manager.location_changed,
+            self._project_manager.task_states_changed,
+            cmd_mgr.stack_changed,
+        ):
+            self._calendar_tab.watch(signal, lambda: self.calendar_view.schedule_refresh())
 
         # Frost alert badge in the tab-bar corner (US-12.2)
         self._frost_badge = QPushButton(self._tab_widget)
@@ -2491,7 +2507,6 @@ class GardenPlannerApp(QMainWindow):
         self._frost_badge.clicked.connect(lambda: self._tab_widget.setCurrentIndex(1))
         self._frost_badge.hide()
         self._tab_widget.setCornerWidget(self._frost_badge, Qt.Corner.TopRightCorner)
-        self.calendar_view.frost_alert_ready.connect(self._on_frost_alert_ready)
 
         # ── Tasks tab wiring (US-C2, #188) ───────────────────────────────────
         # Ctrl shortcut for the Tasks tab — resolve its index (don't hardcode).
@@ -2499,47 +2514,33 @@ class GardenPlannerApp(QMainWindow):
         tasks_shortcut.setShortcut(QKeySequence("Ctrl+4"))  # contiguous 1–5 (#310)
         tasks_shortcut.triggered.connect(
             lambda: self._tab_widget.setCurrentIndex(
-                self._tab_widget.indexOf(self.tasks_view)
+                self._tab_widget.indexOf(self._tasks_tab)
             )
         )
         self.addAction(tasks_shortcut)
-        # Reuse the calendar's single weather fetch for frost tasks.
-        self.calendar_view.frost_alerts_ready.connect(self.tasks_view.set_frost_alerts)
         # Regenerate (debounced inside the view) on relevant project changes.
-        self._project_manager.location_changed.connect(
-            lambda _: self.tasks_view.schedule_refresh()
-        )
-        self._project_manager.task_states_changed.connect(
-            lambda _: self.tasks_view.schedule_refresh()
-        )
-        self._project_manager.manual_tasks_changed.connect(
-            lambda _: self.tasks_view.schedule_refresh()
-        )
-        self._project_manager.succession_plans_changed.connect(
-            lambda _: self.tasks_view.schedule_refresh()
-        )
-        cmd_mgr.command_executed.connect(lambda _: self.tasks_view.schedule_refresh())
-        # Task → canvas navigation.
-        self.tasks_view.navigate_to_bed.connect(self._on_navigate_to_bed)
-        self.tasks_view.navigate_to_species.connect(self._on_highlight_species)
-        self.tasks_view.navigate_to_items.connect(self._on_navigate_to_items)
+        for signal in (
+            self._project_manager.location_changed,
+            self._project_manager.task_states_changed,
+            self._project_manager.manual_tasks_changed,
+            self._project_manager.succession_plans_changed,
+            cmd_mgr.command_executed,
+        ):
+            self._tasks_tab.watch(signal, lambda: self.tasks_view.schedule_refresh())
 
         # ── Harvest tab wiring (US-C1, #188) ─────────────────────────────────
         harvest_shortcut = QAction(self)
         harvest_shortcut.setShortcut(QKeySequence("Ctrl+5"))  # contiguous 1–5 (#310)
         harvest_shortcut.triggered.connect(
             lambda: self._tab_widget.setCurrentIndex(
-                self._tab_widget.indexOf(self.harvest_view)
+                self._tab_widget.indexOf(self._harvest_tab)
             )
         )
         self.addAction(harvest_shortcut)
         # Regenerate (debounced inside the view) when harvest logs change or on
-        # undo/redo (stack_changed); skipped while the tab is hidden.
-        self._project_manager.harvest_logs_changed.connect(
-            lambda _: self.harvest_view.schedule_refresh()
-        )
-        cmd_mgr.stack_changed.connect(lambda: self.harvest_view.schedule_refresh())
-        self.harvest_view.navigate_to_species.connect(self._on_highlight_species)
+        # undo/redo (stack_changed) while the tab is showing.
+        for signal in (self._project_manager.harvest_logs_changed, cmd_mgr.stack_changed):
+            self._harvest_tab.watch(signal, lambda: self.harvest_view.schedule_refresh())
 
         # Wrap tab widget + update/reminder bars in a container
         self._update_bar = UpdateBar(self)
@@ -2548,7 +2549,7 @@ class GardenPlannerApp(QMainWindow):
         self._task_reminder_bar = TaskReminderBar(self)
         self._task_reminder_bar.show_tasks_requested.connect(
             lambda: self._tab_widget.setCurrentIndex(
-                self._tab_widget.indexOf(self.tasks_view)
+                self._tab_widget.indexOf(self._tasks_tab)
             )
         )
         container = QWidget()
@@ -2627,20 +2628,13 @@ class GardenPlannerApp(QMainWindow):
         layers_panel = CollapsiblePanel(self.tr("Layers"), self.layers_panel, expanded=True)
         sidebar_layout.addWidget(layers_panel)
 
-        # 4. Constraints Panel (collapsible) - manage distance constraints
-        self.constraints_panel = ConstraintsPanel()
-        self.constraints_panel.set_scene(self.canvas_scene)
-        self.constraints_panel.constraint_selected.connect(
-            self._on_constraint_selected
-        )
-        self.constraints_panel.constraint_edit_requested.connect(
-            self._on_constraint_edit_requested
-        )
-        self.constraints_panel.constraint_delete_requested.connect(
-            self._on_constraint_delete_requested
-        )
+        # 4. Constraints Panel (collapsible) - manage distance constraints.
+        # Like the Find Plants, pest overview, journal and Smart Symbols panels
+        # below, it is built on first open (DeferredWidget) and, once built,
+        # refreshed only while open — and once on every re-open.
+        self._constraints_content = DeferredWidget(self._build_constraints_panel, _refresh_view)
         constraints_collapsible = CollapsiblePanel(
-            self.tr("Constraints"), self.constraints_panel, expanded=False
+            self.tr("Constraints"), self._constraints_content, expanded=False
         )
         # Delete-all button lives in the header, aligned with individual row × buttons
         from PyQt6.QtWidgets import QToolButton
@@ -2649,13 +2643,14 @@ class GardenPlannerApp(QMainWindow):
         delete_all_btn.setFixedSize(20, 20)
         delete_all_btn.setToolTip(self.tr("Delete all constraints"))
         delete_all_btn.setObjectName("constraintsDeleteAllBtn")
-        delete_all_btn.clicked.connect(self.constraints_panel.delete_all)
+        delete_all_btn.clicked.connect(self._on_delete_all_constraints)
         constraints_collapsible.add_header_widget(delete_all_btn)
         sidebar_layout.addWidget(constraints_collapsible)
 
         # 5. Plant Search Panel (collapsible) - for finding plants in the project
-        self.plant_search_panel = PlantSearchPanel()
-        self.plant_search_panel.set_canvas_scene(self.canvas_scene)
+        self._plant_search_content = DeferredWidget(
+            self._build_plant_search_panel, lambda panel: panel.refresh_plant_list()
+        )
 
         # Debounce timer so the very chatty QGraphicsScene.changed signal does not
         # rebuild the whole list on every repaint (which tore down rows mid-click and
@@ -2665,10 +2660,15 @@ class GardenPlannerApp(QMainWindow):
         self._plant_search_refresh_timer.setInterval(150)
         self._plant_search_refresh_timer.timeout.connect(self._refresh_plant_search_panel)
 
-        # Connect scene changes to (debounced) refresh of the plant list
-        self.canvas_scene.changed.connect(self._on_scene_changed_for_plant_search)
+        # Connect scene changes to (debounced) refresh of the plant list — only
+        # while the panel is open; a re-opened panel refreshes once.
+        self._plant_search_content.watch(
+            self.canvas_scene.changed, self._on_scene_changed_for_plant_search
+        )
 
-        plant_search_collapsible = CollapsiblePanel(self.tr("Find Plants"), self.plant_search_panel, expanded=False)
+        plant_search_collapsible = CollapsiblePanel(
+            self.tr("Find Plants"), self._plant_search_content, expanded=False
+        )
         sidebar_layout.addWidget(plant_search_collapsible)
 
         # 6. Plant Details Panel (collapsible) - only shown when a plant is selected
@@ -2698,33 +2698,35 @@ class GardenPlannerApp(QMainWindow):
         sidebar_layout.addWidget(self.crop_rotation_collapsible)
 
         # 9. Active Pest/Disease overview (US-12.7)
-        self.pest_overview_panel = PestOverviewPanel()
-        self.pest_overview_panel.item_activated.connect(
-            self._on_pest_log_requested
+        self._pest_overview_content = DeferredWidget(
+            self._build_pest_overview_panel, self._rebuild_pest_overview
         )
         self.pest_overview_collapsible = CollapsiblePanel(
             self.tr("Active Pest/Disease Issues"),
-            self.pest_overview_panel,
+            self._pest_overview_content,
             expanded=True,
         )
         sidebar_layout.addWidget(self.pest_overview_collapsible)
 
         # 10. Garden journal (US-12.9) — map-linked notes browser
-        self.journal_panel = JournalPanel()
-        self.journal_panel.note_activated.connect(self._on_journal_note_activated)
+        self._journal_content = DeferredWidget(
+            self._build_journal_panel,
+            lambda panel: panel.refresh(self._project_manager.garden_journal_notes),
+        )
         self.journal_collapsible = CollapsiblePanel(
             self.tr("Garden Journal"),
-            self.journal_panel,
+            self._journal_content,
             expanded=False,
         )
         sidebar_layout.addWidget(self.journal_collapsible)
 
         # 11. Smart Symbols library (US-C4) — parametric blocks
-        self.smart_symbols_panel = SmartSymbolsPanel()
-        self.smart_symbols_panel.symbol_selected.connect(self._on_smart_symbol_selected)
+        self._smart_symbols_content = DeferredWidget(
+            self._build_smart_symbols_panel, lambda _panel: None
+        )
         self.smart_symbols_collapsible = CollapsiblePanel(
             self.tr("Smart Symbols"),
-            self.smart_symbols_panel,
+            self._smart_symbols_content,
             expanded=False,
         )
         sidebar_layout.addWidget(self.smart_symbols_collapsible)
@@ -2771,6 +2773,75 @@ class GardenPlannerApp(QMainWindow):
 
         sidebar_layout.addWidget(self._sidebar_controller)
 
+    # ── Sidebar panels built on first open (DeferredWidget) ────────────────
+
+    @property
+    def constraints_panel(self) -> "ConstraintsPanel":
+        """The Constraints panel (built on first access)."""
+        return self._constraints_content.widget()
+
+    @property
+    def plant_search_panel(self) -> "PlantSearchPanel":
+        """The Find Plants panel (built on first access)."""
+        return self._plant_search_content.widget()
+
+    @property
+    def pest_overview_panel(self) -> "PestOverviewPanel":
+        """The Active Pest/Disease Issues panel (built on first access)."""
+        return self._pest_overview_content.widget()
+
+    @property
+    def journal_panel(self) -> "JournalPanel":
+        """The Garden Journal panel (built on first access)."""
+        return self._journal_content.widget()
+
+    @property
+    def smart_symbols_panel(self) -> "SmartSymbolsPanel":
+        """The Smart Symbols panel (built on first access)."""
+        return self._smart_symbols_content.widget()
+
+    def _build_constraints_panel(self) -> "ConstraintsPanel":
+        from open_garden_planner.ui.panels import ConstraintsPanel  # noqa: PLC0415
+
+        panel = ConstraintsPanel()
+        panel.set_scene(self.canvas_scene)
+        panel.constraint_selected.connect(self._on_constraint_selected)
+        panel.constraint_edit_requested.connect(self._on_constraint_edit_requested)
+        panel.constraint_delete_requested.connect(self._on_constraint_delete_requested)
+        panel.refresh()
+        return panel
+
+    def _build_plant_search_panel(self) -> "PlantSearchPanel":
+        from open_garden_planner.ui.panels import PlantSearchPanel  # noqa: PLC0415
+
+        panel = PlantSearchPanel()
+        panel.set_canvas_scene(self.canvas_scene)
+        panel.refresh_plant_list()
+        return panel
+
+    def _build_pest_overview_panel(self) -> "PestOverviewPanel":
+        from open_garden_planner.ui.panels import PestOverviewPanel  # noqa: PLC0415
+
+        panel = PestOverviewPanel()
+        panel.item_activated.connect(self._on_pest_log_requested)
+        self._rebuild_pest_overview(panel)
+        return panel
+
+    def _build_journal_panel(self) -> "JournalPanel":
+        from open_garden_planner.ui.panels import JournalPanel  # noqa: PLC0415
+
+        panel = JournalPanel()
+        panel.note_activated.connect(self._on_journal_note_activated)
+        panel.refresh(self._project_manager.garden_journal_notes)
+        return panel
+
+    def _build_smart_symbols_panel(self) -> "SmartSymbolsPanel":
+        from open_garden_planner.ui.panels import SmartSymbolsPanel  # noqa: PLC0415
+
+        panel = SmartSymbolsPanel()
+        panel.symbol_selected.connect(self._on_smart_symbol_selected)
+        return panel
+
     def _startup_sequence(self) -> None:
         """Handle startup sequence: recovery check, then welcome dialog."""
         # First check for recovery files
@@ -2968,8 +3039,9 @@ class GardenPlannerApp(QMainWindow):
             self._project_manager.load(self.canvas_scene, recovery_path)
             self.canvas_view.command_manager.clear()
             self.canvas_view.fit_in_view()
+            self._prerender_plant_sprites()
             self.canvas_scene.update_dimension_lines()
-            self.constraints_panel.refresh()
+            self._constraints_content.invalidate()
 
             # Mark as dirty since this is a recovery (not a normal saved project)
             self._project_manager.mark_dirty()
@@ -3021,6 +3093,10 @@ class GardenPlannerApp(QMainWindow):
                 ):
                     show_panel = True
 
+            # A bar that is hidden and stays hidden shows nothing: skip the
+            # rebuild (the common case — an edit with no plant selected).
+            if not show_panel and self.plant_details_collapsible.isHidden():
+                return
             # Update content BEFORE auto-pinning so the open animation tweens to
             # the real content height (else it grows to the stale height, then
             # snaps when the clamp releases — US-226). The bar is hidden entirely
@@ -3042,6 +3118,8 @@ class GardenPlannerApp(QMainWindow):
                 plant_item = selected_items[0]
                 show_panel = bool(self._companion_species_name(plant_item))
 
+            if not show_panel and self.companion_collapsible.isHidden():
+                return
             # Content before pin so the open animation tweens to the real height;
             # the bar is hidden when there is no companion data to show.
             self.companion_panel.update_for_plant(plant_item)
@@ -3064,6 +3142,8 @@ class GardenPlannerApp(QMainWindow):
                     area_id = str(item.item_id)
                     show_panel = True
 
+            if not show_panel and self.crop_rotation_collapsible.isHidden():
+                return
             # Content before pin so the open animation tweens to the real height;
             # the bar is hidden when no bed is selected.
             self.crop_rotation_panel.update_for_bed(bed_item, area_id)
@@ -3151,7 +3231,7 @@ class GardenPlannerApp(QMainWindow):
 
             # Clear undo history and reset project state
             self.canvas_view.command_manager.clear()
-            self.constraints_panel.refresh()
+            self._constraints_content.invalidate()
             self._project_manager.new_project()
 
             # Apply optional garden year chosen in dialog
@@ -3235,6 +3315,14 @@ class GardenPlannerApp(QMainWindow):
         if file_path:
             self._open_project_file(file_path)
 
+    def _prerender_plant_sprites(self) -> None:
+        """Queue the loaded plan's plant sprites at the current zoom for the
+        background workers (ui/canvas/sprite_prerender.py)."""
+        view = self.canvas_view
+        self._sprite_prerenderer.prerender_scene(
+            self.canvas_scene, view.zoom_factor * view.devicePixelRatioF()
+        )
+
     def _open_project_file(self, file_path: str) -> None:
         """Open a project file.
 
@@ -3248,13 +3336,14 @@ class GardenPlannerApp(QMainWindow):
             self._project_manager.load(self.canvas_scene, Path(file_path))
             self.canvas_view.command_manager.clear()
             self.canvas_view.fit_in_view()
+            self._prerender_plant_sprites()
             self.layers_panel.set_layers(self.canvas_scene.layers)
             self.canvas_scene.update_dimension_lines()
-            self.constraints_panel.refresh()
+            self._constraints_content.invalidate()
             self.statusBar().showMessage(self.tr("Opened: {path}").format(path=file_path))
             # Load compare overlay if previous seasons are linked (US-10.7)
             self._load_compare_overlay_from_previous_season()
-            self.tasks_view.refresh()
+            self._tasks_tab.invalidate()
             # Deferred: when opened from the modal Welcome dialog, a bar shown
             # now would sit behind it. singleShot(0) runs after it closes.
             QTimer.singleShot(0, self._check_overdue_tasks)
@@ -3362,6 +3451,8 @@ class GardenPlannerApp(QMainWindow):
 
     def _on_export_png(self) -> None:
         """Handle Export as PNG action."""
+        from PyQt6.QtWidgets import QProgressDialog
+
         from open_garden_planner.ui.dialogs.export_dialog import ExportPngDialog
 
         # Show export dialog
@@ -3391,15 +3482,33 @@ class GardenPlannerApp(QMainWindow):
         if file_path.suffix.lower() != ".png":
             file_path = file_path.with_suffix(".png")
 
+        # Large exports render in bands; the dialog reports them and lets
+        # the user stop a long 300 DPI export.
+        progress = QProgressDialog(
+            self.tr("Exporting PNG…"), self.tr("Cancel"), 0, 100, self
+        )
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)
+
+        def on_progress(current: int, total: int) -> None:
+            if total > 0:
+                progress.setValue(int(current / total * 100))
+
         try:
             ExportService.export_to_png(
                 self.canvas_scene,
                 file_path,
                 dpi=dialog.selected_dpi,
                 output_width_cm=dialog.selected_output_width_cm,
+                progress_callback=on_progress,
+                cancel_check=progress.wasCanceled,
             )
+            progress.setValue(100)
             self.statusBar().showMessage(self.tr("Exported: {path}").format(path=file_path))
+        except ExportCancelled:
+            self.statusBar().showMessage(self.tr("Export cancelled"), 3000)
         except Exception as e:
+            progress.cancel()
             QMessageBox.critical(self, self.tr("Export Error"), self.tr("Failed to export PNG:\n{error}").format(error=e))
 
     def _on_export_svg(self) -> None:
@@ -3505,10 +3614,15 @@ class GardenPlannerApp(QMainWindow):
 
     def _on_import_dxf(self) -> None:
         """Handle Import DXF action."""
-        from open_garden_planner.core.commands import CreateItemsCommand
-        from open_garden_planner.services.dxf_service import DxfImportService
+        from PyQt6.QtWidgets import QProgressDialog
+
+        from open_garden_planner.services.dxf_service import DxfImportWorker
         from open_garden_planner.ui.dialogs.dxf_import_dialog import DxfImportDialog
 
+        if self._dxf_import_worker is not None:
+            self.statusBar().showMessage(self.tr("A DXF import is already running"))
+            return
+
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             self.tr("Import DXF"),
@@ -3522,19 +3636,78 @@ class GardenPlannerApp(QMainWindow):
         if dialog.exec() != DxfImportDialog.DialogCode.Accepted:
             return
 
-        try:
-            result = DxfImportService.import_file(
-                self.canvas_scene,
-                file_path,
-                scale_factor=dialog.scale_factor,
-                selected_layers=dialog.selected_layers,
-            )
-        except Exception as e:
+        # Parsing and geometry conversion run on a worker thread; only the
+        # final item creation (_finish_dxf_import) happens here.
+        worker = DxfImportWorker(
+            file_path,
+            scale_factor=dialog.scale_factor,
+            selected_layers=dialog.selected_layers,
+            merge_lines=dialog.merge_lines,
+            simplify_tolerance=dialog.simplify_tolerance,
+            parent=self,
+        )
+        progress = QProgressDialog(
+            self.tr("Reading DXF…"), self.tr("Cancel"), 0, 1000, self
+        )
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(300)
+        progress.setValue(0)
+
+        def on_progress(read: int, size: int) -> None:
+            if size > 0:
+                progress.setValue(min(999, read * 1000 // size))
+
+        cancelled = False
+
+        def on_done() -> bool:
+            # False once cancelled: a result that raced the Cancel is dropped.
+            if cancelled:
+                return False
+            progress.deleteLater()
+            return True
+
+        def on_parsed(parsed: object) -> None:
+            if on_done():
+                self._finish_dxf_import(parsed)
+
+        def on_failed(error: str) -> None:
+            if not on_done():
+                return
             QMessageBox.critical(
-                self, self.tr("Import Error"), self.tr("Failed to import DXF:\n{error}").format(error=e)
+                self, self.tr("Import Error"), self.tr("Failed to import DXF:\n{error}").format(error=error)
             )
-            return
 
+        def on_canceled() -> None:
+            nonlocal cancelled
+            if cancelled:
+                return
+            cancelled = True
+            progress.deleteLater()
+            # No join here: the parse stops at its next cancel check, and
+            # on_finished releases the worker once the thread has ended.
+            worker.cancel()
+            self.statusBar().showMessage(self.tr("DXF import cancelled"))
+
+        def on_finished() -> None:
+            # Kept until now so closeEvent can still join a winding-down parse.
+            if self._dxf_import_worker is worker:
+                self._dxf_import_worker = None
+            worker.deleteLater()
+
+        worker.finished.connect(on_finished)
+        worker.progress.connect(on_progress)
+        worker.parsed.connect(on_parsed)
+        worker.failed.connect(on_failed)
+        progress.canceled.connect(on_canceled)
+        self._dxf_import_worker = worker
+        worker.start()
+
+    def _finish_dxf_import(self, parsed: object) -> None:
+        """Create the items of a parsed DXF in one undoable batch."""
+        from open_garden_planner.core.commands import CreateItemsCommand
+        from open_garden_planner.services.dxf_service import DxfImportService
+
+        result = DxfImportService.build_items(self.canvas_scene, parsed)
         if not result.items:
             QMessageBox.information(
                 self,
@@ -3584,12 +3757,14 @@ class GardenPlannerApp(QMainWindow):
         """Handle Export PDF Report action."""
         from PyQt6.QtWidgets import QProgressDialog
 
-        from open_garden_planner.services.pdf_report_service import (
-            PdfReportOptions,
-            PdfReportService,
-        )
+        from open_garden_planner.services.pdf_report_process import PdfReportJob
+        from open_garden_planner.services.pdf_report_service import PdfReportOptions
         from open_garden_planner.ui.dialogs.pdf_report_dialog import PdfReportDialog
 
+        if self._pdf_report_job is not None:
+            self.statusBar().showMessage(self.tr("A PDF report is already being generated"))
+            return
+
         dialog = PdfReportDialog(
             project_name=self._project_manager.project_name,
             parent=self,
@@ -3635,28 +3810,53 @@ class GardenPlannerApp(QMainWindow):
             author=dialog.author,
         )
 
+        # The report renders from a snapshot in a worker process, so the
+        # dialog is not modal: the plan stays editable meanwhile.
+        job = PdfReportJob(
+            self._project_manager.snapshot_dict(self.canvas_scene), opts, file_path_obj, self
+        )
         progress = QProgressDialog(
             self.tr("Generating PDF…"), self.tr("Cancel"), 0, 100, self
         )
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setWindowModality(Qt.WindowModality.NonModal)
         progress.setMinimumDuration(500)
+        progress.setValue(0)
 
         def on_progress(current: int, total: int) -> None:
             if total > 0:
                 progress.setValue(int(current / total * 100))
 
-        try:
-            PdfReportService.generate(self.canvas_scene, opts, file_path_obj, on_progress)
-            progress.setValue(100)
+        def on_finished(pages: int) -> None:
+            self._pdf_report_job = None
+            progress.deleteLater()
+            logger.debug("PDF report: %d pages written by the report process", pages)
             self.statusBar().showMessage(self.tr("Exported: {path}").format(path=file_path_obj))
-        except Exception as e:
-            progress.cancel()
+            job.deleteLater()
+
+        def on_failed(error: str) -> None:
+            self._pdf_report_job = None
+            progress.deleteLater()
+            job.deleteLater()
             QMessageBox.critical(
                 self,
                 self.tr("Export Error"),
-                self.tr("Failed to export PDF report:\n{error}").format(error=e),
+                self.tr("Failed to export PDF report:\n{error}").format(error=error),
             )
 
+        def on_canceled() -> None:
+            if self._pdf_report_job is job:
+                self._pdf_report_job = None
+                job.cancel()
+                job.deleteLater()
+            progress.deleteLater()
+
+        job.progress.connect(on_progress)
+        job.finished.connect(on_finished)
+        job.failed.connect(on_failed)
+        progress.canceled.connect(on_canceled)
+        self._pdf_report_job = job
+        job.start()
+
     def _confirm_discard_changes(self) -> bool:
         """Ask user to save if there are unsaved changes.
 
@@ -3692,9 +3892,16 @@ class GardenPlannerApp(QMainWindow):
         if self._confirm_discard_changes():
             # Stop the Agent API server first, while the scene/bridge still exist.
             self._stop_agent_api()
-            # Join a running heatmap worker — a QThread destroyed while
-            # running aborts the process (the #230 class).
-            self._sun_heatmap.shutdown()
+            # Join a running heatmap / shadow-frame worker — a QThread
+            # destroyed while running aborts the process (the #230 class).
+            if self._sun_heatmap_controller is not None:
+                self._sun_heatmap_controller.shutdown()
+            self._sun_controller.shutdown()
+            self._sprite_prerenderer.shutdown()
+            if self._pdf_report_job is not None:
+                self._pdf_report_job.shutdown()
+            if self._dxf_import_worker is not None:
+                self._dxf_import_worker.shutdown()
             # Close any open/pending 3D viewer so the app can actually quit —
             # a visible parentless top-level Qt3DWindow keeps the process alive
             # under Qt's default quitOnLastWindowClosed. Hide (not delete): the
@@ -3901,7 +4108,7 @@ class GardenPlannerApp(QMainWindow):
         else:
             self._sun_toolbar.stop_animation()
             self._sun_controller.set_enabled(False)
-            self._sun_heatmap.clear()
+            self._clear_sun_heatmap()
             self._sun_toolbar.set_heatmap_active(False)
 
     def _on_sun_sim_datetime(self, dt) -> None:
@@ -3910,12 +4117,19 @@ class GardenPlannerApp(QMainWindow):
         self._sun_controller.set_sim_datetime(dt)
         # A daily heatmap goes stale when the DATE changes; a time-of-day
         # change leaves it valid (it aggregates the whole day).
+        heatmap = self._sun_heatmap_controller
         if (
-            self._sun_heatmap.heatmap_visible()
-            and self._sun_heatmap.computed_day != dt.date()
+            heatmap is not None
+            and heatmap.heatmap_visible()
+            and heatmap.computed_day != dt.date()
         ):
-            self._sun_heatmap.clear()
+            heatmap.clear()
             self._sun_toolbar.set_heatmap_active(False)
+        if (
+            self._sun_toolbar.is_animating
+            and self._sun_controller.sim_datetime_utc.date() != previous_date
+        ):
+            self._on_sun_animation_toggled(True)  # re-precompute the new day
         if self._view3d_window is not None:
             # US-E8: growth is keyed on the DATE, so rebuild the 3D geometry
             # only when the day actually changes — the toolbar scrubs through
@@ -3924,6 +4138,38 @@ class GardenPlannerApp(QMainWindow):
                 self._refresh_3d_view()
             self._apply_sun_to_3d()  # 3D light follows the sim time (US-E6)
 
+    def _on_sun_animation_toggled(self, animating: bool) -> None:
+        """Animate on: precompute the shown day's shadow frames in the
+        background so playback ticks are cache lookups; off: stop."""
+        from open_garden_planner.ui.canvas.sun_shadow_controller import day_instants
+
+        if animating:
+            self._sun_controller.start_playback(
+                day_instants(
+                    self._sun_toolbar.current_datetime_local(),
+                    self._sun_toolbar.animate_step_minutes,
+                )
+            )
+        else:
+            self._sun_controller.stop_playback()
+
+    @property
+    def _sun_heatmap(self) -> "SunHeatmapController":
+        """The hours-of-sun heatmap controller, created on first use."""
+        if self._sun_heatmap_controller is None:
+            from open_garden_planner.ui.canvas.sun_heatmap import SunHeatmapController
+
+            heatmap = SunHeatmapController(
+                self.canvas_scene, lambda: self._project_manager.location, self
+            )
+            heatmap.finished.connect(self._on_heatmap_finished)
+            self._sun_heatmap_controller = heatmap
+        return self._sun_heatmap_controller
+
+    def _clear_sun_heatmap(self) -> None:
+        if self._sun_heatmap_controller is not None:
+            self._sun_heatmap_controller.clear()
+
     def _on_heatmap_requested(self) -> None:
         """Heatmap button checked — compute the shown date's hours of sun."""
         day = self._sun_toolbar.current_datetime_local().date()
@@ -3962,7 +4208,7 @@ class GardenPlannerApp(QMainWindow):
         else:
             self._sun_toolbar.stop_animation()
             self._sun_controller.set_enabled(False)
-            self._sun_heatmap.clear()
+            self._clear_sun_heatmap()
             self._sun_toolbar.set_heatmap_active(False)
 
     def _on_sun_state_changed(self, state: str) -> None:
@@ -4610,7 +4856,13 @@ class GardenPlannerApp(QMainWindow):
 
         cid = constraint_id if isinstance(constraint_id, UUID) else UUID(str(constraint_id))
         self.canvas_view._edit_constraint_distance(cid)
-        self.constraints_panel.refresh()
+        self._constraints_content.invalidate()
+
+    def _on_delete_all_constraints(self) -> None:
+        """Header × button: delete every constraint, open panel or not."""
+        panel = self.constraints_panel
+        panel.refresh()  # a collapsed panel's list is not kept current
+        panel.delete_all()
 
     def _on_constraint_delete_requested(self, constraint_id: object) -> None:
         """Handle constraint delete from constraints panel.
@@ -5177,7 +5429,7 @@ class GardenPlannerApp(QMainWindow):
     def _refresh_plant_search_panel(self) -> None:
         """Refresh the plant search panel (debounce timer slot)."""
         with contextlib.suppress(RuntimeError):
-            self.plant_search_panel.refresh_plant_list()
+            self._plant_search_content.invalidate()
 
     def _on_selection_changed(self) -> None:
         """Handle selection changes in the canvas scene."""
@@ -5749,7 +6001,7 @@ class GardenPlannerApp(QMainWindow):
         self.canvas_view.refresh_soil_mismatches()
         # Recompute seasonal reminder badges (US-12.10e).
         self.canvas_view.refresh_soil_badges()
-        self.calendar_view.refresh()
+        self._calendar_tab.invalidate()
 
     def _on_pest_log_requested(self, target_id: str, display_name: str) -> None:
         """Open PestLogDialog for a bed/plant (US-12.7)."""
@@ -6162,18 +6414,19 @@ class GardenPlannerApp(QMainWindow):
         scene.clearSelection()
         symbol.setSelected(True)
 
-    def _on_garden_journal_notes_changed(self, notes: object) -> None:
+    def _on_garden_journal_notes_changed(self, _notes: object) -> None:
         """Refresh the sidebar panel when notes change (added / edited / removed)."""
-        panel = getattr(self, "journal_panel", None)
-        if panel is None or not isinstance(notes, dict):
-            return
-        panel.refresh(notes)
+        content = getattr(self, "_journal_content", None)
+        if content is not None:
+            content.invalidate()
 
     def _refresh_pest_overview(self) -> None:
-        """Rebuild the Active Pest/Disease Issues panel (US-12.7)."""
-        panel = getattr(self, "pest_overview_panel", None)
-        if panel is None:
-            return
+        """Rebuild the Active Pest/Disease Issues panel (US-12.7) if it is open."""
+        content = getattr(self, "_pest_overview_content", None)
+        if content is not None:
+            content.invalidate()
+
+    def _rebuild_pest_overview(self, panel: "PestOverviewPanel") -> None:
         items_by_id: dict[str, str] = {}
         scene = (
             getattr(self.canvas_view, "_canvas_scene", None)
@@ -6415,16 +6668,77 @@ class GardenPlannerApp(QMainWindow):
         except RuntimeError:
             pass
 
-    def _on_tab_changed(self, index: int) -> None:
-        """Refresh tab views when they become active."""
-        if index == 1:
-            self.calendar_view.refresh()
-        elif index == 2:
-            self.seed_inventory_view.refresh()
-        elif index == self._tab_widget.indexOf(self.tasks_view):
-            self.tasks_view.refresh()
-        elif index == self._tab_widget.indexOf(self.harvest_view):
-            self.harvest_view.refresh()
+    # ── Dashboard tab views — built on first show (DeferredWidget) ──────────
+
+    @property
+    def calendar_view(self) -> "PlantingCalendarView":
+        """The Planting Calendar view (built on first access)."""
+        return self._calendar_tab.widget()
+
+    @property
+    def seed_inventory_view(self) -> "SeedInventoryView":
+        """The Seed Inventory view (built on first access)."""
+        return self._seed_inventory_tab.widget()
+
+    @property
+    def tasks_view(self) -> "TasksView":
+        """The Tasks view (built on first access)."""
+        return self._tasks_tab.widget()
+
+    @property
+    def harvest_view(self) -> "HarvestView":
+        """The Harvest view (built on first access)."""
+        return self._harvest_tab.widget()
+
+    def _build_calendar_view(self) -> "PlantingCalendarView":
+        from open_garden_planner.ui.views.planting_calendar_view import (  # noqa: PLC0415
+            PlantingCalendarView,
+        )
+
+        view = PlantingCalendarView(self.canvas_scene, self._project_manager)
+        view.set_soil_service(self._soil_service)
+        # Highlight plant on canvas when user clicks a dashboard task (US-8.6)
+        view.highlight_species.connect(self._on_highlight_species)
+        view.frost_alert_ready.connect(self._on_frost_alert_ready)
+        # Reuse the calendar's single weather fetch for frost tasks.
+        view.frost_alerts_ready.connect(self._on_calendar_frost_alerts)
+        return view
+
+    def _build_seed_inventory_view(self) -> "SeedInventoryView":
+        from open_garden_planner.ui.views.seed_inventory_view import (  # noqa: PLC0415
+            SeedInventoryView,
+        )
+
+        view = SeedInventoryView()
+        view.set_canvas_scene(self.canvas_scene)  # US-9.6: bidirectional links
+        return view
+
+    def _build_tasks_view(self) -> "TasksView":
+        from open_garden_planner.ui.views.tasks_view import TasksView  # noqa: PLC0415
+
+        view = TasksView(
+            self.canvas_scene, self._project_manager, self.canvas_view.command_manager
+        )
+        view.set_soil_service(self._soil_service)
+        if self._calendar_tab.is_built and (alerts := self.calendar_view.current_frost_alerts):
+            view.set_frost_alerts(alerts)
+        # Task → canvas navigation.
+        view.navigate_to_bed.connect(self._on_navigate_to_bed)
+        view.navigate_to_species.connect(self._on_highlight_species)
+        view.navigate_to_items.connect(self._on_navigate_to_items)
+        return view
+
+    def _build_harvest_view(self) -> "HarvestView":
+        from open_garden_planner.ui.views.harvest_view import HarvestView  # noqa: PLC0415
+
+        view = HarvestView(self.canvas_scene, self._project_manager)
+        view.navigate_to_species.connect(self._on_highlight_species)
+        return view
+
+    def _on_calendar_frost_alerts(self, alerts: list) -> None:
+        """Hand a fresh forecast's frost alerts to the Tasks view, if built."""
+        if self._tasks_tab.is_built:
+            self.tasks_view.set_frost_alerts(alerts)
 
     def _on_frost_alert_ready(self, count: int, max_severity: str) -> None:
         """Update the frost alert corner badge (themed icon, re-applied on
@@ -4,6 +4,11 @@ User projects (`.ogp` files) and exports must never default into the install
 directory: on Windows the installer wipes that directory on upgrade/uninstall,
 which destroyed user data (issue #199). These helpers resolve a safe, writable
 location under the OS Documents folder instead.
+
+The on-disk caches (plant API answers, weather and frost data, rendered
+sprites, satellite tiles) all live under one cache directory,
+``get_cache_dir()``; the test suite points it at a temporary directory with
+``set_cache_dir()``.
 """
 
 from pathlib import Path
@@ -13,6 +18,27 @@ from PyQt6.QtCore import QStandardPaths
 #: Sub-folder created under the user's Documents directory for OGP projects.
 PROJECTS_FOLDER_NAME = "Open Garden Planner"
 
+_cache_dir_override: Path | None = None
+
+
+def get_cache_dir() -> Path:
+    """Return the root of the app's on-disk caches (``<AppLocalData>``)."""
+    if _cache_dir_override is not None:
+        return _cache_dir_override
+    return Path(
+        QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppLocalDataLocation)
+    )
+
+
+def set_cache_dir(path: Path | None) -> None:
+    """Point every on-disk cache at ``path`` (None: the default location).
+
+    Each cache accessor compares its store's location with
+    ``get_cache_dir()`` and opens a new store once it moved.
+    """
+    global _cache_dir_override
+    _cache_dir_override = path
+
 
 def get_documents_dir() -> Path:
     """Return the OS Documents directory, falling back to ``~/Documents``."""
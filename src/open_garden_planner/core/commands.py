@@ -4,8 +4,10 @@ All modifications to the canvas are wrapped in commands that can be
 executed, undone, and redone.
 """
 
+import contextlib
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from contextlib import AbstractContextManager
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
@@ -189,6 +191,12 @@ def trigger_soil_mismatch_refresh(scene: QGraphicsScene) -> None:
             refresh()
 
 
+def bulk_update(scene: QGraphicsScene) -> AbstractContextManager[None]:
+    """``scene.bulk_update()`` on a CanvasScene, a no-op context elsewhere."""
+    begin = getattr(scene, "bulk_update", None)
+    return begin() if begin is not None else contextlib.nullcontext()
+
+
 def _auto_parent_plant(scene: QGraphicsScene, item: QGraphicsItem) -> None:
     """If *item* is a plant inside a bed, establish the parent-child link."""
     from open_garden_planner.core.plant_renderer import is_plant_type
@@ -305,19 +313,21 @@ class CreateItemsCommand(Command):
 
     def execute(self) -> None:
         """Add the items to the scene."""
-        for item in self._items:
-            if item.scene() is None:
-                self._scene.addItem(item)
-        for item in self._items:
-            _auto_parent_plant(self._scene, item)
+        with bulk_update(self._scene):
+            for item in self._items:
+                if item.scene() is None:
+                    self._scene.addItem(item)
+            for item in self._items:
+                _auto_parent_plant(self._scene, item)
 
     def undo(self) -> None:
         """Remove the items from the scene."""
-        for item in self._items:
-            _detach_from_parent(self._scene, item)
-        for item in self._items:
-            if item.scene() is not None:
-                self._scene.removeItem(item)
+        with bulk_update(self._scene):
+            for item in self._items:
+                _detach_from_parent(self._scene, item)
+            for item in self._items:
+                if item.scene() is not None:
+                    self._scene.removeItem(item)
 
 
 class DeleteItemsCommand(Command):
@@ -1050,9 +1060,10 @@ class LinearArrayCommand(Command):
 
     def execute(self) -> None:
         """Add items and constraints to the scene."""
-        for item in self._items:
-            if item.scene() is None:
-                self._scene.addItem(item)
+        with bulk_update(self._scene):
+            for item in self._items:
+                if item.scene() is None:
+                    self._scene.addItem(item)
         if self._graph and self._constraint_pairs:
             self._constraint_ids = []
             for anchor_a, anchor_b, dist in self._constraint_pairs:
@@ -1065,9 +1076,10 @@ class LinearArrayCommand(Command):
             for cid in reversed(self._constraint_ids):
                 self._graph.remove_constraint(cid)
         self._constraint_ids = []
-        for item in self._items:
-            if item.scene() is not None:
-                self._scene.removeItem(item)
+        with bulk_update(self._scene):
+            for item in self._items:
+                if item.scene() is not None:
+                    self._scene.removeItem(item)
 
 
 class GridArrayCommand(Command):
@@ -1107,9 +1119,10 @@ class GridArrayCommand(Command):
 
     def execute(self) -> None:
         """Add items and constraints to the scene."""
-        for item in self._items:
-            if item.scene() is None:
-                self._scene.addItem(item)
+        with bulk_update(self._scene):
+            for item in self._items:
+                if item.scene() is None:
+                    self._scene.addItem(item)
         if self._graph and self._constraint_pairs:
             self._constraint_ids = []
             for anchor_a, anchor_b, dist in self._constraint_pairs:
@@ -1122,9 +1135,10 @@ class GridArrayCommand(Command):
             for cid in reversed(self._constraint_ids):
                 self._graph.remove_constraint(cid)
         self._constraint_ids = []
-        for item in self._items:
-            if item.scene() is not None:
-                self._scene.removeItem(item)
+        with bulk_update(self._scene):
+            for item in self._items:
+                if item.scene() is not None:
+                    self._scene.removeItem(item)
 
 
 class CircularArrayCommand(Command):
@@ -1155,15 +1169,17 @@ class CircularArrayCommand(Command):
 
     def execute(self) -> None:
         """Add items to the scene."""
-        for item in self._items:
-            if item.scene() is None:
-                self._scene.addItem(item)
+        with bulk_update(self._scene):
+            for item in self._items:
+                if item.scene() is None:
+                    self._scene.addItem(item)
 
     def undo(self) -> None:
         """Remove items from the scene."""
-        for item in self._items:
-            if item.scene() is not None:
-                self._scene.removeItem(item)
+        with bulk_update(self._scene):
+            for item in self._items:
+                if item.scene() is not None:
+                    self._scene.removeItem(item)
 
 
 class MirrorItemsCommand(Command):
@@ -1624,11 +1640,7 @@ class DeleteLayerCommand(Command):
         """Move the layer's items to the replacement layer and remove it."""
         # Re-capture on every execute (incl. redo): the linear stack guarantees
         # the same items are back on this layer by the time a redo runs.
-        self._moved_items = [
-            item
-            for item in self._scene.items()
-            if getattr(item, "layer_id", None) == self._layer.id
-        ]
+        self._moved_items = self._scene.items_in_layer(self._layer.id)  # type: ignore[attr-defined]
         for item in self._moved_items:
             item.layer_id = self._replacement.id  # type: ignore[union-attr]
         layers = self._scene.layers  # type: ignore[attr-defined]
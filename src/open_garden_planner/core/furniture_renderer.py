@@ -11,6 +11,8 @@ from PyQt6.QtGui import QImage, QPainter, QPixmap
 from PyQt6.QtSvg import QSvgRenderer
 
 from .object_types import ObjectType
+from .sprite_cache import SpriteCache, mip_size
+from .sprite_disk_cache import disk_sprite_cache
 
 # Directories containing SVG files
 _FURNITURE_DIR = Path(__file__).parent.parent / "resources" / "objects" / "furniture"
@@ -113,11 +115,11 @@ FURNITURE_DEFAULT_DIMENSIONS: dict[ObjectType, tuple[float, float]] = {
 # Cache for QSvgRenderer instances (path -> renderer)
 _renderer_cache: dict[str, QSvgRenderer] = {}
 
-# Cache for rendered pixmaps (cache_key -> QPixmap)
-_pixmap_cache: dict[str, QPixmap] = {}
+# Byte budget for rendered furniture pixmaps (LRU, see core/sprite_cache.py)
+_PIXMAP_CACHE_MAX_BYTES = 32 * 1024 * 1024
 
-# Maximum pixmap cache entries before eviction
-_PIXMAP_CACHE_MAX = 200
+# Cache for rendered pixmaps (cache_key -> QPixmap)
+_pixmap_cache = SpriteCache(_PIXMAP_CACHE_MAX_BYTES)
 
 
 def is_furniture_type(object_type: ObjectType | None) -> bool:
@@ -186,6 +188,37 @@ def _get_renderer(svg_path: Path) -> QSvgRenderer | None:
     return renderer
 
 
+def _render_svg(svg_path: Path, w: int, h: int) -> QPixmap | None:
+    """A furniture SVG stretched into a w x h pixmap, from the on-disk
+    cache (``core/sprite_disk_cache``) or rasterized and written back."""
+    disk = disk_sprite_cache()
+    image = None if disk is None else disk.load(svg_path, w, h, "furniture")
+    if image is None:
+        renderer = _get_renderer(svg_path)
+        if renderer is None:
+            return None
+        image = _render_svg_image(renderer, w, h)
+        if disk is not None:
+            disk.store(svg_path, w, h, "furniture", image)
+    return QPixmap.fromImage(image)
+
+
+def _render_svg_image(renderer: QSvgRenderer, w: int, h: int) -> QImage:
+    """Rasterize a furniture SVG stretched into a w x h image."""
+    image = QImage(w, h, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+
+    # Render SVG into the full area
+    renderer.render(painter, QRectF(0, 0, w, h))
+
+    painter.end()
+    return image
+
+
 def render_furniture_pixmap(
     object_type: ObjectType,
     width: float,
@@ -193,7 +226,9 @@ def render_furniture_pixmap(
 ) -> QPixmap | None:
     """Render a furniture SVG to a QPixmap at the specified size.
 
-    Uses caching for performance.
+    Uses caching for performance. The canvas paints through
+    ``render_furniture_sprite`` instead; this exact-size variant serves
+    callers that need a specific pixel size.
 
     Args:
         object_type: The furniture ObjectType
@@ -207,42 +242,61 @@ def render_furniture_pixmap(
     if svg_path is None:
         return None
 
-    renderer = _get_renderer(svg_path)
-    if renderer is None:
-        return None
-
     # Calculate render size (use integer pixels, minimum 4)
     w = max(int(width), 4)
     h = max(int(height), 4)
 
-    # Build cache key
-    cache_key = f"{svg_path}:{w}:{h}"
+    cache_key = (str(svg_path), w, h)
+    cached = _pixmap_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    if cache_key in _pixmap_cache:
-        return _pixmap_cache[cache_key]
+    pixmap = _render_svg(svg_path, w, h)
+    if pixmap is not None:
+        _pixmap_cache.put(cache_key, pixmap)
+    return pixmap
 
-    # Evict cache if too large
-    if len(_pixmap_cache) >= _PIXMAP_CACHE_MAX:
-        _pixmap_cache.clear()
 
-    # Render SVG to QImage
-    image = QImage(w, h, QImage.Format.Format_ARGB32_Premultiplied)
-    image.fill(Qt.GlobalColor.transparent)
+def render_furniture_sprite(
+    object_type: ObjectType,
+    width_px: float,
+    height_px: float,
+) -> QPixmap | None:
+    """Furniture sprite at the mip level covering ``width_px`` x ``height_px``.
 
-    painter = QPainter(image)
-    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+    Each axis is rounded up to its own power of two (``core/sprite_cache``),
+    so resizing an item or zooming reuses the same pixmap until a level
+    boundary is crossed; callers scale it into their rect.
 
-    # Render SVG into the full area
-    renderer.render(painter, QRectF(0, 0, w, h))
+    Args:
+        object_type: The furniture ObjectType
+        width_px: On-screen width in device pixels
+        height_px: On-screen height in device pixels
 
-    painter.end()
+    Returns:
+        QPixmap with rendered furniture, or None if no SVG available
+    """
+    svg_path = get_furniture_svg_path(object_type)
+    if svg_path is None:
+        return None
+
+    w, h = mip_size(width_px), mip_size(height_px)
+    cache_key = ("mip", str(svg_path), w, h)
+    cached = _pixmap_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    pixmap = QPixmap.fromImage(image)
-    _pixmap_cache[cache_key] = pixmap
+    pixmap = _render_svg(svg_path, w, h)
+    if pixmap is not None:
+        _pixmap_cache.put(cache_key, pixmap)
     return pixmap
 
 
+def furniture_cache() -> SpriteCache:
+    """The shared furniture pixmap cache (hit/miss/eviction counters)."""
+    return _pixmap_cache
+
+
 def get_default_dimensions(object_type: ObjectType) -> tuple[float, float]:
     """Get the default dimensions (width, height) for a furniture type.
 
@@ -13,6 +13,10 @@ the cell whose centre is scene ``(x0 + (c+0.5)*cell, y0 + (r+0.5)*cell)``; row 0
 is the SOUTH edge (scene +y = North, ADR-002). ``iso_segments`` returns points in
 **grid coordinates** ``(col, row)`` (floats); the display layer maps them to
 scene cm with that same +0.5 cell-centre offset — no Y-flip here (§8.20).
+
+Every grid argument goes through ``np.asarray``, so the multi-resolution
+``AdaptiveHeatmap`` (which implements ``__array__``) is accepted wherever the
+uniform minutes array is.
 """
 
 from __future__ import annotations
@@ -20,6 +24,7 @@ from __future__ import annotations
 import math
 
 import numpy as np
+import numpy.typing as npt
 
 #: Cool→warm ramp control stops as ``(fraction, r, g, b, a)`` with fraction in
 #: [0, 1] = fewest→most sun. Alpha DECREASES with sun hours: deep shade is the
@@ -52,19 +57,20 @@ def build_sun_lut(n: int = 256) -> np.ndarray:
     return lut
 
 
-def sun_fraction(minutes: np.ndarray, daylight_minutes: float) -> np.ndarray:
+def sun_fraction(minutes: npt.ArrayLike, daylight_minutes: float) -> np.ndarray:
     """Normalize a sun-minutes grid to ``[0, 1]`` against the day's daylight.
 
     ``daylight_minutes`` is the full daylight duration for the shown date, so a
     cell sunny all day maps to 1.0 and the ramp uses full contrast. Guards
     ``daylight_minutes <= 0`` (polar night) as all-shade (zeros).
     """
+    minutes = np.asarray(minutes)
     if daylight_minutes <= 0:
         return np.zeros(minutes.shape, dtype=np.float32)
     return np.clip(minutes / daylight_minutes, 0.0, 1.0).astype(np.float32)
 
 
-def smooth_field(grid: np.ndarray, passes: int = 2) -> np.ndarray:
+def smooth_field(grid: npt.ArrayLike, passes: int = 2) -> np.ndarray:
     """Edge-padded 3-wide separable box blur, ``passes`` times (≈ Gaussian).
 
     Softens the hard 0→high shadow boundaries BEFORE contouring, so the
@@ -72,7 +78,7 @@ def smooth_field(grid: np.ndarray, passes: int = 2) -> np.ndarray:
     grid-aligned staircases. Contour-only: the ramp fill and the toy-case gates
     keep using the raw minutes.
     """
-    out = grid.astype(np.float32, copy=True)
+    out = np.array(grid, dtype=np.float32)
     for _ in range(max(0, passes)):
         padded = np.pad(out, ((1, 1), (0, 0)), mode="edge")
         out = (padded[:-2, :] + padded[1:-1, :] + padded[2:, :]) / 3.0
@@ -100,7 +106,7 @@ def _edge_point(
 Segment = tuple[tuple[float, float], tuple[float, float]]
 
 
-def iso_segments(grid: np.ndarray, threshold: float) -> list[Segment]:
+def iso_segments(grid: npt.ArrayLike, threshold: float) -> list[Segment]:
     """Marching-squares iso-line of ``threshold`` over ``grid``.
 
     Returns line segments as ``((x1, y1), (x2, y2))`` pairs in **grid**
@@ -110,6 +116,7 @@ def iso_segments(grid: np.ndarray, threshold: float) -> list[Segment]:
     Saddle cells (all four edges cross) are split into two segments with a
     fixed, consistent resolution.
     """
+    grid = np.asarray(grid)
     rows, cols = grid.shape
     if rows < 2 or cols < 2:
         return []
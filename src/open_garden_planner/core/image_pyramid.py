@@ -0,0 +1,194 @@
+"""Tiled multi-resolution pyramid of a large raster image.
+
+Background imagery (satellite mosaics, scanned site plans) used to be one
+full-resolution pixmap painted whole at every zoom level: a 6000² photo
+was uploaded and scaled in full even when the view showed a thumbnail of
+it. The pyramid instead describes the image as power-of-two *levels*
+(level ``L`` is the source halved ``L`` times) cut into ``TILE_PX`` square
+tiles. A painter asks for the level matching its scale and only the tiles
+that intersect the exposed rect; each tile is produced on demand from its
+level image, and level images are built lazily from the nearest finer level
+still in memory.
+
+Level images are themselves a bounded LRU (``MAX_RESIDENT_BYTES``): once a
+coarser level exists, the full-resolution source and levels no longer in
+use at the current zoom are dropped. A pyramid given a ``reload`` callable
+decodes the source again when a finer level is next needed; one without
+keeps level 0 resident, as it has no other copy of the pixels.
+
+Tiles are ``QImage``s — pixmap caching (and eviction) is the caller's
+business, see ``BackgroundImageItem``. Coordinates are always *source
+pixels* at level 0, so callers never deal with per-level scale.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+from collections import OrderedDict
+from collections.abc import Callable
+
+from PyQt6.QtCore import QRect, QRectF, Qt
+from PyQt6.QtGui import QImage
+
+#: Edge length of one tile, pixels at its own level.
+TILE_PX = 256
+
+#: Budget for the level images one pyramid keeps in memory (LRU). The most
+#: recently used level always stays, whatever its size.
+MAX_RESIDENT_BYTES = 32 * 1024 * 1024
+
+TileKey = tuple[int, int, int, int]  # pyramid id, level, column, row
+
+_ids = itertools.count(1)
+
+
+class ImagePyramid:
+    """Power-of-two levels of ``image``, addressed as tiles (see module doc)."""
+
+    def __init__(
+        self,
+        image: QImage,
+        tile_px: int = TILE_PX,
+        *,
+        reload: Callable[[], QImage] | None = None,
+        max_resident_bytes: int = MAX_RESIDENT_BYTES,
+    ) -> None:
+        """Initialize the pyramid.
+
+        Args:
+            image: The full-resolution source.
+            tile_px: Edge length of one tile.
+            reload: Decodes the source again after it was dropped. Without
+                it the source is never released.
+            max_resident_bytes: Budget for the level images kept in memory.
+        """
+        if image.isNull():
+            raise ValueError("Cannot build a pyramid from a null image")
+        self.id = next(_ids)
+        self.tile_px = tile_px
+        self.width = image.width()
+        self.height = image.height()
+        self._reload = reload
+        self._max_resident_bytes = max_resident_bytes
+        self._levels: OrderedDict[int, QImage] = OrderedDict({0: image})
+        #: Instrument: tiles cut so far (for tests and profiling).
+        self.tiles_built = 0
+        #: Instrument: times the source was decoded again.
+        self.reloads = 0
+
+    @property
+    def source(self) -> QImage:
+        """The full-resolution (level 0) image.
+
+        Reloaded for the caller if it was dropped; the reloaded copy is not
+        kept.
+        """
+        image = self._levels.get(0)
+        return image if image is not None else self._load_source()
+
+    @property
+    def resident_levels(self) -> list[int]:
+        """Levels whose images are currently in memory."""
+        return sorted(self._levels)
+
+    @property
+    def resident_bytes(self) -> int:
+        return sum(image.sizeInBytes() for image in self._levels.values())
+
+    @property
+    def level_count(self) -> int:
+        """Levels down to (and including) the first that fits in one tile."""
+        longest = max(self.width, self.height)
+        return 1 + max(0, math.ceil(math.log2(longest / self.tile_px)))
+
+    def level_for_scale(self, scale: float) -> int:
+        """The coarsest level that still has ≥ 1 pixel per device pixel.
+
+        ``scale`` is device pixels per source pixel (the painter's level of
+        detail in item coordinates).
+        """
+        if not math.isfinite(scale) or scale <= 0:
+            return self.level_count - 1
+        if scale >= 1.0:
+            return 0
+        return min(int(math.floor(math.log2(1.0 / scale))), self.level_count - 1)
+
+    def level_size(self, level: int) -> tuple[int, int]:
+        """Pixel size of ``level`` (each halving rounds up)."""
+        width, height = self.width, self.height
+        for _ in range(level):
+            width, height = max(1, (width + 1) // 2), max(1, (height + 1) // 2)
+        return width, height
+
+    def level_image(self, level: int) -> QImage:
+        """Level ``level`` (source halved ``level`` times), built on demand."""
+        image = self._levels.get(level)
+        if image is None:
+            finer = [resident for resident in self._levels if resident < level]
+            below = self._levels[max(finer)] if finer else self._load_source()
+            if level == 0:
+                image = below
+            else:
+                image = below.scaled(
+                    *self.level_size(level),
+                    Qt.AspectRatioMode.IgnoreAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation,
+                )
+            self._levels[level] = image
+        self._levels.move_to_end(level)
+        self._trim()
+        return image
+
+    def _load_source(self) -> QImage:
+        if self._reload is None:  # level 0 is never dropped without a reload
+            raise RuntimeError("Pyramid source is not resident")
+        image = self._reload()
+        if image.isNull() or (image.width(), image.height()) != (self.width, self.height):
+            raise ValueError("Reloaded pyramid source does not match the original")
+        self.reloads += 1
+        return image
+
+    def _trim(self) -> None:
+        """Drop least recently used levels beyond the budget, never the
+        current one (and never the source unless it can be reloaded)."""
+        used = self.resident_bytes
+        for level in list(self._levels)[:-1]:
+            if used <= self._max_resident_bytes:
+                break
+            if level == 0 and self._reload is None:
+                continue
+            used -= self._levels.pop(level).sizeInBytes()
+
+    def tile_span(self, level: int) -> int:
+        """Edge of one tile at ``level``, in source pixels."""
+        return self.tile_px << level
+
+    def tiles_in(self, level: int, rect: QRectF) -> list[tuple[int, int]]:
+        """``(column, row)`` of every tile at ``level`` meeting ``rect``
+        (source pixels, y down)."""
+        span = self.tile_span(level)
+        clipped = rect.intersected(QRectF(0, 0, self.width, self.height))
+        if clipped.isEmpty():
+            return []
+        c0, r0 = int(clipped.left() // span), int(clipped.top() // span)
+        c1 = int(math.ceil(clipped.right() / span)) - 1
+        r1 = int(math.ceil(clipped.bottom() / span)) - 1
+        return [(c, r) for r in range(r0, r1 + 1) for c in range(c0, c1 + 1)]
+
+    def tile_rect(self, level: int, column: int, row: int) -> QRectF:
+        """Area covered by a tile, in source pixels (clipped to the image)."""
+        span = self.tile_span(level)
+        return QRectF(column * span, row * span, span, span).intersected(
+            QRectF(0, 0, self.width, self.height)
+        )
+
+    def tile_key(self, level: int, column: int, row: int) -> TileKey:
+        return (self.id, level, column, row)
+
+    def tile_image(self, level: int, column: int, row: int) -> QImage:
+        """The pixels of one tile at its level's resolution."""
+        image = self.level_image(level)
+        t = self.tile_px
+        self.tiles_built += 1
+        return image.copy(QRect(column * t, row * t, t, t).intersected(image.rect()))
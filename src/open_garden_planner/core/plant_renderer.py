@@ -8,6 +8,7 @@ illustrations (8+ popular species).
 
 import hashlib
 import math
+from collections.abc import Callable, Iterable
 from enum import Enum, auto
 from pathlib import Path
 
@@ -16,6 +17,8 @@ from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap
 from PyQt6.QtSvg import QSvgRenderer
 
 from .object_types import ObjectType
+from .sprite_cache import SpriteCache, mip_size
+from .sprite_disk_cache import disk_sprite_cache
 
 # Directory containing plant SVG files
 _PLANTS_DIR = Path(__file__).parent.parent / "resources" / "plants"
@@ -313,11 +316,17 @@ _OBJECT_TYPE_DEFAULT_CATEGORY: dict[ObjectType, PlantCategory] = {
 # Cache for QSvgRenderer instances (path -> renderer)
 _renderer_cache: dict[str, QSvgRenderer] = {}
 
+# Byte budget for rendered plant pixmaps (LRU, see core/sprite_cache.py)
+_PIXMAP_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
 # Cache for rendered pixmaps (cache_key -> QPixmap)
-_pixmap_cache: dict[str, QPixmap] = {}
+_pixmap_cache = SpriteCache(_PIXMAP_CACHE_MAX_BYTES)
+
+# ("mip", svg path, mip size, tint rgba) -- see plant_sprite_key
+PlantSpriteKey = tuple[str, str, int, int]
 
-# Maximum pixmap cache entries before eviction
-_PIXMAP_CACHE_MAX = 500
+# Mip sprites a background worker is currently rendering
+_pending_sprites: set[PlantSpriteKey] = set()
 
 
 def _get_renderer(svg_path: Path) -> QSvgRenderer | None:
@@ -419,6 +428,95 @@ def _stable_random_for_item(item_id: str, seed_offset: int = 0) -> float:
     return int(h[:8], 16) / 0xFFFFFFFF
 
 
+def plant_rotation_deg(item_id: str) -> float:
+    """Stable per-item sprite rotation in degrees (0 without an item ID).
+
+    Args:
+        item_id: Unique item identifier string
+
+    Returns:
+        Rotation in degrees, 0.0 to 360.0
+    """
+    if not item_id:
+        return 0.0
+    return _stable_random_for_item(item_id, seed_offset=0) * 360.0
+
+
+def _tint_key(tint_color: QColor | None) -> int:
+    return tint_color.rgba() if tint_color else 0
+
+
+def _render_svg_image(
+    renderer: QSvgRenderer,
+    size: int,
+    rotation: float,
+    tint_color: QColor | None,
+) -> QImage:
+    """Rasterize a plant SVG into a size x size image.
+
+    Touches only its arguments, so it is safe on a worker thread given a
+    renderer owned by that thread (see ``render_plant_image``).
+    """
+    # Render SVG to QImage (for compositing)
+    image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+
+    # Apply rotation around center
+    if abs(rotation) > 0.5:
+        center = size / 2.0
+        painter.translate(center, center)
+        painter.rotate(rotation)
+        painter.translate(-center, -center)
+
+    # Render SVG into the full area
+    renderer.render(painter, QRectF(0, 0, size, size))
+
+    # Apply color tint if specified
+    if tint_color is not None and tint_color.alpha() > 0:
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceAtop)
+        tint = QColor(tint_color.red(), tint_color.green(), tint_color.blue(), 60)
+        painter.fillRect(0, 0, size, size, tint)
+
+    painter.end()
+    return image
+
+
+def _sprite_image(
+    key: PlantSpriteKey, renderer_for: Callable[[], QSvgRenderer | None]
+) -> QImage | None:
+    """The mip sprite for ``key`` from the on-disk cache, else rendered
+    (and written back) — worker-thread safe given a thread-owned renderer.
+    """
+    _tag, svg_path, size, tint_rgba = key
+    disk = disk_sprite_cache()
+    if disk is not None:
+        image = disk.load(Path(svg_path), size, size, "plant", tint_rgba)
+        if image is not None:
+            return image
+    renderer = renderer_for()
+    if renderer is None:
+        return None
+    image = _render_svg_image(renderer, size, 0.0, QColor.fromRgba(tint_rgba))
+    if disk is not None:
+        disk.store(Path(svg_path), size, size, "plant", image, tint_rgba)
+    return image
+
+
+def _render_svg(
+    renderer: QSvgRenderer,
+    size: int,
+    rotation: float,
+    tint_color: QColor | None,
+) -> QPixmap | None:
+    """Rasterize a plant SVG into a size x size pixmap (GUI thread)."""
+    pixmap = QPixmap.fromImage(_render_svg_image(renderer, size, rotation, tint_color))
+    return None if pixmap.isNull() else pixmap
+
+
 def render_plant_pixmap(
     object_type: ObjectType,
     diameter: float,
@@ -430,7 +528,9 @@ def render_plant_pixmap(
     """Render a plant SVG to a QPixmap at the specified size.
 
     Uses caching for performance. Applies slight random rotation
-    based on item_id for natural variation.
+    based on item_id for natural variation. The canvas paints through
+    ``render_plant_sprite`` instead; this exact-size variant serves
+    icons, previews and callers that need a specific pixel size.
 
     Args:
         object_type: The plant's ObjectType
@@ -462,55 +562,138 @@ def render_plant_pixmap(
     size = max(int(min(diameter, _MAX_RENDER_DIAMETER_PX)), 4)
 
     # Generate stable random rotation for this specific item
-    rotation = 0.0
-    if item_id:
-        rotation = _stable_random_for_item(item_id, seed_offset=0) * 360.0
+    rotation = plant_rotation_deg(item_id)
 
-    # Build cache key
-    tint_key = tint_color.rgba() if tint_color else 0
-    cache_key = f"{svg_path}:{size}:{int(rotation)}:{tint_key}"
+    cache_key = (str(svg_path), size, int(rotation), _tint_key(tint_color))
+    cached = _pixmap_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    if cache_key in _pixmap_cache:
-        cached = _pixmap_cache[cache_key]
-        return None if cached.isNull() else cached
+    pixmap = _render_svg(renderer, size, rotation, tint_color)
+    if pixmap is not None:
+        _pixmap_cache.put(cache_key, pixmap)
+    return pixmap
 
-    # Evict cache if too large
-    if len(_pixmap_cache) >= _PIXMAP_CACHE_MAX:
-        _pixmap_cache.clear()
 
-    # Render SVG to QImage (for compositing)
-    image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
-    image.fill(Qt.GlobalColor.transparent)
+def plant_sprite_key(
+    object_type: ObjectType,
+    device_px: float,
+    species: str = "",
+    category: PlantCategory | None = None,
+    tint_color: QColor | None = None,
+) -> PlantSpriteKey | None:
+    """Cache key of the mip-level sprite ``render_plant_sprite`` would return.
 
-    painter = QPainter(image)
-    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+    Args:
+        object_type: The plant's ObjectType
+        device_px: On-screen diameter in device pixels
+        species: Species name for SVG lookup
+        category: Plant category for SVG lookup
+        tint_color: Optional color tint to apply
 
-    # Apply rotation around center
-    if abs(rotation) > 0.5:
-        center = size / 2.0
-        painter.translate(center, center)
-        painter.rotate(rotation)
-        painter.translate(-center, -center)
+    Returns:
+        Plain-data key (safe to hand to a worker thread), or None if no
+        SVG is available
+    """
+    svg_path = _resolve_svg_path(object_type, species, category)
+    if svg_path is None:
+        return None
+    return ("mip", str(svg_path), mip_size(device_px), _tint_key(tint_color))
 
-    # Render SVG into the full area
-    renderer.render(painter, QRectF(0, 0, size, size))
 
-    # Apply color tint if specified
-    if tint_color is not None and tint_color.alpha() > 0:
-        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceAtop)
-        tint = QColor(tint_color.red(), tint_color.green(), tint_color.blue(), 60)
-        painter.fillRect(0, 0, size, size, tint)
+def render_plant_sprite(
+    object_type: ObjectType,
+    device_px: float,
+    species: str = "",
+    category: PlantCategory | None = None,
+    tint_color: QColor | None = None,
+) -> QPixmap | None:
+    """Unrotated plant sprite at the mip level covering ``device_px``.
 
-    painter.end()
+    The pixmap is a power-of-two square (``core/sprite_cache.mip_size``)
+    shared by every item of this species and tint; callers scale it into
+    their rect and apply ``plant_rotation_deg`` with the painter.
 
+    Args:
+        object_type: The plant's ObjectType
+        device_px: On-screen diameter in device pixels
+        species: Species name for SVG lookup
+        category: Plant category for SVG lookup
+        tint_color: Optional color tint to apply
+
+    Returns:
+        QPixmap with rendered plant, or None if no SVG available
+    """
+    key = plant_sprite_key(object_type, device_px, species, category, tint_color)
+    return None if key is None else sprite_for_key(key)
+
+
+def sprite_for_key(key: PlantSpriteKey) -> QPixmap | None:
+    """The sprite for ``key``; on a cache miss it is loaded from the on-disk
+    cache (``core/sprite_disk_cache``) or rendered synchronously."""
+    cached = _pixmap_cache.get(key)
+    if cached is not None:
+        return cached
+    image = _sprite_image(key, lambda: _get_renderer(Path(key[1])))
+    if image is None:
+        return None
     pixmap = QPixmap.fromImage(image)
     if pixmap.isNull():
         return None
-    _pixmap_cache[cache_key] = pixmap
+    _pixmap_cache.put(key, pixmap)
     return pixmap
 
 
+def render_plant_image(key: PlantSpriteKey) -> QImage | None:
+    """Render the sprite for ``key`` into a QImage — worker-thread safe.
+
+    Reads the on-disk cache first; otherwise builds its own QSvgRenderer
+    instead of using the shared renderer cache. Returns an image (QPixmap
+    is GUI-thread only); hand the result to ``store_plant_sprite`` on the
+    GUI thread.
+    """
+
+    def renderer_for() -> QSvgRenderer | None:
+        renderer = QSvgRenderer(key[1])
+        return renderer if renderer.isValid() else None
+
+    return _sprite_image(key, renderer_for)
+
+
+def store_plant_sprite(key: PlantSpriteKey, image: QImage | None) -> None:
+    """Adopt a worker-rendered image as the cached sprite for ``key``.
+
+    A None (failed) render just clears the pending flag, so the next paint
+    falls back to rendering synchronously.
+    """
+    _pending_sprites.discard(key)
+    if image is None or image.isNull():
+        return
+    pixmap = QPixmap.fromImage(image)
+    if not pixmap.isNull():
+        _pixmap_cache.put(key, pixmap)
+
+
+def mark_plant_sprites_pending(keys: Iterable[PlantSpriteKey]) -> None:
+    """Flag sprites a worker is rendering: paint shows a placeholder instead
+    of rendering them synchronously (see ``is_plant_sprite_pending``)."""
+    _pending_sprites.update(keys)
+
+
+def clear_pending_plant_sprites() -> None:
+    _pending_sprites.clear()
+
+
+def is_plant_sprite_pending(key: PlantSpriteKey) -> bool:
+    """True while a worker renders ``key`` and it is not cached yet."""
+    return key in _pending_sprites and key not in _pixmap_cache
+
+
+def plant_cache() -> SpriteCache:
+    """The shared plant pixmap cache (hit/miss/eviction counters)."""
+    return _pixmap_cache
+
+
 def is_plant_type(object_type: ObjectType | None) -> bool:
     """Check if an ObjectType is a plant type.
 
@@ -559,3 +742,4 @@ def clear_plant_cache() -> None:
     """Clear all cached renderers and pixmaps."""
     _renderer_cache.clear()
     _pixmap_cache.clear()
+    _pending_sprites.clear()
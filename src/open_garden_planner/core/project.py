@@ -16,6 +16,7 @@ from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import QGraphicsItem, QGraphicsScene
 
 from open_garden_planner.app.settings import get_settings
+from open_garden_planner.core.commands import bulk_update
 from open_garden_planner.core.fill_patterns import FillPattern, create_pattern_brush
 from open_garden_planner.core.object_types import PathFenceStyle, StrokeStyle
 from open_garden_planner.models.layer import Layer, create_default_layers
@@ -887,6 +888,15 @@ class ProjectManager(QObject):
         }
         return out
 
+    def load_scene_snapshot(self, scene: QGraphicsScene, snapshot: dict[str, Any]) -> None:
+        """Rebuild ``scene`` from a :meth:`snapshot_dict` result.
+
+        Only the scene is restored: no project state, signals, current file or
+        recent-files entry — this is for headless consumers (the background
+        PDF report process) that need the plan's items, not an open project.
+        """
+        self._deserialize_to_scene(scene, ProjectData.from_dict(snapshot))
+
     def diagnostics_snapshot(self, scene: QGraphicsScene) -> list[dict[str, Any]]:
         """Harvest each garden item's already-computed warning flags (read-only).
 
@@ -1692,11 +1702,14 @@ class ProjectManager(QObject):
                 # Create default layers if none exist (for backward compatibility)
                 scene.set_layers(create_default_layers())
 
-        # Create items
-        for obj in data.objects:
-            item = self._deserialize_item(obj)
-            if item:
-                scene.addItem(item)
+        # Create items. Objects are serialized in scene.items() order, topmost
+        # first; adding them bottom-up restores the stacking of items that
+        # share a z-value instead of reversing it on every round trip.
+        with bulk_update(scene):
+            for obj in reversed(data.objects):
+                item = self._deserialize_item(obj)
+                if item:
+                    scene.addItem(item)
 
         # Apply layer visibility/opacity/lock/z-order to all items now that they exist
         if hasattr(scene, "_update_items_visibility"):
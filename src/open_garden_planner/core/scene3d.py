@@ -1,8 +1,8 @@
 """Qt-free 3D scene description for the 3D view (US-E6, #261).
 
-Everything heavy — triangulation, prism extrusion, the solar-light vector,
-the scene→engine frame mapping — lives here, headless-testable, in plain
-floats. The Qt3D adapter (`ui/view3d/qt3d_adapter.py`, the ONLY module
+Everything heavy — triangulation, prism extrusion, per-material batching,
+the solar-light vector, the scene→engine frame mapping — lives here,
+headless-testable, in plain floats. The Qt3D adapter (`ui/view3d/qt3d_adapter.py`, the ONLY module
 allowed to import PyQt6.Qt3D* per ADR-038) just packs these arrays into
 GPU buffers. If the engine is ever swapped, this module survives intact.
 
@@ -16,9 +16,15 @@ Frames (§8.20 discipline):
 from __future__ import annotations
 
 import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import NamedTuple
 
-from .shadow_geometry import Polygon
+import numpy as np
+
+from .shadow_geometry import Point, Polygon
+from .triangulation import triangulate
 
 #: Items without a height render as thin ground decals of this thickness.
 FLAT_THICKNESS_CM = 2.0
@@ -89,7 +95,10 @@ def records_from_raw(
     return records
 
 
-# ── polygon triangulation (ear clipping) ────────────────────────────
+# ── polygon triangulation ───────────────────────────────────────────
+
+#: Distinct footprint shapes whose triangulation is kept (LRU).
+TRIANGULATION_CACHE_SIZE = 4096
 
 
 def _signed_area(polygon: Polygon) -> float:
@@ -102,113 +111,217 @@ def _signed_area(polygon: Polygon) -> float:
     return total / 2.0
 
 
-def _cross(o, a, b) -> float:
-    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
-
+@lru_cache(maxsize=TRIANGULATION_CACHE_SIZE)
+def _triangulate_shape(
+    outer: tuple[Point, ...], holes: tuple[tuple[Point, ...], ...]
+) -> tuple[tuple[int, int, int], ...]:
+    return tuple(triangulate(outer, holes))
 
-def _point_in_triangle(p, a, b, c) -> bool:
-    d1 = _cross(p, a, b)
-    d2 = _cross(p, b, c)
-    d3 = _cross(p, c, a)
-    has_neg = (d1 < 0) or (d2 < 0) or (d3 < 0)
-    has_pos = (d1 > 0) or (d2 > 0) or (d3 > 0)
-    return not (has_neg and has_pos)
 
+def triangulate_polygon(
+    polygon: Polygon, holes: Sequence[Polygon] = ()
+) -> list[tuple[int, int, int]]:
+    """Triangulate ``polygon`` minus ``holes``; CCW index triples.
 
-def triangulate_polygon(polygon: Polygon) -> list[tuple[int, int, int]]:
-    """Ear-clipping triangulation; returns index triples into ``polygon``.
-
-    Handles convex and concave simple polygons; input winding is
-    irrelevant (normalized to CCW internally, indices refer to the
-    ORIGINAL order). Falls back to a fan for pathological inputs so the
-    renderer always gets triangles rather than nothing.
+    Indices refer to the ORIGINAL vertex order of ``polygon`` followed by
+    each hole's; input winding is irrelevant. Uses the z-order ear clipper
+    in ``core/triangulation`` and memoizes per footprint SHAPE: the rings
+    are keyed relative to the first outer vertex, so an item that was only
+    moved is not re-triangulated on the next rebuild.
     """
-    n = len(polygon)
-    if n < 3:
+    if len(polygon) < 3:
         return []
-    indices = list(range(n))
-    if _signed_area(polygon) < 0:
-        indices.reverse()  # normalize to CCW traversal
-    triangles: list[tuple[int, int, int]] = []
-    guard = 0
-    while len(indices) > 3 and guard < 10000:
-        guard += 1
-        ear_found = False
-        m = len(indices)
-        for i in range(m):
-            prev_i, cur_i, next_i = (
-                indices[(i - 1) % m],
-                indices[i],
-                indices[(i + 1) % m],
-            )
-            a, b, c = polygon[prev_i], polygon[cur_i], polygon[next_i]
-            if _cross(a, b, c) <= 0:
-                continue  # reflex or collinear — not an ear
-            if any(
-                _point_in_triangle(polygon[j], a, b, c)
-                for j in indices
-                if j not in (prev_i, cur_i, next_i)
-            ):
-                continue
-            triangles.append((prev_i, cur_i, next_i))
-            indices.pop(i)
-            ear_found = True
-            break
-        if not ear_found:
-            break  # numeric degeneracy — fan out the rest below
-    if len(indices) == 3:
-        triangles.append((indices[0], indices[1], indices[2]))
-    elif len(indices) > 3:
-        anchor = indices[0]
-        for i in range(1, len(indices) - 1):
-            triangles.append((anchor, indices[i], indices[i + 1]))
-    return triangles
+    x0, y0 = polygon[0]
+
+    def relative(ring: Polygon) -> tuple[Point, ...]:
+        return tuple((x - x0, y - y0) for x, y in ring)
+
+    return list(
+        _triangulate_shape(relative(polygon), tuple(relative(h) for h in holes))
+    )
+
+
+#: ``functools`` cache statistics of ``triangulate_polygon`` (instrument).
+triangulation_cache_info = _triangulate_shape.cache_info
 
 
 # ── prism extrusion ─────────────────────────────────────────────
 
 
 def extrude_footprint(
-    footprint: Polygon, height_cm: float, base_cm: float = 0.0
+    footprint: Polygon,
+    height_cm: float,
+    base_cm: float = 0.0,
+    holes: Sequence[Polygon] = (),
 ) -> tuple[list[float], list[float]]:
     """Triangle soup (positions, normals) for an extruded prism, SCENE frame.
 
-    Side walls (two triangles per edge, outward flat normals) + top cap
-    (ear-clipped, +up normals). The bottom cap is omitted — prisms sit on
-    the ground plane and their underside is never visible. Vertex winding
-    is chosen so front faces point outward/up (CCW seen from outside).
+    Side walls (two triangles per edge, outward flat normals — around holes
+    they face into the hole) + top cap (triangulated minus ``holes``, +up
+    normals). The bottom cap is omitted — prisms sit on the ground plane
+    and their underside is never visible. Vertex winding is chosen so front
+    faces point outward/up (CCW seen from outside).
     """
     if len(footprint) < 3 or height_cm <= 0:
         return [], []
     ring = list(footprint)
     if _signed_area(ring) < 0:
         ring.reverse()  # CCW so edge normals point outward
+    hole_rings: list[Polygon] = []
+    for hole in holes:
+        if len(hole) >= 3:
+            hole_ring = list(hole)
+            if _signed_area(hole_ring) > 0:
+                hole_ring.reverse()  # CW so wall normals point into the hole
+            hole_rings.append(hole_ring)
     positions: list[float] = []
     normals: list[float] = []
     top = base_cm + height_cm
-    n = len(ring)
-    for i in range(n):
-        x1, y1 = ring[i]
-        x2, y2 = ring[(i + 1) % n]
-        edge = math.hypot(x2 - x1, y2 - y1)
-        if edge <= 1e-9:
-            continue
-        nx, ny = (y2 - y1) / edge, -(x2 - x1) / edge  # outward for CCW ring
-        quad = [
-            (x1, y1, base_cm), (x2, y2, base_cm), (x2, y2, top),
-            (x1, y1, base_cm), (x2, y2, top), (x1, y1, top),
-        ]
-        for px, py, pz in quad:
-            positions.extend((px, py, pz))
-            normals.extend((nx, ny, 0.0))
-    for i1, i2, i3 in triangulate_polygon(ring):
+    for wall in (ring, *hole_rings):
+        n = len(wall)
+        for i in range(n):
+            x1, y1 = wall[i]
+            x2, y2 = wall[(i + 1) % n]
+            edge = math.hypot(x2 - x1, y2 - y1)
+            if edge <= 1e-9:
+                continue
+            nx, ny = (y2 - y1) / edge, -(x2 - x1) / edge  # outward for CCW ring
+            quad = [
+                (x1, y1, base_cm), (x2, y2, base_cm), (x2, y2, top),
+                (x1, y1, base_cm), (x2, y2, top), (x1, y1, top),
+            ]
+            for px, py, pz in quad:
+                positions.extend((px, py, pz))
+                normals.extend((nx, ny, 0.0))
+    cap = [point for wall in (ring, *hole_rings) for point in wall]
+    for i1, i2, i3 in triangulate_polygon(ring, hole_rings):
         for idx in (i1, i2, i3):
-            x, y = ring[idx]
+            x, y = cap[idx]
             positions.extend((x, y, top))
             normals.extend((0.0, 0.0, 1.0))
     return positions, normals
 
 
+# ── batching (one draw call per material) ───────────────────────────
+
+#: Batches are keyed by diffuse colour — the only material parameter the
+#: adapter varies — so every record of one colour shares a single mesh.
+BatchKey = tuple[int, int, int]
+
+
+def batch_key(record: Scene3DRecord) -> BatchKey:
+    """The material group a record renders in (alpha is not rendered)."""
+    r, g, b, _a = record.color_rgba
+    return (r, g, b)
+
+
+@dataclass
+class MeshBatch:
+    """Merged triangle soup of every record sharing one material, SCENE frame.
+
+    ``ranges[i]`` is ``(first_vertex, vertex_count)`` of ``records[i]`` inside
+    ``positions``/``normals`` (float32, shape (n, 3)) — the slice the adapter
+    rewrites in place when only that record changed.
+    """
+
+    key: BatchKey
+    records: list[Scene3DRecord]
+    ranges: list[tuple[int, int]]
+    positions: np.ndarray
+    normals: np.ndarray
+
+    @property
+    def vertex_count(self) -> int:
+        return int(self.positions.shape[0])
+
+
+class BatchDiff(NamedTuple):
+    """What the adapter must do to move from one batch set to the next."""
+
+    batches: dict[BatchKey, MeshBatch]
+    #: New or resized batches: upload the whole buffer.
+    uploads: list[BatchKey]
+    #: Same-layout batches: rewrite only these ``(first_vertex, count)`` ranges.
+    patches: dict[BatchKey, list[tuple[int, int]]]
+    #: Batches that no longer have any record.
+    removed: list[BatchKey]
+
+
+def _extrude_record(record: Scene3DRecord) -> tuple[np.ndarray, np.ndarray]:
+    positions, normals = extrude_footprint(
+        list(record.footprint), record.height_cm, base_cm=record.base_cm
+    )
+    return (
+        np.asarray(positions, dtype=np.float32).reshape(-1, 3),
+        np.asarray(normals, dtype=np.float32).reshape(-1, 3),
+    )
+
+
+def diff_batches(
+    previous: dict[BatchKey, MeshBatch],
+    records: list[Scene3DRecord],
+) -> BatchDiff:
+    """Group ``records`` into per-material batches, reusing ``previous``.
+
+    Records are plain values, so an unchanged record is found by equality
+    and its extruded vertices are copied rather than recomputed. A batch
+    whose records keep their order and vertex counts is reported as a list
+    of patched ranges (typically: one item moved or was recoloured within
+    its group); anything else re-uploads that batch only.
+    """
+    grouped: dict[BatchKey, list[Scene3DRecord]] = {}
+    for record in records:
+        grouped.setdefault(batch_key(record), []).append(record)
+
+    batches: dict[BatchKey, MeshBatch] = {}
+    uploads: list[BatchKey] = []
+    patches: dict[BatchKey, list[tuple[int, int]]] = {}
+    for key, group in grouped.items():
+        old = previous.get(key)
+        cached: dict[Scene3DRecord, tuple[np.ndarray, np.ndarray]] = {}
+        if old is not None:
+            for record, (start, count) in zip(old.records, old.ranges, strict=True):
+                cached.setdefault(
+                    record,
+                    (
+                        old.positions[start : start + count],
+                        old.normals[start : start + count],
+                    ),
+                )
+        pieces = [cached.get(record) or _extrude_record(record) for record in group]
+        ranges: list[tuple[int, int]] = []
+        first = 0
+        for positions, _normals in pieces:
+            ranges.append((first, positions.shape[0]))
+            first += positions.shape[0]
+        batch = MeshBatch(
+            key=key,
+            records=group,
+            ranges=ranges,
+            positions=_concat([p for p, _n in pieces]),
+            normals=_concat([n for _p, n in pieces]),
+        )
+        batches[key] = batch
+        if old is None or old.ranges != ranges:
+            uploads.append(key)
+            continue
+        changed = [
+            span
+            for span, before, after in zip(ranges, old.records, group, strict=True)
+            if before != after and span[1] > 0
+        ]
+        if changed:
+            patches[key] = changed
+    removed = [key for key in previous if key not in batches]
+    return BatchDiff(batches, uploads, patches, removed)
+
+
+def _concat(arrays: list[np.ndarray]) -> np.ndarray:
+    if not arrays:
+        return np.zeros((0, 3), dtype=np.float32)
+    return np.concatenate(arrays).astype(np.float32, copy=False)
+
+
 # ── solar light + frame mapping ────────────────────────────────────
 
 
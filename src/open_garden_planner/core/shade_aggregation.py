@@ -41,6 +41,11 @@ SAMPLE_STEP_MINUTES = 15
 #: garden, the stated performance target).
 GRID_CELL_CM = 10.0
 
+#: Adaptive mode: fine cells per tile edge. A 16 × 16 tile of 10 cm cells is
+#: 1.6 m — coarse enough that an open lawn costs 1/256 of the uniform raster,
+#: fine enough that a tile rarely straddles two unrelated shadow edges.
+ADAPTIVE_TILE_CELLS = 16
+
 #: Band thresholds in minutes of direct sun: deep shade < 2 h ≤ light
 #: shade < 4 h ≤ partial sun < 6 h ≤ full sun.
 BAND_THRESHOLDS_MINUTES: tuple[int, int, int] = (120, 240, 360)
@@ -95,6 +100,57 @@ class HeatmapGrid:
         )
 
 
+@dataclass
+class AdaptiveHeatmap:
+    """Multi-resolution sun-minutes result of ``compute_heatmap_adaptive``.
+
+    The fine ``grid`` is partitioned into square tiles of ``tile_cells`` cells
+    (row 0 = south edge, as everywhere). ``coarse[tr, tc]`` holds the minutes
+    of every sample during which tile ``(tr, tc)`` was uniformly lit or shaded;
+    ``refined`` holds, for tiles that a shadow boundary crossed at least once,
+    the fine per-cell minutes of exactly those boundary samples. A cell's total
+    is therefore ``coarse[its tile] + refined[its tile][cell]`` (0 if absent).
+
+    Implements ``__array__`` so consumers expecting the uniform ``(rows, cols)``
+    grid (``build_heatmap_image``, the ``core.heatmap_render`` helpers) accept
+    it unchanged via ``np.asarray``.
+    """
+
+    grid: HeatmapGrid
+    tile_cells: int
+    coarse: np.ndarray
+    refined: dict[tuple[int, int], np.ndarray]
+    #: Fine cells actually rasterized across all samples (cost instrument).
+    rasterized_cells: int = 0
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (self.grid.rows, self.grid.cols)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the result (vs ``rows * cols * 4`` for uniform)."""
+        return self.coarse.nbytes + sum(t.nbytes for t in self.refined.values())
+
+    @property
+    def refined_fraction(self) -> float:
+        return len(self.refined) / max(1, self.coarse.size)
+
+    def to_dense(self) -> np.ndarray:
+        """Expand to the uniform ``(rows, cols)`` float32 minutes grid."""
+        t = self.tile_cells
+        dense = np.repeat(np.repeat(self.coarse, t, axis=0), t, axis=1)
+        for (tr, tc), tile in self.refined.items():
+            dense[tr * t : (tr + 1) * t, tc * t : (tc + 1) * t] += tile
+        return dense[: self.grid.rows, : self.grid.cols].astype(
+            np.float32, copy=False
+        )
+
+    def __array__(self, dtype: object = None, copy: object = None) -> np.ndarray:
+        dense = self.to_dense()
+        return dense if dtype is None else dense.astype(dtype)
+
+
 #: A rasterizer turns one sample's shadow polygons into a boolean shade mask
 #: of shape (rows, cols), True = shaded. Injected so the core stays Qt-free.
 Rasterizer = Callable[[list[Polygon], HeatmapGrid], np.ndarray]
@@ -204,3 +260,126 @@ def compute_heatmap(
             progress(index + 1, total)
     return minutes
 
+
+def _boundary_tiles(
+    polygons: list[Polygon], tiles: HeatmapGrid
+) -> np.ndarray:
+    """Boolean ``(rows, cols)`` mask of tiles a polygon edge may cross.
+
+    Each edge is walked at half-tile steps and the visited tiles are then
+    dilated by one tile (8-neighbourhood), which also catches a tile whose
+    corner the edge merely clips between two steps. Conservative by design:
+    a false positive only costs a fine raster of that tile, a false negative
+    would paint a whole tile with the wrong value.
+    """
+    touched = np.zeros((tiles.rows, tiles.cols), dtype=bool)
+    starts = np.concatenate(
+        [np.asarray(polygon, dtype=np.float64) for polygon in polygons]
+    )
+    ends = np.concatenate(
+        [np.roll(np.asarray(polygon, dtype=np.float64), -1, axis=0) for polygon in polygons]
+    )
+    # All edges walked at once: edge i contributes counts[i] + 1 points.
+    lengths = np.hypot(*(ends - starts).T)
+    counts = np.maximum(1, np.ceil(lengths / (tiles.cell_cm / 2.0))).astype(np.intp)
+    edge = np.repeat(np.arange(len(counts)), counts + 1)
+    first = np.repeat(np.cumsum(counts + 1) - (counts + 1), counts + 1)
+    ts = (np.arange(len(edge)) - first) / counts[edge]
+    points = starts[edge] + ts[:, None] * (ends[edge] - starts[edge])
+    rows = np.floor((points[:, 1] - tiles.y0_cm) / tiles.cell_cm)
+    cols = np.floor((points[:, 0] - tiles.x0_cm) / tiles.cell_cm)
+    keep = (rows >= -1) & (rows <= tiles.rows) & (cols >= -1) & (cols <= tiles.cols)
+    rows = np.clip(rows[keep], 0, tiles.rows - 1).astype(np.intp)
+    cols = np.clip(cols[keep], 0, tiles.cols - 1).astype(np.intp)
+    touched[rows, cols] = True
+    dilated = touched.copy()
+    dilated[1:, :] |= touched[:-1, :]
+    dilated[:-1, :] |= touched[1:, :]
+    grown = dilated.copy()
+    grown[:, 1:] |= dilated[:, :-1]
+    grown[:, :-1] |= dilated[:, 1:]
+    return grown
+
+
+def compute_heatmap_adaptive(
+    casters: Sequence[tuple[Sequence[tuple[float, float]], float | None]],
+    lat_deg: float,
+    lon_deg: float,
+    day: date,
+    grid: HeatmapGrid,
+    rasterize: Rasterizer,
+    *,
+    tile_cells: int = ADAPTIVE_TILE_CELLS,
+    step_minutes: int = SAMPLE_STEP_MINUTES,
+    progress: Callable[[int, int], None] | None = None,
+    should_cancel: Callable[[], bool] | None = None,
+) -> AdaptiveHeatmap | None:
+    """``compute_heatmap`` at coarse resolution, refined only where needed.
+
+    Per sample, the shadow polygons are rasterized once on the TILE grid
+    (one cell per tile, sampled at the tile centre). Tiles no polygon edge
+    crosses are uniformly lit or shaded, so that single sample is exact for
+    all their cells. Only tiles a shadow boundary crosses at THIS sample are
+    rasterized at full resolution — one band per tile row, spanning the
+    touched tiles — and accumulated into that tile's fine array. On a large,
+    mostly open property this rasterizes a small fraction of the cells the
+    uniform path does, with the same per-cell-centre result.
+
+    Same sampling, clamping and cancellation contract as ``compute_heatmap``.
+    """
+    t = max(1, int(tile_cells))
+    tile_cm = grid.cell_cm * t
+    tiles = HeatmapGrid(
+        x0_cm=grid.x0_cm,
+        y0_cm=grid.y0_cm,
+        cell_cm=tile_cm,
+        cols=math.ceil(grid.cols / t),
+        rows=math.ceil(grid.rows / t),
+    )
+    samples = daylight_samples(lat_deg, lon_deg, day, step_minutes)
+    coarse = np.zeros((tiles.rows, tiles.cols), dtype=np.float32)
+    refined: dict[tuple[int, int], np.ndarray] = {}
+    rasterized = 0
+    step = float(step_minutes)
+    total = len(samples)
+    for index, sample in enumerate(samples):
+        if should_cancel is not None and should_cancel():
+            return None
+        polygons = compute_scene_shadows(
+            casters,
+            max(sample.elevation_deg, MIN_SUN_ELEVATION_DEG),
+            sample.azimuth_deg,
+        )
+        if not polygons:
+            coarse += step
+        else:
+            touched = _boundary_tiles(polygons, tiles)
+            shaded = rasterize(polygons, tiles)
+            rasterized += tiles.rows * tiles.cols
+            coarse += np.where(touched | shaded, 0.0, step).astype(np.float32)
+            for tr in np.flatnonzero(touched.any(axis=1)).tolist():
+                tcs = np.flatnonzero(touched[tr]).tolist()
+                c0, c1 = tcs[0], tcs[-1] + 1
+                band = HeatmapGrid(
+                    x0_cm=grid.x0_cm + c0 * tile_cm,
+                    y0_cm=grid.y0_cm + tr * tile_cm,
+                    cell_cm=grid.cell_cm,
+                    cols=(c1 - c0) * t,
+                    rows=t,
+                )
+                lit = np.where(rasterize(polygons, band), 0.0, step)
+                rasterized += band.rows * band.cols
+                for tc in tcs:
+                    tile = refined.get((tr, tc))
+                    if tile is None:
+                        tile = refined[(tr, tc)] = np.zeros((t, t), np.float32)
+                    tile += lit[:, (tc - c0) * t : (tc - c0 + 1) * t]
+        if progress is not None:
+            progress(index + 1, total)
+    return AdaptiveHeatmap(
+        grid=grid,
+        tile_cells=t,
+        coarse=coarse,
+        refined=refined,
+        rasterized_cells=rasterized,
+    )
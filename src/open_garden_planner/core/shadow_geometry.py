@@ -168,11 +168,25 @@ def _caster_paths_int(
     footprint: Sequence[Point], length_cm: float, direction: Point
 ) -> list[list[tuple[int, int]]]:
     """Integer paths whose nonzero union is the swept (filled) shadow."""
+    return _sweep_paths_int(_footprint_int(footprint), length_cm, direction)
+
+
+def _footprint_int(footprint: Sequence[Point]) -> list[tuple[int, int]]:
+    """Footprint on the integer grid, normalized CCW; [] when degenerate."""
     int_fp = _to_int(footprint)
     if len(int_fp) < 3:
         return []
     if not pyclipper.Orientation(int_fp):
         int_fp = list(reversed(int_fp))  # normalize CCW for stable winding
+    return int_fp
+
+
+def _sweep_paths_int(
+    int_fp: list[tuple[int, int]], length_cm: float, direction: Point
+) -> list[list[tuple[int, int]]]:
+    """``_caster_paths_int`` for a footprint already on the integer grid."""
+    if len(int_fp) < 3:
+        return []
     dx = round(direction[0] * length_cm * CLIPPER_SCALE)
     dy = round(direction[1] * length_cm * CLIPPER_SCALE)
     if abs(dx) < _MIN_SWEEP_CM * CLIPPER_SCALE and abs(dy) < _MIN_SWEEP_CM * CLIPPER_SCALE:
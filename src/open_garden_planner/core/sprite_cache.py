@@ -0,0 +1,112 @@
+"""Byte-bounded LRU cache for rasterized SVG sprites.
+
+Shared by ``plant_renderer`` and ``furniture_renderer``. Sprites are
+rendered at power-of-two device-pixel sizes ("mip levels") picked from the
+painter's level of detail, so every item of one species shares a handful of
+pixmaps no matter its diameter, and zooming only renders a new level when
+it crosses a power of two. The painter scales the nearest level into the
+item's rect (always downward, at most 2×, with smooth transform).
+
+Eviction is least-recently-used and bounded by pixmap BYTES, not entry
+count: one 2048² sprite weighs as much as a thousand 64² ones. The
+``hits``/``misses``/``evictions`` counters are instruments for tests and
+profiling.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from PyQt6.QtGui import QPainter, QPixmap
+
+#: Smallest and largest mip level, device pixels per side. A 2048² sprite
+#: is 16 MiB, so the plant cache (64 MiB) still holds several of them.
+MIN_MIP_PX = 16
+MAX_MIP_PX = 2048
+
+
+def mip_size(device_px: float) -> int:
+    """The power-of-two mip level that covers ``device_px`` pixels."""
+    if not math.isfinite(device_px) or device_px >= MAX_MIP_PX:
+        return MAX_MIP_PX
+    if device_px <= MIN_MIP_PX:
+        return MIN_MIP_PX
+    return 1 << math.ceil(math.log2(device_px))
+
+
+def painter_lod(painter: QPainter, lod: float) -> float:
+    """Scene-to-device scale of ``painter``, including the HiDPI ratio.
+
+    ``lod`` is ``QStyleOptionGraphicsItem.levelOfDetailFromTransform`` of
+    the painter's world transform.
+    """
+    device = painter.device()
+    ratio = device.devicePixelRatioF() if device is not None else 1.0
+    return lod * ratio
+
+
+def pixmap_nbytes(pixmap: QPixmap) -> int:
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+class SpriteCache:
+    """LRU of rendered pixmaps bounded by total bytes (see module doc)."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[QPixmap, int]] = OrderedDict()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def get(self, key: Hashable) -> QPixmap | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: Hashable, pixmap: QPixmap) -> None:
+        size = pixmap_nbytes(pixmap)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._nbytes -= old[1]
+        self._entries[key] = (pixmap, size)
+        self._nbytes += size
+        # Keep at least the newest entry even if it alone exceeds the budget.
+        while self._nbytes > self.max_bytes and len(self._entries) > 1:
+            _key, (_pixmap, evicted) = self._entries.popitem(last=False)
+            self._nbytes -= evicted
+            self.evictions += 1
+
+    def discard(self, key: Hashable) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._nbytes -= old[1]
+
+    def keys(self) -> list[Hashable]:
+        """The keys, least recently used first."""
+        return list(self._entries)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        self._entries.clear()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
@@ -0,0 +1,226 @@
+"""On-disk PNG cache of rendered SVG sprites and thumbnails, across launches.
+
+Every cold start used to re-render hundreds of SVGs (gallery thumbnails,
+canvas sprites). Rendered images are now kept as PNGs under the app's
+local data directory and reloaded on the next launch:
+
+- **Keyed by content**, not path: the SVG's SHA-1 plus pixel size, tint and
+  a render *variant* (``"plant"``, ``"furniture"``, ``"thumb"`` — each
+  rasterizes the same SVG differently). Editing or replacing an SVG simply
+  misses; stale files age out.
+- **Versioned**: files live under ``v<FORMAT_VERSION>/``; bump the version
+  whenever a renderer's output changes and the old tree is ignored (and
+  removed on the next prune).
+- **Populated lazily** by the renderers on a miss, and **pruned LRU**: a load
+  refreshes the file's mtime, and once the tree exceeds ``MAX_BYTES`` the
+  least recently used files are deleted down to ``PRUNE_TO_FRACTION``.
+
+Loads and stores only touch ``QImage`` and the filesystem, so the sprite
+workers (``ui/canvas/sprite_prerender.py``) use the cache directly. Every
+failure degrades to "miss": a read-only or full disk never breaks painting.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+
+from PyQt6.QtGui import QImage
+
+from open_garden_planner.app.paths import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+#: Bump when any renderer's pixels change for the same key.
+FORMAT_VERSION = 1
+
+#: Size budget of the cache tree, and the level a prune trims it to.
+MAX_BYTES = 128 * 1024 * 1024
+PRUNE_TO_FRACTION = 0.8
+
+_DIR_NAME = "sprite_cache"
+
+
+def _svg_digest_uncached(path: Path) -> str:
+    return hashlib.sha1(path.read_bytes(), usedforsecurity=False).hexdigest()
+
+
+class DiskSpriteCache:
+    """Versioned PNG store with LRU pruning (see module doc)."""
+
+    def __init__(self, root: Path, max_bytes: int = MAX_BYTES) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self._dir = root / f"v{FORMAT_VERSION}"
+        self._lock = threading.Lock()
+        self._digests: dict[tuple[str, int, int], str] = {}
+        self._nbytes: int | None = None  # scanned lazily on the first store
+        #: Instruments for tests and profiling.
+        self.hits = 0
+        self.misses = 0
+        self.pruned = 0
+
+    # ── keys ───────────────────────────────────────────────────
+
+    def svg_digest(self, svg_path: Path) -> str | None:
+        """SHA-1 of the SVG's bytes, memoized per (path, mtime, size)."""
+        try:
+            stat = svg_path.stat()
+        except OSError:
+            return None
+        memo_key = (str(svg_path), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            digest = self._digests.get(memo_key)
+        if digest is None:
+            try:
+                digest = _svg_digest_uncached(svg_path)
+            except OSError:
+                return None
+            with self._lock:
+                self._digests[memo_key] = digest
+        return digest
+
+    def _file(
+        self, svg_path: Path, width: int, height: int, variant: str, tint: int
+    ) -> Path | None:
+        digest = self.svg_digest(svg_path)
+        if digest is None:
+            return None
+        return self._dir / digest[:2] / f"{digest}_{variant}_{width}x{height}_{tint:08x}.png"
+
+    # ── load / store ───────────────────────────────────────────
+
+    def load(
+        self, svg_path: Path, width: int, height: int, variant: str, tint: int = 0
+    ) -> QImage | None:
+        """The cached image, or None on a miss (any I/O error is a miss)."""
+        file = self._file(svg_path, width, height, variant, tint)
+        if file is None or not file.exists():
+            self._count(hit=False)
+            return None
+        image = QImage(str(file))
+        if image.isNull() or image.width() != width or image.height() != height:
+            self._count(hit=False)
+            with contextlib.suppress(OSError):
+                file.unlink()
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(file)  # LRU: mtime is the last use
+        self._count(hit=True)
+        return image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+
+    def _count(self, hit: bool) -> None:
+        # Loads run on the sprite worker pool: the counters share the lock.
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def store(
+        self,
+        svg_path: Path,
+        width: int,
+        height: int,
+        variant: str,
+        image: QImage,
+        tint: int = 0,
+    ) -> None:
+        """Write ``image`` as a PNG (atomically), pruning if over budget."""
+        file = self._file(svg_path, width, height, variant, tint)
+        if file is None or image.isNull():
+            return
+        tmp = file.with_name(f"{file.name}.{threading.get_ident()}.tmp")
+        try:
+            file.parent.mkdir(parents=True, exist_ok=True)
+            if not image.save(str(tmp), "PNG"):
+                return
+            size = tmp.stat().st_size
+            try:
+                replaced = file.stat().st_size  # an overwrite frees the old bytes
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp, file)
+        except OSError as exc:
+            logger.debug("Sprite cache write failed: %s", exc)
+            with contextlib.suppress(OSError):
+                tmp.unlink()
+            return
+        with self._lock:
+            if self._nbytes is None:
+                self._nbytes = self._scan_bytes()
+            else:
+                self._nbytes += size - replaced
+            over = self._nbytes > self.max_bytes
+        if over:
+            self.prune()
+
+    def prune(self, target_bytes: int | None = None) -> None:
+        """Delete least-recently-used files down to ``target_bytes``, and any
+        tree left by an older ``FORMAT_VERSION``."""
+        if target_bytes is None:
+            target_bytes = int(self.max_bytes * PRUNE_TO_FRACTION)
+        with self._lock:
+            if self.root.is_dir():
+                for stale in self.root.iterdir():
+                    if stale.is_dir() and stale != self._dir:
+                        shutil.rmtree(stale, ignore_errors=True)
+            entries: list[tuple[float, int, Path]] = []
+            for file in self._dir.rglob("*.png") if self._dir.is_dir() else ():
+                with contextlib.suppress(OSError):
+                    stat = file.stat()
+                    entries.append((stat.st_mtime, stat.st_size, file))
+            total = sum(size for _mtime, size, _file in entries)
+            for _mtime, size, file in sorted(entries, key=lambda e: e[0]):
+                if total <= target_bytes:
+                    break
+                with contextlib.suppress(OSError):
+                    file.unlink()
+                    total -= size
+                    self.pruned += 1
+            self._nbytes = total
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            if self._nbytes is None:
+                self._nbytes = self._scan_bytes()
+            return self._nbytes
+
+    def _scan_bytes(self) -> int:
+        total = 0
+        for file in self._dir.rglob("*.png") if self._dir.is_dir() else ():
+            with contextlib.suppress(OSError):
+                total += file.stat().st_size
+        return total
+
+
+_default: DiskSpriteCache | None = None
+_default_lock = threading.Lock()
+
+
+def default_cache_dir() -> Path:
+    """``<cache dir>/sprite_cache`` (next to ``site_data_cache.sqlite3``)."""
+    return get_cache_dir() / _DIR_NAME
+
+
+def disk_sprite_cache() -> DiskSpriteCache | None:
+    """The shared cache, created on first use (and again if the app cache
+    directory moved, see ``app.paths.set_cache_dir``); None if no writable
+    location."""
+    global _default
+    root = default_cache_dir()
+    with _default_lock:
+        if _default is None or _default.root != root:
+            try:
+                root.mkdir(parents=True, exist_ok=True)
+            except OSError as exc:
+                logger.warning("Sprite disk cache disabled: %s", exc)
+                return None
+            _default = DiskSpriteCache(root)
+        return _default
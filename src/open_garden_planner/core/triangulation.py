@@ -0,0 +1,543 @@
+"""Polygon triangulation with holes for the 3D view (US-E6 perf).
+
+Qt-free. A Python port of the z-order-hashed ear clipper popularised by
+Mapbox's *earcut*: vertices live in a circular doubly linked list, holes are
+bridged into the outer ring, and for large rings every vertex gets a
+Morton (z-order) code so the "is any other vertex inside this ear?" test only
+visits vertices whose codes fall inside the ear's bounding box — near
+O(n log n) on the curved beds and bezier paths the old O(n³) clipper choked
+on. When no ear can be found the ring is cleaned (collinear/duplicate points,
+local self-intersections) and, as a last resort, split in two; the result is
+always a list of triangles, never an exception.
+
+``triangulate`` returns index triples into the concatenation
+``outer + holes[0] + holes[1] + …`` in the caller's ORIGINAL vertex order,
+wound CCW (scene frame, y = North).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+Point = tuple[float, float]
+
+#: Below this many vertices the plain O(n²) ear scan beats building the
+#: z-order index.
+ZORDER_MIN_VERTICES = 80
+
+
+class _Node:
+    __slots__ = ("i", "x", "y", "prev", "next", "z", "prev_z", "next_z", "steiner")
+
+    def __init__(self, i: int, x: float, y: float) -> None:
+        self.i = i
+        self.x = x
+        self.y = y
+        self.prev: _Node = self
+        self.next: _Node = self
+        self.z = 0
+        self.prev_z: _Node | None = None
+        self.next_z: _Node | None = None
+        self.steiner = False
+
+
+def triangulate(
+    outer: Sequence[Point], holes: Sequence[Sequence[Point]] = ()
+) -> list[tuple[int, int, int]]:
+    """CCW index triples covering ``outer`` minus ``holes`` (see module doc)."""
+    coords: list[Point] = [(float(x), float(y)) for x, y in outer]
+    hole_starts: list[int] = []
+    for hole in holes:
+        if len(hole) >= 3:
+            hole_starts.append(len(coords))
+            coords.extend((float(x), float(y)) for x, y in hole)
+    outer_len = hole_starts[0] if hole_starts else len(coords)
+    if outer_len < 3:
+        return []
+
+    triangles: list[tuple[int, int, int]] = []
+    ring = _linked_list(coords, 0, outer_len, ccw=True)
+    if ring is None or ring.next is ring.prev:
+        return triangles
+    if hole_starts:
+        ring = _eliminate_holes(coords, hole_starts, ring)
+
+    min_x = min_y = inv_size = 0.0
+    if len(coords) > ZORDER_MIN_VERTICES:
+        xs = [x for x, _y in coords[:outer_len]]
+        ys = [y for _x, y in coords[:outer_len]]
+        min_x, min_y = min(xs), min(ys)
+        size = max(max(xs) - min_x, max(ys) - min_y)
+        inv_size = 32767.0 / size if size else 0.0
+
+    _earcut_linked(ring, triangles, min_x, min_y, inv_size, 0)
+    return triangles
+
+
+# ── linked ring ─────────────────────────────────────────────────────
+
+
+def _linked_list(
+    coords: Sequence[Point], start: int, end: int, *, ccw: bool
+) -> _Node | None:
+    """Circular list of ``coords[start:end]`` in the requested winding."""
+    area = 0.0
+    j = end - 1
+    for i in range(start, end):
+        area += (coords[j][0] - coords[i][0]) * (coords[i][1] + coords[j][1])
+        j = i
+    # ``area`` > 0 means the input runs CCW (y-up).
+    last: _Node | None = None
+    order = range(start, end) if ccw == (area > 0) else range(end - 1, start - 1, -1)
+    for i in order:
+        last = _insert_node(i, coords[i][0], coords[i][1], last)
+    if last is not None and _equals(last, last.next):
+        _remove_node(last)
+        last = last.next
+    return last
+
+
+def _filter_points(start: _Node | None, end: _Node | None = None) -> _Node | None:
+    """Drop duplicate and collinear vertices."""
+    if start is None:
+        return start
+    if end is None:
+        end = start
+    p = start
+    while True:
+        again = False
+        if not p.steiner and (_equals(p, p.next) or _area(p.prev, p, p.next) == 0):
+            _remove_node(p)
+            p = end = p.prev
+            if p is p.next:
+                break
+            again = True
+        else:
+            p = p.next
+        if not again and p is end:
+            break
+    return end
+
+
+# ── ear clipping ────────────────────────────────────────────────────
+
+
+def _earcut_linked(
+    ear: _Node | None,
+    triangles: list[tuple[int, int, int]],
+    min_x: float,
+    min_y: float,
+    inv_size: float,
+    stage: int,
+) -> None:
+    if ear is None:
+        return
+    if not stage and inv_size:
+        _index_curve(ear, min_x, min_y, inv_size)
+
+    stop = ear
+    while ear.prev is not ear.next:
+        prev, nxt = ear.prev, ear.next
+        is_ear = _is_ear_hashed(ear, min_x, min_y, inv_size) if inv_size else _is_ear(ear)
+        if is_ear:
+            triangles.append((prev.i, ear.i, nxt.i))
+            _remove_node(ear)
+            ear = nxt.next
+            stop = nxt.next
+            continue
+        ear = nxt
+        if ear is stop:
+            if stage == 0:
+                _earcut_linked(_filter_points(ear), triangles, min_x, min_y, inv_size, 1)
+            elif stage == 1:
+                ear = _cure_local_intersections(_filter_points(ear), triangles)
+                _earcut_linked(ear, triangles, min_x, min_y, inv_size, 2)
+            else:
+                _split_earcut(ear, triangles, min_x, min_y, inv_size)
+            break
+
+
+def _is_ear(ear: _Node) -> bool:
+    a, b, c = ear.prev, ear, ear.next
+    if _area(a, b, c) >= 0:
+        return False  # reflex
+    x0, x1 = min(a.x, b.x, c.x), max(a.x, b.x, c.x)
+    y0, y1 = min(a.y, b.y, c.y), max(a.y, b.y, c.y)
+    p = c.next
+    while p is not a:
+        if (
+            x0 <= p.x <= x1
+            and y0 <= p.y <= y1
+            and not (p.x == a.x and p.y == a.y)
+            and _point_in_triangle(a.x, a.y, b.x, b.y, c.x, c.y, p.x, p.y)
+            and _area(p.prev, p, p.next) >= 0
+        ):
+            return False
+        p = p.next
+    return True
+
+
+def _is_ear_hashed(ear: _Node, min_x: float, min_y: float, inv_size: float) -> bool:
+    a, b, c = ear.prev, ear, ear.next
+    if _area(a, b, c) >= 0:
+        return False
+    x0, x1 = min(a.x, b.x, c.x), max(a.x, b.x, c.x)
+    y0, y1 = min(a.y, b.y, c.y), max(a.y, b.y, c.y)
+    min_z = _z_order(x0, y0, min_x, min_y, inv_size)
+    max_z = _z_order(x1, y1, min_x, min_y, inv_size)
+
+    def blocks(p: _Node) -> bool:
+        return (
+            p is not a
+            and p is not c
+            and x0 <= p.x <= x1
+            and y0 <= p.y <= y1
+            and not (p.x == a.x and p.y == a.y)
+            and _point_in_triangle(a.x, a.y, b.x, b.y, c.x, c.y, p.x, p.y)
+            and _area(p.prev, p, p.next) >= 0
+        )
+
+    p, n = ear.prev_z, ear.next_z
+    while p is not None and p.z >= min_z and n is not None and n.z <= max_z:
+        if blocks(p) or blocks(n):
+            return False
+        p, n = p.prev_z, n.next_z
+    while p is not None and p.z >= min_z:
+        if blocks(p):
+            return False
+        p = p.prev_z
+    while n is not None and n.z <= max_z:
+        if blocks(n):
+            return False
+        n = n.next_z
+    return True
+
+
+def _cure_local_intersections(
+    start: _Node | None, triangles: list[tuple[int, int, int]]
+) -> _Node | None:
+    if start is None:
+        return None
+    p = start
+    while True:
+        a, b = p.prev, p.next.next
+        if (
+            not _equals(a, b)
+            and _intersects(a, p, p.next, b)
+            and _locally_inside(a, b)
+            and _locally_inside(b, a)
+        ):
+            triangles.append((a.i, p.i, b.i))
+            _remove_node(p)
+            _remove_node(p.next)
+            p = start = b
+        p = p.next
+        if p is start:
+            break
+    return _filter_points(p)
+
+
+def _split_earcut(
+    start: _Node,
+    triangles: list[tuple[int, int, int]],
+    min_x: float,
+    min_y: float,
+    inv_size: float,
+) -> None:
+    a = start
+    while True:
+        b = a.next.next
+        while b is not a.prev:
+            if a.i != b.i and _is_valid_diagonal(a, b):
+                c = _split_polygon(a, b)
+                a = _filter_points(a, a.next)
+                c = _filter_points(c, c.next)
+                _earcut_linked(a, triangles, min_x, min_y, inv_size, 0)
+                _earcut_linked(c, triangles, min_x, min_y, inv_size, 0)
+                return
+            b = b.next
+        a = a.next
+        if a is start:
+            return
+
+
+# ── holes ───────────────────────────────────────────────────────────
+
+
+def _eliminate_holes(
+    coords: Sequence[Point], hole_starts: list[int], outer: _Node
+) -> _Node:
+    queue: list[_Node] = []
+    for k, start in enumerate(hole_starts):
+        end = hole_starts[k + 1] if k + 1 < len(hole_starts) else len(coords)
+        ring = _linked_list(coords, start, end, ccw=False)
+        if ring is None:
+            continue
+        if ring is ring.next:
+            ring.steiner = True
+        queue.append(_leftmost(ring))
+    queue.sort(key=lambda node: (node.x, node.y))
+    for hole in queue:
+        outer = _eliminate_hole(hole, outer)
+    return outer
+
+
+def _eliminate_hole(hole: _Node, outer: _Node) -> _Node:
+    bridge = _find_hole_bridge(hole, outer)
+    if bridge is None:
+        return outer
+    bridge_reverse = _split_polygon(bridge, hole)
+    _filter_points(bridge_reverse, bridge_reverse.next)
+    return _filter_points(bridge, bridge.next) or outer
+
+
+def _find_hole_bridge(hole: _Node, outer: _Node) -> _Node | None:
+    p = outer
+    hx, hy = hole.x, hole.y
+    qx = -float("inf")
+    m: _Node | None = None
+    if _equals(hole, p):
+        return p
+    while True:
+        if _equals(hole, p.next):
+            return p.next
+        if hy <= p.y and hy >= p.next.y and p.next.y != p.y:
+            x = p.x + (hy - p.y) * (p.next.x - p.x) / (p.next.y - p.y)
+            if hx >= x > qx:
+                qx = x
+                m = p if p.x < p.next.x else p.next
+                if x == hx:
+                    return m
+        p = p.next
+        if p is outer:
+            break
+    if m is None:
+        return None
+
+    stop = m
+    mx, my = m.x, m.y
+    tan_min = float("inf")
+    p = m
+    while True:
+        if (
+            hx >= p.x >= mx
+            and hx != p.x
+            and _point_in_triangle(
+                hx if hy < my else qx, hy, mx, my, qx if hy < my else hx, hy, p.x, p.y
+            )
+        ):
+            tan = abs(hy - p.y) / (hx - p.x)
+            if _locally_inside(p, hole) and (
+                tan < tan_min
+                or (
+                    tan == tan_min
+                    and (p.x > m.x or (p.x == m.x and _sector_contains_sector(m, p)))
+                )
+            ):
+                m = p
+                tan_min = tan
+        p = p.next
+        if p is stop:
+            break
+    return m
+
+
+def _sector_contains_sector(m: _Node, p: _Node) -> bool:
+    return _area(m.prev, m, p.prev) < 0 and _area(p.next, m, m.next) < 0
+
+
+def _leftmost(start: _Node) -> _Node:
+    p = left = start
+    while True:
+        if p.x < left.x or (p.x == left.x and p.y < left.y):
+            left = p
+        p = p.next
+        if p is start:
+            return left
+
+
+# ── z-order index ───────────────────────────────────────────────────
+
+
+def _index_curve(start: _Node, min_x: float, min_y: float, inv_size: float) -> None:
+    p = start
+    while True:
+        if p.z == 0:
+            p.z = _z_order(p.x, p.y, min_x, min_y, inv_size)
+        p.prev_z = p.prev
+        p.next_z = p.next
+        p = p.next
+        if p is start:
+            break
+    # A sort on a Python list replaces earcut's in-place linked-list merge sort.
+    nodes: list[_Node] = []
+    p = start
+    while True:
+        nodes.append(p)
+        p = p.next
+        if p is start:
+            break
+    nodes.sort(key=lambda node: node.z)
+    for k, node in enumerate(nodes):
+        node.prev_z = nodes[k - 1] if k else None
+        node.next_z = nodes[k + 1] if k + 1 < len(nodes) else None
+
+
+def _z_order(x: float, y: float, min_x: float, min_y: float, inv_size: float) -> int:
+    """Morton code of a point on the 15-bit grid spanned by the ring's bbox."""
+    xi = int((x - min_x) * inv_size)
+    yi = int((y - min_y) * inv_size)
+    xi = (xi | (xi << 8)) & 0x00FF00FF
+    xi = (xi | (xi << 4)) & 0x0F0F0F0F
+    xi = (xi | (xi << 2)) & 0x33333333
+    xi = (xi | (xi << 1)) & 0x55555555
+    yi = (yi | (yi << 8)) & 0x00FF00FF
+    yi = (yi | (yi << 4)) & 0x0F0F0F0F
+    yi = (yi | (yi << 2)) & 0x33333333
+    yi = (yi | (yi << 1)) & 0x55555555
+    return xi | (yi << 1)
+
+
+# ── primitives ──────────────────────────────────────────────────────
+
+
+def _point_in_triangle(
+    ax: float, ay: float, bx: float, by: float, cx: float, cy: float, px: float, py: float
+) -> bool:
+    return (
+        (cx - px) * (ay - py) >= (ax - px) * (cy - py)
+        and (ax - px) * (by - py) >= (bx - px) * (ay - py)
+        and (bx - px) * (cy - py) >= (cx - px) * (by - py)
+    )
+
+
+def _is_valid_diagonal(a: _Node, b: _Node) -> bool:
+    return bool(
+        a.next.i != b.i
+        and a.prev.i != b.i
+        and not _intersects_polygon(a, b)
+        and (
+            (
+                _locally_inside(a, b)
+                and _locally_inside(b, a)
+                and _middle_inside(a, b)
+                and (_area(a.prev, a, b.prev) or _area(a, b.prev, b))
+            )
+            or (
+                _equals(a, b)
+                and _area(a.prev, a, a.next) > 0
+                and _area(b.prev, b, b.next) > 0
+            )
+        )
+    )
+
+
+def _area(p: _Node, q: _Node, r: _Node) -> float:
+    """Negative for a convex corner of a CCW (y-up) ring."""
+    return (q.y - p.y) * (r.x - q.x) - (q.x - p.x) * (r.y - q.y)
+
+
+def _equals(p: _Node, q: _Node) -> bool:
+    return p.x == q.x and p.y == q.y
+
+
+def _intersects(p1: _Node, q1: _Node, p2: _Node, q2: _Node) -> bool:
+    o1 = _sign(_area(p1, q1, p2))
+    o2 = _sign(_area(p1, q1, q2))
+    o3 = _sign(_area(p2, q2, p1))
+    o4 = _sign(_area(p2, q2, q1))
+    if o1 != o2 and o3 != o4:
+        return True
+    return (
+        (o1 == 0 and _on_segment(p1, p2, q1))
+        or (o2 == 0 and _on_segment(p1, q2, q1))
+        or (o3 == 0 and _on_segment(p2, p1, q2))
+        or (o4 == 0 and _on_segment(p2, q1, q2))
+    )
+
+
+def _on_segment(p: _Node, q: _Node, r: _Node) -> bool:
+    return (
+        min(p.x, r.x) <= q.x <= max(p.x, r.x)
+        and min(p.y, r.y) <= q.y <= max(p.y, r.y)
+    )
+
+
+def _sign(value: float) -> int:
+    return (value > 0) - (value < 0)
+
+
+def _intersects_polygon(a: _Node, b: _Node) -> bool:
+    p = a
+    while True:
+        if (
+            p.i != a.i
+            and p.next.i != a.i
+            and p.i != b.i
+            and p.next.i != b.i
+            and _intersects(p, p.next, a, b)
+        ):
+            return True
+        p = p.next
+        if p is a:
+            return False
+
+
+def _locally_inside(a: _Node, b: _Node) -> bool:
+    if _area(a.prev, a, a.next) < 0:
+        return _area(a, b, a.next) >= 0 and _area(a, a.prev, b) >= 0
+    return _area(a, b, a.prev) < 0 or _area(a, a.next, b) < 0
+
+
+def _middle_inside(a: _Node, b: _Node) -> bool:
+    p = a
+    inside = False
+    px, py = (a.x + b.x) / 2, (a.y + b.y) / 2
+    while True:
+        if (
+            (p.y > py) != (p.next.y > py)
+            and p.next.y != p.y
+            and px < (p.next.x - p.x) * (py - p.y) / (p.next.y - p.y) + p.x
+        ):
+            inside = not inside
+        p = p.next
+        if p is a:
+            return inside
+
+
+def _split_polygon(a: _Node, b: _Node) -> _Node:
+    """Link ``a`` and ``b`` with a bridge; returns the twin of ``b``."""
+    a2 = _Node(a.i, a.x, a.y)
+    b2 = _Node(b.i, b.x, b.y)
+    an, bp = a.next, b.prev
+    a.next = b
+    b.prev = a
+    a2.next = an
+    an.prev = a2
+    b2.next = a2
+    a2.prev = b2
+    bp.next = b2
+    b2.prev = bp
+    return b2
+
+
+def _insert_node(i: int, x: float, y: float, last: _Node | None) -> _Node:
+    p = _Node(i, x, y)
+    if last is None:
+        p.prev = p
+        p.next = p
+    else:
+        p.next = last.next
+        p.prev = last
+        last.next.prev = p
+        last.next = p
+    return p
+
+
+def _remove_node(p: _Node) -> None:
+    p.next.prev = p.prev
+    p.prev.next = p.next
+    if p.prev_z is not None:
+        p.prev_z.next_z = p.next_z
+    if p.next_z is not None:
+        p.next_z.prev_z = p.prev_z
@@ -5,12 +5,6 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-# QtWebEngineWidgets (used by the satellite map picker) must be imported
-# before QApplication is created — Qt enforces this so it can configure
-# OpenGL sharing in time. Importing here at module load satisfies the
-# requirement regardless of whether the picker is opened this session.
-from PyQt6 import QtWebEngineWidgets  # noqa: F401, E402
-
 # Load environment variables from a ``.env`` file. Two layouts to support:
 # - Dev (source run): repo-root ``.env`` (three parents up from this file).
 # - Frozen (PyInstaller exe): ``.env`` placed next to the .exe by the user;
@@ -234,11 +228,27 @@ def _install_excepthook() -> None:
 
 def main() -> int:
     """Run the Open Garden Planner application."""
+    # Frozen builds re-launch this executable for worker processes (PDF
+    # reports); freeze_support() hands those launches to multiprocessing.
+    # Here rather than in __main__: the installed entry point calls main().
+    import multiprocessing
+
+    multiprocessing.freeze_support()
+
     # Headless subsystem self-test (issue #277) — before any Qt UI is created.
     if "--selftest" in sys.argv:
         return _run_selftest()
 
+    # Before any other import, so the breakdown covers PyQt6 and the app.
+    profiler = None
+    if "--profile-startup" in sys.argv:
+        from open_garden_planner.startup_profile import StartupProfiler
+
+        profiler = StartupProfiler()
+        profiler.install()
+
     # Import here to avoid slow startup for --help, --version, etc.
+    from PyQt6.QtCore import QCoreApplication, Qt
     from PyQt6.QtGui import QIcon
     from PyQt6.QtWidgets import QApplication
 
@@ -251,6 +261,15 @@ def main() -> int:
     from open_garden_planner.core.i18n import load_translator
     from open_garden_planner.ui.theme import apply_theme
 
+    if profiler is not None:
+        profiler.mark("imports")
+
+    # QtWebEngineWidgets (the satellite map picker) must either be imported
+    # before QApplication exists or find OpenGL context sharing enabled, so
+    # that Qt can share contexts with it. Enabling sharing lets the picker
+    # import the web engine when it is first opened, instead of every start
+    # paying for it.
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
     # Same pair the settings chokepoint builds every store from (ADR-041) — read
     # from there rather than repeated, so there is one source of truth for it.
@@ -272,11 +291,18 @@ def main() -> int:
     # silent process kill that discards unsaved work (issue #277).
     _install_excepthook()
 
+    if profiler is not None:
+        profiler.mark("application and theme")
     window = GardenPlannerApp()
+    if profiler is not None:
+        profiler.mark("main window")
+        profiler.report_after_first_paint(window)
     window.show()
 
     # Reapply theme after window is shown to update title bar
     apply_theme(app, settings.theme_mode)
+    if profiler is not None:
+        profiler.mark("show")
 
     # Open file passed as command-line argument (e.g. double-click .ogp file)
     args = app.arguments()
@@ -215,8 +215,9 @@ class SeedViabilityDB:
     @classmethod
     def load(cls, path: Path) -> SeedViabilityDB:
         """Load the database from a JSON file."""
-        with open(path, encoding="utf-8") as fh:
-            return cls(json.load(fh))
+        from open_garden_planner.services.bundled_data import load_bundled_json
+
+        return cls(load_bundled_json(path))
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> SeedViabilityDB:
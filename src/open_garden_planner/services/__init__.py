@@ -1,13 +1,24 @@
-"""External services (file I/O, plant API, etc.)."""
+"""External services (file I/O, plant API, etc.).
 
-from .autosave_service import AutoSaveManager
-from .plant_api import (
-    PlantAPIClient,
-    PlantAPIError,
-    PlantAPIManager,
-    PlantDetailUnavailableError,
-)
-from .plant_library import PlantLibrary, get_plant_library
+The exports are resolved lazily: importing one service module (say the
+companion-planting data at startup) must not pull in the plant API clients
+and with them ``requests``.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .autosave_service import AutoSaveManager
+    from .plant_api import (
+        PlantAPIClient,
+        PlantAPIError,
+        PlantAPIManager,
+        PlantDetailUnavailableError,
+    )
+    from .plant_library import PlantLibrary, get_plant_library
 
 __all__ = [
     "AutoSaveManager",
@@ -18,3 +29,21 @@ __all__ = [
     "PlantLibrary",
     "get_plant_library",
 ]
+
+_LAZY = {
+    "AutoSaveManager": ".autosave_service",
+    "PlantAPIClient": ".plant_api",
+    "PlantAPIError": ".plant_api",
+    "PlantAPIManager": ".plant_api",
+    "PlantDetailUnavailableError": ".plant_api",
+    "PlantLibrary": ".plant_library",
+    "get_plant_library": ".plant_library",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module behind an export on first access."""
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
@@ -10,6 +10,7 @@ import json
 from pathlib import Path
 
 from open_garden_planner.models.amendment import Amendment
+from open_garden_planner.services.bundled_data import load_bundled_json
 
 _DATA_DIR = Path(__file__).parent.parent / "resources" / "data"
 _AMENDMENTS_FILENAME = "amendments.json"
@@ -34,8 +35,7 @@ class AmendmentLoader:
 
     def _load(self) -> list[Amendment]:
         try:
-            with open(self._path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_bundled_json(self._path)
         except (OSError, json.JSONDecodeError) as exc:
             raise ValueError(
                 f"Failed to read amendments file {self._path}: {exc}"
@@ -0,0 +1,142 @@
+"""Precompiled form of the bundled ``resources/data`` JSON files.
+
+The species, companion-planting, amendment, seed-viability and smart-symbol
+files are read on first use, several of them while the main window is being
+built. ``scripts/compile_bundled_data.py`` (run by the installer build)
+packs every ``*.json`` below ``resources/data`` into
+``resources/data/bundled_data.pickle``, and ``load_bundled_json`` serves a
+document from there instead of parsing JSON, about twice as fast.
+
+The archive records each source file's size and SHA-256, computed at build
+time. A document is served from the archive only while its file still hashes
+to that digest; a file edited since the archive was built is parsed as JSON.
+Content rather than mtime decides, because a git checkout gives every file a
+fresh mtime. A missing, unreadable or older-format archive likewise falls
+back to JSON, so the archive is only ever an accelerator.
+
+Every document is pickled on its own and unpickled per call: callers get a
+fresh object, exactly as from ``json.load``, and may mutate it. Only plain
+JSON types are accepted on unpickling.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import pickle
+import threading
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent.parent / "resources" / "data"
+COMPILED_FILENAME = "bundled_data.pickle"
+
+#: Bumped whenever the archive layout changes; older archives are ignored.
+FORMAT_VERSION = 2
+
+# Fixed rather than HIGHEST_PROTOCOL: the archive is built by whichever
+# Python runs the build and must load on every supported one (3.11+).
+_PROTOCOL = 5
+
+
+class _JsonUnpickler(pickle.Unpickler):
+    """Unpickler for plain JSON data: refuses to resolve any class."""
+
+    def find_class(self, module: str, name: str) -> Any:
+        raise pickle.UnpicklingError(f"{module}.{name} is not bundled data")
+
+
+def _unpickle(payload: bytes) -> Any:
+    return _JsonUnpickler(io.BytesIO(payload)).load()
+
+
+def _source_files(data_dir: Path) -> list[Path]:
+    return sorted(data_dir.rglob("*.json"))
+
+
+def compile_bundled_data(data_dir: Path | None = None) -> Path:
+    """Write the archive for every JSON file below ``data_dir``.
+
+    Returns:
+        Path of the written archive. Raises ``json.JSONDecodeError`` on a
+        malformed source file, so a broken asset fails the build.
+    """
+    data_dir = data_dir or DATA_DIR
+    documents: dict[str, tuple[int, str, bytes]] = {}
+    for path in _source_files(data_dir):
+        raw = path.read_bytes()
+        payload = pickle.dumps(json.loads(raw), protocol=_PROTOCOL)
+        documents[path.relative_to(data_dir).as_posix()] = (
+            len(raw),
+            hashlib.sha256(raw).hexdigest(),
+            payload,
+        )
+    target = data_dir / COMPILED_FILENAME
+    tmp = target.with_suffix(".tmp")
+    tmp.write_bytes(
+        pickle.dumps({"version": FORMAT_VERSION, "documents": documents}, protocol=_PROTOCOL)
+    )
+    tmp.replace(target)
+    return target
+
+
+_archives: dict[Path, dict[str, tuple[int, str, bytes]]] = {}
+_archives_lock = threading.Lock()
+
+
+def _archive(data_dir: Path) -> dict[str, tuple[int, str, bytes]]:
+    """The documents of ``data_dir``'s archive ({} when there is none)."""
+    with _archives_lock:
+        documents = _archives.get(data_dir)
+        if documents is None:
+            documents = {}
+            try:
+                archive = _unpickle((data_dir / COMPILED_FILENAME).read_bytes())
+                if isinstance(archive, dict) and archive.get("version") == FORMAT_VERSION:
+                    documents = archive["documents"]
+                else:
+                    logger.info("Ignoring bundled data archive of another format")
+            except FileNotFoundError:
+                pass
+            except Exception as exc:  # noqa: BLE001 — any broken archive means "parse JSON"
+                logger.warning("Ignoring unreadable bundled data archive: %s", exc)
+            _archives[data_dir] = documents
+        return documents
+
+
+def load_bundled_json(path: Path, data_dir: Path | None = None) -> Any:
+    """Return the parsed content of ``path``, from the archive when current.
+
+    Behaves like ``json.load`` on the file — including its ``OSError`` and
+    ``json.JSONDecodeError`` — for files outside ``data_dir`` or not (or no
+    longer) matching the archive.
+    """
+    data_dir = data_dir or DATA_DIR
+    try:
+        key = path.relative_to(data_dir).as_posix()
+    except ValueError:
+        key = None
+    entry = _archive(data_dir).get(key) if key is not None else None
+    if entry is not None:
+        size, digest, payload = entry
+        try:
+            raw = path.read_bytes()
+        except OSError:
+            raw = None
+        if raw is not None:
+            if len(raw) == size and hashlib.sha256(raw).hexdigest() == digest:
+                return _unpickle(payload)
+            logger.debug("%s changed since the bundled data archive was built", key)
+            return json.loads(raw)
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def reset_bundled_data_cache() -> None:
+    """Forget loaded archives so the next load re-reads them (tests)."""
+    with _archives_lock:
+        _archives.clear()
@@ -9,10 +9,11 @@ calendar callers should keep using ``get_calendar_entry`` / ``merge_calendar_dat
 with their original signatures.
 """
 
-import json
 from pathlib import Path
 from typing import Any
 
+from open_garden_planner.services.bundled_data import load_bundled_json
+
 _DATA_DIR = Path(__file__).parent.parent / "resources" / "data"
 
 
@@ -57,9 +58,7 @@ def _load_species_db() -> tuple[
     by_common: dict[str, dict[str, Any]] = {}
     by_alias: dict[str, dict[str, Any]] = {}
     try:
-        species_path = _DATA_DIR / "plant_species.json"
-        with open(species_path, encoding="utf-8") as f:
-            parsed: dict[str, Any] = json.load(f)
+        parsed: dict[str, Any] = load_bundled_json(_DATA_DIR / "plant_species.json")
     except Exception:
         return by_scientific, by_common, by_alias
 
@@ -2,18 +2,23 @@
 
 Uses the Open-Meteo ERA5 archive API (free, no API key required) to fetch
 historical daily minimum temperatures and compute local frost dates and
-USDA hardiness zones.
+USDA hardiness zones. Results live in the shared site data cache
+(``site_data_cache``) next to the weather forecasts.
 """
 
-import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from pathlib import Path
 from typing import Any
 
 import requests
-from PyQt6.QtCore import QStandardPaths
+
+from open_garden_planner.services.site_data_cache import (
+    CacheEntry,
+    Site,
+    SiteDataCache,
+    SiteLookup,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +42,9 @@ _USDA_ZONES: list[tuple[float, str]] = [
 ]
 
 _CACHE_EXPIRY_DAYS = 365
+_REFRESH_AHEAD_DAYS = 30  # refresh in the background during the last month
+_BATCH_SIZE = 10  # sites per archive request (10 years of days each)
+_CACHE_KIND = "frost"
 
 
 def _celsius_to_fahrenheit(c: float) -> float:
@@ -83,12 +91,30 @@ class ClimateService:
 
     Uses the Open-Meteo ERA5 archive API (free, no API key) to fetch 10 years
     of daily minimum temperatures and compute typical frost dates and USDA zone.
-    Results are cached on disk for one year to avoid repeated API calls.
+    Results are cached for one year to avoid repeated API calls.
     """
 
-    def __init__(self) -> None:
-        """Initialise the climate service and ensure the cache directory exists."""
-        self._cache_dir = self._get_cache_dir()
+    def __init__(
+        self,
+        base_url: str = _OPEN_METEO_ARCHIVE_URL,
+        cache: SiteDataCache | None = None,
+    ) -> None:
+        """Initialise the climate service.
+
+        Args:
+            base_url: Archive endpoint; tests point it at a local stand-in.
+            cache: Store to use instead of the shared site data cache.
+        """
+        self._base_url = base_url
+        self._lookup = SiteLookup(
+            _CACHE_KIND,
+            key=self._cache_key,
+            fetch=self._fetch_payloads,
+            ttl_s=_CACHE_EXPIRY_DAYS * 86400,
+            refresh_ahead_s=_REFRESH_AHEAD_DAYS * 86400,
+            batch_size=_BATCH_SIZE,
+            cache=cache,
+        )
 
     # ------------------------------------------------------------------
     # Public API
@@ -97,8 +123,9 @@ class ClimateService:
     def lookup_frost_dates(self, lat: float, lon: float) -> FrostData:
         """Look up frost dates and hardiness zone for given coordinates.
 
-        Checks the on-disk cache first; if no valid entry exists the
-        Open-Meteo ERA5 archive is queried.
+        Checks the cache first; if no valid entry exists the Open-Meteo ERA5
+        archive is queried (a concurrent lookup of the same cell shares
+        that request).
 
         Args:
             lat: Latitude in decimal degrees (−90 to 90).
@@ -110,79 +137,68 @@ class ClimateService:
         Raises:
             ClimateServiceError: If the lookup fails and no cache is available.
         """
-        cached = self._load_cache(lat, lon)
-        if cached is not None:
-            logger.info("Using cached climate data for (%.4f, %.4f)", lat, lon)
-            return cached
+        try:
+            entry = self._lookup.get(lat, lon)
+        except ClimateServiceError:
+            raise
+        except Exception as exc:
+            raise ClimateServiceError(f"Frost date lookup failed: {exc}") from exc
+        return self._frost_data(lat, lon, entry)
 
-        data = self._fetch_from_open_meteo(lat, lon)
-        self._save_cache(lat, lon, data)
-        return data
+    def lookup_frost_dates_many(self, sites: list[Site]) -> dict[Site, FrostData | None]:
+        """Look up several sites, fetching every uncached one in batched requests.
+
+        Args:
+            sites: ``(lat, lon)`` pairs.
+
+        Returns:
+            FrostData per requested site, or None where the lookup failed.
+        """
+        result: dict[Site, FrostData | None] = {}
+        for (lat, lon), answer in self._lookup.get_many(sites).items():
+            if isinstance(answer, BaseException):
+                logger.warning("Frost date lookup failed for (%.4f, %.4f): %s", lat, lon, answer)
+                result[(lat, lon)] = None
+            else:
+                result[(lat, lon)] = self._frost_data(lat, lon, answer)
+        return result
 
     # ------------------------------------------------------------------
     # Cache helpers
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _get_cache_dir() -> Path:
-        app_data = QStandardPaths.writableLocation(
-            QStandardPaths.StandardLocation.AppLocalDataLocation
-        )
-        cache_dir = Path(app_data) / "climate_cache"
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir
-
     def _cache_key(self, lat: float, lon: float) -> str:
         """Round coordinates to ~0.5° (~55 km) for cache key grouping."""
         return f"{round(lat * 2) / 2:.1f}_{round(lon * 2) / 2:.1f}"
 
-    def _load_cache(self, lat: float, lon: float) -> FrostData | None:
-        """Load cached frost data if it exists and has not expired."""
-        cache_file = self._cache_dir / f"{self._cache_key(lat, lon)}.json"
-        if not cache_file.exists():
-            return None
-        try:
-            raw: dict[str, Any] = json.loads(cache_file.read_text(encoding="utf-8"))
-            cached_at = datetime.fromisoformat(raw.get("cached_at", "2000-01-01"))
-            age_days = (datetime.now() - cached_at).days
-            if age_days > _CACHE_EXPIRY_DAYS:
-                logger.debug("Climate cache expired for (%.4f, %.4f)", lat, lon)
-                return None
-            return FrostData(
-                last_spring_frost=raw.get("last_spring_frost"),
-                first_fall_frost=raw.get("first_fall_frost"),
-                hardiness_zone=raw.get("hardiness_zone"),
-                data_source="cached",
-                latitude=lat,
-                longitude=lon,
-            )
-        except Exception as exc:
-            logger.warning("Failed to load climate cache: %s", exc)
-            return None
+    @staticmethod
+    def _frost_data(lat: float, lon: float, entry: CacheEntry) -> FrostData:
+        if entry.fetched:
+            logger.debug("Fetched climate data for (%.4f, %.4f)", lat, lon)
+        else:
+            logger.info("Using cached climate data for (%.4f, %.4f)", lat, lon)
+        raw: dict[str, Any] = entry.payload
+        return FrostData(
+            last_spring_frost=raw.get("last_spring_frost"),
+            first_fall_frost=raw.get("first_fall_frost"),
+            hardiness_zone=raw.get("hardiness_zone"),
+            data_source="open-meteo" if entry.fetched else "cached",
+            latitude=lat,
+            longitude=lon,
+        )
 
-    def _save_cache(self, lat: float, lon: float, data: FrostData) -> None:
-        """Persist frost data to the on-disk cache."""
-        cache_file = self._cache_dir / f"{self._cache_key(lat, lon)}.json"
-        try:
-            payload: dict[str, Any] = {
-                "cached_at": datetime.now().isoformat(),
-                "last_spring_frost": data.last_spring_frost,
-                "first_fall_frost": data.first_fall_frost,
-                "hardiness_zone": data.hardiness_zone,
-            }
-            cache_file.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-        except Exception as exc:
-            logger.warning("Failed to save climate cache: %s", exc)
+    def _fetch_payloads(self, sites: list[Site]) -> list[dict[str, Any]]:
+        return [_payload(data) for data in self._fetch_many_from_open_meteo(sites)]
 
     # ------------------------------------------------------------------
     # API fetch
     # ------------------------------------------------------------------
 
-    def _fetch_from_open_meteo(self, lat: float, lon: float) -> FrostData:
+    def _fetch_many_from_open_meteo(self, sites: list[Site]) -> list[FrostData]:
         """Query the Open-Meteo ERA5 archive for historical daily min temps.
 
-        Fetches the last 10 complete calendar years and derives frost dates
-        and an estimated USDA hardiness zone.
+        Fetches the last 10 complete calendar years for every site in one
+        request and derives frost dates and an estimated USDA hardiness zone.
 
         Raises:
             ClimateServiceError: On network error or unexpected response format.
@@ -192,8 +208,8 @@ class ClimateService:
         start_year = end_year - 9  # 10 full years
 
         params = {
-            "latitude": lat,
-            "longitude": lon,
+            "latitude": ",".join(str(lat) for lat, _ in sites),
+            "longitude": ",".join(str(lon) for _, lon in sites),
             "start_date": f"{start_year}-01-01",
             "end_date": f"{end_year}-12-31",
             "daily": "temperature_2m_min",
@@ -202,7 +218,7 @@ class ClimateService:
 
         try:
             response = requests.get(
-                _OPEN_METEO_ARCHIVE_URL, params=params, timeout=30
+                self._base_url, params=params, timeout=30
             )
             response.raise_for_status()
         except requests.RequestException as exc:
@@ -217,16 +233,26 @@ class ClimateService:
                 f"Invalid JSON from Open-Meteo: {exc}"
             ) from exc
 
-        daily = raw.get("daily", {})
-        dates: list[str] = daily.get("time", [])
-        temps: list[float | None] = daily.get("temperature_2m_min", [])
-
-        if not dates or not temps:
+        # One site answers with an object, several with a list in request order.
+        answers = raw if isinstance(raw, list) else [raw]
+        if len(answers) != len(sites):
             raise ClimateServiceError(
-                "No temperature data received from Open-Meteo"
+                f"Open-Meteo returned {len(answers)} records for {len(sites)} sites"
             )
 
-        return self._compute_frost_data(lat, lon, dates, temps)
+        results: list[FrostData] = []
+        for (lat, lon), answer in zip(sites, answers, strict=True):
+            daily = answer.get("daily", {})
+            dates: list[str] = daily.get("time", [])
+            temps: list[float | None] = daily.get("temperature_2m_min", [])
+
+            if not dates or not temps:
+                raise ClimateServiceError(
+                    "No temperature data received from Open-Meteo"
+                )
+
+            results.append(self._compute_frost_data(lat, lon, dates, temps))
+        return results
 
     # ------------------------------------------------------------------
     # Computation helpers
@@ -302,6 +328,15 @@ class ClimateService:
         )
 
 
+def _payload(data: FrostData) -> dict[str, Any]:
+    """The cached fields of ``data`` (coordinates and source are per lookup)."""
+    return {
+        "last_spring_frost": data.last_spring_frost,
+        "first_fall_frost": data.first_fall_frost,
+        "hardiness_zone": data.hardiness_zone,
+    }
+
+
 def _median_date(mmdd_list: list[str]) -> str | None:
     """Return the median MM-DD value from a list of "MM-DD" strings.
 
@@ -13,6 +13,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from open_garden_planner.services.bundled_data import load_bundled_json
 from open_garden_planner.services.plant_library import get_app_data_dir
 
 _DATA_DIR = Path(__file__).parent.parent / "resources" / "data"
@@ -280,9 +281,7 @@ class CompanionPlantingService:
     def _load_db(self) -> None:
         """Load the bundled companion planting JSON database."""
         try:
-            db_path = _DATA_DIR / "companion_planting.json"
-            with open(db_path, encoding="utf-8") as f:
-                self._db = json.load(f)
+            self._db = load_bundled_json(_DATA_DIR / "companion_planting.json")
         except Exception:
             return
 
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import contextlib
 import math
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from PyQt6.QtCore import QPointF, QRectF
+from PyQt6.QtCore import QObject, QPointF, QRectF, QThread, pyqtSignal
 from PyQt6.QtWidgets import QGraphicsItem, QGraphicsScene
 
 if TYPE_CHECKING:
@@ -282,8 +285,56 @@ class DxfExportService:
 
 # ---------------------------------------------------------------------------
 # DXF Import
+#
+# Import runs in two halves. ``parse_file`` reads the DXF and converts each
+# modelspace entity to a plain, Qt-free ``DxfShape`` (scene centimetres); it
+# is safe to run on a worker thread (``DxfImportWorker``) and reports progress
+# and honours a cancel check. ``build_items`` then creates the layers and
+# graphics items on the GUI thread in one batch. ``import_file`` chains the
+# two synchronously.
 # ---------------------------------------------------------------------------
 
+class DxfImportCancelled(RuntimeError):
+    """Raised when a DXF parse is cancelled by the caller."""
+
+
+@dataclass(frozen=True, slots=True)
+class DxfShape:
+    """One importable DXF entity as plain geometry, in scene centimetres.
+
+    ``kind`` is ``"polyline"``, ``"polygon"``, ``"circle"`` (``center``,
+    ``radius``) or ``"ellipse"`` (``center``, ``radius`` / ``minor`` semi-axes,
+    ``rotation`` in degrees).
+    """
+
+    kind: str
+    layer: str
+    points: tuple[tuple[float, float], ...] = ()
+    center: tuple[float, float] = (0.0, 0.0)
+    radius: float = 0.0
+    minor: float = 0.0
+    rotation: float = 0.0
+
+
+@dataclass
+class DxfParseResult:
+    """Plain-data result of ``DxfImportService.parse_file``."""
+
+    shapes: list[DxfShape] = field(default_factory=list)
+    #: DXF layers holding supported entities, in first-seen order.
+    layers: list[str] = field(default_factory=list)
+    entity_count: int = 0
+    skipped_count: int = 0
+    skipped_types: list[str] = field(default_factory=list)
+    #: LINE entities folded into longer polylines by ``merge_lines``.
+    merged_lines: int = 0
+
+    def skip(self, dxf_type: str) -> None:
+        self.skipped_count += 1
+        if dxf_type not in self.skipped_types:
+            self.skipped_types.append(dxf_type)
+
+
 @dataclass
 class DxfImportResult:
     """Result of a DXF import operation."""
@@ -293,6 +344,117 @@ class DxfImportResult:
     skipped_types: list[str] = field(default_factory=list)
 
 
+#: Entities converted between two progress / cancel checks.
+_PROGRESS_EVERY = 500
+
+#: Endpoints closer than this (scene cm) join when chaining LINEs.
+_JOIN_EPS = 1e-6
+
+
+@contextmanager
+def _open_modelspace(file_path: Path | str) -> Iterator[tuple[Iterable[Any], Callable[[], int], int]]:
+    """Yield ``(entities, bytes_read, file_size)`` for a DXF's modelspace.
+
+    ASCII files are streamed entity by entity with ``ezdxf.addons.iterdxf``,
+    so a 100k-entity survey never exists as one in-memory document; binary
+    or malformed files fall back to ``ezdxf.readfile`` (whose progress then
+    jumps from 0 to done once loaded).
+    """
+    import ezdxf
+    from ezdxf.addons import iterdxf
+    from ezdxf.lldxf.validator import is_binary_dxf_file
+
+    path = str(file_path)
+    size = max(1, Path(path).stat().st_size)
+    streamed = None
+    if not is_binary_dxf_file(path):
+        try:
+            streamed = iterdxf.opendxf(path)
+        except ezdxf.DXFError:
+            streamed = None
+    if streamed is not None:
+        try:
+            yield streamed.modelspace(), streamed.file.tell, size
+        finally:
+            streamed.close()
+        return
+    doc = ezdxf.readfile(path)
+    yield doc.modelspace(), lambda: size, size
+
+
+def _simplify(points: list[tuple[float, float]], tolerance: float) -> list[tuple[float, float]]:
+    """Ramer–Douglas–Peucker: drop vertices within ``tolerance`` of the chord."""
+    if len(points) < 3:
+        return points
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        (ax, ay), (bx, by) = points[first], points[last]
+        dx, dy = bx - ax, by - ay
+        length = math.hypot(dx, dy)
+        worst, worst_dist = -1, tolerance
+        for i in range(first + 1, last):
+            px, py = points[i]
+            if length > 0.0:
+                dist = abs(dx * (py - ay) - dy * (px - ax)) / length
+            else:
+                dist = math.hypot(px - ax, py - ay)
+            if dist > worst_dist:
+                worst, worst_dist = i, dist
+        if worst >= 0:
+            keep[worst] = True
+            stack.append((first, worst))
+            stack.append((worst, last))
+    return [p for p, k in zip(points, keep, strict=True) if k]
+
+
+def _chain_lines(
+    segments: list[tuple[tuple[float, float], tuple[float, float]]],
+) -> list[list[tuple[float, float]]]:
+    """Join LINE segments that share endpoints into polylines.
+
+    Chains run through vertices where exactly two segments meet; a branch
+    or a dead end closes the chain. A closed loop repeats its first point.
+    """
+
+    def key(p: tuple[float, float]) -> tuple[int, int]:
+        return (round(p[0] / _JOIN_EPS), round(p[1] / _JOIN_EPS))
+
+    at: dict[tuple[int, int], list[int]] = {}
+    for idx, (a, b) in enumerate(segments):
+        at.setdefault(key(a), []).append(idx)
+        at.setdefault(key(b), []).append(idx)
+    used = [False] * len(segments)
+
+    def extend(chain: list[tuple[float, float]], seg: int) -> None:
+        # Walk from chain[-1] away from segment ``seg``.
+        while True:
+            node = at[key(chain[-1])]
+            if len(node) != 2:
+                return
+            nxt = node[0] if node[1] == seg else node[1]
+            if used[nxt]:
+                return
+            used[nxt] = True
+            a, b = segments[nxt]
+            chain.append(b if key(a) == key(chain[-1]) else a)
+            seg = nxt
+
+    chains: list[list[tuple[float, float]]] = []
+    for idx, (a, b) in enumerate(segments):
+        if used[idx]:
+            continue
+        used[idx] = True
+        forward = [a, b]
+        extend(forward, idx)
+        backward = [b, a]
+        extend(backward, idx)
+        chains.append(backward[:1:-1] + forward)
+    return chains
+
+
 class DxfImportService:
     """Imports DXF entities into a CanvasScene."""
 
@@ -300,15 +462,17 @@ class DxfImportService:
     ARC_SEGMENTS = 32
 
     @staticmethod
-    def get_dxf_layers(file_path: Path | str) -> list[str]:
+    def get_dxf_layers(
+        file_path: Path | str, cancel_check: Callable[[], bool] | None = None
+    ) -> list[str]:
         """Return the list of layer names present in a DXF file."""
-        import ezdxf
-
-        doc = ezdxf.readfile(str(file_path))
         layers: set[str] = set()
-        for entity in doc.modelspace():
-            if hasattr(entity, "dxf") and hasattr(entity.dxf, "layer"):
-                layers.add(entity.dxf.layer)
+        with _open_modelspace(file_path) as (entities, _read, _size):
+            for count, entity in enumerate(entities, 1):
+                if count % _PROGRESS_EVERY == 0 and cancel_check is not None and cancel_check():
+                    raise DxfImportCancelled("DXF layer scan cancelled")
+                if hasattr(entity, "dxf") and hasattr(entity.dxf, "layer"):
+                    layers.add(entity.dxf.layer)
         return sorted(layers)
 
     @staticmethod
@@ -323,33 +487,146 @@ class DxfImportService:
         The caller is responsible for adding items to the scene via a Command.
         Y-coordinates are scaled only; no negation (DXF Y-up matches OGP scene Y-up).
         """
-        import ezdxf
-
-        doc = ezdxf.readfile(str(file_path))
-        result = DxfImportResult()
-
-        for entity in doc.modelspace():
-            dxf_type = entity.dxftype()
-            dxf_layer = getattr(entity.dxf, "layer", "0") if hasattr(entity, "dxf") else "0"
+        parsed = DxfImportService.parse_file(file_path, scale_factor, selected_layers)
+        return DxfImportService.build_items(scene, parsed)
 
-            if selected_layers is not None and dxf_layer not in selected_layers:
-                continue
+    @staticmethod
+    def parse_file(
+        file_path: Path | str,
+        scale_factor: float = 1.0,
+        selected_layers: list[str] | None = None,
+        *,
+        merge_lines: bool = False,
+        simplify_tolerance: float = 0.0,
+        progress_callback: Callable[[int, int], None] | None = None,
+        cancel_check: Callable[[], bool] | None = None,
+    ) -> DxfParseResult:
+        """Convert a DXF's modelspace to ``DxfShape`` geometry (Qt-free).
+
+        Args:
+            file_path: DXF file to read.
+            scale_factor: DXF units → scene centimetres.
+            selected_layers: Import only these DXF layers (``None``: all).
+            merge_lines: Join LINE entities that meet end to end into one
+                polyline per chain, dropping collinear interior vertices.
+            simplify_tolerance: If positive, drop polyline/polygon vertices
+                closer than this (scene cm) to the simplified outline.
+            progress_callback: Optional callable(bytes_read, file_size).
+            cancel_check: Polled every few hundred entities; when it returns
+                True the parse stops with ``DxfImportCancelled``.
+        """
+        result = DxfParseResult()
+        selected = set(selected_layers) if selected_layers is not None else None
+        lines: dict[str, list[tuple[tuple[float, float], tuple[float, float]]]] = {}
+        seen_layers: set[str] = set()
+
+        with _open_modelspace(file_path) as (entities, bytes_read, size):
+            for entity in entities:
+                result.entity_count += 1
+                if result.entity_count % _PROGRESS_EVERY == 0:
+                    if cancel_check is not None and cancel_check():
+                        raise DxfImportCancelled("DXF import cancelled")
+                    if progress_callback is not None:
+                        progress_callback(bytes_read(), size)
+
+                dxf_type = entity.dxftype()
+                dxf_layer = getattr(entity.dxf, "layer", "0") if hasattr(entity, "dxf") else "0"
+                if selected is not None and dxf_layer not in selected:
+                    continue
+                if dxf_type not in DxfImportService.SUPPORTED_TYPES:
+                    result.skip(dxf_type)
+                    continue
+                if dxf_layer not in seen_layers:
+                    seen_layers.add(dxf_layer)
+                    result.layers.append(dxf_layer)
+
+                if merge_lines and dxf_type == "LINE":
+                    try:
+                        start, end = entity.dxf.start, entity.dxf.end
+                    except Exception:
+                        result.skip(dxf_type)
+                        continue
+                    lines.setdefault(dxf_layer, []).append((
+                        (start.x * scale_factor, start.y * scale_factor),
+                        (end.x * scale_factor, end.y * scale_factor),
+                    ))
+                    continue
+
+                shape = DxfImportService._entity_to_shape(entity, dxf_type, scale_factor, dxf_layer)
+                if shape is None:
+                    result.skip(dxf_type)
+                else:
+                    result.shapes.append(shape)
+
+        if simplify_tolerance > 0.0:
+            for i, shape in enumerate(result.shapes):
+                if shape.kind not in ("polyline", "polygon") or len(shape.points) < 3:
+                    continue
+                points = _simplify(list(shape.points), simplify_tolerance)
+                if shape.kind == "polygon" and len(points) < 3:
+                    continue  # would collapse to a line; keep the outline
+                result.shapes[i] = DxfShape(shape.kind, shape.layer, tuple(points))
+        # Merged chains come last; collinear vertices go even at tolerance 0.
+        for layer, segments in lines.items():
+            chains = _chain_lines(segments)
+            result.merged_lines += len(segments) - len(chains)
+            for chain in chains:
+                points = _simplify(chain, max(simplify_tolerance, _JOIN_EPS))
+                result.shapes.append(DxfShape("polyline", layer, tuple(points)))
+        if progress_callback is not None:
+            progress_callback(size, size)
+        return result
 
-            if dxf_type not in DxfImportService.SUPPORTED_TYPES:
-                result.skipped_count += 1
-                if dxf_type not in result.skipped_types:
-                    result.skipped_types.append(dxf_type)
-                continue
+    @staticmethod
+    def build_items(scene: CanvasScene, parsed: DxfParseResult) -> DxfImportResult:
+        """Create the scene layers and graphics items for parsed shapes.
 
-            layer_id = DxfImportService._get_or_create_layer(scene, dxf_layer)
-            item = DxfImportService._entity_to_item(entity, dxf_type, scale_factor, layer_id)
-            if item is not None:
-                result.items.append(item)
-            else:
-                result.skipped_count += 1
-                if dxf_type not in result.skipped_types:
-                    result.skipped_types.append(dxf_type)
+        GUI thread only. The items are returned, not added: the caller adds
+        them with one ``CreateItemsCommand``.
+        """
+        from open_garden_planner.core.object_types import ObjectType
+        from open_garden_planner.ui.canvas.items.circle_item import CircleItem
+        from open_garden_planner.ui.canvas.items.ellipse_item import EllipseItem
+        from open_garden_planner.ui.canvas.items.polygon_item import PolygonItem
+        from open_garden_planner.ui.canvas.items.polyline_item import PolylineItem
 
+        layer_ids = {
+            name: DxfImportService._get_or_create_layer(scene, name) for name in parsed.layers
+        }
+        result = DxfImportResult(
+            skipped_count=parsed.skipped_count, skipped_types=list(parsed.skipped_types)
+        )
+        items = result.items
+        for shape in parsed.shapes:
+            layer_id = layer_ids.get(shape.layer)
+            if shape.kind == "polyline":
+                items.append(PolylineItem(
+                    [QPointF(x, y) for x, y in shape.points],
+                    object_type=ObjectType.GENERIC_POLYGON,
+                    layer_id=layer_id,
+                ))
+            elif shape.kind == "polygon":
+                items.append(PolygonItem(
+                    [QPointF(x, y) for x, y in shape.points],
+                    object_type=ObjectType.GENERIC_POLYGON,
+                    layer_id=layer_id,
+                ))
+            elif shape.kind == "circle":
+                cx, cy = shape.center
+                items.append(CircleItem(
+                    cx, cy, shape.radius,
+                    object_type=ObjectType.GENERIC_CIRCLE,
+                    layer_id=layer_id,
+                ))
+            elif shape.kind == "ellipse":
+                cx, cy = shape.center
+                item = EllipseItem(
+                    cx - shape.radius, cy - shape.minor, shape.radius * 2, shape.minor * 2,
+                    object_type=ObjectType.GENERIC_ELLIPSE,
+                    layer_id=layer_id,
+                )
+                item.setRotation(shape.rotation)
+                items.append(item)
         return result
 
     @staticmethod
@@ -376,50 +653,36 @@ class DxfImportService:
         return None
 
     @staticmethod
-    def _entity_to_item(
+    def _entity_to_shape(
         entity: Any,
         dxf_type: str,
         scale: float,
-        layer_id: Any,
-    ) -> QGraphicsItem | None:
-        from open_garden_planner.core.object_types import ObjectType
-        from open_garden_planner.ui.canvas.items.circle_item import CircleItem
-        from open_garden_planner.ui.canvas.items.ellipse_item import EllipseItem
-        from open_garden_planner.ui.canvas.items.polygon_item import PolygonItem
-        from open_garden_planner.ui.canvas.items.polyline_item import PolylineItem
-
-        def _s(v: float) -> float:
-            return v * scale
-
-        def _y(v: float) -> float:
-            # DXF Y-up matches OGP scene Y-up (view flips Y so scene Y=0 is visual
-            # bottom, same as DXF). No negation needed.
-            return v * scale
-
+        layer: str,
+    ) -> DxfShape | None:
+        # DXF Y-up matches OGP scene Y-up (view flips Y so scene Y=0 is visual
+        # bottom, same as DXF): both axes are only scaled, never negated.
         try:
             if dxf_type == "LINE":
                 start = entity.dxf.start
                 end = entity.dxf.end
-                pts = [QPointF(_s(start.x), _y(start.y)), QPointF(_s(end.x), _y(end.y))]
-                return PolylineItem(pts, object_type=ObjectType.GENERIC_POLYGON, layer_id=layer_id)
+                return DxfShape("polyline", layer, (
+                    (start.x * scale, start.y * scale), (end.x * scale, end.y * scale),
+                ))
 
             if dxf_type == "LWPOLYLINE":
-                raw_pts = list(entity.get_points("xy"))
-                pts = [QPointF(_s(x), _y(y)) for x, y in raw_pts]
+                pts = tuple((x * scale, y * scale) for x, y in entity.get_points("xy"))
                 if len(pts) < 2:
                     return None
                 if entity.is_closed and len(pts) >= 3:
-                    return PolygonItem(pts, object_type=ObjectType.GENERIC_POLYGON, layer_id=layer_id)
-                return PolylineItem(pts, object_type=ObjectType.GENERIC_POLYGON, layer_id=layer_id)
+                    return DxfShape("polygon", layer, pts)
+                return DxfShape("polyline", layer, pts)
 
             if dxf_type == "CIRCLE":
-                cx = _s(entity.dxf.center.x)
-                cy = _y(entity.dxf.center.y)
-                r = _s(entity.dxf.radius)
-                return CircleItem(
-                    cx, cy, r,
-                    object_type=ObjectType.GENERIC_CIRCLE,
-                    layer_id=layer_id,
+                center = entity.dxf.center
+                return DxfShape(
+                    "circle", layer,
+                    center=(center.x * scale, center.y * scale),
+                    radius=entity.dxf.radius * scale,
                 )
 
             if dxf_type == "ARC":
@@ -435,34 +698,125 @@ class DxfImportService:
                 pts = []
                 for i in range(n + 1):
                     t = start_a + (end_a - start_a) * i / n
-                    pts.append(QPointF(_s(cx + r * math.cos(t)), _y(cy + r * math.sin(t))))
-                return PolylineItem(pts, object_type=ObjectType.GENERIC_POLYGON, layer_id=layer_id)
+                    pts.append(((cx + r * math.cos(t)) * scale, (cy + r * math.sin(t)) * scale))
+                return DxfShape("polyline", layer, tuple(pts))
 
             if dxf_type == "ELLIPSE":
-                cx = _s(entity.dxf.center.x)
-                cy = _y(entity.dxf.center.y)
+                center = entity.dxf.center
                 major = entity.dxf.major_axis
-                ratio = entity.dxf.ratio
-                semi_a = _s(math.hypot(major.x, major.y))
-                semi_b = semi_a * ratio
-                angle_deg = -math.degrees(math.atan2(major.y, major.x))
-                item = EllipseItem(
-                    cx - semi_a, cy - semi_b, semi_a * 2, semi_b * 2,
-                    object_type=ObjectType.GENERIC_ELLIPSE,
-                    layer_id=layer_id,
+                semi_a = math.hypot(major.x, major.y) * scale
+                return DxfShape(
+                    "ellipse", layer,
+                    center=(center.x * scale, center.y * scale),
+                    radius=semi_a,
+                    minor=semi_a * entity.dxf.ratio,
+                    rotation=-math.degrees(math.atan2(major.y, major.x)),
                 )
-                item.setRotation(angle_deg)
-                return item
 
             if dxf_type == "SPLINE":
                 # Sample control points
                 control_pts = list(entity.control_points)
                 if len(control_pts) < 2:
                     return None
-                pts = [QPointF(_s(p[0]), _y(p[1])) for p in control_pts]
-                return PolylineItem(pts, object_type=ObjectType.GENERIC_POLYGON, layer_id=layer_id)
+                return DxfShape(
+                    "polyline", layer, tuple((p[0] * scale, p[1] * scale) for p in control_pts)
+                )
 
         except Exception:
             return None
 
         return None
+
+
+class DxfImportWorker(QThread):
+    """Runs ``DxfImportService.parse_file`` off the GUI thread.
+
+    Emits ``progress(bytes_read, file_size)``, then ``parsed(DxfParseResult)``
+    or ``failed(message)``; a cancelled parse emits neither.
+    """
+
+    progress = pyqtSignal("qint64", "qint64")
+    parsed = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        file_path: Path | str,
+        scale_factor: float = 1.0,
+        selected_layers: list[str] | None = None,
+        *,
+        merge_lines: bool = False,
+        simplify_tolerance: float = 0.0,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._file_path = Path(file_path)
+        self._scale_factor = scale_factor
+        self._selected_layers = selected_layers
+        self._merge_lines = merge_lines
+        self._simplify_tolerance = simplify_tolerance
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def shutdown(self, timeout_ms: int = 3000) -> None:
+        """Cancel + join — call before teardown (#230)."""
+        with contextlib.suppress(RuntimeError):
+            self.cancel()
+            self.wait(timeout_ms)
+
+    def run(self) -> None:  # worker thread
+        try:
+            result = DxfImportService.parse_file(
+                self._file_path,
+                self._scale_factor,
+                self._selected_layers,
+                merge_lines=self._merge_lines,
+                simplify_tolerance=self._simplify_tolerance,
+                progress_callback=self.progress.emit,
+                cancel_check=lambda: self._cancelled,
+            )
+        except DxfImportCancelled:
+            return
+        except Exception as exc:
+            self.failed.emit(str(exc))
+            return
+        self.parsed.emit(result)
+
+
+class DxfLayerScanWorker(QThread):
+    """Runs ``DxfImportService.get_dxf_layers`` off the GUI thread.
+
+    Emits ``layers_ready(names)`` or ``failed(message)``; a cancelled scan
+    emits neither.
+    """
+
+    layers_ready = pyqtSignal(list)
+    failed = pyqtSignal(str)
+
+    def __init__(self, file_path: Path | str, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._file_path = Path(file_path)
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def shutdown(self, timeout_ms: int = 3000) -> None:
+        """Cancel + join — call before teardown (#230)."""
+        with contextlib.suppress(RuntimeError):
+            self.cancel()
+            self.wait(timeout_ms)
+
+    def run(self) -> None:  # worker thread
+        try:
+            layers = DxfImportService.get_dxf_layers(
+                self._file_path, cancel_check=lambda: self._cancelled
+            )
+        except DxfImportCancelled:
+            return
+        except Exception as exc:
+            self.failed.emit(str(exc))
+            return
+        self.layers_ready.emit(layers)
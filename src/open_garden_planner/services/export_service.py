@@ -1,6 +1,7 @@
 """Export service for exporting garden plans to various formats."""
 
 import csv
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +11,10 @@ from PyQt6.QtSvg import QSvgGenerator
 from PyQt6.QtWidgets import QGraphicsScene, QGraphicsSimpleTextItem, QGraphicsTextItem
 
 
+class ExportCancelled(RuntimeError):
+    """Raised when a banded PNG export is cancelled by the caller."""
+
+
 class ExportService:
     """Service for exporting garden plans to PNG and SVG formats."""
 
@@ -23,6 +28,9 @@ class ExportService:
     PAPER_A3_LANDSCAPE_WIDTH_CM = 42.0
     PAPER_LETTER_LANDSCAPE_WIDTH_CM = 27.94
 
+    # Upper bound for one rendered PNG band (ARGB, 4 bytes per pixel)
+    MAX_BAND_BYTES = 32 * 1024 * 1024
+
     @staticmethod
     def _hide_construction_items(scene: QGraphicsScene) -> list[object]:
         """Hide all construction geometry items before export.
@@ -174,9 +182,20 @@ class ExportService:
         dpi: int = 150,
         output_width_cm: float = 30.0,
         background_color: str | None = None,
+        progress_callback: Callable[[int, int], None] | None = None,
+        cancel_check: Callable[[], bool] | None = None,
+        band_height_px: int | None = None,
     ) -> None:
         """Export the scene to a PNG image.
 
+        The image is rendered in horizontal bands of at most
+        ``MAX_BAND_BYTES`` each and streamed into the PNG encoder
+        (``services/png_stream.py``), so print resolutions never allocate
+        the whole picture at once. Each band renders only its own slice of
+        the scene (so every item is painted about once per export, not once
+        per band) at the same scene-to-image scale as a single-shot render,
+        clipped to its rows, so the pixels match.
+
         Args:
             scene: The QGraphicsScene to export
             file_path: Path to save the PNG file
@@ -184,9 +203,15 @@ class ExportService:
             output_width_cm: Width of the output image in centimeters (default 30cm ~ A4 landscape)
             background_color: Optional background color hex string (e.g., "#ffffff")
                             If None, uses the scene's canvas background
+            progress_callback: Optional callable(bands_done, band_count)
+            cancel_check: Polled between bands; when it returns True the
+                partial file is removed and ``ExportCancelled`` is raised
+            band_height_px: Rows per band (default: derived from
+                ``MAX_BAND_BYTES``)
 
         Raises:
             ValueError: If export fails
+            ExportCancelled: If ``cancel_check`` requested a stop
         """
         file_path = Path(file_path)
 
@@ -207,50 +232,92 @@ class ExportService:
         # Calculate scale for text adjustment
         scale = output_width_cm / canvas_width
 
+        from open_garden_planner.services.png_stream import PngStreamWriter
         from open_garden_planner.services.scene_rendering import (
             compute_export_font_size,
+            export_render_state,
             render_scene_region,
         )
 
         text_point_size = compute_export_font_size(scale, dpi)
 
-        # Create image with the calculated dimensions
-        image = QImage(width_px, height_px, QImage.Format.Format_ARGB32)
-
-        # Fill with background color
         if background_color:
-            image.fill(QColor(background_color))
+            background = QColor(background_color)
         elif hasattr(scene, 'CANVAS_COLOR'):
-            image.fill(scene.CANVAS_COLOR)
+            background = QColor(scene.CANVAS_COLOR)
         else:
-            image.fill(Qt.GlobalColor.white)
+            background = QColor(Qt.GlobalColor.white)
+
+        if band_height_px is None:
+            band_height_px = ExportService.MAX_BAND_BYTES // max(1, width_px * 4)
+        band_height_px = max(1, min(band_height_px, height_px))
+        band_count = -(-height_px // band_height_px)
 
-        painter = QPainter(image)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        # The scale a single-shot render of canvas_rect into the whole image
+        # uses (QGraphicsScene.render, KeepAspectRatio: anchored top-left).
+        pixels_per_unit = min(width_px / canvas_width, height_px / canvas_height)
 
         try:
-            # Single helper call owns ALL bookkeeping: overlay hide,
-            # construction hide, text scaling, Y-flip, and scene render.
-            # No legacy `_hide_*` / `_prepare_text_*` calls — this is the
-            # deduplication promised by ADR-023.
-            render_scene_region(
-                scene=scene,
-                painter=painter,
-                target_rect=QRectF(0, 0, width_px, height_px),
-                source_rect=canvas_rect,
-                hide_overlays=True,
-                hide_construction=True,
-                text_point_size=text_point_size,
-                y_flip=True,
-            )
-        finally:
-            painter.end()
+            writer = PngStreamWriter(file_path, width_px, height_px, dpi=dpi)
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Failed to save PNG to {file_path}: {e}") from e
 
-        # Save the image
-        if not image.save(str(file_path), "PNG"):
-            raise ValueError(f"Failed to save PNG to {file_path}")
+        try:
+            # Overlay hide, construction hide and text scaling once for all
+            # bands; each band then renders the scene slice that lands on
+            # its rows. The image is Y-flipped: row 0 is the slice with the
+            # largest scene y.
+            with export_render_state(scene, text_point_size=text_point_size):
+                for index in range(band_count):
+                    if cancel_check is not None and cancel_check():
+                        raise ExportCancelled("PNG export cancelled")
+                    top = index * band_height_px
+                    rows = min(band_height_px, height_px - top)
+                    band = QImage(width_px, rows, QImage.Format.Format_ARGB32)
+                    band.fill(background)
+
+                    painter = QPainter(band)
+                    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+                    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+                    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+                    band_rect = QRectF(0, 0, width_px, rows)
+                    band_source = QRectF(
+                        canvas_rect.left(),
+                        canvas_rect.top() + (height_px - top - rows) / pixels_per_unit,
+                        width_px / pixels_per_unit,
+                        rows / pixels_per_unit,
+                    )
+                    try:
+                        painter.setClipRect(band_rect)
+                        render_scene_region(
+                            scene=scene,
+                            painter=painter,
+                            target_rect=band_rect,
+                            source_rect=band_source,
+                            hide_overlays=False,
+                            hide_construction=False,
+                            y_flip=True,
+                        )
+                    finally:
+                        painter.end()
+
+                    rgba = band.convertToFormat(QImage.Format.Format_RGBA8888)
+                    writer.write_rows(
+                        rgba.constBits().asstring(rgba.sizeInBytes()),
+                        rows,
+                        rgba.bytesPerLine(),
+                    )
+                    if progress_callback is not None:
+                        progress_callback(index + 1, band_count)
+            writer.close()
+        except ExportCancelled:
+            writer.abort()
+            raise
+        except Exception as e:
+            writer.abort()
+            if isinstance(e, ValueError):
+                raise
+            raise ValueError(f"Failed to save PNG to {file_path}: {e}") from e
 
     @staticmethod
     def export_to_svg(
@@ -0,0 +1,32 @@
+"""The Google Maps API key, read from ``OGP_GOOGLE_MAPS_KEY`` (ADR-019).
+
+Kept apart from ``google_maps_service`` so that the File menu can grey out
+"Load Satellite Background" at startup without importing ``requests`` and
+Pillow; ``google_maps_service`` re-exports all of it.
+"""
+
+from __future__ import annotations
+
+import os
+
+_ENV_VAR = "OGP_GOOGLE_MAPS_KEY"
+
+
+class GoogleMapsKeyMissingError(RuntimeError):
+    """Raised when the API key env var is not set."""
+
+
+def has_api_key() -> bool:
+    """True iff the API key env var is set and non-empty."""
+    return bool(os.environ.get(_ENV_VAR, "").strip())
+
+
+def get_api_key() -> str:
+    """Return the API key or raise if missing. Strip whitespace."""
+    key = os.environ.get(_ENV_VAR, "").strip()
+    if not key:
+        raise GoogleMapsKeyMissingError(
+            f"Environment variable {_ENV_VAR} is not set. "
+            "Put it in your project .env file."
+        )
+    return key
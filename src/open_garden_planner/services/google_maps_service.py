@@ -4,7 +4,14 @@ Fetches a satellite background image for a given lat/lng bounding box and
 returns it together with the pixel→meters scale derived analytically from
 the Web-Mercator projection. For boxes too large to fit in a single
 640x640 Static-Maps call (scale=2 → 1280x1280 effective pixels), the
-service automatically stitches a 2x2 / 3x3 grid of sub-calls with Pillow.
+service automatically stitches a grid of sub-calls with Pillow.
+
+A box that fits one call is fetched as that single call, centred on the
+box. Mosaic sub-tiles are centred on a fixed Web-Mercator grid per zoom
+level, fetched concurrently on a small bounded pool, and kept on disk
+(``map_tile_cache``), so a second request over an overlapping area reuses
+the tiles it shares with the first. ``fetch_bbox(on_progress=...)`` reports
+the mosaic after every tile for a live preview.
 
 The API key is read from the ``OGP_GOOGLE_MAPS_KEY`` environment variable
 (loaded from ``.env`` at app startup in ``main.py``). It is intentionally
@@ -16,15 +23,23 @@ from __future__ import annotations
 
 import io
 import math
-import os
 import re
+import threading
 from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from urllib.parse import urlencode
 
 import requests
 from PIL import Image
 
+from open_garden_planner.services.google_maps_key import (  # noqa: F401 — re-exported
+    GoogleMapsKeyMissingError,
+    get_api_key,
+    has_api_key,
+)
+from open_garden_planner.services.map_tile_cache import MapTileCache, map_tile_cache
+
 _STATIC_MAPS_URL = "https://maps.googleapis.com/maps/api/staticmap"
 _EARTH_CIRCUMFERENCE_M = 2 * math.pi * 6378137.0
 # Static Maps free tier: 640x640 per call, scale=2 → 1280x1280 effective.
@@ -36,13 +51,12 @@ _TILE_BASE_PX = 640
 _TILE_SCALE = 2
 _TILE_EFFECTIVE_PX = _TILE_BASE_PX * _TILE_SCALE  # 1280, output dimensions
 # Max grid we'll auto-stitch; beyond this resolution is overkill and call
-# budgets get uncomfortable.
+# budgets get uncomfortable. Caps the grid-aligned mosaic actually fetched.
 _MAX_GRID = 3
-_ENV_VAR = "OGP_GOOGLE_MAPS_KEY"
-
-
-class GoogleMapsKeyMissingError(RuntimeError):
-    """Raised when the API key env var is not set."""
+# Concurrent Static Maps calls per mosaic.
+_MAX_CONCURRENT_TILES = 4
+# How often a mosaic fetch polls ``cancel_check`` while tiles are in flight.
+_CANCEL_POLL_S = 0.1
 
 
 class GoogleMapsFetchError(RuntimeError):
@@ -81,20 +95,9 @@ class FetchResult:
     tile_grid: tuple[int, int]  # (cols, rows) — (1,1) means single call
 
 
-def has_api_key() -> bool:
-    """True iff the API key env var is set and non-empty."""
-    return bool(os.environ.get(_ENV_VAR, "").strip())
-
-
-def get_api_key() -> str:
-    """Return the API key or raise if missing. Strip whitespace."""
-    key = os.environ.get(_ENV_VAR, "").strip()
-    if not key:
-        raise GoogleMapsKeyMissingError(
-            f"Environment variable {_ENV_VAR} is not set. "
-            "Put it in your project .env file."
-        )
-    return key
+#: ``on_progress(mosaic, tiles_done, tiles_total)`` — the mosaic is shared
+#: and keeps filling in; copy or downscale it, do not keep it.
+ProgressCallback = Callable[[Image.Image, int, int], None]
 
 
 def meters_per_pixel(lat: float, zoom: int) -> float:
@@ -136,7 +139,9 @@ def pick_zoom_and_grid(bbox: BoundingBox) -> tuple[int, int, int]:
     Caps at zoom 20 (Static Maps satellite limit) and a 3x3 grid (9 calls,
     enough for very large gardens at meaningful resolution).
 
-    Returns ``(zoom, cols, rows)``. One call covers ``_TILE_BASE_PX *
+    Returns ``(zoom, cols, rows)``. ``(1, 1)`` means one call centred on the
+    bbox; any other grid is the :func:`aligned_tile_grid` at ``zoom``, which
+    is what gets fetched (and paid for). One call covers ``_TILE_BASE_PX *
     standard_mpp`` meters wide; ``scale=2`` only doubles the OUTPUT pixels.
     """
     width_m, height_m = bbox_size_m(bbox)
@@ -146,13 +151,55 @@ def pick_zoom_and_grid(bbox: BoundingBox) -> tuple[int, int, int]:
         mpp = meters_per_pixel(center_lat, zoom)
         # Coverage of one Static Maps call (scale=2 doesn't change coverage).
         call_span_m = _TILE_BASE_PX * mpp
-        cols = max(1, math.ceil(width_m / call_span_m))
-        rows = max(1, math.ceil(height_m / call_span_m))
+        if width_m <= call_span_m and height_m <= call_span_m:
+            return zoom, 1, 1
+        _, _, cols, rows = aligned_tile_grid(bbox, zoom)
         if cols <= _MAX_GRID and rows <= _MAX_GRID:
             return zoom, cols, rows
 
-    # Fallback: lowest zoom + max grid (only hits for absurdly large bboxes).
-    return 1, _MAX_GRID, _MAX_GRID
+    # Fallback: lowest zoom, one call (only hits for absurdly large bboxes).
+    return 1, 1, 1
+
+
+def _world_px(lat: float, lng: float, zoom: int) -> tuple[float, float]:
+    """Web-Mercator world pixel of ``(lat, lng)`` at ``zoom`` (256-px tiles)."""
+    size = 256.0 * (2**zoom)
+    sin_lat = min(max(math.sin(math.radians(lat)), -0.9999), 0.9999)
+    x = (lng + 180.0) / 360.0 * size
+    y = (0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)) * size
+    return x, y
+
+
+def _lat_lng(x: float, y: float, zoom: int) -> tuple[float, float]:
+    """Inverse of :func:`_world_px`."""
+    size = 256.0 * (2**zoom)
+    lng = x / size * 360.0 - 180.0
+    lat = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y / size))))
+    return lat, lng
+
+
+def aligned_tile_grid(bbox: BoundingBox, zoom: int) -> tuple[int, int, int, int]:
+    """Grid-aligned Static Maps calls covering ``bbox`` at ``zoom``.
+
+    Call ``(col, row)`` is centred on world pixel ``((col + 0.5) * 640,
+    (row + 0.5) * 640)``; every bbox at a zoom shares that grid, which is
+    what lets overlapping requests reuse cached tiles.
+
+    Returns ``(first_col, first_row, cols, rows)``.
+    """
+    x0, y0 = _world_px(bbox.nw_lat, bbox.nw_lng, zoom)
+    x1, y1 = _world_px(bbox.se_lat, bbox.se_lng, zoom)
+    x0, x1 = sorted((x0, x1))
+    y0, y1 = sorted((y0, y1))
+    col0, row0 = math.floor(x0 / _TILE_BASE_PX), math.floor(y0 / _TILE_BASE_PX)
+    col1, row1 = math.floor(x1 / _TILE_BASE_PX), math.floor(y1 / _TILE_BASE_PX)
+    return col0, row0, col1 - col0 + 1, row1 - row0 + 1
+
+
+def _tile_center(col: int, row: int, zoom: int) -> tuple[float, float]:
+    """``(lat, lng)`` of grid call ``(col, row)``, rounded to the cache key."""
+    lat, lng = _lat_lng((col + 0.5) * _TILE_BASE_PX, (row + 0.5) * _TILE_BASE_PX, zoom)
+    return round(lat, 7), round(lng, 7)
 
 
 def _build_static_url(
@@ -186,18 +233,18 @@ def _scrub_key(text: str, api_key: str) -> str:
     return re.sub(r"key=[^&\s\"']+", "key=[REDACTED]", scrubbed)
 
 
-def _fetch_tile(
+def _fetch_tile_bytes(
     center_lat: float,
     center_lng: float,
     zoom: int,
     api_key: str,
     *,
     timeout: float = 10.0,
-) -> Image.Image:
-    """HTTP-fetch a single Static Maps tile and return as PIL Image.
+) -> bytes:
+    """HTTP-fetch a single Static Maps tile and return the response body.
 
-    Raises ``GoogleMapsFetchError`` on non-200 or invalid response. The
-    API key is scrubbed from every error message before raising.
+    Raises ``GoogleMapsFetchError`` on non-200. The API key is scrubbed from
+    every error message before raising.
     """
     url = _build_static_url(center_lat, center_lng, zoom, _TILE_BASE_PX, api_key)
     try:
@@ -211,16 +258,67 @@ def _fetch_tile(
         raise GoogleMapsFetchError(
             f"Static Maps returned HTTP {response.status_code}: {body}"
         )
+    return response.content
+
+
+def _decode_tile(data: bytes) -> Image.Image:
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    return image.convert("RGB")
+
+
+def _fetch_tile(
+    center_lat: float,
+    center_lng: float,
+    zoom: int,
+    api_key: str,
+    *,
+    timeout: float = 10.0,
+    cache: MapTileCache | None = None,
+) -> Image.Image:
+    """A single Static Maps tile as PIL Image, from the disk cache if present.
+
+    Raises ``GoogleMapsFetchError`` on non-200 or invalid response. The
+    API key is scrubbed from every error message before raising.
+    """
+    if cache is None:
+        cache = map_tile_cache()
+    cached = cache.load(center_lat, center_lng, zoom, _TILE_SCALE)
+    if cached is not None:
+        try:
+            return _decode_tile(cached)
+        except Exception:
+            cache.discard(center_lat, center_lng, zoom, _TILE_SCALE)
+    data = _fetch_tile_bytes(center_lat, center_lng, zoom, api_key, timeout=timeout)
     try:
-        return Image.open(io.BytesIO(response.content)).convert("RGB")
+        image = _decode_tile(data)
     except Exception as e:
         raise GoogleMapsFetchError(
             f"Invalid image response: {_scrub_key(str(e), api_key)}"
         ) from None
+    cache.store(center_lat, center_lng, zoom, _TILE_SCALE, data)
+    return image
+
+
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _tile_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=_MAX_CONCURRENT_TILES, thread_name_prefix="map-tiles"
+            )
+        return _pool
 
 
 def _crop_to_bbox(
-    image: Image.Image, mpp: float, bbox: BoundingBox
+    image: Image.Image,
+    mpp: float,
+    bbox: BoundingBox,
+    focus: tuple[float, float] | None = None,
 ) -> Image.Image:
     """Crop the centred satellite image down to exactly the bbox area.
 
@@ -230,6 +328,10 @@ def _crop_to_bbox(
     rectangle, with padding on all sides. Cropping to the bbox makes the
     canvas-placed image match the rectangle the user drew.
 
+    ``focus`` is the pixel of the bbox centre in ``image`` (default: the
+    image centre, as for a single call centred on the bbox); the crop is
+    shifted inside the image where the focus sits near an edge.
+
     ``mpp`` is unchanged by cropping (pixels-per-metre is intrinsic to the
     zoom level + latitude, not the image size).
     """
@@ -237,8 +339,9 @@ def _crop_to_bbox(
     img_w, img_h = image.size
     crop_w = max(1, min(img_w, round(bbox_w_m / mpp)))
     crop_h = max(1, min(img_h, round(bbox_h_m / mpp)))
-    left = (img_w - crop_w) // 2
-    top = (img_h - crop_h) // 2
+    fx, fy = focus if focus is not None else (img_w / 2.0, img_h / 2.0)
+    left = min(max(0, round(fx - crop_w / 2.0)), img_w - crop_w)
+    top = min(max(0, round(fy - crop_h / 2.0)), img_h - crop_h)
     return image.crop((left, top, left + crop_w, top + crop_h))
 
 
@@ -248,64 +351,94 @@ def fetch_bbox(
     api_key: str | None = None,
     timeout: float = 10.0,
     cancel_check: Callable[[], bool] | None = None,
+    on_progress: ProgressCallback | None = None,
 ) -> FetchResult:
     """Fetch a satellite image covering ``bbox``.
 
-    Picks the zoom level + tile grid that maximises resolution while fitting
-    the entire bbox. Single Static-Maps call for small boxes; stitched
-    mosaic for larger ones. The returned image is cropped to exactly the
-    bbox dimensions so the canvas-placed image matches what the user drew.
-
-    ``cancel_check`` — if given, is polled between tiles. When it returns
-    True, the fetch raises ``FetchCancelled`` rather than continuing.
+    Picks the zoom level that maximises resolution while fitting the entire
+    bbox in a small mosaic (see :func:`pick_zoom_and_grid`), then fetches
+    either one call centred on the bbox or the grid-aligned tiles covering
+    it — cached ones from disk, the rest concurrently (at most
+    ``_MAX_CONCURRENT_TILES`` calls at once). The returned image is cropped
+    to exactly the bbox dimensions so the canvas-placed image matches what
+    the user drew.
+
+    ``cancel_check`` — if given, is polled before the first call and while
+    tiles are in flight. When it returns True, queued tiles are dropped and
+    the fetch raises ``FetchCancelled``; calls already on the wire finish
+    in the background (their tiles still land in the cache).
+
+    ``on_progress`` — if given, is called on the calling thread after every
+    tile is pasted, with the partially filled mosaic.
     """
     if api_key is None:
         api_key = get_api_key()
 
     zoom, cols, rows = pick_zoom_and_grid(bbox)
     center_lat, center_lng = bbox.center
+    if (cols, rows) == (1, 1):
+        # One call centred on the bbox; the mosaic is that call's image.
+        centers = [(round(center_lat, 7), round(center_lng, 7))]
+        x, y = _world_px(*centers[0], zoom)
+        origin = (x - _TILE_BASE_PX / 2, y - _TILE_BASE_PX / 2)
+    else:
+        col0, row0, cols, rows = aligned_tile_grid(bbox, zoom)
+        centers = [
+            _tile_center(col0 + col, row0 + row, zoom)
+            for row in range(rows)
+            for col in range(cols)
+        ]
+        origin = (col0 * _TILE_BASE_PX, row0 * _TILE_BASE_PX)
     standard_mpp = meters_per_pixel(center_lat, zoom)
     # One Static Maps call covers _TILE_BASE_PX * standard_mpp meters and
     # returns _TILE_EFFECTIVE_PX pixels because of scale=2 → the output's
     # actual mpp is standard_mpp / _TILE_SCALE. Crop math and consumers
     # (BackgroundImageItem auto-scale) must use this output_mpp.
     output_mpp = standard_mpp / _TILE_SCALE
-    call_span_m = _TILE_BASE_PX * standard_mpp  # ground covered per call
-
-    if cols == 1 and rows == 1:
-        raw = _fetch_tile(center_lat, center_lng, zoom, api_key, timeout=timeout)
-        return FetchResult(
-            image=_crop_to_bbox(raw, output_mpp, bbox),
-            meters_per_pixel=output_mpp,
-            zoom=zoom,
-            bbox=bbox,
-            tile_grid=(1, 1),
-        )
 
+    if cancel_check is not None and cancel_check():
+        raise FetchCancelled("Fetch cancelled by caller")
+
+    cache = map_tile_cache()
     mosaic = Image.new("RGB", (cols * _TILE_EFFECTIVE_PX, rows * _TILE_EFFECTIVE_PX))
-    deg_per_m_lat = 1.0 / 111320.0
-    deg_per_m_lng = 1.0 / (111320.0 * max(math.cos(math.radians(center_lat)), 1e-6))
-    tile_dlat = call_span_m * deg_per_m_lat
-    tile_dlng = call_span_m * deg_per_m_lng
+    pool = _tile_pool()
+    pending: dict[Future[Image.Image], tuple[int, int]] = {}
+    for index, (tile_lat, tile_lng) in enumerate(centers):
+        future = pool.submit(
+            _fetch_tile,
+            tile_lat,
+            tile_lng,
+            zoom,
+            api_key,
+            timeout=timeout,
+            cache=cache,
+        )
+        pending[future] = (index % cols, index // cols)
 
-    for row in range(rows):
-        for col in range(cols):
+    total = len(pending)
+    try:
+        while pending:
+            done, _ = wait(pending, timeout=_CANCEL_POLL_S, return_when=FIRST_COMPLETED)
             if cancel_check is not None and cancel_check():
                 raise FetchCancelled("Fetch cancelled by caller")
-            offset_x = col - (cols - 1) / 2.0
-            offset_y = (rows - 1) / 2.0 - row  # row 0 is at the top → +lat
-            tile_lat = center_lat + offset_y * tile_dlat
-            tile_lng = center_lng + offset_x * tile_dlng
-            tile_img = _fetch_tile(
-                tile_lat, tile_lng, zoom, api_key, timeout=timeout
-            )
-            mosaic.paste(
-                tile_img,
-                (col * _TILE_EFFECTIVE_PX, row * _TILE_EFFECTIVE_PX),
-            )
-
+            for future in done:
+                col, row = pending.pop(future)
+                tile_img = future.result()  # GoogleMapsFetchError propagates
+                mosaic.paste(
+                    tile_img,
+                    (col * _TILE_EFFECTIVE_PX, row * _TILE_EFFECTIVE_PX),
+                )
+                if on_progress is not None:
+                    on_progress(mosaic, total - len(pending), total)
+    finally:
+        for future in pending:
+            future.cancel()
+
+    # The bbox centre's position in the mosaic: crop around it.
+    cx, cy = _world_px(center_lat, center_lng, zoom)
+    focus = ((cx - origin[0]) * _TILE_SCALE, (cy - origin[1]) * _TILE_SCALE)
     return FetchResult(
-        image=_crop_to_bbox(mosaic, output_mpp, bbox),
+        image=_crop_to_bbox(mosaic, output_mpp, bbox, focus),
         meters_per_pixel=output_mpp,
         zoom=zoom,
         bbox=bbox,
@@ -0,0 +1,162 @@
+"""On-disk cache of raw Google Static Maps tiles, across fetches and launches.
+
+Every satellite background request used to download each sub-tile of its
+mosaic again, even when the user only nudged the rectangle. The PNG bytes
+of every tile are now kept under the app's local data directory:
+
+- **Keyed by request**: ``(lat, lng, zoom, scale)`` of the tile centre.
+  ``google_maps_service`` puts tile centres on a fixed Web-Mercator grid
+  per zoom, so overlapping bounding boxes ask for the very same tiles.
+- **Stored verbatim**: the bytes Google sent, written atomically; a file
+  that no longer decodes is treated as a miss by the caller.
+- **Bounded**: a tile stored more than ``MAX_AGE_S`` ago is a miss, and
+  once the tree exceeds ``MAX_BYTES`` the oldest files (by mtime, the store
+  time — a load does not touch it, so age stays meaningful) are deleted
+  down to ``PRUNE_TO_FRACTION``.
+
+Tiles are loaded and stored from the mosaic worker threads. Like the sprite
+disk cache, every failure degrades to "miss".
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+from open_garden_planner.app.paths import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+#: Size budget of the cache tree, and the level a prune trims it to.
+MAX_BYTES = 256 * 1024 * 1024
+PRUNE_TO_FRACTION = 0.8
+
+#: Imagery gets refreshed now and then; so do our copies of it.
+MAX_AGE_S = 30 * 24 * 3600
+
+_DIR_NAME = "map_tile_cache"
+
+
+class MapTileCache:
+    """PNG-bytes store for Static Maps tiles with age-based pruning (see module doc)."""
+
+    def __init__(
+        self, root: Path, max_bytes: int = MAX_BYTES, max_age_s: float = MAX_AGE_S
+    ) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_age_s = max_age_s
+        self._lock = threading.Lock()
+        self._nbytes: int | None = None  # scanned lazily on the first store
+        #: Instruments for tests and profiling.
+        self.hits = 0
+        self.misses = 0
+        self.pruned = 0
+
+    def _file(self, lat: float, lng: float, zoom: int, scale: int) -> Path:
+        return self.root / f"z{zoom}" / f"{lat:+.7f}_{lng:+.7f}@{scale}x.png"
+
+    def load(self, lat: float, lng: float, zoom: int, scale: int) -> bytes | None:
+        """The cached tile bytes, or None on a miss (any I/O error is a miss)."""
+        file = self._file(lat, lng, zoom, scale)
+        try:
+            if time.time() - file.stat().st_mtime > self.max_age_s:
+                file.unlink()
+                raise FileNotFoundError(file)
+            data = file.read_bytes()
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def store(self, lat: float, lng: float, zoom: int, scale: int, data: bytes) -> None:
+        """Write ``data`` (atomically), pruning if over budget."""
+        file = self._file(lat, lng, zoom, scale)
+        tmp = file.with_name(f"{file.name}.{threading.get_ident()}.tmp")
+        try:
+            file.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(data)
+            try:
+                replaced = file.stat().st_size  # an overwrite frees the old bytes
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp, file)
+        except OSError as exc:
+            logger.debug("Map tile cache write failed: %s", exc)
+            with contextlib.suppress(OSError):
+                tmp.unlink()
+            return
+        with self._lock:
+            if self._nbytes is None:
+                self._nbytes = self._scan_bytes()
+            else:
+                self._nbytes += len(data) - replaced
+            over = self._nbytes > self.max_bytes
+        if over:
+            self.prune()
+
+    def discard(self, lat: float, lng: float, zoom: int, scale: int) -> None:
+        """Drop one tile (the caller found it undecodable)."""
+        with contextlib.suppress(OSError):
+            self._file(lat, lng, zoom, scale).unlink()
+
+    def prune(self, target_bytes: int | None = None) -> None:
+        """Delete the oldest tiles down to ``target_bytes``."""
+        if target_bytes is None:
+            target_bytes = int(self.max_bytes * PRUNE_TO_FRACTION)
+        with self._lock:
+            entries: list[tuple[float, int, Path]] = []
+            for file in self.root.rglob("*.png") if self.root.is_dir() else ():
+                with contextlib.suppress(OSError):
+                    stat = file.stat()
+                    entries.append((stat.st_mtime, stat.st_size, file))
+            total = sum(size for _mtime, size, _file in entries)
+            for _mtime, size, file in sorted(entries, key=lambda e: e[0]):
+                if total <= target_bytes:
+                    break
+                with contextlib.suppress(OSError):
+                    file.unlink()
+                    total -= size
+                    self.pruned += 1
+            self._nbytes = total
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            if self._nbytes is None:
+                self._nbytes = self._scan_bytes()
+            return self._nbytes
+
+    def _scan_bytes(self) -> int:
+        total = 0
+        for file in self.root.rglob("*.png") if self.root.is_dir() else ():
+            with contextlib.suppress(OSError):
+                total += file.stat().st_size
+        return total
+
+
+_default: MapTileCache | None = None
+_default_lock = threading.Lock()
+
+
+def default_cache_dir() -> Path:
+    """``<cache dir>/map_tile_cache`` (next to ``sprite_cache``)."""
+    return get_cache_dir() / _DIR_NAME
+
+
+def map_tile_cache() -> MapTileCache:
+    """The shared cache, created on first use (and again if the app cache
+    directory moved, see ``app.paths.set_cache_dir``)."""
+    global _default
+    root = default_cache_dir()
+    with _default_lock:
+        if _default is None or _default.root != root:
+            _default = MapTileCache(root)
+        return _default
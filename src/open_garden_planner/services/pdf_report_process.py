@@ -0,0 +1,193 @@
+"""PDF report generation in a background process.
+
+``PdfReportService.generate`` paints the live ``CanvasScene``, so it has to
+run on the GUI thread — a 100-page report froze editing until it was done.
+``PdfReportJob`` instead hands a *snapshot* of the plan (the ``.ogp``-shaped
+dict from ``ProjectManager.snapshot_dict``) and the report options to a
+spawned worker process. The worker starts its own ``QApplication`` on the
+offscreen platform, rebuilds a scene from the snapshot, and runs the very
+same ``generate`` on it, sending progress back over a queue that the job
+polls from a GUI-thread timer. Editing carries on meanwhile; the report
+shows the plan as it was when the export started.
+
+The worker writes to ``<name>.part`` and renames on success; ``cancel()``
+terminates it and removes the partial file. ``render_report_from_snapshot``
+is the worker's body, callable in-process too (tests compare both paths).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import multiprocessing
+import os
+import queue
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from open_garden_planner.services.pdf_report_service import (
+    PdfPageTiming,
+    PdfReportOptions,
+    PdfReportService,
+)
+
+#: How often the GUI thread drains the worker's message queue, ms.
+POLL_INTERVAL_MS = 50
+
+
+def _part_path(file_path: Path) -> Path:
+    return file_path.with_name(file_path.name + ".part")
+
+
+def render_report_from_snapshot(
+    snapshot: dict[str, Any],
+    opts: PdfReportOptions,
+    file_path: Path | str,
+    progress_callback: Callable[[int, int], None] | None = None,
+) -> list[PdfPageTiming]:
+    """Rebuild a scene from ``snapshot`` and write its report to ``file_path``.
+
+    Needs a ``QApplication``.
+    """
+    from open_garden_planner.core.project import ProjectManager
+    from open_garden_planner.ui.canvas.canvas_scene import CanvasScene
+
+    scene = CanvasScene()
+    ProjectManager().load_scene_snapshot(scene, snapshot)
+    return PdfReportService.generate(scene, opts, file_path, progress_callback)
+
+
+def _report_process_main(
+    snapshot: dict[str, Any],
+    opts: PdfReportOptions,
+    file_path: str,
+    messages: Any,
+) -> None:
+    """Worker-process entry point: report progress and outcome on ``messages``.
+
+    Messages are ``("progress", current, total)``, then either
+    ``("done", pages)`` or ``("error", text)``.
+    """
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([sys.argv[0] if sys.argv else "ogp-report"])
+    target = Path(file_path)
+    part = _part_path(target)
+    try:
+        timings = render_report_from_snapshot(
+            snapshot, opts, part, lambda c, t: messages.put(("progress", c, t))
+        )
+        os.replace(part, target)
+    except Exception as exc:  # reported to the GUI process, not raised there
+        part.unlink(missing_ok=True)
+        messages.put(("error", f"{type(exc).__name__}: {exc}"))
+    else:
+        messages.put(("done", len(timings)))
+    del app
+
+
+class PdfReportJob(QObject):
+    """One report rendered in a worker process (see module doc).
+
+    Signals arrive on the GUI thread: ``progress(current, total)``, then
+    either ``finished(pages)`` or ``failed(message)``. ``cancel()`` emits
+    neither.
+    """
+
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(int)
+    failed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        snapshot: dict[str, Any],
+        opts: PdfReportOptions,
+        file_path: Path | str,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        # Runtime-only keys of the snapshot mean nothing to the worker.
+        self._snapshot = {k: v for k, v in snapshot.items() if k != "agent_meta"}
+        self._opts = opts
+        self.file_path = Path(file_path)
+        # "spawn" everywhere: a forked child would inherit the GUI process's
+        # Qt state, which is not fork-safe.
+        self._context = multiprocessing.get_context("spawn")
+        self._messages: Any = None
+        self._process: Any = None
+        self._timer = QTimer(self)
+        self._timer.setInterval(POLL_INTERVAL_MS)
+        self._timer.timeout.connect(self._poll)
+
+    @property
+    def is_running(self) -> bool:
+        return self._process is not None
+
+    def start(self) -> None:
+        if self._process is not None:
+            raise RuntimeError("PDF report job already started")
+        self._messages = self._context.Queue()
+        self._process = self._context.Process(
+            target=_report_process_main,
+            args=(self._snapshot, self._opts, str(self.file_path), self._messages),
+            name="ogp-pdf-report",
+            daemon=True,
+        )
+        self._process.start()
+        self._timer.start()
+
+    def cancel(self) -> None:
+        """Stop the worker and remove the partial file; emits nothing."""
+        process = self._process
+        if process is None:
+            return
+        self._stop()
+        if process.is_alive():
+            process.terminate()
+        process.join(2.0)
+        _part_path(self.file_path).unlink(missing_ok=True)
+
+    def shutdown(self) -> None:
+        """Cancel before teardown (#230)."""
+        with contextlib.suppress(RuntimeError):
+            self.cancel()
+
+    def _stop(self) -> None:
+        self._timer.stop()
+        self._process = None
+
+    def _poll(self) -> None:  # GUI thread
+        process = self._process
+        if process is None:
+            return
+        alive = process.is_alive()
+        # Drain after the liveness check: a verdict sent just before exit is
+        # already in the pipe by then.
+        if self._drain(process) or alive:
+            return
+        self._stop()
+        _part_path(self.file_path).unlink(missing_ok=True)
+        self.failed.emit(f"Report process exited with code {process.exitcode}")
+
+    def _drain(self, process: Any) -> bool:
+        """Dispatch queued messages; True once the job has finished."""
+        while True:
+            try:
+                message = self._messages.get_nowait()
+            except queue.Empty:
+                return False
+            kind = message[0]
+            if kind == "progress":
+                self.progress.emit(message[1], message[2])
+                continue
+            self._stop()
+            process.join(2.0)
+            if kind == "done":
+                self.finished.emit(message[1])
+            else:
+                self.failed.emit(message[1])
+            return True
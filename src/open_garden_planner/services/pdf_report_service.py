@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
@@ -10,6 +12,12 @@ from typing import TYPE_CHECKING, Any
 
 from PyQt6.QtCore import QCoreApplication, QMarginsF, QPointF, QRectF, Qt
 from PyQt6.QtGui import QColor, QFont, QImage, QPageLayout, QPageSize, QPainter, QPdfWriter, QPen
+from PyQt6.QtWidgets import QGraphicsSimpleTextItem, QGraphicsTextItem
+
+from open_garden_planner.services.scene_rendering import (
+    compute_export_font_size,
+    export_render_state,
+)
 
 
 def _tr(text: str) -> str:
@@ -19,7 +27,6 @@ def _tr(text: str) -> str:
 if TYPE_CHECKING:
     from open_garden_planner.ui.canvas.canvas_scene import CanvasScene
 
-# Imported lazily inside _scene_to_image to avoid circular imports
 _PDF_DPI = 72
 
 
@@ -76,41 +83,98 @@ def _pt(mm: float) -> float:
     return mm / 25.4 * 72.0
 
 
-def _scene_to_image(scene: Any, source: QRectF, dest: QRectF) -> QImage:
-    """Render *source* region of *scene* into a QImage sized to *dest*, with Y-flip.
+class _RenderSession:
+    """Scene renders for one report, sharing the export state across pages.
+
+    Hiding overlays (which clears and later restores the selection, with
+    its resize handles) and rescaling text touch every item. The report
+    used to pay for both, and for undoing them, around every overview and
+    bed page; a session does the bookkeeping once for the whole report and
+    each page only renders its own region.
 
-    Using a temporary QImage avoids PDF/SVG coordinate-system interactions that
-    make the painter pre-flip approach unreliable on non-QImage devices.
-    ItemIgnoresTransformations text items are pre-scaled so they appear
-    proportionally correct at the PDF's 72-DPI output size.
+    Text is still sized per page, from that page's scale (a bed page is
+    far more zoomed in than the overview): the session remembers the
+    original fonts once and only re-applies them when a page needs a
+    different point size.
     """
-    from open_garden_planner.services.export_service import ExportService
 
-    w = max(1, int(round(dest.width())))
-    h = max(1, int(round(dest.height())))
+    def __init__(self, scene: Any) -> None:
+        self._scene = scene
+        self._fonts: list[tuple[Any, QFont]] = [
+            (item, QFont(item.font()))
+            for item in scene.items()
+            if isinstance(item, (QGraphicsSimpleTextItem, QGraphicsTextItem))
+        ]
+        self._text_point_size: int | None = None
+        #: Instruments for the per-page timing breakdown.
+        self.renders = 0
+        self.render_seconds = 0.0
+
+    @staticmethod
+    @contextmanager
+    def open(scene: Any) -> Iterator[_RenderSession]:
+        with export_render_state(scene, hide_construction=False):
+            session = _RenderSession(scene)
+            try:
+                yield session
+            finally:
+                session._restore_text()
+
+    def _set_text_point_size(self, point_size: int) -> None:
+        if point_size == self._text_point_size:
+            return
+        for item, original in self._fonts:
+            font = QFont(original)
+            font.setPointSize(max(4, point_size))
+            item.setFont(font)
+        self._text_point_size = point_size
+
+    def _restore_text(self) -> None:
+        if self._text_point_size is None:
+            return
+        for item, original in self._fonts:
+            item.setFont(original)
+        self._text_point_size = None
+
+    def image(self, source: QRectF, dest: QRectF) -> QImage:
+        """Render *source* of the scene into a QImage sized to *dest*, with Y-flip.
 
-    # Scale factor: output physical width (cm at 72 DPI) / scene source width (cm)
-    w_cm = w / _PDF_DPI * 2.54
-    scale = w_cm / max(1.0, source.width())
+        Using a temporary QImage avoids PDF/SVG coordinate-system interactions
+        that make the painter pre-flip approach unreliable on non-QImage devices.
+        """
+        started = time.perf_counter()
+        w = max(1, int(round(dest.width())))
+        h = max(1, int(round(dest.height())))
+
+        # Scale factor: output physical width (cm at 72 DPI) / scene source width (cm)
+        w_cm = w / _PDF_DPI * 2.54
+        self._set_text_point_size(
+            compute_export_font_size(w_cm / max(1.0, source.width()), _PDF_DPI)
+        )
 
-    saved_text = ExportService._prepare_text_for_export(scene, scale, _PDF_DPI)
-    hidden_overlay, prior_selection = ExportService._hide_overlay_items(scene)
-    try:
         img = QImage(w, h, QImage.Format.Format_ARGB32)
         img.fill(QColor("white"))
         p = QPainter(img)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
         p.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-        p.save()
         p.translate(0, h)
         p.scale(1.0, -1.0)
-        scene.render(p, QRectF(0, 0, w, h), source)
-        p.restore()
+        self._scene.render(p, QRectF(0, 0, w, h), source)
         p.end()
-    finally:
-        ExportService._restore_text_after_export(saved_text)
-        ExportService._restore_overlay_items(hidden_overlay, prior_selection)
-    return img
+        self.renders += 1
+        self.render_seconds += time.perf_counter() - started
+        return img
+
+
+@dataclass
+class PdfPageTiming:
+    """Where the time of one report page went."""
+
+    index: int
+    page_type: str
+    seconds: float
+    scene_seconds: float = 0.0   # rendering the plan into page images
+    scene_renders: int = 0
 
 
 def _draw_title_block(
@@ -260,6 +324,7 @@ def _render_overview(
     painter: QPainter,
     page_rect: QRectF,
     scene: CanvasScene,
+    session: _RenderSession,
     opts: PdfReportOptions,
 ) -> None:
     title_bar_h = _pt(8)
@@ -274,7 +339,7 @@ def _render_overview(
     )
 
     canvas_rect = scene.canvas_rect if hasattr(scene, "canvas_rect") else scene.sceneRect()
-    img = _scene_to_image(scene, canvas_rect, content_rect)
+    img = session.image(canvas_rect, content_rect)
     painter.drawImage(content_rect, img)
 
     # North arrow (top-right of content area)
@@ -305,7 +370,7 @@ def _render_overview(
 def _render_bed_detail(
     painter: QPainter,
     page_rect: QRectF,
-    scene: CanvasScene,
+    session: _RenderSession,
     bed_item: Any,
     opts: PdfReportOptions,
 ) -> None:
@@ -320,7 +385,7 @@ def _render_bed_detail(
     bed_scene_rect = bed_item.mapToScene(bed_item.boundingRect()).boundingRect()
     padding = max(bed_scene_rect.width(), bed_scene_rect.height()) * 0.1
     source = bed_scene_rect.adjusted(-padding, -padding, padding, padding)
-    img = _scene_to_image(scene, source, content_rect)
+    img = session.image(source, content_rect)
     painter.drawImage(content_rect, img)
 
     bed_name = getattr(bed_item, "name", "") or _tr("Bed")
@@ -841,14 +906,23 @@ class PdfReportService:
         opts: PdfReportOptions,
         file_path: Path | str,
         progress_callback: Callable[[int, int], None] | None = None,
-    ) -> None:
+        timing_callback: Callable[[PdfPageTiming], None] | None = None,
+    ) -> list[PdfPageTiming]:
         """Generate a PDF report and write it to *file_path*.
 
+        Plan pages (overview, bed details) share one ``_RenderSession``, so
+        the scene is prepared for export once rather than per page.
+
         Args:
             scene: The canvas scene to render.
             opts: Report configuration options.
             file_path: Destination path for the PDF file.
             progress_callback: Optional callable(current, total) for progress.
+            timing_callback: Optional callable receiving each finished
+                page's ``PdfPageTiming``.
+
+        Returns:
+            The per-page timing breakdown, in page order.
         """
         writer = QPdfWriter(str(file_path))
         # Set 72 DPI so painter.viewport() dimensions are in PDF points and match
@@ -890,49 +964,66 @@ class PdfReportService:
             pages.append(("legend", None))
 
         if not pages:
-            return
+            return []
 
         total = len(pages)
+        timings: list[PdfPageTiming] = []
         painter = QPainter()
         if not painter.begin(writer):
             raise RuntimeError("Failed to start PDF painter")
 
         try:
-            for idx, (page_type, data) in enumerate(pages):
-                if idx > 0:
-                    writer.newPage()
-
-                if progress_callback:
-                    progress_callback(idx, total)
-
-                page_rect = QRectF(painter.viewport())
-
-                painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-                painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
-                painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-
-                painter.fillRect(page_rect, QColor("white"))
-
-                if page_type == "cover":
-                    _render_cover(painter, page_rect, opts)
-                elif page_type == "overview":
-                    _render_overview(painter, page_rect, scene, opts)
-                elif page_type == "bed":
-                    _render_bed_detail(painter, page_rect, scene, data, opts)
-                elif page_type == "plant_list":
-                    _render_plant_list(painter, page_rect, scene, opts)
-                elif page_type == "garden_notes":
-                    _render_garden_notes(painter, page_rect, scene, opts)
-                elif page_type == "harvest_summary":
-                    _render_harvest_summary(painter, page_rect, scene, opts)
-                elif page_type == "legend":
-                    _render_legend(painter, page_rect, scene, opts)
+            with _RenderSession.open(scene) as session:
+                for idx, (page_type, data) in enumerate(pages):
+                    started = time.perf_counter()
+                    renders_before = session.renders
+                    render_before = session.render_seconds
+                    if idx > 0:
+                        writer.newPage()
+
+                    if progress_callback:
+                        progress_callback(idx, total)
+
+                    page_rect = QRectF(painter.viewport())
+
+                    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+                    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+                    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+
+                    painter.fillRect(page_rect, QColor("white"))
+
+                    if page_type == "cover":
+                        _render_cover(painter, page_rect, opts)
+                    elif page_type == "overview":
+                        _render_overview(painter, page_rect, scene, session, opts)
+                    elif page_type == "bed":
+                        _render_bed_detail(painter, page_rect, session, data, opts)
+                    elif page_type == "plant_list":
+                        _render_plant_list(painter, page_rect, scene, opts)
+                    elif page_type == "garden_notes":
+                        _render_garden_notes(painter, page_rect, scene, opts)
+                    elif page_type == "harvest_summary":
+                        _render_harvest_summary(painter, page_rect, scene, opts)
+                    elif page_type == "legend":
+                        _render_legend(painter, page_rect, scene, opts)
+
+                    timing = PdfPageTiming(
+                        index=idx,
+                        page_type=page_type,
+                        seconds=time.perf_counter() - started,
+                        scene_seconds=session.render_seconds - render_before,
+                        scene_renders=session.renders - renders_before,
+                    )
+                    timings.append(timing)
+                    if timing_callback:
+                        timing_callback(timing)
 
         finally:
             painter.end()
 
         if progress_callback:
             progress_callback(total, total)
+        return timings
 
     @staticmethod
     def export_shopping_list_to_pdf(
@@ -2,10 +2,13 @@
 
 from .base import PlantAPIClient, PlantAPIError, PlantDetailUnavailableError
 from .manager import PlantAPIManager
+from .search_job import PlantSearchJob, PlantSearchOutcome
 
 __all__ = [
     "PlantAPIClient",
     "PlantAPIError",
     "PlantAPIManager",
     "PlantDetailUnavailableError",
+    "PlantSearchJob",
+    "PlantSearchOutcome",
 ]
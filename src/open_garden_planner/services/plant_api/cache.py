@@ -0,0 +1,155 @@
+"""Persistent TTL cache of plant API answers.
+
+Every debounced keystroke in the plant search used to go back to the
+network, and confirming a result fetched its detail record again each time.
+Answers are now kept in one SQLite file under the app's local data
+directory, shared by every ``PlantAPIManager``:
+
+- **search** entries: ``(source, limit, normalized query) -> results``,
+  kept for ``SEARCH_TTL_S``. An empty answer is cached too — it is an
+  honest "no match" (#302), not a failure.
+- **detail** entries: ``(source, id) -> record``, kept for ``DETAIL_TTL_S``.
+
+Only answers are cached; a provider that raised leaves nothing behind, so
+the next search retries it. Cached species also feed the local fuzzy
+name index (``species_search_index``). Records round-trip through
+``PlantSpeciesData.to_dict``/``from_dict``. Storage is the shared
+``SqliteCache`` (``services/sqlite_cache.py``): searches run on worker
+threads (``PlantSearchJob``), and every failure degrades to "miss".
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+from open_garden_planner.app.paths import get_cache_dir
+from open_garden_planner.models.plant_data import PlantSpeciesData
+from open_garden_planner.services.species_search_index import index_cached_plants
+from open_garden_planner.services.sqlite_cache import SqliteCache
+
+#: How long a search answer / a detail record stays fresh, seconds.
+SEARCH_TTL_S = 7 * 24 * 3600
+DETAIL_TTL_S = 30 * 24 * 3600
+
+#: Bump when the stored record shape changes; older rows are ignored.
+FORMAT_VERSION = 1
+
+_FILE_NAME = "plant_api_cache.sqlite3"
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a search query."""
+    return " ".join(query.split()).casefold()
+
+
+class PlantApiCache(SqliteCache):
+    """SQLite-backed TTL store for search answers and detail records."""
+
+    format_version = FORMAT_VERSION
+    label = "Plant API cache"
+
+    def __init__(
+        self,
+        path: Path,
+        search_ttl_s: float = SEARCH_TTL_S,
+        detail_ttl_s: float = DETAIL_TTL_S,
+    ) -> None:
+        super().__init__(path)
+        self.search_ttl_s = search_ttl_s
+        self.detail_ttl_s = detail_ttl_s
+
+    # ── search answers ─────────────────────────────────────────
+
+    def get_search(self, source: str, query: str, limit: int) -> list[PlantSpeciesData] | None:
+        """The cached answer of ``source`` for ``query``, or None on a miss."""
+        entry = self.get("search", self._search_key(source, query, limit), self.search_ttl_s)
+        if entry is None:
+            return None
+        return [PlantSpeciesData.from_dict(record) for record in entry.payload]
+
+    def put_search(
+        self, source: str, query: str, limit: int, results: list[PlantSpeciesData]
+    ) -> None:
+        self.put(
+            "search",
+            self._search_key(source, query, limit),
+            [plant.to_dict() for plant in results],
+        )
+        index_cached_plants(results)
+
+    # ── detail records ─────────────────────────────────────────
+
+    def get_detail(self, source: str, plant_id: str) -> PlantSpeciesData | None:
+        entry = self.get("detail", self._detail_key(source, plant_id), self.detail_ttl_s)
+        return None if entry is None else PlantSpeciesData.from_dict(entry.payload)
+
+    def put_detail(self, source: str, plant_id: str, plant: PlantSpeciesData) -> None:
+        self.put("detail", self._detail_key(source, plant_id), plant.to_dict())
+        index_cached_plants([plant])
+
+    def cached_plants(self) -> list[PlantSpeciesData]:
+        """Every fresh species record in the cache, one per plant.
+
+        Feeds the local search index (``species_search_index``); a detail
+        record wins over the sparser search-result copy of the same plant.
+        """
+        now = time.time()
+        with self._lock, self._connect() as db:
+            rows = []
+            if db is not None:
+                rows = db.execute(
+                    "SELECT kind, payload FROM entries WHERE version = ? AND ("
+                    "(kind = 'search' AND stored_at >= ?) OR (kind = 'detail' AND stored_at >= ?))"
+                    " ORDER BY kind DESC",
+                    (self.format_version, now - self.search_ttl_s, now - self.detail_ttl_s),
+                ).fetchall()
+        plants: dict[tuple[str, str], PlantSpeciesData] = {}
+        for kind, payload in rows:  # "search" rows first, details overwrite
+            try:
+                records = json.loads(payload)
+                for record in records if kind == "search" else [records]:
+                    plant = PlantSpeciesData.from_dict(record)
+                    if plant.source_id:
+                        plants[(plant.data_source, plant.source_id)] = plant
+            except (ValueError, KeyError, TypeError):
+                continue
+        return list(plants.values())
+
+    # ── maintenance ────────────────────────────────────────────
+
+    def prune(self) -> None:
+        """Delete expired and old-format rows."""
+        self._prune({"search": self.search_ttl_s, "detail": self.detail_ttl_s})
+
+    # ── internals ──────────────────────────────────────────────
+
+    @staticmethod
+    def _search_key(source: str, query: str, limit: int) -> str:
+        return f"{source.casefold()}\x1f{limit}\x1f{normalize_query(query)}"
+
+    @staticmethod
+    def _detail_key(source: str, plant_id: str) -> str:
+        return f"{source.casefold()}\x1f{plant_id}"
+
+
+_default: PlantApiCache | None = None
+_default_lock = threading.Lock()
+
+
+def default_cache_path() -> Path:
+    """``<cache dir>/plant_api_cache.sqlite3`` (next to ``sprite_cache``)."""
+    return get_cache_dir() / _FILE_NAME
+
+
+def plant_api_cache() -> PlantApiCache:
+    """The shared cache, created on first use (and again if the app cache
+    directory moved, see ``app.paths.set_cache_dir``)."""
+    global _default
+    path = default_cache_path()
+    with _default_lock:
+        if _default is None or _default.path != path:
+            _default = PlantApiCache(path)
+        return _default
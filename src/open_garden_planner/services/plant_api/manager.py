@@ -4,8 +4,10 @@ import logging
 from typing import Any
 
 from open_garden_planner.models.plant_data import PlantSpeciesData
+from open_garden_planner.services.species_search_index import species_search_index
 
 from .base import PlantAPIClient, PlantAPIError, PlantDetailUnavailableError
+from .cache import PlantApiCache, plant_api_cache
 from .perenual_client import PerenualClient
 from .permapeople_client import PermapeopleClient
 from .trefle_client import TrefleClient
@@ -24,6 +26,9 @@ class PlantAPIManager:
     5. User-defined entries (always available) - Not yet implemented
 
     The manager automatically tries each service in order until one succeeds.
+    Answers are kept in a persistent TTL cache (``cache.py``), and
+    ``PlantSearchJob`` (``search_job.py``) queries the configured services
+    concurrently instead, for the search dialog.
     """
 
     def __init__(
@@ -32,6 +37,7 @@ class PlantAPIManager:
         perenual_api_key: str | None = None,
         permapeople_key_id: str | None = None,
         permapeople_key_secret: str | None = None,
+        cache: PlantApiCache | None = None,
     ) -> None:
         """Initialize the plant API manager.
 
@@ -40,8 +46,10 @@ class PlantAPIManager:
             perenual_api_key: Optional Perenual API key
             permapeople_key_id: Optional Permapeople key ID
             permapeople_key_secret: Optional Permapeople key secret
+            cache: Answer cache; defaults to the shared app-data one
         """
         self._clients: list[PlantAPIClient] = []
+        self._cache = cache if cache is not None else plant_api_cache()
         #: Names of configured providers that raised during the most recent
         #: ``search()`` while another provider still answered. Lets the UI
         #: mention "provider X unavailable" next to an honest zero-result
@@ -97,6 +105,66 @@ class PlantAPIManager:
         """
         return sum(1 for c in self._clients if c.is_configured())
 
+    @property
+    def configured_sources(self) -> list[str]:
+        """Names of the clients `search()` would try, in fallback order."""
+        return [c.name for c in self._clients if c.is_configured()]
+
+    def search_custom(self, query: str) -> list[PlantSpeciesData]:
+        """Search the user's custom plant library; never raises."""
+        try:
+            from open_garden_planner.services.plant_library import get_plant_library
+
+            return list(get_plant_library().search_plants(query))
+        except Exception as e:
+            logger.warning(f"Custom library search failed: {e}")
+            return []
+
+    def search_local(self, query: str, limit: int = 20) -> list[PlantSpeciesData]:
+        """Fuzzy-match bundled and previously fetched species; never raises.
+
+        Answers from memory (``species_search_index``) without touching the
+        network, so it can run on every keystroke.
+        """
+        try:
+            return species_search_index().search(query, limit)
+        except Exception as e:
+            logger.warning(f"Local species search failed: {e}")
+            return []
+
+    def cached_search_source(
+        self, source: str, query: str, limit: int
+    ) -> list[PlantSpeciesData] | None:
+        """The cached answer of one source, or None if it must be asked."""
+        return self._cache.get_search(source, query, limit)
+
+    def search_source(self, source: str, query: str, limit: int = 10) -> list[PlantSpeciesData]:
+        """Search one source by name, through the cache.
+
+        `PlantSearchJob` calls it from its worker threads.
+
+        Raises:
+            PlantAPIError: If the source fails or is unknown
+        """
+        return self._search_client(self._client_named(source), query, limit)
+
+    def _search_client(
+        self, client: PlantAPIClient, query: str, limit: int
+    ) -> list[PlantSpeciesData]:
+        cached = self._cache.get_search(client.name, query, limit)
+        if cached is not None:
+            logger.info(f"{client.name} answer for '{query}' served from cache")
+            return cached
+        results = client.search(query, limit)
+        self._cache.put_search(client.name, query, limit, results)
+        return results
+
+    def _client_named(self, source: str) -> PlantAPIClient:
+        for client in self._clients:
+            if client.name.lower() == source.lower():
+                return client
+        raise PlantAPIError(f"No client available for source: {source}")
+
     def search(self, query: str, limit: int = 10) -> list[PlantSpeciesData]:
         """Search for plants across custom library and all available APIs.
 
@@ -133,16 +201,10 @@ class PlantAPIManager:
         results: list[PlantSpeciesData] = []
 
         # First, search custom plant library
-        try:
-            from open_garden_planner.services.plant_library import get_plant_library
-
-            library = get_plant_library()
-            custom_results = library.search_plants(query)
-            if custom_results:
-                logger.info(f"Custom library returned {len(custom_results)} results")
-                results.extend(custom_results)
-        except Exception as e:
-            logger.warning(f"Custom library search failed: {e}")
+        custom_results = self.search_custom(query)
+        if custom_results:
+            logger.info(f"Custom library returned {len(custom_results)} results")
+            results.extend(custom_results)
 
         # If we have enough results from custom library, return them
         if len(results) >= limit:
@@ -162,7 +224,7 @@ class PlantAPIManager:
 
             try:
                 logger.info(f"Trying {client.name} API for search: '{query}'")
-                api_results = client.search(query, remaining_limit)
+                api_results = self._search_client(client, query, remaining_limit)
                 any_client_answered = True
 
                 if api_results:
@@ -215,7 +277,7 @@ class PlantAPIManager:
         raise PlantAPIError(error_msg)
 
     def get_by_id(self, plant_id: str, source: str) -> PlantSpeciesData:
-        """Get detailed plant data by ID from a specific source.
+        """Get detailed plant data by ID from a specific source, through the cache.
 
         Args:
             plant_id: Unique identifier in the source's database
@@ -227,19 +289,23 @@ class PlantAPIManager:
         Raises:
             PlantAPIError: If the API request fails or source not found
         """
-        # Find the client for this source
-        for client in self._clients:
-            if client.name.lower() == source.lower():
-                try:
-                    return client.get_by_id(plant_id)
-                except PlantDetailUnavailableError:
-                    # Not a failure -- pass through unwrapped so callers can
-                    # distinguish it from a genuine error (#297 round 4).
-                    raise
-                except PlantAPIError as e:
-                    raise PlantAPIError(f"Failed to get plant from {source}: {e}") from e
-
-        raise PlantAPIError(f"No client available for source: {source}")
+        client = self._client_named(source)
+        cached = self._cache.get_detail(client.name, plant_id)
+        if cached is not None:
+            return cached
+        try:
+            detail = client.get_by_id(plant_id)
+        except PlantDetailUnavailableError:
+            # Not a failure -- pass through unwrapped so callers can
+            # distinguish it from a genuine error (#297 round 4).
+            raise
+        except PlantAPIError as e:
+            raise PlantAPIError(f"Failed to get plant from {source}: {e}") from e
+        # Only a record that is what was asked for is worth keeping (the
+        # source_id contract, see PlantAPIClient.get_by_id).
+        if detail.source_id == plant_id:
+            self._cache.put_detail(client.name, plant_id, detail)
+        return detail
 
     def get_available_sources(self) -> list[str]:
         """Get list of currently available API sources.
@@ -0,0 +1,206 @@
+"""Concurrent plant search for the search dialog.
+
+``PlantAPIManager.search`` asks Trefle, Perenual and Permapeople one after
+another on the calling thread — up to three 10 s timeouts with the dialog
+frozen. ``PlantSearchJob`` instead asks every configured source at once on
+a shared thread pool and streams each answer back to the GUI thread as it
+arrives:
+
+- the custom plant library and the local species index (bundled and
+  previously fetched species, fuzzy-matched) are searched synchronously in
+  ``start()``, then every source whose answer is cached is delivered right
+  away, and only the rest go to the pool;
+- ``source_answered(source, results)`` / ``source_failed(source, message)``
+  fire once per source, ``finished(outcome)`` once all have reported;
+- ``cancel()`` drops a superseded query: queued requests never start, and
+  answers still in flight are discarded (they do land in the cache).
+
+Signals are emitted from worker threads on a ``QObject`` living in the GUI
+thread, so Qt queues them to it; an emit racing the job's deletion is
+swallowed (#230).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from open_garden_planner.models.plant_data import PlantSpeciesData
+from open_garden_planner.services.species_search_index import plant_key
+
+from .manager import PlantAPIManager
+
+logger = logging.getLogger(__name__)
+
+#: Source name used for the user's custom plant library.
+CUSTOM_SOURCE = "custom"
+#: Source name used for bundled and cached species matched from memory.
+LOCAL_SOURCE = "local"
+_LOCAL_SOURCES = (CUSTOM_SOURCE, LOCAL_SOURCE)
+
+#: Enough workers for every provider, plus a superseded query still in flight.
+_MAX_WORKERS = 6
+
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _search_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix="plant-search")
+        return _pool
+
+
+@dataclass(frozen=True)
+class PlantSearchOutcome:
+    """How a finished search went, for the dialog's status line."""
+
+    query: str
+    result_count: int  # distinct records, across sources
+    answered_sources: tuple[str, ...]
+    failed_sources: tuple[str, ...]
+    configured_count: int
+    last_error: str = ""
+
+    @property
+    def failed(self) -> bool:
+        """Every configured source raised and nothing was found (#302)."""
+        return (
+            self.result_count == 0
+            and self.configured_count > 0
+            and not self.answered_sources
+        )
+
+
+class PlantSearchJob(QObject):
+    """One query against every configured source at once (see module doc)."""
+
+    source_answered = pyqtSignal(str, list)
+    source_failed = pyqtSignal(str, str)
+    finished = pyqtSignal(object)  # PlantSearchOutcome
+
+    # Worker threads -> GUI thread: (source, results or None, error or None).
+    _delivered = pyqtSignal(str, object, object)
+
+    def __init__(
+        self,
+        manager: PlantAPIManager,
+        query: str,
+        limit: int = 20,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._manager = manager
+        self.query = query
+        self._limit = limit
+        self._pending: set[str] = set()
+        self._futures: list[Future] = []
+        self._answered: list[str] = []
+        self._failed: list[str] = []
+        self._last_error = ""
+        self._found: set[str] = set()  # plant_key of every result
+        self._started = False
+        self._cancelled = False
+        self._delivered.connect(self._on_delivered)
+
+    @property
+    def sources(self) -> list[str]:
+        """Every source this job reports on, in display order.
+
+        The custom library first, the online databases next, and the local
+        index last: its matches are only a fallback for what they return.
+        """
+        return [CUSTOM_SOURCE, *self._manager.configured_sources, LOCAL_SOURCE]
+
+    @property
+    def is_running(self) -> bool:
+        return self._started and not self._cancelled and bool(self._pending)
+
+    def start(self) -> None:
+        if self._started:
+            raise RuntimeError("plant search job already started")
+        self._started = True
+        sources = self._manager.configured_sources
+        self._pending = {*sources, *_LOCAL_SOURCES}
+
+        self._on_delivered(CUSTOM_SOURCE, self._manager.search_custom(self.query), None)
+        self._on_delivered(LOCAL_SOURCE, self._manager.search_local(self.query, self._limit), None)
+        for source in sources:
+            if self._cancelled:
+                return
+            cached = self._manager.cached_search_source(source, self.query, self._limit)
+            if cached is not None:
+                self._on_delivered(source, cached, None)
+            else:
+                self._futures.append(_search_pool().submit(self._run_source, source))
+
+    def cancel(self) -> None:
+        """Drop this query; emits nothing more."""
+        self._cancelled = True
+        for future in self._futures:
+            future.cancel()
+        self._futures.clear()
+
+    def shutdown(self) -> None:
+        """Cancel before teardown (#230)."""
+        with contextlib.suppress(RuntimeError):
+            self.cancel()
+
+    def _run_source(self, source: str) -> None:  # worker thread
+        if self._cancelled:
+            return
+        results: list[PlantSpeciesData] | None = None
+        error: Exception | None = None
+        try:
+            results = self._manager.search_source(source, self.query, self._limit)
+        except Exception as e:  # noqa: BLE001 -- reported per source, like search()
+            error = e
+        with contextlib.suppress(RuntimeError):  # job deleted meanwhile
+            self._delivered.emit(source, results, error)
+
+    def _on_delivered(
+        self,
+        source: str,
+        results: list[PlantSpeciesData] | None,
+        error: Exception | None,
+    ) -> None:  # GUI thread
+        if self._cancelled or source not in self._pending:
+            return
+        self._pending.discard(source)
+        if error is not None:
+            logger.warning(f"{source} API failed: {error}")
+            self._failed.append(source)
+            self._last_error = str(error)
+            self.source_failed.emit(source, str(error))
+        else:
+            if source not in _LOCAL_SOURCES:
+                self._answered.append(source)
+            self._found.update(plant_key(plant) for plant in results or [])
+            self.source_answered.emit(source, list(results or []))
+        if not self._pending:
+            self._finish()
+
+    def _finish(self) -> None:
+        self._futures.clear()
+        # Same contract as PlantAPIManager.search(): failures are only worth
+        # mentioning next to a source that did answer.
+        self._manager.last_search_failed_sources = (
+            list(self._failed) if self._answered else []
+        )
+        self.finished.emit(
+            PlantSearchOutcome(
+                query=self.query,
+                result_count=len(self._found),
+                answered_sources=tuple(self._answered),
+                failed_sources=tuple(self._failed),
+                configured_count=self._manager.configured_source_count,
+                last_error=self._last_error,
+            )
+        )
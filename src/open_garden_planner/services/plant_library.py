@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Any
 
 from open_garden_planner.models.plant_data import PlantSpeciesData
+from open_garden_planner.services.species_search_index import SpeciesSearchIndex
 
 
 def get_app_data_dir() -> Path:
@@ -40,7 +41,9 @@ class PlantLibrary:
     """Manages a library of custom plant species.
 
     Stores user-defined plants in a JSON file in the application data directory.
-    Plants are indexed by a unique ID for easy retrieval and deletion.
+    Plants are indexed by a unique ID for easy retrieval and deletion, and by
+    name in a fuzzy search index built on the first search and kept current
+    by every edit.
     """
 
     LIBRARY_FILENAME = "custom_plants.json"
@@ -48,6 +51,7 @@ class PlantLibrary:
     def __init__(self) -> None:
         """Initialize the plant library."""
         self._plants: dict[str, PlantSpeciesData] = {}
+        self._index: SpeciesSearchIndex | None = None
         self._library_path = get_app_data_dir() / self.LIBRARY_FILENAME
         self._load()
 
@@ -104,6 +108,7 @@ class PlantLibrary:
 
         plant_id = plant.source_id
         self._plants[plant_id] = plant
+        self._index_plant(plant_id)
         self._save()
         return plant_id
 
@@ -123,6 +128,7 @@ class PlantLibrary:
         plant.data_source = "custom"
         plant.source_id = plant_id
         self._plants[plant_id] = plant
+        self._index_plant(plant_id)
         self._save()
         return True
 
@@ -139,6 +145,8 @@ class PlantLibrary:
             return False
 
         del self._plants[plant_id]
+        if self._index is not None:
+            self._index.discard(plant_id)
         self._save()
         return True
 
@@ -162,26 +170,24 @@ class PlantLibrary:
         return list(self._plants.items())
 
     def search_plants(self, query: str) -> list[PlantSpeciesData]:
-        """Search for plants by name.
+        """Search for plants by name, tolerating typos.
 
         Args:
             query: Search query (matches scientific name, common name, or family)
 
         Returns:
-            List of matching plants
+            List of matching plants, best match first
         """
-        query_lower = query.lower()
-        results = []
+        if self._index is None:
+            self._index = SpeciesSearchIndex()
+            for plant_id in self._plants:
+                self._index_plant(plant_id)
+        return self._index.search(query, limit=None)
 
-        for plant in self._plants.values():
-            if (
-                query_lower in plant.scientific_name.lower()
-                or query_lower in plant.common_name.lower()
-                or query_lower in plant.family.lower()
-            ):
-                results.append(plant)
-
-        return results
+    def _index_plant(self, plant_id: str) -> None:
+        """Bring the search index up to date with one plant, once it exists."""
+        if self._index is not None:
+            self._index.add(plant_id, self._plants[plant_id])
 
     @property
     def count(self) -> int:
@@ -217,6 +223,7 @@ class PlantLibrary:
                     plant.data_source = "custom"
                     plant.source_id = plant_id
                     self._plants[plant_id] = plant
+                    self._index_plant(plant_id)
                     imported += 1
                 except (KeyError, ValueError):
                     continue
@@ -0,0 +1,116 @@
+"""Incremental PNG encoder for exports too large to hold in one image.
+
+``QImage.save`` needs the whole picture in memory: an A0 plan at 300 DPI is
+a ~10000×14000 ARGB image, over half a gigabyte, allocated and encoded in
+one go. ``PngStreamWriter`` instead accepts the picture as horizontal bands
+of RGBA rows and deflates them straight into the file as they arrive, so
+only one band is ever resident. Compression runs on a single background
+thread (``zlib`` releases the GIL), overlapping with the caller rendering
+the next band; at most one band waits in the queue.
+
+The pixel density (``dpi``) goes into a ``pHYs`` chunk, as ``QImage.save``
+writes it from the image's dots-per-metre. The file is written under a ``.part`` name and moved into place by
+``close()``; ``abort()`` removes it, so a cancelled export never leaves a
+truncated PNG behind. Qt-free: bands are plain ``bytes``.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_BYTES_PER_PIXEL = 4  # RGBA, 8 bits per channel
+
+
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+class PngStreamWriter:
+    """Write an RGBA PNG band by band (see module doc)."""
+
+    def __init__(
+        self,
+        path: Path | str,
+        width: int,
+        height: int,
+        level: int = 6,
+        dpi: float | None = None,
+    ) -> None:
+        if width <= 0 or height <= 0:
+            raise ValueError(f"Invalid PNG size {width}x{height}")
+        self.path = Path(path)
+        self.width = width
+        self.height = height
+        self._part = self.path.with_name(self.path.name + ".part")
+        self._file = self._part.open("wb")
+        self._deflate = zlib.compressobj(level)
+        self._rows = 0
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="png-encode")
+        self._pending: Future[None] | None = None
+        self._file.write(_SIGNATURE)
+        self._file.write(_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)))
+        if dpi is not None and dpi > 0:
+            per_metre = round(dpi / 0.0254)
+            self._file.write(_chunk(b"pHYs", struct.pack(">IIB", per_metre, per_metre, 1)))
+
+    @property
+    def rows_written(self) -> int:
+        """Rows accepted so far (encoding may still be in flight)."""
+        return self._rows
+
+    def write_rows(self, data: bytes, rows: int, stride: int | None = None) -> None:
+        """Queue ``rows`` RGBA rows; ``stride`` is the byte length of one row
+        in ``data`` (defaults to ``width * 4``, padding beyond it is dropped)."""
+        row_bytes = self.width * _BYTES_PER_PIXEL
+        stride = row_bytes if stride is None else stride
+        if rows <= 0 or len(data) < stride * (rows - 1) + row_bytes:
+            raise ValueError("Band data is shorter than the declared rows")
+        if self._rows + rows > self.height:
+            raise ValueError("More rows than the PNG height")
+        self._rows += rows
+        self._wait()  # bound memory: one band encoding, this one queued
+        self._pending = self._pool.submit(self._encode, bytes(data), rows, stride, row_bytes)
+
+    def _encode(self, data: bytes, rows: int, stride: int, row_bytes: int) -> None:
+        # Filter type 0 (None) per scanline; deflate does the work.
+        raw = b"".join(
+            b"\x00" + data[r * stride:r * stride + row_bytes] for r in range(rows)
+        )
+        compressed = self._deflate.compress(raw)
+        if compressed:
+            self._file.write(_chunk(b"IDAT", compressed))
+
+    def _wait(self) -> None:
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            pending.result()
+
+    def close(self) -> None:
+        """Finish the stream and move the file into place."""
+        try:
+            self._wait()
+            if self._rows != self.height:
+                raise ValueError(f"PNG incomplete: {self._rows} of {self.height} rows written")
+            self._file.write(_chunk(b"IDAT", self._deflate.flush()))
+            self._file.write(_chunk(b"IEND", b""))
+            self._file.close()
+            os.replace(self._part, self.path)
+        except BaseException:
+            self.abort()
+            raise
+        finally:
+            self._pool.shutdown(wait=True)
+
+    def abort(self) -> None:
+        """Stop writing and delete the partial file."""
+        if self._pending is not None:
+            self._pending.cancel()
+        self._pool.shutdown(wait=True)
+        self._pending = None
+        self._file.close()
+        self._part.unlink(missing_ok=True)
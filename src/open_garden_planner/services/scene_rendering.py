@@ -129,6 +129,39 @@ def compute_export_font_size(scale: float, dpi: int) -> int:
     return max(4, target)
 
 
+@contextmanager
+def export_render_state(
+    scene: QGraphicsScene,
+    *,
+    hide_overlays: bool = True,
+    hide_construction: bool = True,
+    text_point_size: int | None = None,
+) -> Iterator[None]:
+    """Put ``scene`` into its export state for the duration of the block.
+
+    The bookkeeping half of :func:`render_scene_region`, for callers that
+    render one source region in several passes (banded PNG export) and
+    should hide and restore items once rather than per pass.
+    """
+    overlay_ctx = (
+        _hidden_overlay_items(scene)
+        if hide_overlays
+        else _noop_context()
+    )
+    construction_ctx = (
+        _hidden_construction_items(scene)
+        if hide_construction
+        else _noop_context()
+    )
+    text_ctx = (
+        _scaled_text(scene, text_point_size)
+        if text_point_size is not None
+        else _noop_context()
+    )
+    with overlay_ctx, construction_ctx, text_ctx:
+        yield
+
+
 def render_scene_region(
     scene: QGraphicsScene,
     painter: QPainter,
@@ -160,23 +193,12 @@ def render_scene_region(
         y_flip: If True, apply the standard Y-flip so scene "up" maps to
             target "up".
     """
-    overlay_ctx = (
-        _hidden_overlay_items(scene)
-        if hide_overlays
-        else _noop_context()
-    )
-    construction_ctx = (
-        _hidden_construction_items(scene)
-        if hide_construction
-        else _noop_context()
-    )
-    text_ctx = (
-        _scaled_text(scene, text_point_size)
-        if text_point_size is not None
-        else _noop_context()
-    )
-
-    with overlay_ctx, construction_ctx, text_ctx:
+    with export_render_state(
+        scene,
+        hide_overlays=hide_overlays,
+        hide_construction=hide_construction,
+        text_point_size=text_point_size,
+    ):
         painter.save()
         if y_flip:
             painter.translate(target_rect.x(), target_rect.y() + target_rect.height())
@@ -0,0 +1,255 @@
+"""Persistent per-site cache shared by the weather and climate services.
+
+``WeatherService`` used to keep one JSON file per coordinate pair and
+``ClimateService`` one per half-degree cell, and every miss was a separate
+blocking request. Both now keep their answers in one SQLite file under the
+app's local data directory, and look them up through a ``SiteLookup``:
+
+- **TTL** — an entry older than ``ttl_s`` is refetched;
+- **refresh-ahead** — an entry in the last ``refresh_ahead_s`` of its life
+  is still returned, and a refresh starts on a shared worker pool, so a
+  regular user never waits for the network;
+- **coalescing** — a lookup for a key that is already being fetched (say,
+  the calendar and the Tasks tab asking for the same forecast) waits for
+  that fetch instead of starting its own;
+- **batching** — ``get_many()`` fetches every missing site in one request
+  per ``batch_size`` sites (Open-Meteo accepts comma-separated coordinate
+  lists).
+
+Entries are keyed by ``(kind, key)``; each service picks its own kind and
+key rounding. Storage is the ``SqliteCache`` shared with ``PlantApiCache``
+(``services/sqlite_cache.py``), so every storage failure degrades to a miss.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any
+
+from open_garden_planner.app.paths import get_cache_dir
+from open_garden_planner.services.sqlite_cache import CacheEntry, SqliteCache
+
+logger = logging.getLogger(__name__)
+
+#: Bump when the stored payload shape changes; older rows are ignored.
+FORMAT_VERSION = 1
+
+_FILE_NAME = "site_data_cache.sqlite3"
+
+#: Background refreshes and the extra chunks of a large batch.
+_MAX_WORKERS = 4
+
+#: A site as (latitude, longitude) in decimal degrees.
+Site = tuple[float, float]
+
+
+class SiteDataCache(SqliteCache):
+    """SQLite-backed store of JSON payloads keyed by ``(kind, key)``."""
+
+    format_version = FORMAT_VERSION
+    label = "Site data cache"
+
+    def prune(self, kind: str, max_age_s: float) -> None:
+        """Delete ``kind`` rows older than ``max_age_s`` and old-format rows."""
+        self._prune({kind: max_age_s})
+
+
+class SiteLookup:
+    """Cache-first, coalesced, batched lookups of one kind of per-site data.
+
+    ``fetch`` receives up to ``batch_size`` sites and returns one JSON-able
+    payload per site, in order; an exception fails every site of that batch.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        *,
+        key: Callable[[float, float], str],
+        fetch: Callable[[list[Site]], list[Any]],
+        ttl_s: float,
+        refresh_ahead_s: float,
+        batch_size: int,
+        cache: SiteDataCache | None = None,
+    ) -> None:
+        self.kind = kind
+        self.ttl_s = ttl_s
+        self.refresh_ahead_s = refresh_ahead_s
+        self.batch_size = max(1, batch_size)
+        self._key = key
+        self._fetch = fetch
+        self._cache = cache
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, Future[CacheEntry]] = {}
+
+    @property
+    def cache(self) -> SiteDataCache:
+        """The injected store, else the shared one (resolved per call)."""
+        return self._cache if self._cache is not None else site_data_cache()
+
+    def key(self, lat: float, lon: float) -> str:
+        return self._key(lat, lon)
+
+    def get(self, lat: float, lon: float) -> CacheEntry:
+        """The entry for one site; raises whatever ``fetch`` raised."""
+        answer = self.get_many([(lat, lon)])[(lat, lon)]
+        if isinstance(answer, BaseException):
+            raise answer
+        return answer
+
+    def get_many(self, sites: Iterable[Site]) -> dict[Site, CacheEntry | BaseException]:
+        """Entries for every site, fetching the missing ones in batches.
+
+        A failed site maps to the exception its batch raised.
+        """
+        keys = {site: self._key(*site) for site in sites}
+        entries: dict[str, CacheEntry] = {}
+        missing: dict[str, Site] = {}
+        expiring: dict[str, Site] = {}
+        store = self.cache
+        for site, key in keys.items():
+            if key in entries or key in missing:
+                continue
+            entry = store.get(self.kind, key)
+            if entry is None or entry.age_s > self.ttl_s:
+                missing[key] = site
+                continue
+            entries[key] = entry
+            if entry.age_s > self.ttl_s - self.refresh_ahead_s:
+                expiring[key] = site
+
+        if expiring:
+            own, _ = self._claim(expiring)
+            if own:
+                _pool().submit(self._run, own, expiring, True)
+
+        answers: dict[str, CacheEntry | BaseException] = dict(entries)
+        if missing:
+            own, pending = self._claim(missing)
+            self._run(own, missing)
+            for key, future in pending.items():
+                try:
+                    answers[key] = future.result()
+                except Exception as exc:  # noqa: BLE001 — handed to the caller
+                    answers[key] = exc
+        return {site: answers[key] for site, key in keys.items()}
+
+    # ── internals ──────────────────────────────────────────────
+
+    def _claim(
+        self, wanted: dict[str, Site]
+    ) -> tuple[dict[str, Future[CacheEntry]], dict[str, Future[CacheEntry]]]:
+        """Register futures for the keys nobody is fetching yet.
+
+        Returns the newly registered futures (ours to fetch) and the future
+        answering every wanted key — ours or another caller's.
+        """
+        own: dict[str, Future[CacheEntry]] = {}
+        with self._lock:
+            for key in wanted:
+                if key not in self._in_flight:
+                    own[key] = self._in_flight[key] = Future()
+            return own, {key: self._in_flight[key] for key in wanted}
+
+    def _run(
+        self,
+        futures: dict[str, Future[CacheEntry]],
+        sites: dict[str, Site],
+        sequential: bool = False,
+    ) -> None:
+        """Fetch the claimed keys, one batch per ``batch_size`` sites.
+
+        The first batch runs on the calling thread, the rest on the pool —
+        unless ``sequential`` (a refresh already running on the pool must
+        not wait for pool workers).
+        """
+        keys = list(futures)
+        batches = [keys[i : i + self.batch_size] for i in range(0, len(keys), self.batch_size)]
+        if not batches:
+            return
+        if sequential:
+            for batch in batches:
+                self._run_batch(batch, futures, sites)
+            return
+        extra = [_pool().submit(self._run_batch, batch, futures, sites) for batch in batches[1:]]
+        self._run_batch(batches[0], futures, sites)
+        wait(extra)
+
+    def _run_batch(
+        self, keys: list[str], futures: dict[str, Future[CacheEntry]], sites: dict[str, Site]
+    ) -> None:
+        # Settled whatever happens: a future left in _in_flight would block
+        # every later lookup of its key.
+        entries: list[CacheEntry] | None = None
+        error: BaseException | None = None
+        try:
+            payloads = self._fetch([sites[key] for key in keys])
+            if len(payloads) != len(keys):
+                raise ValueError(f"expected {len(keys)} answers, got {len(payloads)}")
+            now = time.time()
+            store = self.cache
+            for key, payload in zip(keys, payloads, strict=True):
+                store.put(self.kind, key, payload, now)
+            entries = [CacheEntry(p, now, fetched=True) for p in payloads]
+        except Exception as exc:  # noqa: BLE001 — handed to every waiter
+            logger.debug("%s fetch failed for %d site(s)", self.kind, len(keys), exc_info=True)
+            error = exc
+        finally:
+            self._settle(keys, futures, entries=entries, error=error)
+
+    def _settle(
+        self,
+        keys: list[str],
+        futures: dict[str, Future[CacheEntry]],
+        entries: list[CacheEntry] | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        # Leave the in-flight table first: a lookup arriving after this point
+        # reads the store, which already holds the new answer.
+        with self._lock:
+            for key in keys:
+                self._in_flight.pop(key, None)
+        for i, key in enumerate(keys):
+            if entries is not None:
+                futures[key].set_result(entries[i])
+            else:
+                futures[key].set_exception(error or RuntimeError("fetch failed"))
+
+
+_pool_instance: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _pool_instance
+    with _pool_lock:
+        if _pool_instance is None:
+            _pool_instance = ThreadPoolExecutor(
+                max_workers=_MAX_WORKERS, thread_name_prefix="site-data"
+            )
+        return _pool_instance
+
+
+_default: SiteDataCache | None = None
+_default_lock = threading.Lock()
+
+
+def default_cache_path() -> Path:
+    """``<cache dir>/site_data_cache.sqlite3`` (next to the plant API cache)."""
+    return get_cache_dir() / _FILE_NAME
+
+
+def site_data_cache() -> SiteDataCache:
+    """The shared store, created on first use (and again if the app cache
+    directory moved, see ``app.paths.set_cache_dir``)."""
+    global _default
+    path = default_cache_path()
+    with _default_lock:
+        if _default is None or _default.path != path:
+            _default = SiteDataCache(path)
+        return _default
@@ -19,6 +19,7 @@ import logging
 from pathlib import Path
 
 from open_garden_planner.models.smart_symbol import SmartSymbolDefinition
+from open_garden_planner.services.bundled_data import load_bundled_json
 
 logger = logging.getLogger(__name__)
 
@@ -65,8 +66,7 @@ class SmartSymbolLibrary:
         symbols: dict[str, SmartSymbolDefinition] = {}
         # Bundled: crash loud on malformed (packaging bug).
         for path in sorted(self._bundled_dir.glob("*.json")):
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_bundled_json(path)
             definition = SmartSymbolDefinition.from_dict(data)
             symbols[definition.id] = definition
         # User: skip-with-warning on ANY failure (a bad user file must never
@@ -316,6 +316,11 @@ class SoilService:
     def __init__(self, project_manager: ProjectManager) -> None:
         self._pm = project_manager
 
+    @property
+    def project_manager(self) -> ProjectManager:
+        """The project whose ``soil_tests_changed`` signals history edits."""
+        return self._pm
+
     # ── Read ──────────────────────────────────────────────────────────────────
 
     def get_history(self, target_id: str) -> SoilTestHistory:
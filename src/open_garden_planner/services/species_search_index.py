@@ -0,0 +1,315 @@
+"""In-memory fuzzy name index over locally known plant species.
+
+``bundled_species_db`` only answers exact lower-cased lookups, and the
+custom library used to scan every plant with ``in`` on each search. This
+index answers search-as-you-type queries from memory in well under a
+millisecond, tolerating typos ("carot", "tomatoe"):
+
+- every name of a record (common, scientific, aliases, family) is split into
+  words and each word into padded trigrams (``"  c", " ca", "car", ...``);
+- counting a query's trigrams in the posting lists gives, per indexed word,
+  the trigrams it shares with the query — enough to tell whether it can be a
+  typo match (Dice >= 0.5) or contain the query, so only those records are
+  scored;
+- candidates are ranked: exact name, name prefix, word prefix, substring,
+  then trigram similarity (Dice coefficient) of the closest word.
+
+Queries shorter than three characters have no trigram of their own and only
+match at the start of a word ("ca" finds "Carrot" and "Daucus carota", not
+"Pecan"); from three characters on, every substring match is found.
+
+``PlantLibrary`` keeps one index of its custom plants. The shared index
+(``species_search_index()``) holds the bundled ``plant_species.json`` records
+and every species cached from an online database (``PlantApiCache``), is
+built on first use and then updated as answers are cached. Both are safe to
+update from worker threads.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import unicodedata
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from open_garden_planner.models.plant_data import PlantSpeciesData
+
+logger = logging.getLogger(__name__)
+
+#: Minimum trigram similarity for a typo match.
+FUZZY_MIN_SIMILARITY = 0.5
+
+_EXACT, _PREFIX, _WORD_PREFIX, _SUBSTRING, _FUZZY = 1.0, 0.9, 0.85, 0.75, 0.7
+
+#: Family names match at a discount: "Apiaceae" is a hit, but below a name.
+_FAMILY_WEIGHT = 0.8
+
+
+def normalize_name(text: str) -> str:
+    """Case-, accent- and punctuation-insensitive form of a plant name."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+    return " ".join("".join(c if c.isalnum() else " " for c in stripped).split())
+
+
+def _word_grams(word: str) -> frozenset[str]:
+    padded = f"  {word} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+def _dice(a: frozenset[str], b: frozenset[str]) -> float:
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+def plant_key(plant: PlantSpeciesData) -> str:
+    """Identity of a record across sources: ``source:id`` (bundled: by name)."""
+    ident = plant.source_id or normalize_name(plant.scientific_name)
+    return f"{plant.data_source}:{ident}"
+
+
+@dataclass(frozen=True)
+class _Field:
+    text: str
+    weight: float
+    words: tuple[frozenset[str], ...]
+
+
+@dataclass(frozen=True)
+class _Entry:
+    plant: PlantSpeciesData
+    fields: tuple[_Field, ...]
+    sort_name: str
+
+    def word_ids(self, key: str) -> Iterable[tuple[_WordId, frozenset[str]]]:
+        for f, field in enumerate(self.fields):
+            for w, grams in enumerate(field.words):
+                yield (key, f, w, len(grams)), grams
+
+
+#: One word of one name of a record: (key, field, word, trigram count).
+_WordId = tuple[str, int, int, int]
+
+
+class SpeciesSearchIndex:
+    """Trigram index of ``PlantSpeciesData`` records, keyed by string ids."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[str, _Entry] = {}
+        self._postings: dict[str, set[_WordId]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def add(
+        self,
+        key: str,
+        plant: PlantSpeciesData,
+        aliases: Iterable[str] = (),
+    ) -> None:
+        """Index ``plant`` under ``key``, replacing what was there."""
+        names = [(plant.common_name, 1.0), (plant.scientific_name, 1.0)]
+        names += [(alias, 1.0) for alias in aliases if isinstance(alias, str)]
+        names.append((plant.family, _FAMILY_WEIGHT))
+        fields = []
+        for name, weight in names:
+            text = normalize_name(name or "")
+            if text and text != "unknown":
+                words = tuple(_word_grams(word) for word in text.split())
+                fields.append(_Field(text, weight, words))
+        entry = _Entry(
+            plant=plant,
+            fields=tuple(fields),
+            sort_name=normalize_name(plant.common_name or plant.scientific_name),
+        )
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = entry
+            for word_id, grams in entry.word_ids(key):
+                for gram in grams:
+                    self._postings.setdefault(gram, set()).add(word_id)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._discard(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._postings.clear()
+
+    def search(self, query: str, limit: int | None = 20) -> list[PlantSpeciesData]:
+        """Records matching ``query``, best first; at most ``limit`` of them."""
+        text = normalize_name(query)
+        if not text:
+            return []
+        query_words = [_word_grams(word) for word in text.split()]
+        query_grams = frozenset().union(*query_words)
+        with self._lock:
+            if len(text) < 3:
+                scores = self._short_scores(text)
+            else:
+                scores = {}
+                for key in self._candidates(text, query_grams, len(query_words) > 1):
+                    score = self._score(text, query_words, query_grams, self._entries[key])
+                    if score:
+                        scores[key] = score
+            scored = []
+            for key, score in scores.items():
+                entry = self._entries[key]
+                scored.append((-score, len(entry.sort_name), entry.sort_name, entry.plant))
+        scored.sort(key=lambda row: row[:3])
+        return [row[3] for row in scored[:limit]]
+
+    def _candidates(self, text: str, query_grams: frozenset[str], multi_word: bool) -> set[str]:
+        """Keys of the records that can match at all (see module doc)."""
+        # The word-start gram ("  c") is shared by a sixteenth of all words
+        # and is left out of the count; `bonus` credits it back to everyone,
+        # which keeps the filter a superset (the scoring is exact).
+        start = f"  {text[0]}"
+        bonus = int(start in query_grams)
+        shared: dict[_WordId, int] = {}
+        for gram in query_grams:
+            if gram == start:
+                continue
+            for word_id in self._postings.get(gram, ()):
+                shared[word_id] = shared.get(word_id, 0) + 1
+        size = len(query_grams)
+        if multi_word:
+            # Matched against whole names: a record needs a third of the
+            # query's trigrams to reach Dice 0.5 (shared <= name size).
+            per_record: dict[str, int] = {}
+            for word_id, count in shared.items():
+                per_record[word_id[0]] = per_record.get(word_id[0], 0) + count
+            return {key for key, count in per_record.items() if 3 * (count + bonus) >= size}
+
+        # One query word against each name word: Dice >= 0.5 is decided by
+        # the counts alone, and a word containing the query (substring,
+        # prefix, exact) has every one of its inner trigrams.
+        inner = [gram for gram in query_grams if " " not in gram]
+        inner_shared: dict[_WordId, int] = {}
+        for gram in inner:
+            for word_id in self._postings.get(gram, ()):
+                inner_shared[word_id] = inner_shared.get(word_id, 0) + 1
+        return {
+            word_id[0]
+            for word_id, count in shared.items()
+            if 4 * (count + bonus) >= size + word_id[3] or inner_shared.get(word_id) == len(inner)
+        }
+
+    def _short_scores(self, text: str) -> dict[str, float]:
+        """Scores for a query too short for a trigram of its own.
+
+        The word-start gram ("  c" / " ca") lists every word beginning with
+        the query, and where that word sits decides the score.
+        """
+        scores: dict[str, float] = {}
+        for key, f, w, _size in self._postings.get(f"  {text}"[-3:], ()):
+            field = self._entries[key].fields[f]
+            if w:
+                score = _WORD_PREFIX * field.weight
+            elif field.text == text:
+                score = _EXACT * field.weight
+            else:
+                score = _PREFIX * field.weight
+            if score > scores.get(key, 0.0):
+                scores[key] = score
+        return scores
+
+    @staticmethod
+    def _score(
+        text: str,
+        query_words: list[frozenset[str]],
+        query_grams: frozenset[str],
+        entry: _Entry,
+    ) -> float:
+        best = 0.0
+        for field in entry.fields:
+            name = field.text
+            if name == text:
+                score = _EXACT
+            elif name.startswith(text):
+                score = _PREFIX
+            elif f" {text}" in f" {name}":
+                score = _WORD_PREFIX
+            elif text in name:
+                score = _SUBSTRING
+            else:
+                if len(query_words) == 1:
+                    similarity = max(_dice(query_grams, word) for word in field.words)
+                else:
+                    similarity = _dice(query_grams, frozenset().union(*field.words))
+                score = _FUZZY * similarity if similarity >= FUZZY_MIN_SIMILARITY else 0.0
+            best = max(best, score * field.weight)
+        return best
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for word_id, grams in entry.word_ids(key):
+            for gram in grams:
+                word_ids = self._postings.get(gram)
+                if word_ids is not None:
+                    word_ids.discard(word_id)
+                    if not word_ids:
+                        del self._postings[gram]
+
+
+# ── the shared index of bundled and cached species ───────────────────────
+
+_shared: SpeciesSearchIndex | None = None
+_shared_lock = threading.Lock()
+
+
+def _build_shared_index() -> SpeciesSearchIndex:
+    from open_garden_planner.services.bundled_species_db import get_species_db
+    from open_garden_planner.services.plant_api.cache import plant_api_cache
+
+    index = SpeciesSearchIndex()
+    for record in get_species_db().values():
+        try:
+            plant = PlantSpeciesData.from_dict(record)
+        except (KeyError, ValueError) as exc:
+            logger.debug("Bundled species not indexed: %s", exc)
+            continue
+        plant.data_source = "bundled"
+        index.add(plant_key(plant), plant, record.get("aliases") or ())
+    for plant in plant_api_cache().cached_plants():
+        index.add(plant_key(plant), plant)
+    return index
+
+
+def species_search_index() -> SpeciesSearchIndex:
+    """The shared index of bundled and cached species, built on first use."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            try:
+                _shared = _build_shared_index()
+            except (OSError, json.JSONDecodeError) as exc:
+                logger.warning("Species search index unavailable: %s", exc)
+                _shared = SpeciesSearchIndex()
+        return _shared
+
+
+def index_cached_plants(plants: Iterable[PlantSpeciesData]) -> None:
+    """Add freshly cached online records, if the shared index is built yet."""
+    index = _shared
+    if index is None:
+        return
+    for plant in plants:
+        if plant.source_id:
+            index.add(plant_key(plant), plant)
+
+
+def reset_species_search_index() -> None:
+    """Drop the shared index; the next search rebuilds it (tests)."""
+    global _shared
+    with _shared_lock:
+        _shared = None
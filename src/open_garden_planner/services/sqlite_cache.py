@@ -0,0 +1,159 @@
+"""SQLite store of JSON payloads with per-entry age, shared by the app's caches.
+
+``PlantApiCache`` (plant search answers and detail records) and
+``SiteDataCache`` (weather forecasts and frost dates) keep the same kind of
+data: a JSON payload per ``(kind, key)``, stamped with the time it was
+fetched and the payload format it was written in. ``SqliteCache`` is that
+store; the subclasses add their keys, TTLs and payload types.
+
+Lookups run on worker threads, so every call takes the store's lock and
+opens its own connection. Every storage failure degrades to a miss: a
+read-only or corrupt file never breaks the feature in front of it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (kind, key)
+)
+"""
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """One stored answer."""
+
+    payload: Any
+    stored_at: float  # time.time() of the fetch
+    fetched: bool = False  # True: fetched by this lookup, not read from disk
+
+    @property
+    def age_s(self) -> float:
+        return time.time() - self.stored_at
+
+
+class SqliteCache:
+    """SQLite-backed store of JSON payloads keyed by ``(kind, key)``.
+
+    Subclasses set ``format_version`` (rows written under another version
+    are ignored) and ``label`` (used in log messages).
+    """
+
+    format_version = 1
+    label = "Cache"
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._ready = False
+        #: Instruments for tests and profiling.
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind: str, key: str, max_age_s: float | None = None) -> CacheEntry | None:
+        """The stored entry, or None when missing or older than ``max_age_s``."""
+        with self._lock, self._connect() as db:
+            row = None
+            if db is not None:
+                row = db.execute(
+                    "SELECT version, stored_at, payload FROM entries WHERE kind = ? AND key = ?",
+                    (kind, key),
+                ).fetchone()
+            if (
+                row is None
+                or row[0] != self.format_version
+                or (max_age_s is not None and time.time() - row[1] > max_age_s)
+            ):
+                self.misses += 1
+                return None
+            try:
+                payload = json.loads(row[2])
+            except ValueError:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return CacheEntry(payload, row[1])
+
+    def put(
+        self, kind: str, key: str, payload: object, stored_at: float | None = None
+    ) -> None:
+        """Store ``payload``; ``stored_at`` defaults to now."""
+        try:
+            text = json.dumps(payload)
+        except (TypeError, ValueError) as exc:
+            logger.debug("Not caching %s %r: %s", kind, key, exc)
+            return
+        with self._lock, self._connect() as db:
+            if db is not None:
+                db.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                    (
+                        kind,
+                        key,
+                        self.format_version,
+                        time.time() if stored_at is None else stored_at,
+                        text,
+                    ),
+                )
+
+    def clear(self) -> None:
+        with self._lock, self._connect() as db:
+            if db is not None:
+                db.execute("DELETE FROM entries")
+
+    def _prune(self, max_age_s: Mapping[str, float]) -> None:
+        """Delete old-format rows and rows of each kind older than its age."""
+        now = time.time()
+        with self._lock, self._connect() as db:
+            if db is None:
+                return
+            db.execute("DELETE FROM entries WHERE version != ?", (self.format_version,))
+            for kind, age in max_age_s.items():
+                db.execute(
+                    "DELETE FROM entries WHERE kind = ? AND stored_at < ?", (kind, now - age)
+                )
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection | None]:
+        """A committed-on-exit connection, or None when the file is unusable."""
+        db: sqlite3.Connection | None = None
+        try:
+            if not self._ready:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=5.0)
+            if not self._ready:
+                # A corrupt or foreign file fails here, not on connect.
+                db.execute(_SCHEMA)
+                self._ready = True
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("%s unavailable: %s", self.label, exc)
+            if db is not None:
+                db.close()
+            yield None
+            return
+        try:
+            yield db
+            db.commit()
+        except sqlite3.Error as exc:
+            logger.warning("%s error: %s", self.label, exc)
+        finally:
+            db.close()
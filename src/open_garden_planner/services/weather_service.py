@@ -1,31 +1,31 @@
 """Weather forecast service for US-12.1.
 
 Fetches a 16-day forecast from Open-Meteo (free, no API key) using stdlib
-urllib.  Results are cached on disk for 3 hours so offline launches still
-show data.
+urllib.  Results are cached for 3 hours in the shared site data cache
+(``site_data_cache``), refreshed in the background during their last half
+hour, and several sites can be fetched in one request.
 """
 
 from __future__ import annotations
 
 import json
 import logging
-import ssl
 import sys
-import urllib.error
-import urllib.parse
-import urllib.request
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from open_garden_planner.services.plant_library import get_app_data_dir
+if TYPE_CHECKING:
+    from open_garden_planner.services.site_data_cache import Site, SiteDataCache
 
 logger = logging.getLogger(__name__)
 
 _OPEN_METEO_FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
 _REQUEST_TIMEOUT = 15
 _CACHE_STALE_SECONDS = 10800  # 3 hours
+_REFRESH_AHEAD_SECONDS = 1800  # refresh in the background during the last 30 min
+_BATCH_SIZE = 50  # sites per multi-location request
+_CACHE_KIND = "forecast"
 
 # WMO Weather interpretation codes (Open-Meteo docs)
 # Each tuple is (inclusive_start, inclusive_end) -> (description, icon name).
@@ -182,11 +182,40 @@ class WeatherServiceError(Exception):
 class WeatherService:
     """Fetch and cache 16-day weather forecasts from Open-Meteo."""
 
+    def __init__(
+        self,
+        base_url: str = _OPEN_METEO_FORECAST_URL,
+        cache: SiteDataCache | None = None,
+    ) -> None:
+        """Initialise the service.
+
+        Args:
+            base_url: Forecast endpoint; tests point it at a local stand-in
+                server (plain http is accepted for loopback hosts only).
+            cache: Store to use instead of the shared site data cache.
+        """
+        # sqlite3 stays off the startup path: the calendar imports this
+        # module, the service is only created for the first fetch.
+        from open_garden_planner.services.site_data_cache import SiteLookup  # noqa: PLC0415
+
+        self._base_url = base_url
+        self._lookup = SiteLookup(
+            _CACHE_KIND,
+            key=self._cache_key,
+            fetch=self._fetch_payloads,
+            ttl_s=_CACHE_STALE_SECONDS,
+            refresh_ahead_s=_REFRESH_AHEAD_SECONDS,
+            batch_size=_BATCH_SIZE,
+            cache=cache,
+        )
+
     def fetch_forecast(self, lat: float, lon: float) -> WeatherForecast | None:
         """Return a forecast, preferring cache if fresh.
 
-        Loads a cached entry if it exists and is < 3 hours old. Otherwise
-        queries the Open-Meteo API, saves the result, and returns it.
+        Loads a cached entry if it exists and is < 3 hours old (starting a
+        background refresh once it is older than 2.5 hours). Otherwise
+        queries the Open-Meteo API, saves the result, and returns it; a
+        concurrent call for the same site shares that request.
 
         Args:
             lat: Latitude (-90 to 90).
@@ -196,66 +225,68 @@ class WeatherService:
             A populated WeatherForecast or None if the request failed and
             no valid cache exists.
         """
-        cached = self._load_cache(lat, lon)
-        if cached is not None:
-            logger.info("Using cached weather data for (%.4f, %.4f)", lat, lon)
-            return cached
+        return self.fetch_forecasts([(lat, lon)])[(lat, lon)]
 
-        try:
-            forecast = self._fetch_from_api(lat, lon)
-        except WeatherServiceError:
-            logger.debug("Weather fetch failed for (%.4f, %.4f)", lat, lon, exc_info=True)
-            return None
+    def fetch_forecasts(
+        self, sites: list[tuple[float, float]]
+    ) -> dict[tuple[float, float], WeatherForecast | None]:
+        """Return forecasts for several sites, fetching all misses in one request.
 
-        self._save_cache(lat, lon, forecast)
-        return forecast
+        Args:
+            sites: ``(lat, lon)`` pairs.
+
+        Returns:
+            A forecast (or None on failure) per requested site.
+        """
+        result: dict[tuple[float, float], WeatherForecast | None] = {}
+        for site, answer in self._lookup.get_many(sites).items():
+            if isinstance(answer, BaseException):
+                logger.debug("Weather fetch failed for (%.4f, %.4f): %s", *site, answer)
+                result[site] = None
+                continue
+            if not answer.fetched:
+                logger.info("Using cached weather data for (%.4f, %.4f)", *site)
+            try:
+                result[site] = WeatherForecast.from_dict(answer.payload)
+            except (AttributeError, KeyError, TypeError, ValueError) as exc:
+                logger.warning("Failed to load weather cache: %s", exc)
+                result[site] = None
+        return result
 
     # ------------------------------------------------------------------
     # Cache helpers
     # ------------------------------------------------------------------
 
-    def _cache_path(self, lat: float, lon: float) -> Path:
-        return get_app_data_dir() / f"weather_cache_{lat:.4f}_{lon:.4f}.json"
+    @staticmethod
+    def _cache_key(lat: float, lon: float) -> str:
+        return f"{lat:.4f}_{lon:.4f}"
 
-    def _load_cache(self, lat: float, lon: float) -> WeatherForecast | None:
-        path = self._cache_path(lat, lon)
-        if not path.exists():
-            return None
-        try:
-            raw: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
-            cached_at = datetime.fromisoformat(raw["fetched_at"])
-            age_seconds = (datetime.now(UTC) - cached_at).total_seconds()
-            if age_seconds > _CACHE_STALE_SECONDS:
-                logger.debug("Weather cache stale (%.0f s old)", age_seconds)
-                return None
-            return WeatherForecast.from_dict(raw)
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Failed to load weather cache: %s", exc)
-            return None
-
-    def _save_cache(self, lat: float, lon: float, forecast: WeatherForecast) -> None:
-        path = self._cache_path(lat, lon)
-        try:
-            path.write_text(json.dumps(forecast.to_dict(), indent=2), encoding="utf-8")
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Failed to save weather cache: %s", exc)
+    def _fetch_payloads(self, sites: list[Site]) -> list[dict[str, Any]]:
+        return [forecast.to_dict() for forecast in self._fetch_many_from_api(sites)]
 
     # ------------------------------------------------------------------
     # API fetch
     # ------------------------------------------------------------------
 
-    def _fetch_from_api(self, lat: float, lon: float) -> WeatherForecast:
+    def _fetch_many_from_api(self, sites: list[Site]) -> list[WeatherForecast]:
+        """One request for every site (Open-Meteo takes coordinate lists)."""
+        # Network stack imported here, not at module load: the calendar and
+        # weather widget import this module while the main window is built.
+        import ssl
+        import urllib.error
+        import urllib.parse
+        import urllib.request
+
         params = {
-            "latitude": lat,
-            "longitude": lon,
+            "latitude": ",".join(str(lat) for lat, _ in sites),
+            "longitude": ",".join(str(lon) for _, lon in sites),
             "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum,weathercode",
             "forecast_days": 16,
             "timezone": "auto",
         }
-        query = "&".join(f"{k}={urllib.parse.quote(str(v), safe='')}" for k, v in params.items())
-        url = f"{_OPEN_METEO_FORECAST_URL}?{query}"
-        parsed_url = urllib.parse.urlparse(url)
-        if parsed_url.scheme != "https" or parsed_url.netloc != "api.open-meteo.com":
+        query = "&".join(f"{k}={urllib.parse.quote(str(v), safe=',')}" for k, v in params.items())
+        url = f"{self._base_url}?{query}"
+        if not _is_expected_url(url, self._base_url):
             raise WeatherServiceError("Unexpected weather API URL")
 
         # Enterprise-compatible SSL context: loads the OS certificate store so
@@ -274,14 +305,20 @@ class WeatherService:
         try:
             with urllib.request.urlopen(req, timeout=_REQUEST_TIMEOUT, context=ssl_ctx) as resp:
                 raw_bytes = resp.read()
-                data: dict[str, Any] = json.loads(raw_bytes.decode("utf-8"))
+                data: Any = json.loads(raw_bytes.decode("utf-8"))
         except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError) as exc:
-            logger.debug("Weather fetch failed for (%.4f, %.4f)", lat, lon, exc_info=True)
+            logger.debug("Weather fetch failed for %d site(s)", len(sites), exc_info=True)
             raise WeatherServiceError(f"Open-Meteo request failed: {exc}") from exc
         except json.JSONDecodeError as exc:
             raise WeatherServiceError(f"Invalid JSON from Open-Meteo: {exc}") from exc
 
-        return self._parse_response(data)
+        # One site answers with an object, several with a list in request order.
+        answers = data if isinstance(data, list) else [data]
+        if len(answers) != len(sites):
+            raise WeatherServiceError(
+                f"Open-Meteo returned {len(answers)} forecasts for {len(sites)} sites"
+            )
+        return [self._parse_response(answer) for answer in answers]
 
     # ------------------------------------------------------------------
     # Response parsing
@@ -314,6 +351,19 @@ class WeatherService:
         )
 
 
+def _is_expected_url(url: str, base_url: str) -> bool:
+    """``url`` targets ``base_url``'s host over https (http only on loopback)."""
+    import urllib.parse
+
+    parsed = urllib.parse.urlparse(url)
+    base = urllib.parse.urlparse(base_url)
+    if parsed.netloc != base.netloc:
+        return False
+    if parsed.scheme == "https":
+        return True
+    return parsed.scheme == "http" and parsed.hostname in ("127.0.0.1", "localhost", "::1")
+
+
 # ---------------------------------------------------------------------------
 # Module-level singleton
 # ---------------------------------------------------------------------------
@@ -0,0 +1,244 @@
+"""Startup profiling (``--profile-startup``) and the startup import budget.
+
+``open-garden-planner --profile-startup`` times every module imported while
+the app starts, the startup phases (imports, ``QApplication`` and theme,
+main-window construction, ``show()``) and the first paint, and prints the
+breakdown to stderr once the first frame is on screen. The app then keeps
+running as usual.
+
+The profiler lives outside ``app`` so that installing it imports nothing
+else of the application.
+
+``DEFERRED_MODULES`` lists the subsystems that must stay off the startup
+path — web engine, 3D view, PDF report, DXF, plant API clients, the network
+stack of the weather/climate services — and ``IMPORT_BUDGET_S`` bounds the
+cold import of the main window; ``tests/unit/test_startup_profile.py``
+enforces both.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from PyQt6.QtWidgets import QWidget
+
+# No Qt (or any app) import at module level: the profiler is installed
+# first, so that PyQt6 itself shows up in the breakdown.
+
+#: Wall-clock budget for a cold ``import open_garden_planner.app.application``.
+#: Generous on purpose (a slow CI runner, no warm disk cache): it catches a
+#: heavy subsystem creeping back onto the startup path, not a few ms of drift.
+IMPORT_BUDGET_S = 1.5
+
+#: Modules that importing the main window must not load; each is imported
+#: where the feature needing it is first used.
+DEFERRED_MODULES = (
+    "PyQt6.QtWebEngineCore",
+    "PyQt6.QtWebEngineWidgets",
+    "PyQt6.Qt3DCore",
+    "PyQt6.QtPrintSupport",
+    "open_garden_planner.ui.view3d.qt3d_adapter",
+    "open_garden_planner.services.pdf_report_service",
+    "open_garden_planner.services.dxf_service",
+    "open_garden_planner.services.plant_api",
+    "open_garden_planner.services.climate_service",
+    "open_garden_planner.services.site_data_cache",
+    "open_garden_planner.services.sqlite_cache",
+    "open_garden_planner.agent_api.server",
+    "ezdxf",
+    "mcp",
+    "requests",
+    "sqlite3",
+    "ssl",
+    "urllib.request",
+)
+
+
+@dataclass
+class ImportTiming:
+    """Time spent executing one module: with and without its own imports."""
+
+    name: str
+    cumulative_s: float
+    self_s: float
+
+
+class _TimedLoader(Loader):
+    """Wraps a module's loader to time ``exec_module``."""
+
+    def __init__(self, loader: Any, profiler: StartupProfiler) -> None:
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name: str) -> Any:
+        # Resource readers, get_source, is_package, ... of the real loader.
+        return getattr(self._loader, name)
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        self._profiler._enter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._leave(module.__name__)
+
+
+class _TimingFinder(MetaPathFinder):
+    """First meta-path entry: finds specs through the others, wraps the loader."""
+
+    def __init__(self, profiler: StartupProfiler) -> None:
+        self._profiler = profiler
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Any,
+        target: ModuleType | None = None,
+    ) -> ModuleSpec | None:
+        for finder in sys.meta_path:
+            find = getattr(finder, "find_spec", None)
+            if finder is self or find is None:
+                continue
+            spec = find(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self._profiler)
+            return spec
+        return None
+
+
+class StartupProfiler:
+    """Collects import timings and phase marks for one app start."""
+
+    def __init__(self) -> None:
+        self._started = time.perf_counter()
+        self._finder = _TimingFinder(self)
+        self._marks: list[tuple[str, float]] = []
+        self._imports: list[ImportTiming] = []
+        # One entry per module being executed: [start, time in child imports].
+        self._stack: list[list[float]] = []
+
+    @property
+    def imports(self) -> list[ImportTiming]:
+        return list(self._imports)
+
+    @property
+    def marks(self) -> list[tuple[str, float]]:
+        """``(phase, seconds since the profiler was created)``, in order."""
+        return list(self._marks)
+
+    def install(self) -> None:
+        """Start timing imports."""
+        if self._finder not in sys.meta_path:
+            sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self) -> None:
+        """Stop timing imports; the loaders already handed out stay wrapped."""
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+
+    def mark(self, phase: str) -> None:
+        """Record the end of ``phase``."""
+        self._marks.append((phase, time.perf_counter() - self._started))
+
+    def report_after_first_paint(
+        self,
+        window: QWidget,
+        emit: Callable[[str], None] | None = None,
+    ) -> None:
+        """Mark the first paint of ``window``, then ``emit`` the report.
+
+        "first paint" is the first paint event reaching the window or one of
+        its children; "first frame" is the next turn of the event loop, when
+        that paint pass has finished.
+        """
+        from PyQt6.QtCore import QEvent, QObject, QTimer
+        from PyQt6.QtWidgets import QApplication, QWidget
+
+        app = QApplication.instance()
+        if app is None:
+            return
+        emit = emit or _print_to_stderr
+        profiler = self
+
+        class FirstPaintFilter(QObject):
+            def eventFilter(self, obj: QObject | None, event: QEvent | None) -> bool:  # noqa: N802
+                if (
+                    event is not None
+                    and event.type() == QEvent.Type.Paint
+                    and isinstance(obj, QWidget)
+                    and obj.window() is window
+                ):
+                    app.removeEventFilter(self)
+                    profiler.mark("first paint")
+                    QTimer.singleShot(0, first_frame)
+                return False
+
+        def first_frame() -> None:
+            self.mark("first frame")
+            self.uninstall()
+            emit(self.report())
+
+        app.installEventFilter(FirstPaintFilter(window))
+
+    def report(self, top: int = 15) -> str:
+        """Phase durations, import time per package, slowest modules."""
+        lines = ["Startup profile", "", "Phases:"]
+        previous = 0.0
+        for phase, at in self._marks:
+            lines.append(f"  {phase:<28} {_ms(at - previous)} (at {_ms(at)})")
+            previous = at
+
+        total = sum(t.self_s for t in self._imports)
+        lines += ["", f"Imports: {len(self._imports)} modules, {_ms(total)}", "", "By package:"]
+        by_package: dict[str, float] = {}
+        for timing in self._imports:
+            package = _package_of(timing.name)
+            by_package[package] = by_package.get(package, 0.0) + timing.self_s
+        for package, seconds in sorted(by_package.items(), key=lambda kv: -kv[1])[:top]:
+            lines.append(f"  {package:<40} {_ms(seconds)}")
+
+        lines += ["", f"Slowest {top} modules (self / with imports):"]
+        for timing in sorted(self._imports, key=lambda t: -t.self_s)[:top]:
+            lines.append(
+                f"  {timing.name:<52} {_ms(timing.self_s)} / {_ms(timing.cumulative_s)}"
+            )
+        return "\n".join(lines)
+
+    def _enter(self) -> None:
+        self._stack.append([time.perf_counter(), 0.0])
+
+    def _leave(self, name: str) -> None:
+        started, in_children = self._stack.pop()
+        cumulative = time.perf_counter() - started
+        if self._stack:
+            self._stack[-1][1] += cumulative
+        self._imports.append(ImportTiming(name, cumulative, cumulative - in_children))
+
+
+def _package_of(module: str) -> str:
+    """``open_garden_planner.ui.canvas.items`` -> ``open_garden_planner.ui.canvas``;
+    third-party modules group under their top-level package."""
+    parts = module.split(".")
+    return ".".join(parts[:3]) if parts[0] == "open_garden_planner" else parts[0]
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:8.1f} ms"
+
+
+def _print_to_stderr(text: str) -> None:
+    # A windowed frozen build launched without a console has no stderr.
+    if sys.stderr is not None:
+        print(text, file=sys.stderr, flush=True)
@@ -5,6 +5,8 @@ Coordinates are in centimeters with Y-axis pointing down (Qt convention).
 The view handles the Y-flip for display.
 """
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
@@ -21,6 +23,10 @@ from PyQt6.QtWidgets import (
 
 from open_garden_planner.models.layer import Layer, create_default_layers
 
+#: A bulk_update() that added or removed at least this many items repaints the
+#: whole scene once instead of letting Qt report one dirty rect per item.
+_BULK_COALESCE_MIN_ITEMS = 32
+
 
 @dataclass
 class GuideLine:
@@ -55,6 +61,7 @@ class CanvasScene(QGraphicsScene):
     layers_changed = pyqtSignal()
     active_layer_changed = pyqtSignal(object)  # Layer or None
     layer_auto_unhidden = pyqtSignal(UUID)  # emitted when a draw auto-reveals a hidden layer
+    items_added_or_removed = pyqtSignal()  # once per bulk_update() inside a batch
 
     def __init__(
         self,
@@ -99,6 +106,21 @@ class CanvasScene(QGraphicsScene):
         # Layer management
         self._layers: list[Layer] = create_default_layers()
         self._active_layer: Layer | None = self._layers[0] if self._layers else None  # Default to first layer
+        # Layer lookups: id -> Layer, and id -> the items assigned to it, so a
+        # layer toggle touches only that layer's items (see items_in_layer).
+        self._layers_by_id: dict[UUID, Layer] = {}
+        self._layer_items: dict[UUID, set[QGraphicsItem]] = {}
+        self._rebuild_layer_index()
+        # Every change to the layer list — including commands that edit it in
+        # place — is announced here; connected first so later slots already
+        # see the rebuilt index.
+        self.layers_changed.connect(self._rebuild_layer_index)
+
+        # bulk_update() state: nesting depth, items added/removed so far, and
+        # hidden layers to reveal at the end.
+        self._bulk_depth = 0
+        self._bulk_count = 0
+        self._bulk_revealed: dict[UUID, Layer] = {}
 
         # Command manager reference (set by CanvasView after construction)
         self._command_manager = None
@@ -231,6 +253,11 @@ class CanvasScene(QGraphicsScene):
             item: The graphics item to add
         """
         super().addItem(item)
+        self._index_item_layers(item)
+        if self._bulk_depth:
+            self._bulk_count += 1
+        else:
+            self.items_added_or_removed.emit()
         from open_garden_planner.ui.canvas.items.construction_item import (
             ConstructionCircleItem,
             ConstructionLineItem,
@@ -247,12 +274,16 @@ class CanvasScene(QGraphicsScene):
             item.spacing_circles_visible = self._spacing_circles_visible
 
             # Auto-unhide the target layer so drawing on a hidden layer reveals it
+            # (once per layer at the end of a bulk_update).
             if item.layer_id:
                 layer = self.get_layer_by_id(item.layer_id)
                 if layer and not layer.visible:
-                    layer.visible = True
-                    self._update_items_visibility()
-                    self.layer_auto_unhidden.emit(item.layer_id)
+                    if self._bulk_depth:
+                        self._bulk_revealed.setdefault(layer.id, layer)
+                    else:
+                        layer.visible = True
+                        self._apply_layer_state(layer)
+                        self.layer_auto_unhidden.emit(item.layer_id)
 
             # Assign layer z-value so new items render on top of existing same-layer
             # items. Without this, new items default to z=0, below all layer items.
@@ -261,6 +292,52 @@ class CanvasScene(QGraphicsScene):
                 if _layer:
                     item.setZValue(_layer.z_order * 100)
 
+    def removeItem(self, item: QGraphicsItem) -> None:
+        """Remove an item, dropping it (and its children) from the layer index."""
+        for current in self._with_descendants(item):
+            layer_id = getattr(current, "layer_id", None)
+            if layer_id is not None and layer_id in self._layer_items:
+                self._layer_items[layer_id].discard(current)
+        if self._bulk_depth:
+            self._bulk_count += 1
+        super().removeItem(item)
+        if not self._bulk_depth:
+            self.items_added_or_removed.emit()
+
+    @contextmanager
+    def bulk_update(self) -> Iterator[None]:
+        """Batch many ``addItem``/``removeItem`` calls (load, paste, arrays, DXF).
+
+        Inside the block, hidden layers that receive items are revealed once
+        at the end (one ``layer_auto_unhidden`` per layer, not per item).
+        When the batch touched many items, the scene is repainted as a whole
+        so ``changed`` listeners (snap index, static layer tiles, minimap,
+        companion and spacing checks) get one rect instead of one per item.
+        Blocks nest; only the outermost one finishes the batch.
+        """
+        self._bulk_depth += 1
+        try:
+            yield
+        finally:
+            self._bulk_depth -= 1
+            if not self._bulk_depth:
+                self._finish_bulk_update()
+
+    def _finish_bulk_update(self) -> None:
+        revealed, self._bulk_revealed = self._bulk_revealed, {}
+        count, self._bulk_count = self._bulk_count, 0
+        for layer_id, layer in revealed.items():
+            if not layer.visible:
+                layer.visible = True
+                self._apply_layer_state(layer)
+                self.layer_auto_unhidden.emit(layer_id)
+        if count:
+            self.items_added_or_removed.emit()
+        if count >= _BULK_COALESCE_MIN_ITEMS:
+            # A null rect makes Qt drop the per-item rects it has collected
+            # and report the scene rect once.
+            self.update()
+
     # Constraint dimension line management
 
     @property
@@ -633,9 +710,8 @@ class CanvasScene(QGraphicsScene):
             from_layer_id: Source layer ID
             to_layer_id: Destination layer ID
         """
-        for item in self.items():
-            if hasattr(item, 'layer_id') and item.layer_id == from_layer_id:
-                item.layer_id = to_layer_id
+        for item in self.items_in_layer(from_layer_id):
+            item.layer_id = to_layer_id  # re-indexed by the layer_id setter
 
     def reorder_layers(self, new_order: list[Layer]) -> None:
         """Reorder layers.
@@ -653,49 +729,43 @@ class CanvasScene(QGraphicsScene):
 
     def _update_items_z_order(self) -> None:
         """Update Z-order of all items based on layer order."""
-        for item in self.items():
-            if hasattr(item, 'layer_id') and item.layer_id:
-                layer = self.get_layer_by_id(item.layer_id)
-                if layer:
-                    # Use z_order * 100 to leave room for ordering within layer
-                    item.setZValue(layer.z_order * 100)
+        self._rebuild_layer_index()
+        for layer in self._layers:
+            # Use z_order * 100 to leave room for ordering within layer
+            z = layer.z_order * 100
+            for item in self.items_in_layer(layer.id):
+                item.setZValue(z)
 
-        # Second pass: ensure ROOF_RIDGE items always render above their owner polygon.
-        # Needed because scene.items() serialization order reverses same-z stacking,
-        # so on reload the polygon would otherwise end up on top of the ridge.
+        # Owners and parent beds are looked up by id; one pass collects them.
         from open_garden_planner.core.object_types import ObjectType
-        all_items = list(self.items())
-        for item in all_items:
-            if (
-                hasattr(item, 'object_type')
-                and item.object_type == ObjectType.ROOF_RIDGE
-                and hasattr(item, 'get_metadata')
+
+        items_by_id: dict[str, Any] = {}
+        ridges: list[Any] = []
+        children: list[Any] = []
+        for item in self.items():
+            item_id = getattr(item, "item_id", None)
+            if item_id is not None:
+                items_by_id[str(item_id)] = item
+            if getattr(item, "object_type", None) == ObjectType.ROOF_RIDGE and hasattr(
+                item, "get_metadata"
             ):
-                owner_id_str = item.get_metadata("owner_polygon_id")
-                if not owner_id_str:
-                    continue
-                for other in all_items:
-                    if hasattr(other, 'item_id') and str(other.item_id) == owner_id_str:
-                        if item.zValue() <= other.zValue():
-                            item.setZValue(other.zValue() + 1)
-                        break
+                ridges.append(item)
+            if getattr(item, "_parent_bed_id", None) is not None:
+                children.append(item)
+
+        # Second pass: ensure ROOF_RIDGE items always render above their owner polygon.
+        for item in ridges:
+            owner_id_str = item.get_metadata("owner_polygon_id")
+            owner = items_by_id.get(owner_id_str) if owner_id_str else None
+            if owner is not None and item.zValue() <= owner.zValue():
+                item.setZValue(owner.zValue() + 1)
 
         # Third pass: every item with a _parent_bed_id (plant inside a bed) must
-        # render above its parent bed. Without this, .ogp save/load reverses the
-        # same-z stacking and the plant disappears behind the bed (US-12.10/F2.7).
-        items_by_id: dict[str, Any] = {
-            str(getattr(item, "item_id", "")): item
-            for item in all_items
-            if getattr(item, "item_id", None) is not None
-        }
-        for item in all_items:
-            parent_id = getattr(item, "_parent_bed_id", None)
-            if parent_id is None:
-                continue
-            parent = items_by_id.get(str(parent_id))
-            if parent is None:
-                continue
-            if item.zValue() <= parent.zValue():
+        # render above its parent bed, or the plant disappears behind the bed
+        # (US-12.10/F2.7).
+        for item in children:
+            parent = items_by_id.get(str(item._parent_bed_id))
+            if parent is not None and item.zValue() <= parent.zValue():
                 item.setZValue(parent.zValue() + 1)
 
     def get_layer_by_id(self, layer_id: UUID) -> Layer | None:
@@ -707,11 +777,58 @@ class CanvasScene(QGraphicsScene):
         Returns:
             Layer if found, None otherwise
         """
+        layer = self._layers_by_id.get(layer_id)
+        if layer is not None:
+            return layer
+        # A layer put into ``layers`` whose layers_changed is still to come.
         for layer in self._layers:
             if layer.id == layer_id:
                 return layer
         return None
 
+    def _rebuild_layer_index(self) -> None:
+        """Re-derive the id -> Layer dict from the layer list."""
+        self._layers_by_id = {layer.id: layer for layer in self._layers}
+
+    def _index_item_layers(self, item: QGraphicsItem) -> None:
+        """Record ``item`` and its descendants under their layers."""
+        for current in self._with_descendants(item):
+            layer_id = getattr(current, "layer_id", None)
+            if layer_id is not None:
+                self._layer_items.setdefault(layer_id, set()).add(current)
+
+    @staticmethod
+    def _with_descendants(item: QGraphicsItem) -> Iterator[QGraphicsItem]:
+        stack = [item]
+        while stack:
+            current = stack.pop()
+            yield current
+            stack.extend(current.childItems())
+
+    def reindex_item_layer(self, item: QGraphicsItem, old_layer_id: UUID | None) -> None:
+        """Move ``item`` to its new layer's bucket (called by ``layer_id`` setters)."""
+        if old_layer_id is not None and old_layer_id in self._layer_items:
+            self._layer_items[old_layer_id].discard(item)
+        layer_id = getattr(item, "layer_id", None)
+        if layer_id is not None:
+            self._layer_items.setdefault(layer_id, set()).add(item)
+
+    def items_in_layer(self, layer_id: UUID) -> list[QGraphicsItem]:
+        """Items assigned to ``layer_id``, group children included."""
+        bucket = self._layer_items.get(layer_id)
+        if not bucket:
+            return []
+        members: list[QGraphicsItem] = []
+        stale: list[QGraphicsItem] = []
+        for item in bucket:
+            try:
+                valid = item.scene() is self and getattr(item, "layer_id", None) == layer_id
+            except RuntimeError:  # #230: C++ side already deleted
+                valid = False
+            (members if valid else stale).append(item)
+        bucket.difference_update(stale)
+        return members
+
     @property
     def active_layer(self) -> Layer | None:
         """Get the active layer."""
@@ -729,19 +846,20 @@ class CanvasScene(QGraphicsScene):
 
     def _update_items_visibility(self) -> None:
         """Update visibility and interaction of all items based on layer state."""
-        for item in self.items():
-            if hasattr(item, 'layer_id') and item.layer_id:
-                layer = self.get_layer_by_id(item.layer_id)
-                if layer:
-                    # Set visibility
-                    item.setVisible(layer.visible)
-                    # Set opacity
-                    item.setOpacity(layer.opacity)
-                    # Set selectability based on lock state
-                    if hasattr(item, 'setFlag'):
-                        from PyQt6.QtWidgets import QGraphicsItem
-                        item.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, not layer.locked)
-                        item.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, not layer.locked)
+        self._rebuild_layer_index()
+        for layer in self._layers:
+            self._apply_layer_state(layer)
+
+    def _apply_layer_state(self, layer: Layer) -> None:
+        """Push one layer's visibility, opacity and lock onto its items."""
+        selectable = QGraphicsItem.GraphicsItemFlag.ItemIsSelectable
+        movable = QGraphicsItem.GraphicsItemFlag.ItemIsMovable
+        for item in self.items_in_layer(layer.id):
+            item.setVisible(layer.visible)
+            item.setOpacity(layer.opacity)
+            # Set selectability based on lock state
+            item.setFlag(selectable, not layer.locked)
+            item.setFlag(movable, not layer.locked)
 
     def update_layer_visibility(self, layer_id: UUID, visible: bool) -> None:
         """Update visibility of a layer and its items.
@@ -753,7 +871,7 @@ class CanvasScene(QGraphicsScene):
         layer = self.get_layer_by_id(layer_id)
         if layer:
             layer.visible = visible
-            self._update_items_visibility()
+            self._apply_layer_state(layer)
             self.layers_changed.emit()
 
     def update_layer_lock(self, layer_id: UUID, locked: bool) -> None:
@@ -766,7 +884,7 @@ class CanvasScene(QGraphicsScene):
         layer = self.get_layer_by_id(layer_id)
         if layer:
             layer.locked = locked
-            self._update_items_visibility()
+            self._apply_layer_state(layer)
             self.layers_changed.emit()
 
     def update_layer_opacity(self, layer_id: UUID, opacity: float) -> None:
@@ -779,7 +897,7 @@ class CanvasScene(QGraphicsScene):
         layer = self.get_layer_by_id(layer_id)
         if layer:
             layer.opacity = max(0.0, min(1.0, opacity))
-            self._update_items_visibility()
+            self._apply_layer_state(layer)
             self.layers_changed.emit()
 
     def preview_layer_opacity(self, layer_id: UUID, opacity: float) -> None:
@@ -797,7 +915,7 @@ class CanvasScene(QGraphicsScene):
         layer = self.get_layer_by_id(layer_id)
         if layer:
             layer.opacity = max(0.0, min(1.0, opacity))
-            self._update_items_visibility()
+            self._apply_layer_state(layer)
 
     # ── Compare overlay (US-10.7) ─────────────────────────────────────────
 
@@ -898,6 +1016,7 @@ class CanvasScene(QGraphicsScene):
         self._calibration_points.clear()
         self._calibration_image = None
         self._calibration_mode = False
+        self._layer_items.clear()
         super().clear()
 
     def set_compare_overlay_visible(self, visible: bool) -> None:
@@ -950,7 +1069,9 @@ class CanvasScene(QGraphicsScene):
         best_bed: QGraphicsItem | None = None
         best_area = float("inf")
 
-        for item in self.items():
+        # The BSP index narrows the scan to items whose bounds cover the point;
+        # walking every item made auto-parenting N pasted plants O(N²).
+        for item in self.items(scene_point, Qt.ItemSelectionMode.IntersectsItemBoundingRect):
             if not isinstance(item, GardenItemMixin):
                 continue
             if not is_plant_parent_type(item.object_type):
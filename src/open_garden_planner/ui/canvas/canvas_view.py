@@ -5,15 +5,17 @@ It flips the Y-axis to provide CAD-style coordinates (origin at bottom-left,
 Y increasing upward).
 """
 
+import bisect
 import contextlib
 import logging
+import math
 from datetime import date
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from open_garden_planner.ui.canvas.items.soil_badge_item import SoilBadgeItem
 
-from PyQt6.QtCore import QCoreApplication, QPointF, QRectF, Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import QCoreApplication, QLineF, QPointF, QRectF, Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import (
     QBrush,
     QColor,
@@ -22,6 +24,7 @@ from PyQt6.QtGui import (
     QKeyEvent,
     QMouseEvent,
     QPainter,
+    QPainterPath,
     QPaintEvent,
     QPen,
     QTransform,
@@ -118,10 +121,56 @@ from open_garden_planner.ui.canvas.items.resize_handle import (
     RotationHandle,
     VertexHandle,
 )
+from open_garden_planner.ui.canvas.static_layer_cache import StaticLayerCache
 
 _log = logging.getLogger(__name__)
 
 
+class _GridLines:
+    """Grid lines of one step over a scene region, sorted by position.
+
+    Minor lines under a major line are left out. ``draw`` bisects each
+    family down to the lines crossing the exposed rect, so a small repaint
+    issues a short batch however large the region is.
+    """
+
+    def __init__(self, step: float, region: QRectF) -> None:
+        self.step = step
+        self.region = region
+        # position-sorted (positions, lines) per family
+        self.minor_v: tuple[list[float], list[QLineF]] = ([], [])
+        self.minor_h: tuple[list[float], list[QLineF]] = ([], [])
+        self.major_v: tuple[list[float], list[QLineF]] = ([], [])
+        self.major_h: tuple[list[float], list[QLineF]] = ([], [])
+        for k in range(math.ceil(region.left() / step), math.floor(region.right() / step) + 1):
+            x = k * step
+            xs, lines = self.major_v if k % 5 == 0 else self.minor_v
+            xs.append(x)
+            lines.append(QLineF(x, region.top(), x, region.bottom()))
+        for k in range(math.ceil(region.top() / step), math.floor(region.bottom() / step) + 1):
+            y = k * step
+            ys, lines = self.major_h if k % 5 == 0 else self.minor_h
+            ys.append(y)
+            lines.append(QLineF(region.left(), y, region.right(), y))
+
+    @staticmethod
+    def _within(family: tuple[list[float], list[QLineF]], lo: float, hi: float) -> list[QLineF]:
+        positions, lines = family
+        return lines[bisect.bisect_left(positions, lo):bisect.bisect_right(positions, hi)]
+
+    def draw(self, painter: QPainter, rect: QRectF, minor_pen: QPen, major_pen: QPen) -> None:
+        painter.setPen(minor_pen)
+        painter.drawLines(
+            self._within(self.minor_v, rect.left(), rect.right())
+            + self._within(self.minor_h, rect.top(), rect.bottom())
+        )
+        painter.setPen(major_pen)
+        painter.drawLines(
+            self._within(self.major_v, rect.left(), rect.right())
+            + self._within(self.major_h, rect.top(), rect.bottom())
+        )
+
+
 class CanvasView(QGraphicsView):
     """Graphics view for the garden canvas.
 
@@ -203,6 +252,9 @@ class CanvasView(QGraphicsView):
         self._tangent_snap_enabled = False
         self._dynamic_input_enabled = True
         self._grid_size = 50.0  # 50cm default grid
+        # Line sets of the last grid paint, reused until the step changes
+        # or the exposed rect leaves their region (_draw_grid).
+        self._grid_lines: _GridLines | None = None
         self._scale_bar_visible = True
 
         # Drag-time bounding-box snapping engine and visual guides
@@ -302,9 +354,21 @@ class CanvasView(QGraphicsView):
         self._soil_overlay_visible: bool = False
         self._soil_overlay_param: str = PARAM_OVERALL
         self._soil_service: SoilService | None = None
+        # (scene path, bounds, brush) per bed, rebuilt only when soil tests,
+        # scene items or the parameter change — not on every repaint.
+        self._soil_overlay_cache: list[tuple[QPainterPath, QRectF, QBrush]] | None = None
         # US-12.10e: seasonal reminder badges, keyed by bed UUID.
         self._soil_badges: dict[str, SoilBadgeItem] = {}
 
+        # Locked layers are composited from offscreen tiles instead of being
+        # repainted under every live change (static_layer_cache.py).
+        self._static_layer = StaticLayerCache(self, scene)
+        scene.layers_changed.connect(self._static_layer.schedule_membership_refresh)
+        scene.items_added_or_removed.connect(self._static_layer.schedule_membership_refresh)
+        self._command_manager.stack_changed.connect(
+            self._static_layer.schedule_membership_refresh
+        )
+
         # Set up view properties
         self._setup_view()
 
@@ -613,6 +677,7 @@ class CanvasView(QGraphicsView):
 
         # Also propagate to the scene
         self._canvas_scene.apply_theme_colors(colors)
+        self._static_layer.invalidate()
         self.viewport().update()
 
     def _apply_transform(self) -> None:
@@ -826,7 +891,18 @@ class CanvasView(QGraphicsView):
         The overlay is a no-op until a service is supplied; the application
         wires this once after constructing both objects.
         """
-        self._soil_service = service
+        previous, self._soil_service = self._soil_service, service
+        self._soil_overlay_cache = None
+        if previous is not service:
+            if previous is not None:
+                with contextlib.suppress(TypeError, RuntimeError):
+                    previous.project_manager.soil_tests_changed.disconnect(
+                        self._invalidate_soil_overlay
+                    )
+            if service is not None:
+                service.project_manager.soil_tests_changed.connect(
+                    self._invalidate_soil_overlay
+                )
         if not hasattr(self, "_soil_mismatch_timer"):
             self._soil_mismatch_timer = QTimer(self)
             self._soil_mismatch_timer.setSingleShot(True)
@@ -854,7 +930,10 @@ class CanvasView(QGraphicsView):
         widget/app teardown the scene can still emit ``changed`` after the view's
         timer is deleted, and an unguarded access raises ``RuntimeError`` inside a
         Qt slot — which aborts the interpreter. (Was a bare lambda before.)
+        Panning and zooming never emit ``changed``, so the cached overlay
+        geometry is dropped here without costing anything while navigating.
         """
+        self._soil_overlay_cache = None
         with contextlib.suppress(RuntimeError):
             self._soil_mismatch_timer.start()
 
@@ -873,6 +952,13 @@ class CanvasView(QGraphicsView):
         from open_garden_planner.ui.canvas.items import GardenItemMixin
 
         all_items = list(self._canvas_scene.items())
+        # One id -> item map per pass; matching every bed against every item
+        # made a bulk-created plan of beds and plants cost seconds here.
+        index_by_id: dict[str, int] = {}
+        for index, other in enumerate(all_items):
+            other_id = getattr(other, "item_id", None)
+            if other_id is not None:
+                index_by_id.setdefault(str(other_id), index)
         for item in all_items:
             if not isinstance(item, GardenItemMixin):
                 continue
@@ -882,9 +968,8 @@ class CanvasView(QGraphicsView):
             record = self._soil_service.get_effective_record(bed_id)
             child_ids = {str(c) for c in getattr(item, "_child_item_ids", [])}
             specs: list[PlantSpeciesData] = []
-            for child in all_items:
-                if str(getattr(child, "item_id", "")) not in child_ids:
-                    continue
+            for index in sorted(index_by_id[c] for c in child_ids if c in index_by_id):
+                child = all_items[index]
                 ps_dict = getattr(child, "metadata", {}).get("plant_species")
                 if ps_dict and isinstance(ps_dict, dict):
                     with contextlib.suppress(Exception):
@@ -970,9 +1055,17 @@ class CanvasView(QGraphicsView):
         if self._soil_overlay_param == parameter:
             return
         self._soil_overlay_param = parameter
+        self._soil_overlay_cache = None
         if self._soil_overlay_visible:
             self.viewport().update()
 
+    def _invalidate_soil_overlay(self, _tests: object = None) -> None:
+        """Drop the cached overlay geometry after a soil-test history change."""
+        self._soil_overlay_cache = None
+        with contextlib.suppress(RuntimeError):  # #230: view already deleted
+            if self._soil_overlay_visible:
+                self.viewport().update()
+
     # Grid methods
 
     def set_grid_visible(self, visible: bool) -> None:
@@ -1928,6 +2021,7 @@ class CanvasView(QGraphicsView):
         """Handle mouse press for panning and tool operations."""
         # Grab keyboard focus so Delete/arrow keys work
         self.setFocus()
+        self._static_layer.begin_interaction()
 
         # ── Guide line handling ─────────────────────────────────────────────
         if self._guides_visible and event.button() == Qt.MouseButton.LeftButton:
@@ -2669,6 +2763,8 @@ class CanvasView(QGraphicsView):
 
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         """Handle mouse release to stop panning and finish tool operations."""
+        # Scene changes collected during the press reach the tiles now.
+        self._static_layer.end_interaction()
         # Clear snap guides
         if self._snap_guides:
             self._snap_guides = []
@@ -3810,9 +3906,15 @@ class CanvasView(QGraphicsView):
                 # including the properties-panel Unlink button.
                 self._command_manager.execute(cmd)
 
+    @property
+    def static_layer(self) -> StaticLayerCache:
+        """The tile cache the locked layers are composited from."""
+        return self._static_layer
+
     def drawBackground(self, painter: QPainter, rect: QRectF) -> None:
-        """Draw the background."""
+        """Draw the background, then the cached static layer on top of it."""
         super().drawBackground(painter, rect)
+        self._static_layer.paint(painter, rect)
 
     def drawForeground(self, painter: QPainter, rect: QRectF) -> None:
         """Draw the foreground including canvas border, grid overlay, and snap guides."""
@@ -3822,7 +3924,7 @@ class CanvasView(QGraphicsView):
         # grid and guide lines stay legible above the tint. Drawn at view
         # level so scene.render() (PNG/SVG/PDF/print) excludes it.
         if self._soil_overlay_visible and self._soil_service is not None:
-            self._draw_soil_overlay(painter)
+            self._draw_soil_overlay(painter, rect)
 
         # Draw canvas border
         self._draw_canvas_border(painter)
@@ -3858,20 +3960,33 @@ class CanvasView(QGraphicsView):
         # Draw rectangle around canvas
         painter.drawRect(canvas_rect)
 
-    def _draw_soil_overlay(self, painter: QPainter) -> None:
+    def _draw_soil_overlay(self, painter: QPainter, rect: QRectF) -> None:
         """Tint each bed by the current soil-health parameter (US-12.10b).
 
         Beds with no effective soil test get a hatched grey fill so the
         absence of data reads visually distinct from POOR.
         """
-        service = self._soil_service
-        if service is None:
+        if self._soil_service is None:
             return
+        if self._soil_overlay_cache is None:
+            self._soil_overlay_cache = self._build_soil_overlay()
 
         painter.save()
         painter.setPen(Qt.PenStyle.NoPen)
+        for scene_path, bounds, brush in self._soil_overlay_cache:
+            if bounds.intersects(rect):
+                painter.setBrush(brush)
+                painter.drawPath(scene_path)
+        painter.restore()
 
+    def _build_soil_overlay(self) -> list[tuple[QPainterPath, QRectF, QBrush]]:
+        """Scene path, bounds and brush of every tinted bed, in paint order."""
+        service = self._soil_service
+        if service is None:
+            return []
+        unknown = QBrush(QColor(140, 140, 140, 40), Qt.BrushStyle.DiagCrossPattern)
         param = self._soil_overlay_param
+        overlay: list[tuple[QPainterPath, QRectF, QBrush]] = []
         for item in self._canvas_scene.items():
             if not is_bed_type(getattr(item, "object_type", None)):
                 continue
@@ -3880,21 +3995,19 @@ class CanvasView(QGraphicsView):
                 continue
             record = service.get_effective_record(target_id)
             level = service.health_level(record, param)
-            scene_path = item.mapToScene(item.shape())
             if level is HealthLevel.UNKNOWN:
-                painter.setBrush(QBrush(QColor(140, 140, 140, 40),
-                                        Qt.BrushStyle.DiagCrossPattern))
+                brush = unknown
             else:
                 rgba = service.overlay_rgba(level)
                 if rgba is None:
                     continue
-                painter.setBrush(QBrush(QColor(*rgba)))
-            painter.drawPath(scene_path)
-
-        painter.restore()
+                brush = QBrush(QColor(*rgba))
+            scene_path = item.mapToScene(item.shape())
+            overlay.append((scene_path, scene_path.boundingRect(), brush))
+        return overlay
 
     def _draw_grid(self, painter: QPainter, rect: QRectF) -> None:
-        """Draw the grid overlay."""
+        """Draw the grid overlay: one ``drawLines`` batch per pen."""
         # Determine grid line spacing based on zoom
         grid_size = self._grid_size
 
@@ -3904,45 +4017,25 @@ class CanvasView(QGraphicsView):
         while grid_size * self._zoom_factor > 100:  # More than 100 pixels
             grid_size /= 2
 
-        # Set up pen for grid lines
-        pen = QPen(self._grid_color)
-        pen.setWidth(0)  # Cosmetic pen (1 pixel regardless of transform)
-        painter.setPen(pen)
+        lines = self._grid_lines
+        if lines is None or lines.step != grid_size or not lines.region.contains(rect):
+            # Cover the viewport padded by half its size on every side, so
+            # panning reuses the lines until the exposed rect leaves it.
+            visible = self.mapToScene(self.viewport().rect()).boundingRect().united(rect)
+            region = visible.adjusted(
+                -visible.width() / 2, -visible.height() / 2,
+                visible.width() / 2, visible.height() / 2,
+            )
+            lines = _GridLines(grid_size, region)
+            self._grid_lines = lines
 
-        # Calculate grid bounds
-        left = int(rect.left() / grid_size) * grid_size
-        top = int(rect.top() / grid_size) * grid_size
-        right = rect.right()
-        bottom = rect.bottom()
-
-        # Draw vertical lines
-        x = left
-        while x <= right:
-            painter.drawLine(QPointF(x, rect.top()), QPointF(x, rect.bottom()))
-            x += grid_size
-
-        # Draw horizontal lines
-        y = top
-        while y <= bottom:
-            painter.drawLine(QPointF(rect.left(), y), QPointF(rect.right(), y))
-            y += grid_size
-
-        # Draw major grid lines (every 5th line) slightly darker
+        # Cosmetic pens (1 pixel regardless of transform); major grid lines
+        # (every 5th line) slightly darker
+        pen = QPen(self._grid_color)
+        pen.setWidth(0)
         major_pen = QPen(self._grid_major_color)
         major_pen.setWidth(0)
-        painter.setPen(major_pen)
-
-        major_grid = grid_size * 5
-
-        x = int(rect.left() / major_grid) * major_grid
-        while x <= right:
-            painter.drawLine(QPointF(x, rect.top()), QPointF(x, rect.bottom()))
-            x += major_grid
-
-        y = int(rect.top() / major_grid) * major_grid
-        while y <= bottom:
-            painter.drawLine(QPointF(rect.left(), y), QPointF(rect.right(), y))
-            y += major_grid
+        lines.draw(painter, rect, pen, major_pen)
 
     def _draw_snap_guides(self, painter: QPainter, rect: QRectF) -> None:
         """Draw snap alignment guide lines.
@@ -133,7 +133,10 @@ class ArcItem(CurveEditMixin, QGraphicsPathItem):
 
     @layer_id.setter
     def layer_id(self, value: uuid.UUID | None) -> None:
-        self._layer_id = value
+        old, self._layer_id = self._layer_id, value
+        scene = self.scene()
+        if old != value and scene is not None and hasattr(scene, "reindex_item_layer"):
+            scene.reindex_item_layer(self, old)
 
     @property
     def stroke_color(self) -> QColor:
@@ -2,26 +2,57 @@
 
 Displays an imported image (satellite photo, etc.) that can be calibrated
 to real-world scale.
+
+The image is held as a tiled pyramid (``core/image_pyramid.py``) rather
+than one full-resolution pixmap: each paint picks the level matching the
+view's scale and draws only the tiles in the exposed rect, converting
+them to pixmaps through a shared byte-bounded LRU (``_tile_cache``). A
+zoomed-out view of a huge photo therefore touches a few small tiles, and
+zooming into a corner never uploads the rest of the image. Only the
+encoded file bytes stay resident for the item's lifetime; the pyramid
+decodes them again when it has dropped the full-resolution pixels and a
+finer level is needed. Project files are unchanged — the full image is still embedded as one PNG, and every
+existing single-image project becomes a pyramid on load.
 """
 
 import base64
+from pathlib import Path
 
-from PyQt6.QtCore import QBuffer, QByteArray, QCoreApplication, QIODevice, QPointF
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import QBuffer, QByteArray, QCoreApplication, QIODevice, QPointF, QRectF, Qt
+from PyQt6.QtGui import QColor, QImage, QPainter, QPen, QPixmap, QTransform
 from PyQt6.QtWidgets import (
     QGraphicsItem,
-    QGraphicsPixmapItem,
     QGraphicsSceneContextMenuEvent,
     QInputDialog,
     QMenu,
+    QStyle,
+    QStyleOptionGraphicsItem,
+    QWidget,
 )
 
+from open_garden_planner.core.image_pyramid import ImagePyramid
+from open_garden_planner.core.sprite_cache import SpriteCache, painter_lod
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Byte budget for tile pixmaps of all background images (LRU)
+_TILE_CACHE_MAX_BYTES = 96 * 1024 * 1024
+
+_tile_cache = SpriteCache(_TILE_CACHE_MAX_BYTES)
+
+
+def background_tile_cache() -> SpriteCache:
+    """The shared background tile cache (hit/miss/eviction counters)."""
+    return _tile_cache
 
-class BackgroundImageItem(QGraphicsPixmapItem):
+
+class BackgroundImageItem(QGraphicsItem):
     """A background image that can be scaled and positioned.
 
     The image is rendered behind all other items and can be calibrated
-    to match real-world dimensions.
+    to match real-world dimensions. Item coordinates are source-image
+    pixels with y up (the view is Y-flipped), ``(0, 0)`` the image's
+    bottom-left corner.
     """
 
     def __init__(
@@ -53,16 +84,24 @@ class BackgroundImageItem(QGraphicsPixmapItem):
         self._scale_factor = 1.0  # pixels per cm after calibration
         self._geo_metadata: dict | None = geo_metadata
 
-        # Load the image — either from embedded bytes or from disk path
+        # Load the image — either from embedded bytes or from disk path. The
+        # encoded bytes are kept so the pyramid can drop the decoded source.
         if _pixmap_data is not None:
-            self._original_pixmap = QPixmap()
-            self._original_pixmap.loadFromData(QByteArray(_pixmap_data))
-            if self._original_pixmap.isNull():
+            self._encoded = bytes(_pixmap_data)
+            image = self._decode()
+            if image.isNull():
                 raise ValueError("Failed to load image from embedded data")
         else:
-            self._original_pixmap = QPixmap(image_path)
-            if self._original_pixmap.isNull():
+            try:
+                self._encoded = Path(image_path).read_bytes()
+            except OSError as e:
+                raise ValueError(f"Failed to load image: {image_path}") from e
+            image = self._decode()
+            if image.isNull():
                 raise ValueError(f"Failed to load image: {image_path}")
+        self._pyramid = ImagePyramid(image, reload=self._decode)
+        #: Instrument: tiles drawn by the last paint (tests and profiling).
+        self.last_painted_tiles = 0
 
         # Derive the scale from geo metadata so the satellite image is true-to-life.
         # 1 cm = 0.01 m → px_per_cm = 0.01 / meters_per_pixel.
@@ -71,16 +110,12 @@ class BackgroundImageItem(QGraphicsPixmapItem):
             if mpp is not None and mpp > 0:
                 self._scale_factor = 0.01 / float(mpp)
 
-        # Flip vertically to compensate for view's Y-flip transform (CAD convention)
-        from PyQt6.QtGui import QTransform
-        flip_transform = QTransform().scale(1, -1)
-        flipped_pixmap = self._original_pixmap.transformed(flip_transform)
-        self.setPixmap(flipped_pixmap)
-
         # Set up item properties
         self.setZValue(-1000)  # Behind all other items
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, True)
+        # paint() only draws the tiles inside option.exposedRect
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption, True)
 
         # Transform origin at center for easier manipulation
         self.setTransformOriginPoint(self.boundingRect().center())
@@ -92,6 +127,68 @@ class BackgroundImageItem(QGraphicsPixmapItem):
         if self._scale_factor != 1.0:
             self.setScale(1.0 / self._scale_factor)
 
+    def _decode(self) -> QImage:
+        return QImage.fromData(QByteArray(self._encoded))
+
+    def boundingRect(self) -> QRectF:
+        """The whole image, in source pixels."""
+        return QRectF(0, 0, self._pyramid.width, self._pyramid.height)
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionGraphicsItem,
+        widget: QWidget | None = None,  # noqa: ARG002
+    ) -> None:
+        """Draw the visible tiles of the level matching the view's scale."""
+        pyramid = self._pyramid
+        height = pyramid.height
+        lod = painter_lod(painter, option.levelOfDetailFromTransform(painter.worldTransform()))
+        level = pyramid.level_for_scale(lod)
+        exposed = option.exposedRect.intersected(self.boundingRect())
+        if painter.hasClipping():  # scene.render() (export) exposes the whole item
+            exposed = exposed.intersected(painter.clipBoundingRect())
+        # Image rows run top-down; flip so row 0 lands at the top of the view.
+        source_rect = QRectF(
+            exposed.left(), height - exposed.bottom(), exposed.width(), exposed.height()
+        )
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.translate(0, height)
+        painter.scale(1, -1)
+        tiles = pyramid.tiles_in(level, source_rect)
+        for column, row in tiles:
+            key = pyramid.tile_key(level, column, row)
+            pixmap = _tile_cache.get(key)
+            if pixmap is None:
+                pixmap = QPixmap.fromImage(pyramid.tile_image(level, column, row))
+                _tile_cache.put(key, pixmap)
+            painter.drawPixmap(
+                pyramid.tile_rect(level, column, row), pixmap, QRectF(pixmap.rect())
+            )
+        painter.restore()
+        self.last_painted_tiles = len(tiles)
+
+        if option.state & QStyle.StateFlag.State_Selected:
+            pen = QPen(QColor(0, 0, 0), 0, Qt.PenStyle.DashLine)
+            painter.setPen(pen)
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawRect(self.boundingRect())
+
+    def pixmap(self) -> QPixmap:
+        """The full-resolution image as displayed (Y-flipped), built on demand.
+
+        The canvas never uses this — it paints tiles; it serves callers that
+        need the whole image at once.
+        """
+        return QPixmap.fromImage(self._pyramid.source).transformed(QTransform().scale(1, -1))
+
+    @property
+    def pyramid(self) -> ImagePyramid:
+        """The tiled pyramid the item paints from."""
+        return self._pyramid
+
     def shape(self):
         """Return the shape for clipping to canvas bounds."""
         from PyQt6.QtGui import QPainterPath
@@ -107,7 +204,7 @@ class BackgroundImageItem(QGraphicsPixmapItem):
                 path.addRect(item_rect)
                 return path
 
-        # Default: entire pixmap
+        # Default: entire image
         path.addRect(self.boundingRect())
         return path
 
@@ -163,7 +260,7 @@ class BackgroundImageItem(QGraphicsPixmapItem):
 
     def image_size_pixels(self) -> tuple[int, int]:
         """Get original image size in pixels."""
-        return self._original_pixmap.width(), self._original_pixmap.height()
+        return self._pyramid.width, self._pyramid.height
 
     def image_size_cm(self) -> tuple[float, float]:
         """Get image size in centimeters (after calibration)."""
@@ -178,16 +275,20 @@ class BackgroundImageItem(QGraphicsPixmapItem):
     def to_dict(self) -> dict:
         """Serialize the item to a dictionary for saving.
 
-        The original pixmap is embedded as a base64-encoded PNG so that the
+        The original image is embedded as a base64-encoded PNG so that the
         project file is self-contained and portable across machines.
         ``image_path`` is kept as a human-readable hint only — it is not used
         when loading if ``image_data`` is present.
         """
-        buf = QBuffer()
-        buf.open(QIODevice.OpenModeFlag.WriteOnly)
-        self._original_pixmap.save(buf, "PNG")
-        image_data_b64 = base64.b64encode(bytes(buf.data())).decode("ascii")
-        buf.close()
+        if self._encoded.startswith(_PNG_SIGNATURE):
+            png = self._encoded
+        else:
+            buf = QBuffer()
+            buf.open(QIODevice.OpenModeFlag.WriteOnly)
+            self._pyramid.source.save(buf, "PNG")
+            png = bytes(buf.data())
+            buf.close()
+        image_data_b64 = base64.b64encode(png).decode("ascii")
         data: dict = {
             "type": "background_image",
             "image_path": self._image_path,
@@ -17,15 +17,20 @@ from PyQt6.QtWidgets import (
 )
 
 from open_garden_planner.core.fill_patterns import FillPattern, create_pattern_brush
-from open_garden_planner.core.furniture_renderer import is_furniture_type, render_furniture_pixmap
+from open_garden_planner.core.furniture_renderer import is_furniture_type, render_furniture_sprite
 from open_garden_planner.core.growth_model import grown_spread_cm
 from open_garden_planner.core.object_types import ObjectType, StrokeStyle, get_style
 from open_garden_planner.core.plant_renderer import (
     PlantCategory,
+    PlantSpriteKey,
+    is_plant_sprite_pending,
     is_plant_type,
-    render_plant_pixmap,
+    plant_rotation_deg,
+    plant_sprite_key,
+    sprite_for_key,
 )
 from open_garden_planner.core.plant_sizing import sizing_for_item
+from open_garden_planner.core.sprite_cache import painter_lod
 
 from .garden_item import GardenItemMixin
 from .resize_handle import (
@@ -316,6 +321,27 @@ class CircleItem(RotationHandleMixin, ResizeHandlesMixin, GardenItemMixin, QGrap
         )
         return grown if grown is not None else footprint_diameter
 
+    def plant_sprite_key(
+        self, lod: float, diameter: float | None = None
+    ) -> PlantSpriteKey | None:
+        """Key of the mip-level sprite this plant paints at scale ``lod``.
+
+        ``diameter`` is the visual plant diameter in cm (resolved from the
+        growth model when omitted). None for non-plants and plants without
+        an SVG.
+        """
+        if not is_plant_type(self.object_type):
+            return None
+        if diameter is None:
+            diameter = self._visual_plant_diameter_cm(self.rect().width())
+        return plant_sprite_key(
+            object_type=self.object_type,
+            device_px=diameter * self._PLANT_FILL_SCALE * lod,
+            species=self._plant_species,
+            category=self._plant_category,
+            tint_color=self.fill_color,
+        )
+
     def paint(
         self,
         painter: QPainter,
@@ -363,16 +389,19 @@ class CircleItem(RotationHandleMixin, ResizeHandlesMixin, GardenItemMixin, QGrap
             # Render at a larger size so organic shapes fill the circle
             render_diameter = diameter * self._PLANT_FILL_SCALE
 
-            pixmap = render_plant_pixmap(
-                object_type=self.object_type,
-                diameter=render_diameter,
-                item_id=str(self._item_id),
-                species=self._plant_species,
-                category=self._plant_category,
-                tint_color=self.fill_color,
+            # One mip-level sprite per species/tint, picked from the on-screen
+            # size (zoom-aware, see core/sprite_cache.py); the per-item
+            # rotation is applied here rather than baked into the pixmap.
+            # While a background worker is still rendering the sprite
+            # (ui/canvas/sprite_prerender.py) a placeholder disc stands in.
+            lod = painter_lod(
+                painter, option.levelOfDetailFromTransform(painter.worldTransform())
             )
+            sprite_key = self.plant_sprite_key(lod, diameter)
+            pending = sprite_key is not None and is_plant_sprite_pending(sprite_key)
+            pixmap = None if sprite_key is None or pending else sprite_for_key(sprite_key)
 
-            if pixmap is not None:
+            if pixmap is not None or pending:
                 painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
                 # Centered on the footprint rect regardless of how far
                 # render_diameter has diverged from it (a young plant's icon
@@ -386,7 +415,22 @@ class CircleItem(RotationHandleMixin, ResizeHandlesMixin, GardenItemMixin, QGrap
                     render_diameter,
                     render_diameter,
                 )
-                painter.drawPixmap(draw_rect.toAlignedRect(), pixmap)
+                painter.save()
+                if pixmap is None:
+                    painter.setPen(Qt.PenStyle.NoPen)
+                    painter.setBrush(self.brush())
+                    painter.drawEllipse(draw_rect.adjusted(
+                        render_diameter * 0.1, render_diameter * 0.1,
+                        -render_diameter * 0.1, -render_diameter * 0.1,
+                    ))
+                else:
+                    rotation = plant_rotation_deg(str(self._item_id))
+                    if abs(rotation) > 0.5:
+                        painter.translate(center)
+                        painter.rotate(rotation)
+                        painter.translate(-center)
+                    painter.drawPixmap(draw_rect, pixmap, QRectF(pixmap.rect()))
+                painter.restore()
 
                 # Draw selection highlight
                 if self.isSelected():
@@ -480,10 +524,13 @@ class CircleItem(RotationHandleMixin, ResizeHandlesMixin, GardenItemMixin, QGrap
         if is_furniture_type(self.object_type):
             rect = self.rect()
             diameter = rect.width()
-            pixmap = render_furniture_pixmap(
+            lod = painter_lod(
+                painter, option.levelOfDetailFromTransform(painter.worldTransform())
+            )
+            pixmap = render_furniture_sprite(
                 object_type=self.object_type,
-                width=diameter,
-                height=diameter,
+                width_px=diameter * lod,
+                height_px=diameter * lod,
             )
             if pixmap is not None:
                 painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
@@ -17,8 +17,9 @@ from PyQt6.QtWidgets import (
 )
 
 from open_garden_planner.core.fill_patterns import FillPattern, create_pattern_brush
-from open_garden_planner.core.furniture_renderer import is_furniture_type, render_furniture_pixmap
+from open_garden_planner.core.furniture_renderer import is_furniture_type, render_furniture_sprite
 from open_garden_planner.core.object_types import ObjectType, StrokeStyle, get_style, is_bed_type
+from open_garden_planner.core.sprite_cache import painter_lod
 
 from .garden_item import GardenItemMixin
 from .resize_handle import RectVertexEditMixin, ResizeHandlesMixin, RotationHandleMixin
@@ -266,10 +267,15 @@ class RectangleItem(RectVertexEditMixin, RotationHandleMixin, ResizeHandlesMixin
 
         if is_furniture_type(self.object_type):
             rect = self.rect()
-            pixmap = render_furniture_pixmap(
+            # Mip-level sprite for the on-screen size (core/sprite_cache.py),
+            # scaled into the rect below.
+            lod = painter_lod(
+                painter, option.levelOfDetailFromTransform(painter.worldTransform())
+            )
+            pixmap = render_furniture_sprite(
                 object_type=self.object_type,
-                width=rect.width(),
-                height=rect.height(),
+                width_px=rect.width() * lod,
+                height_px=rect.height() * lod,
             )
             if pixmap is not None:
                 painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
@@ -0,0 +1,155 @@
+"""Background pre-rasterization of plant sprites for a freshly loaded plan.
+
+Opening a plan with hundreds of distinct species used to parse and render
+every species SVG on the GUI thread inside the first ``paint`` pass. The
+prerenderer instead collects the mip-level sprite keys the visible zoom
+needs (plain data, ``core/plant_renderer.plant_sprite_key``), marks them
+pending and splits them across a small pool of ``QThread`` workers that
+render into ``QImage`` — QImage painting is thread-safe, QPixmap is not, the
+same split ``sun_heatmap.py`` relies on. Until a sprite lands, ``CircleItem``
+paints a placeholder disc; when it does, the GUI thread adopts it into the
+sprite cache and repaints only the items waiting on that key.
+"""
+
+from __future__ import annotations
+
+import contextlib
+
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from PyQt6.QtGui import QImage
+from PyQt6.QtWidgets import QGraphicsItem, QGraphicsScene
+
+from open_garden_planner.core.plant_renderer import (
+    PlantSpriteKey,
+    clear_pending_plant_sprites,
+    mark_plant_sprites_pending,
+    plant_cache,
+    render_plant_image,
+    store_plant_sprite,
+)
+
+#: Upper bound on concurrent render threads (SVG parsing is CPU-bound).
+MAX_WORKERS = 4
+
+
+class SpriteRenderWorker(QThread):
+    """Renders a list of sprite keys into QImages (plain-data inputs)."""
+
+    sprite_ready = pyqtSignal(int, object, object)  # generation, key, QImage | None
+
+    def __init__(
+        self,
+        keys: list[PlantSpriteKey],
+        generation: int,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._keys = keys
+        self._generation = generation
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def run(self) -> None:  # worker thread
+        for key in self._keys:
+            if self._cancelled:
+                return
+            self.sprite_ready.emit(self._generation, key, render_plant_image(key))
+
+
+class SpritePrerenderer(QObject):
+    """Owns the worker pool; one run per loaded scene (see module doc)."""
+
+    #: Emitted on the GUI thread once every queued sprite has landed.
+    finished = pyqtSignal()
+
+    def __init__(
+        self, parent: QObject | None = None, max_workers: int = MAX_WORKERS
+    ) -> None:
+        super().__init__(parent)
+        self._max_workers = max(1, min(max_workers, QThread.idealThreadCount()))
+        self._workers: list[SpriteRenderWorker] = []
+        self._waiting: dict[PlantSpriteKey, list[QGraphicsItem]] = {}
+        self._generation = 0
+
+    @property
+    def pending_count(self) -> int:
+        """Sprites queued but not yet delivered."""
+        return len(self._waiting)
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._waiting)
+
+    def prerender_scene(self, scene: QGraphicsScene, lod: float) -> int:
+        """Queue every uncached plant sprite ``scene`` needs at scale ``lod``.
+
+        Cancels a previous run. Returns the number of sprites queued.
+        """
+        self.cancel()
+        cache = plant_cache()
+        waiting: dict[PlantSpriteKey, list[QGraphicsItem]] = {}
+        for item in scene.items():
+            key_for = getattr(item, "plant_sprite_key", None)
+            if key_for is None:
+                continue
+            key = key_for(lod)
+            if key is not None and key not in cache:
+                waiting.setdefault(key, []).append(item)
+        if not waiting:
+            return 0
+        self._waiting = waiting
+        mark_plant_sprites_pending(waiting)
+        keys = list(waiting)
+        count = min(self._max_workers, len(keys))
+        for index in range(count):
+            worker = SpriteRenderWorker(keys[index::count], self._generation, self)
+            worker.sprite_ready.connect(self._on_sprite_ready)
+            worker.finished.connect(self._on_worker_finished)
+            self._workers.append(worker)
+            worker.start()
+        return len(keys)
+
+    def cancel(self, timeout_ms: int = 3000) -> None:
+        """Stop and join the pool; pending items fall back to synchronous
+        rendering on their next paint."""
+        self._generation += 1
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            with contextlib.suppress(RuntimeError):  # already deleted
+                worker.cancel()
+                worker.wait(timeout_ms)
+        stranded = list(self._waiting.values())
+        self._waiting = {}
+        clear_pending_plant_sprites()
+        for items in stranded:
+            self._update_items(items)
+
+    def shutdown(self, timeout_ms: int = 3000) -> None:
+        """Cancel + join the workers — call before teardown (#230)."""
+        self.cancel(timeout_ms)
+
+    def _on_sprite_ready(
+        self, generation: int, key: PlantSpriteKey, image: QImage | None
+    ) -> None:  # GUI thread
+        if generation != self._generation:
+            return  # a cancelled run
+        store_plant_sprite(key, image)
+        self._update_items(self._waiting.pop(key, []))
+        if not self._waiting:
+            clear_pending_plant_sprites()
+            self.finished.emit()
+
+    def _on_worker_finished(self) -> None:  # GUI thread
+        worker = self.sender()
+        if worker in self._workers:
+            self._workers.remove(worker)
+        if worker is not None:
+            worker.deleteLater()
+
+    @staticmethod
+    def _update_items(items: list[QGraphicsItem]) -> None:
+        for item in items:
+            with contextlib.suppress(RuntimeError):  # #230: item deleted meanwhile
+                item.update()
@@ -0,0 +1,307 @@
+"""Offscreen tile cache for the static layers of the canvas.
+
+Every viewport repaint used to redraw the background photo, textured beds,
+paths and fences underneath whatever changed — dragging one plant across
+a plan repainted all of them on every mouse move. Content that cannot take
+part in an interaction is now rasterized once per zoom level into
+device-pixel tiles and blitted under the live items:
+
+- **Static items** are top-level garden items and background images that
+  are not movable (a locked layer, a locked image), not selected, and
+  stacked below every live item — compositing the cache *under* the live
+  pass must not change the z-order. Membership is re-derived when items
+  are added or removed, and when layers, the selection or the undo stack
+  change — not on every ``scene.changed``, which fires per drag frame.
+- A static item stays in the scene, selectable and hit-testable as before;
+  only its *view* paint is skipped, by a ``_CachedLayerEffect`` that draws
+  nothing into this view's viewport. Exports, printing and the minimap
+  paint on other devices and keep drawing it.
+- **Tiles** are ``TILE_PX`` device pixels, aligned to the scene origin so
+  scrolling reuses them; any change of zoom, rotation or device pixel
+  ratio starts a fresh set. Tiles live in a byte-bounded LRU
+  (``SpriteCache``), so panning across a large property does not keep every
+  tile ever rendered. ``scene.changed`` invalidates exactly the tiles its
+  rects touch (each rect is mapped to a tile index range) — but while a mouse interaction is in progress those
+  rects are only collected and applied on release: the static layer is by
+  definition not part of the interaction, so the live items move over an
+  unchanged cache.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+
+from PyQt6.QtCore import QObject, QPointF, QRectF, Qt, QTimer
+from PyQt6.QtGui import QPainter, QPixmap, QTransform
+from PyQt6.QtWidgets import (
+    QGraphicsEffect,
+    QGraphicsItem,
+    QGraphicsScene,
+    QGraphicsView,
+    QStyleOptionGraphicsItem,
+)
+
+from open_garden_planner.core.sprite_cache import SpriteCache
+
+#: Edge length of one cache tile, logical (device-independent) pixels.
+TILE_PX = 256
+
+#: Tile bytes kept per view: the tiles of a 4K HiDPI viewport, twice over.
+MAX_TILE_BYTES = 128 * 1024 * 1024
+
+_GIF = QGraphicsItem.GraphicsItemFlag
+
+
+class _CachedLayerEffect(QGraphicsEffect):
+    """Skips an item's paint into one viewport (it comes from the tiles)."""
+
+    def __init__(self, viewport: object) -> None:
+        super().__init__()
+        self._viewport = viewport
+
+    def draw(self, painter: QPainter) -> None:
+        if painter.device() is self._viewport:
+            return
+        self.drawSource(painter)
+
+
+def _paint_tree(
+    painter: QPainter, item: QGraphicsItem, base: QTransform, option: QStyleOptionGraphicsItem
+) -> None:
+    """Paint ``item`` and its children the way the scene would, on ``base``."""
+    if not item.isVisible():
+        return
+    flags = item.flags()
+    children = item.childItems()  # stacking order
+    behind = [
+        c for c in children
+        if c.zValue() < 0 or c.flags() & _GIF.ItemStacksBehindParent
+    ]
+    painter.save()
+    if flags & _GIF.ItemClipsChildrenToShape:
+        painter.setTransform(item.deviceTransform(base))
+        painter.setClipPath(item.shape(), Qt.ClipOperation.IntersectClip)
+    for child in behind:
+        _paint_tree(painter, child, base, option)
+    painter.save()
+    painter.setTransform(item.deviceTransform(base))
+    painter.setOpacity(item.effectiveOpacity())
+    if flags & _GIF.ItemClipsToShape:
+        painter.setClipPath(item.shape(), Qt.ClipOperation.IntersectClip)
+    option.exposedRect = item.boundingRect()
+    item.paint(painter, option, None)
+    painter.restore()
+    for child in children:
+        if child not in behind:
+            _paint_tree(painter, child, base, option)
+    painter.restore()
+
+
+class StaticLayerCache(QObject):
+    """Tiles of the static layer of one ``CanvasView`` (see module doc)."""
+
+    def __init__(self, view: QGraphicsView, scene: QGraphicsScene) -> None:
+        super().__init__(view)
+        self._view = view
+        self._scene = scene
+        self._enabled = True
+        self._static: set[QGraphicsItem] = set()
+        self._tiles = SpriteCache(MAX_TILE_BYTES)
+        self._key: tuple[float, ...] | None = None
+        self._interacting = False
+        self._deferred: list[QRectF] = []
+        # Membership changes come in bursts (a paste adds items one by one).
+        self._membership_timer = QTimer(self)
+        self._membership_timer.setSingleShot(True)
+        self._membership_timer.setInterval(0)
+        self._membership_timer.timeout.connect(self.refresh_membership)
+        scene.changed.connect(self._on_scene_changed)
+        scene.selectionChanged.connect(self.refresh_membership)
+        #: Instruments for tests and profiling.
+        self.tiles_rendered = 0
+        self.last_tiles_drawn = 0
+
+    # ── state ──────────────────────────────────────────────────
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def set_enabled(self, enabled: bool) -> None:
+        if enabled == self._enabled:
+            return
+        self._enabled = enabled
+        if enabled:
+            self.refresh_membership()
+        else:
+            self._set_static(set())
+            self._tiles.clear()
+        self._view.viewport().update()
+
+    @property
+    def static_items(self) -> frozenset[QGraphicsItem]:
+        return frozenset(self._static)
+
+    @property
+    def tile_count(self) -> int:
+        return len(self._tiles)
+
+    def schedule_membership_refresh(self) -> None:
+        """Re-derive the static set on the next event-loop turn."""
+        self._membership_timer.start()
+
+    def begin_interaction(self) -> None:
+        """Mouse pressed: defer ``scene.changed`` invalidation until release."""
+        self._interacting = True
+
+    def end_interaction(self) -> None:
+        self._interacting = False
+        deferred, self._deferred = self._deferred, []
+        self.invalidate_rects(deferred)
+
+    def invalidate(self) -> None:
+        """Drop every tile (theme change, global display toggles)."""
+        self._tiles.clear()
+
+    def invalidate_rects(self, rects: Iterable[QRectF]) -> None:
+        """Drop the tiles touched by scene ``rects``."""
+        if not self._tiles or self._key is None:
+            return
+        _origin, to_tiles = self._frame()
+        for rect in rects:
+            if not self._tiles:
+                return
+            if rect.isNull():
+                self._tiles.clear()
+                return
+            device = to_tiles.mapRect(rect).adjusted(-1, -1, 1, 1)
+            i0, i1 = math.floor(device.left() / TILE_PX), math.ceil(device.right() / TILE_PX)
+            j0, j1 = math.floor(device.top() / TILE_PX), math.ceil(device.bottom() / TILE_PX)
+            if (i1 - i0) * (j1 - j0) <= len(self._tiles):
+                for j in range(j0, j1):
+                    for i in range(i0, i1):
+                        self._tiles.discard((i, j))
+            else:  # a huge rect (zoomed in): fewer tiles than indices
+                for i, j in self._tiles.keys():
+                    if i0 <= i < i1 and j0 <= j < j1:
+                        self._tiles.discard((i, j))
+
+    # ── membership ─────────────────────────────────────────────
+
+    @staticmethod
+    def _is_candidate(item: QGraphicsItem) -> bool:
+        from open_garden_planner.ui.canvas.items import BackgroundImageItem
+        from open_garden_planner.ui.canvas.items.garden_item import GardenItemMixin
+
+        return (
+            isinstance(item, (GardenItemMixin, BackgroundImageItem))
+            and item.isVisible()
+            and not item.flags() & _GIF.ItemIsMovable
+            and not item.flags() & _GIF.ItemIgnoresTransformations
+            and not item.isSelected()
+            and (item.graphicsEffect() is None
+                 or isinstance(item.graphicsEffect(), _CachedLayerEffect))
+        )
+
+    def refresh_membership(self) -> None:
+        """Recompute which items are static (see module doc)."""
+        if not self._enabled:
+            return
+        candidates: list[QGraphicsItem] = []
+        live_min_z = math.inf
+        for item in self._scene.items():
+            if item.parentItem() is not None or not item.isVisible():
+                continue
+            if self._is_candidate(item):
+                candidates.append(item)
+            else:
+                live_min_z = min(live_min_z, item.zValue())
+        self._set_static({item for item in candidates if item.zValue() < live_min_z})
+
+    def _set_static(self, static: set[QGraphicsItem]) -> None:
+        leaving = self._static - static
+        entering = static - self._static
+        if not leaving and not entering:
+            return
+        viewport = self._view.viewport()
+        changed: list[QRectF] = []
+        for item in leaving:
+            try:
+                changed.append(item.sceneBoundingRect())
+                if isinstance(item.graphicsEffect(), _CachedLayerEffect):
+                    item.setGraphicsEffect(None)
+            except RuntimeError:  # #230: deleted with the scene
+                changed.append(QRectF())
+        for item in entering:
+            item.setGraphicsEffect(_CachedLayerEffect(viewport))
+            changed.append(item.sceneBoundingRect())
+        self._static = static
+        self.invalidate_rects(changed)
+
+    def _on_scene_changed(self, rects: list[QRectF]) -> None:
+        if self._interacting:
+            self._deferred.extend(rects)
+            return
+        self.invalidate_rects(rects)
+
+    # ── painting ───────────────────────────────────────────────
+
+    def _frame(self) -> tuple[QPointF, QTransform]:
+        """Integer device position of the scene origin, and scene → tile
+        space (the view transform with that position removed)."""
+        transform = self._view.viewportTransform()
+        anchor = transform.map(QPointF(0.0, 0.0))
+        origin = QPointF(round(anchor.x()), round(anchor.y()))
+        return origin, transform * QTransform.fromTranslate(-origin.x(), -origin.y())
+
+    def paint(self, painter: QPainter, rect: QRectF) -> None:
+        """Composite the static tiles covering scene ``rect`` (drawBackground)."""
+        self.last_tiles_drawn = 0
+        if not self._enabled or not self._static:
+            return
+        origin, to_tiles = self._frame()
+        ratio = self._view.viewport().devicePixelRatioF()
+        key = (
+            to_tiles.m11(), to_tiles.m12(), to_tiles.m21(), to_tiles.m22(),
+            to_tiles.dx(), to_tiles.dy(), ratio,
+        )
+        if key != self._key:
+            self._tiles.clear()
+            self._key = key
+        device = to_tiles.mapRect(rect)
+        i0, i1 = math.floor(device.left() / TILE_PX), math.ceil(device.right() / TILE_PX)
+        j0, j1 = math.floor(device.top() / TILE_PX), math.ceil(device.bottom() / TILE_PX)
+        painter.save()
+        painter.setWorldTransform(QTransform.fromTranslate(origin.x(), origin.y()))
+        for j in range(j0, j1):
+            for i in range(i0, i1):
+                tile = self._tiles.get((i, j))
+                if tile is None:
+                    tile = self._render_tile(i, j, to_tiles, ratio)
+                    self._tiles.put((i, j), tile)
+                painter.drawPixmap(QPointF(i * TILE_PX, j * TILE_PX), tile)
+                self.last_tiles_drawn += 1
+        painter.restore()
+
+    def _render_tile(self, i: int, j: int, to_tiles: QTransform, ratio: float) -> QPixmap:
+        side = math.ceil(TILE_PX * ratio)
+        tile = QPixmap(side, side)
+        tile.setDevicePixelRatio(ratio)
+        tile.fill(Qt.GlobalColor.transparent)
+        base = to_tiles * QTransform.fromTranslate(-i * TILE_PX, -j * TILE_PX)
+        inverse, _ok = base.inverted()
+        scene_rect = inverse.mapRect(QRectF(0, 0, TILE_PX, TILE_PX))
+        painter = QPainter(tile)
+        painter.setRenderHints(self._view.renderHints())
+        option = QStyleOptionGraphicsItem()
+        for item in self._scene.items(
+            scene_rect,
+            Qt.ItemSelectionMode.IntersectsItemBoundingRect,
+            Qt.SortOrder.AscendingOrder,
+        ):
+            if item in self._static:
+                _paint_tree(painter, item, base, option)
+        painter.end()
+        self.tiles_rendered += 1
+        return tile
@@ -58,10 +58,13 @@ from open_garden_planner.core.heatmap_render import (
     sun_fraction,
 )
 from open_garden_planner.core.shade_aggregation import (
+    ADAPTIVE_TILE_CELLS,
     GRID_CELL_CM,
     SAMPLE_STEP_MINUTES,
+    AdaptiveHeatmap,
     HeatmapGrid,
     compute_heatmap,
+    compute_heatmap_adaptive,
     daylight_samples,
 )
 from open_garden_planner.core.shadow_geometry import Polygon
@@ -130,10 +133,13 @@ def rasterize_polygons_qimage(
 
 
 def build_heatmap_image(
-    sun_minutes: np.ndarray, daylight_minutes: float
+    sun_minutes: np.ndarray | AdaptiveHeatmap, daylight_minutes: float
 ) -> QImage:
     """Continuous cool→warm ARGB image, one pixel per grid cell (GUI thread).
 
+    Accepts the uniform minutes array or an ``AdaptiveHeatmap`` (expanded to
+    the fine grid by ``sun_fraction``'s ``np.asarray``).
+
     Each cell's sun-minutes are normalized against the day's daylight duration
     and mapped through the shared sun ramp LUT (single source of truth for the
     tints). The overlay draws this with SmoothTransformation, so the coarse grid
@@ -165,7 +171,7 @@ class HeatmapWorker(QThread):
     """Computes one day's heatmap off the GUI thread (plain-data inputs)."""
 
     progress = pyqtSignal(int, int)
-    success = pyqtSignal(object)  # np.ndarray sun-minutes
+    success = pyqtSignal(object)  # np.ndarray | AdaptiveHeatmap sun-minutes
 
     def __init__(
         self,
@@ -175,6 +181,7 @@ class HeatmapWorker(QThread):
         day: date,
         grid: HeatmapGrid,
         parent: QObject | None = None,
+        tile_cells: int | None = ADAPTIVE_TILE_CELLS,
     ) -> None:
         super().__init__(parent)
         self._casters = casters
@@ -182,22 +189,33 @@ class HeatmapWorker(QThread):
         self._lon = lon_deg
         self._day = day
         self._grid = grid
+        #: None = uniform grid; otherwise adaptive with this tile edge.
+        self._tile_cells = tile_cells
         self._cancelled = False
 
     def cancel(self) -> None:
         self._cancelled = True
 
     def run(self) -> None:  # worker thread
-        minutes = compute_heatmap(
+        args = (
             self._casters,
             self._lat,
             self._lon,
             self._day,
             self._grid,
             rasterize_polygons_qimage,
-            progress=lambda done, total: self.progress.emit(done, total),
-            should_cancel=lambda: self._cancelled,
         )
+        callbacks: dict[str, Any] = {
+            "progress": lambda done, total: self.progress.emit(done, total),
+            "should_cancel": lambda: self._cancelled,
+        }
+        minutes: np.ndarray | AdaptiveHeatmap | None
+        if self._tile_cells is None:
+            minutes = compute_heatmap(*args, **callbacks)
+        else:
+            minutes = compute_heatmap_adaptive(
+                *args, tile_cells=self._tile_cells, **callbacks
+            )
         if minutes is not None and not self._cancelled:
             self.success.emit(minutes)
 
@@ -232,8 +250,11 @@ class SunHeatmapController(QObject):
         self._computed_day: date | None = None
         #: Test instrument — number of worker launches.
         self.run_count = 0
-        #: Last computed minutes grid (tests / future tooltips).
+        #: Last computed minutes grid, expanded to the fine grid (tests /
+        #: future tooltips).
         self.last_minutes: np.ndarray | None = None
+        #: Last raw worker result — an ``AdaptiveHeatmap`` in adaptive mode.
+        self.last_result: np.ndarray | AdaptiveHeatmap | None = None
         #: Grid of the last launch (cell lookup for tests / tooltips).
         self.last_grid: HeatmapGrid | None = None
         #: Runtime-only contour lines + hour labels (rebuilt on each success).
@@ -255,10 +276,20 @@ class SunHeatmapController(QObject):
         overlay = self._alive_overlay()
         return overlay is not None and overlay.isVisible()
 
-    def run_for_day(self, day: date, cell_cm: float = GRID_CELL_CM) -> bool:
+    def run_for_day(
+        self,
+        day: date,
+        cell_cm: float = GRID_CELL_CM,
+        *,
+        adaptive: bool = True,
+    ) -> bool:
         """Snapshot the scene and launch the worker. False if it can't run
         (no location / already running — incl. a just-cancelled worker still
-        winding down; the button re-enables on its ``finished``)."""
+        winding down; the button re-enables on its ``finished``).
+
+        ``adaptive`` (default) computes tiles coarse-first and refines only
+        those a shadow boundary crosses; ``False`` forces the uniform grid.
+        """
         if self.is_running:
             return False
         location = self._location_provider()
@@ -287,7 +318,15 @@ class SunHeatmapController(QObject):
         # date — near midnight the two can name different days, immaterial to a
         # decade-scale linear curve but why they are not the same call.
         casters = collect_shadow_casters(self._scene, at_date=day)
-        worker = HeatmapWorker(casters, latitude, longitude, day, grid, self)
+        worker = HeatmapWorker(
+            casters,
+            latitude,
+            longitude,
+            day,
+            grid,
+            self,
+            tile_cells=ADAPTIVE_TILE_CELLS if adaptive else None,
+        )
         worker.progress.connect(self.progress)
         worker.success.connect(self._on_success)
         worker.finished.connect(self._on_worker_finished)
@@ -331,12 +370,16 @@ class SunHeatmapController(QObject):
 
     # ── internals ──────────────────────────────────────────────
 
-    def _on_success(self, minutes: np.ndarray) -> None:  # GUI thread
+    def _on_success(
+        self, result: np.ndarray | AdaptiveHeatmap
+    ) -> None:  # GUI thread
         grid = self._grid
         # A clear() may land between the worker's success emission and this
         # queued slot — the result is no longer wanted, don't paint it.
         if grid is None or not getattr(self, "_result_wanted", True):
             return
+        self.last_result = result
+        minutes = np.asarray(result, dtype=np.float32)
         self.last_minutes = minutes
         image = build_heatmap_image(minutes, self._daylight_minutes)
         overlay = self._ensure_overlay()
@@ -8,9 +8,18 @@ Design constraints (campaign fences):
 
 - Shadows are PRECOMPUTED here — never in ``paint()``. Scene changes are
   debounced (150 ms, the companion/spacing precedent) and a snapshot key
-  (sun position + caster geometry) skips rebuilds when nothing relevant
+  (sun bucket + caster-set version) skips rebuilds when nothing relevant
   changed — this also breaks the feedback loop where the overlay's own
   ``setPath`` re-fires ``QGraphicsScene.changed``.
+- Geometry goes through a ``core/shadow_engine.ShadowEngine``: casters are
+  tracked by item id + a cheap local-geometry revision, and per-caster sweeps
+  and per-component unions are memoized per sun bucket, so scrubbing the
+  time slider back and forth over a large plan reuses earlier work.
+- Playback (the Animate button) precomputes a whole day's frames on a
+  ``ShadowFrameWorker`` thread into a per-sun-bucket frame cache; a tick whose
+  frame is ready is a dictionary lookup, one that is not falls back to the
+  synchronous engine path. The worker gets a plain-data caster snapshot and
+  builds only ``QPainterPath`` values (reentrant) — never touching the scene.
 - The overlay is NEVER serialized: ``project._serialize_item`` whitelists
   item classes, and the integration test pins that a save/load round-trip
   carries no overlay (the #219 lesson: runtime visuals must not perturb
@@ -30,11 +39,12 @@ from __future__ import annotations
 
 import contextlib
 import math
-from collections.abc import Callable
-from datetime import UTC, date, datetime
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from datetime import UTC, date, datetime, timedelta
 from typing import Any
 
-from PyQt6.QtCore import QObject, QPointF, QRectF, Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import QObject, QPointF, QRectF, Qt, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QBrush, QColor, QPainter, QPainterPath, QPen, QPolygonF
 from PyQt6.QtWidgets import (
     QGraphicsPathItem,
@@ -44,11 +54,15 @@ from PyQt6.QtWidgets import (
 )
 
 from open_garden_planner.core.object_height import effective_height_cm
+from open_garden_planner.core.shadow_engine import (
+    ANGLE_BUCKET_DEG,
+    CasterEntry,
+    ShadowEngine,
+)
 from open_garden_planner.core.shadow_geometry import (
     MIN_SUN_ELEVATION_DEG,
     Polygon,
     circle_footprint,
-    compute_scene_shadows,
     polyline_footprint,
 )
 from open_garden_planner.core.solar import solar_position
@@ -82,6 +96,9 @@ _FEATHER_MAX_WIDTH = 14.0
 _DEBOUNCE_MS = 150
 _ELLIPSE_SEGMENTS = 24
 
+#: Precomputed playback frames kept (LRU) — a full day at one-minute steps.
+_MAX_FRAMES = 24 * 60
+
 
 def _build_feather_pens() -> tuple[QPen, ...]:
     """The feather strokes are constant — build them once, not every paint()."""
@@ -295,6 +312,70 @@ def _item_footprints(item: Any, at_date: date | None = None) -> list[Polygon]:
     return []
 
 
+def _item_revision(item: Any, at_date: date | None) -> tuple[Any, ...]:
+    """Cheap token that changes whenever the item's shadow footprint can.
+
+    Built from what the item OWNS — its scene transform and local geometry
+    parameters — without mapping a single vertex or touching pyclipper, so
+    an unchanged plan costs one tuple compare per caster.
+    """
+    from open_garden_planner.ui.canvas.items.circle_item import CircleItem
+    from open_garden_planner.ui.canvas.items.polygon_item import PolygonItem
+    from open_garden_planner.ui.canvas.items.polyline_item import PolylineItem
+
+    t = item.sceneTransform()
+    token: tuple[Any, ...] = (t.m11(), t.m12(), t.m21(), t.m22(), t.dx(), t.dy())
+    if isinstance(item, CircleItem):
+        center = item.center
+        return (
+            *token,
+            center.x(),
+            center.y(),
+            item.radius,
+            _plant_canopy_radius_cm(item, at_date),
+        )
+    if isinstance(item, PolygonItem):
+        polygon = item.polygon()
+        return (*token, *((polygon.at(i).x(), polygon.at(i).y()) for i in range(polygon.count())))
+    if isinstance(item, PolylineItem):
+        return (*token, item.pen().widthF(), *((p.x(), p.y()) for p in item.points))
+    rect = getattr(item, "rect", None)
+    if callable(rect):
+        r = rect()
+        return (*token, r.x(), r.y(), r.width(), r.height())
+    return token
+
+
+def collect_shadow_caster_entries(
+    scene: QGraphicsScene,
+    at_date: date | None = None,
+) -> list[CasterEntry]:
+    """``ShadowEngine.sync`` entries for every visible item with a height.
+
+    Each entry is ``(item id, revision, build)``; ``build`` maps the item's
+    footprints only when the engine has no matching revision cached.
+    """
+    entries: list[CasterEntry] = []
+    for item in scene.items():
+        if not item.isVisible():
+            continue
+        object_type = getattr(item, "object_type", None)
+        if object_type is None:
+            continue
+        height = effective_height_cm(
+            object_type, getattr(item, "metadata", None), at_date=at_date
+        )
+        if height is None:
+            continue
+
+        def build(item: Any = item, height: float = height) -> list[tuple[Polygon, float]]:
+            return [(fp, height) for fp in _item_footprints(item, at_date)]
+
+        key = getattr(item, "item_id", None) or id(item)
+        entries.append((key, (height, *_item_revision(item, at_date)), build))
+    return entries
+
+
 def collect_shadow_casters(
     scene: QGraphicsScene,
     at_date: date | None = None,
@@ -323,6 +404,74 @@ def collect_shadow_casters(
     return casters
 
 
+def shadow_path(polygons: Sequence[Polygon]) -> QPainterPath:
+    """Odd-even ``QPainterPath`` of unioned shadow polygons (any thread)."""
+    path = QPainterPath()
+    path.setFillRule(Qt.FillRule.OddEvenFill)
+    for polygon in polygons:
+        path.addPolygon(QPolygonF([QPointF(x, y) for x, y in polygon]))
+        path.closeSubpath()
+    return path
+
+
+def day_instants(start: datetime, step_minutes: int) -> list[datetime]:
+    """Playback instants over one day, starting at ``start`` and wrapping.
+
+    Ordered from ``start`` forward so the frames the animation reaches first
+    are computed first; every step of the day appears exactly once.
+    """
+    midnight = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    step = max(1, step_minutes)
+    first = (start.hour * 60 + start.minute) // step
+    count = (24 * 60 + step - 1) // step
+    return [
+        midnight + timedelta(minutes=((first + i) % count) * step)
+        for i in range(count)
+    ]
+
+
+class ShadowFrameWorker(QThread):
+    """Precomputes shadow frames off the GUI thread (plain-data inputs).
+
+    Owns a private ``ShadowEngine`` over a caster snapshot and emits one
+    ``QPainterPath`` per sun bucket, tagged with the GUI engine version the
+    snapshot was taken at so the controller can drop stale frames.
+    """
+
+    frame_ready = pyqtSignal(int, object, object)  # version, bucket, path
+
+    def __init__(
+        self,
+        casters: list[tuple[Polygon, float]],
+        buckets: list[tuple[tuple[int, int], float, float]],
+        version: int,
+        bucket_deg: float,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._casters = casters
+        self._buckets = buckets
+        self._version = version
+        self._bucket_deg = bucket_deg
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def run(self) -> None:  # worker thread
+        # Every bucket is visited once, so the private engine keeps only one.
+        engine = ShadowEngine(bucket_deg=self._bucket_deg, max_buckets=1)
+        engine.sync(
+            (index, 0, lambda caster=caster: [caster])
+            for index, caster in enumerate(self._casters)
+        )
+        for bucket, elevation, azimuth in self._buckets:
+            if self._cancelled:
+                return
+            path = shadow_path(engine.shadows(elevation, azimuth))
+            self.frame_ready.emit(self._version, bucket, path)
+
+
 class SunShadowController(QObject):
     """Computes and paints the unioned solar shadow overlay.
 
@@ -347,8 +496,17 @@ class SunShadowController(QObject):
         self._overlay: SunShadowOverlayItem | None = None
         self._state = STATE_DISABLED
         self._last_key: tuple[Any, ...] | None = None
+        self._engine = ShadowEngine()
+        #: Playback frame cache: sun bucket -> path, valid for one engine
+        #: version (any caster edit invalidates every frame).
+        self._frames: OrderedDict[tuple[int, int], QPainterPath] = OrderedDict()
+        self._frames_version = -1
+        self._frame_worker: ShadowFrameWorker | None = None
+        self._playback_instants: list[datetime] = []
         #: Effective overlay rebuilds — the #206-style recompute instrument.
         self.recompute_count = 0
+        #: Rebuilds served from the precomputed frame cache.
+        self.frame_hits = 0
         self._debounce = QTimer(self)
         self._debounce.setSingleShot(True)
         self._debounce.setInterval(_DEBOUNCE_MS)
@@ -369,6 +527,15 @@ class SunShadowController(QObject):
     def sim_datetime_utc(self) -> datetime:
         return self._sim_dt_utc
 
+    @property
+    def is_precomputing(self) -> bool:
+        worker = self._frame_worker
+        return worker is not None and worker.isRunning()
+
+    def cached_frame_count(self) -> int:
+        """Frames ready for the current caster set."""
+        return len(self._frames) if self._frames_version == self._engine.version else 0
+
     def set_enabled(self, enabled: bool) -> None:
         if enabled == self._enabled:
             return
@@ -376,9 +543,32 @@ class SunShadowController(QObject):
         if enabled:
             self.recompute_now()
         else:
+            self.stop_playback()
             self._clear_overlay()
             self._set_state(STATE_DISABLED)
 
+    def start_playback(self, instants: Sequence[datetime]) -> bool:
+        """Precompute frames for ``instants`` (timezone-aware) in the background.
+
+        The caller keeps driving ``set_sim_datetime`` at its own steady rate
+        (the toolbar's animation timer); ready frames are served from the
+        cache, missing ones computed on demand. Caster edits during playback
+        restart the precompute for the new geometry. False if it can't run
+        (disabled / no location).
+        """
+        self._playback_instants = list(instants)
+        return self._start_precompute()
+
+    def stop_playback(self) -> None:
+        """Stop precomputing; already cached frames stay valid until an edit."""
+        self._playback_instants = []
+        self._cancel_frame_worker()
+
+    def shutdown(self, timeout_ms: int = 3000) -> None:
+        """Cancel + join the frame worker — call before teardown (#230)."""
+        self._playback_instants = []
+        self._cancel_frame_worker(timeout_ms)
+
     def set_sim_datetime(self, dt: datetime) -> None:
         """Set the simulated instant (timezone-aware; stored as UTC)."""
         if dt.tzinfo is None:
@@ -415,32 +605,31 @@ class SunShadowController(QObject):
             return
         # US-E8: the sim instant doubles as the growth timeline — dated
         # plants cast their date-projected (grown) shadows.
-        casters = collect_shadow_casters(
-            self._scene, at_date=self._sim_dt_utc.date()
+        changed = self._engine.sync(
+            collect_shadow_caster_entries(
+                self._scene, at_date=self._sim_dt_utc.date()
+            )
         )
+        if changed and self._playback_instants:
+            self._start_precompute(synced=True)
         canvas_key = (
             (round(canvas_rect.width(), 3), round(canvas_rect.height(), 3))
             if canvas_rect is not None
             else None
         )
-        key = (
-            round(position.elevation_deg, 4),
-            round(position.azimuth_deg, 4),
-            canvas_key,
-            tuple((tuple(fp), h) for fp, h in casters),
-        )
+        bucket = self._engine.bucket(position.elevation_deg, position.azimuth_deg)
+        key = (bucket, canvas_key, self._engine.version)
         overlay = self._alive_overlay()
         if key == self._last_key and overlay is not None and overlay.isVisible():
             self._set_state(STATE_ACTIVE)
             return
-        polygons = compute_scene_shadows(
-            casters, position.elevation_deg, position.azimuth_deg
-        )
-        path = QPainterPath()
-        path.setFillRule(Qt.FillRule.OddEvenFill)
-        for polygon in polygons:
-            path.addPolygon(QPolygonF([QPointF(x, y) for x, y in polygon]))
-            path.closeSubpath()
+        path = self._cached_frame(bucket)
+        if path is None:
+            path = shadow_path(
+                self._engine.shadows(position.elevation_deg, position.azimuth_deg)
+            )
+        else:
+            self.frame_hits += 1
         overlay = self._ensure_overlay()
         overlay.set_clip_rect(canvas_rect)
         overlay.set_shadow_path(path)
@@ -454,6 +643,88 @@ class SunShadowController(QObject):
     def _on_scene_changed(self, _regions: list | None = None) -> None:
         self.schedule_recompute()
 
+    def _start_precompute(self, *, synced: bool = False) -> bool:
+        """(Re)launch the frame worker for the pending playback instants.
+
+        ``synced``: the engine was just synced for the current sim date.
+        """
+        self._cancel_frame_worker()
+        if not self._enabled or not self._playback_instants:
+            return False
+        location = self._location_provider()
+        latitude = location.get("latitude") if isinstance(location, dict) else None
+        longitude = location.get("longitude") if isinstance(location, dict) else None
+        if latitude is None or longitude is None:
+            return False
+        at_date = self._sim_dt_utc.date()
+        if not synced:
+            self._engine.sync(
+                collect_shadow_caster_entries(self._scene, at_date=at_date)
+            )
+        version = self._engine.version
+        if self._frames_version != version:
+            self._frames.clear()
+            self._frames_version = version
+        buckets: list[tuple[tuple[int, int], float, float]] = []
+        seen: set[tuple[int, int]] = set()
+        for instant in self._playback_instants:
+            position = solar_position(latitude, longitude, instant.astimezone(UTC))
+            if position.elevation_deg < MIN_SUN_ELEVATION_DEG:
+                continue  # night frames are the constant full-canvas fill
+            bucket = self._engine.bucket(position.elevation_deg, position.azimuth_deg)
+            if bucket in seen or bucket in self._frames:
+                continue
+            seen.add(bucket)
+            buckets.append((bucket, position.elevation_deg, position.azimuth_deg))
+        if not buckets:
+            return True
+        worker = ShadowFrameWorker(
+            collect_shadow_casters(self._scene, at_date=at_date),
+            buckets,
+            version,
+            ANGLE_BUCKET_DEG,
+            self,
+        )
+        worker.frame_ready.connect(self._on_frame_ready)
+        worker.finished.connect(self._on_frame_worker_finished)
+        self._frame_worker = worker
+        worker.start()
+        return True
+
+    def _cancel_frame_worker(self, timeout_ms: int = 3000) -> None:
+        """Cancel and join the frame worker. It checks the flag between
+        frames, so the join costs at most one frame's compute."""
+        worker = self._frame_worker
+        self._frame_worker = None
+        if worker is not None:
+            with contextlib.suppress(RuntimeError):  # already deleted
+                worker.cancel()
+                worker.wait(timeout_ms)
+
+    def _on_frame_worker_finished(self) -> None:  # GUI thread
+        worker = self.sender()
+        if worker is self._frame_worker:
+            self._frame_worker = None
+        if worker is not None:
+            worker.deleteLater()
+
+    def _on_frame_ready(
+        self, version: int, bucket: tuple[int, int], path: QPainterPath
+    ) -> None:  # GUI thread
+        if version != self._frames_version:
+            return  # snapshot predates a caster edit
+        self._frames[bucket] = path
+        while len(self._frames) > _MAX_FRAMES:
+            self._frames.popitem(last=False)
+
+    def _cached_frame(self, bucket: tuple[int, int]) -> QPainterPath | None:
+        if self._frames_version != self._engine.version:
+            return None
+        path = self._frames.get(bucket)
+        if path is not None:
+            self._frames.move_to_end(bucket)
+        return path
+
     def _alive_overlay(self) -> SunShadowOverlayItem | None:
         """The overlay if its C++ object still lives in our scene, else None.
 
@@ -1,29 +1,35 @@
-"""Dialog windows for user interactions."""
-
-from open_garden_planner.ui.dialogs.amendment_plan_dialog import AmendmentPlanDialog
-from open_garden_planner.ui.dialogs.calibration_dialog import CalibrationDialog
-from open_garden_planner.ui.dialogs.companion_check_dialog import CompanionCheckDialog
-from open_garden_planner.ui.dialogs.connect_ai_assistant_dialog import (
-    ConnectAiAssistantDialog,
-)
-from open_garden_planner.ui.dialogs.constraint_conflict_dialog import (
-    ConstraintConflictDialog,
-)
-from open_garden_planner.ui.dialogs.custom_plants_dialog import CustomPlantsDialog
-from open_garden_planner.ui.dialogs.grid_array_dialog import GridArrayDialog
-from open_garden_planner.ui.dialogs.harvest_log_dialog import HarvestLogDialog
-from open_garden_planner.ui.dialogs.linear_array_dialog import LinearArrayDialog
-from open_garden_planner.ui.dialogs.new_project_dialog import NewProjectDialog
-from open_garden_planner.ui.dialogs.pest_log_dialog import PestLogDialog
-from open_garden_planner.ui.dialogs.plant_search_dialog import PlantSearchDialog
-from open_garden_planner.ui.dialogs.preferences_dialog import PreferencesDialog
-from open_garden_planner.ui.dialogs.print_dialog import GardenPrintManager, PrintOptionsDialog
-from open_garden_planner.ui.dialogs.properties_dialog import PropertiesDialog
-from open_garden_planner.ui.dialogs.season_manager_dialog import SeasonManagerDialog
-from open_garden_planner.ui.dialogs.shopping_list_dialog import ShoppingListDialog
-from open_garden_planner.ui.dialogs.shortcuts_dialog import ShortcutsDialog
-from open_garden_planner.ui.dialogs.soil_test_dialog import SoilTestDialog
-from open_garden_planner.ui.dialogs.welcome_dialog import WelcomeDialog
+"""Dialog windows for user interactions.
+
+Each dialog module is imported on first access of its export, so startup
+only pays for the dialogs the main window actually builds.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from open_garden_planner.ui.dialogs.amendment_plan_dialog import AmendmentPlanDialog
+    from open_garden_planner.ui.dialogs.calibration_dialog import CalibrationDialog
+    from open_garden_planner.ui.dialogs.companion_check_dialog import CompanionCheckDialog
+    from open_garden_planner.ui.dialogs.connect_ai_assistant_dialog import ConnectAiAssistantDialog
+    from open_garden_planner.ui.dialogs.constraint_conflict_dialog import ConstraintConflictDialog
+    from open_garden_planner.ui.dialogs.custom_plants_dialog import CustomPlantsDialog
+    from open_garden_planner.ui.dialogs.grid_array_dialog import GridArrayDialog
+    from open_garden_planner.ui.dialogs.harvest_log_dialog import HarvestLogDialog
+    from open_garden_planner.ui.dialogs.linear_array_dialog import LinearArrayDialog
+    from open_garden_planner.ui.dialogs.new_project_dialog import NewProjectDialog
+    from open_garden_planner.ui.dialogs.pest_log_dialog import PestLogDialog
+    from open_garden_planner.ui.dialogs.plant_search_dialog import PlantSearchDialog
+    from open_garden_planner.ui.dialogs.preferences_dialog import PreferencesDialog
+    from open_garden_planner.ui.dialogs.print_dialog import GardenPrintManager, PrintOptionsDialog
+    from open_garden_planner.ui.dialogs.properties_dialog import PropertiesDialog
+    from open_garden_planner.ui.dialogs.season_manager_dialog import SeasonManagerDialog
+    from open_garden_planner.ui.dialogs.shopping_list_dialog import ShoppingListDialog
+    from open_garden_planner.ui.dialogs.shortcuts_dialog import ShortcutsDialog
+    from open_garden_planner.ui.dialogs.soil_test_dialog import SoilTestDialog
+    from open_garden_planner.ui.dialogs.welcome_dialog import WelcomeDialog
 
 __all__ = [
     "AmendmentPlanDialog",
@@ -48,3 +54,35 @@ __all__ = [
     "SoilTestDialog",
     "WelcomeDialog",
 ]
+
+_LAZY = {
+    "AmendmentPlanDialog": "amendment_plan_dialog",
+    "CalibrationDialog": "calibration_dialog",
+    "CompanionCheckDialog": "companion_check_dialog",
+    "ConnectAiAssistantDialog": "connect_ai_assistant_dialog",
+    "ConstraintConflictDialog": "constraint_conflict_dialog",
+    "CustomPlantsDialog": "custom_plants_dialog",
+    "GridArrayDialog": "grid_array_dialog",
+    "HarvestLogDialog": "harvest_log_dialog",
+    "LinearArrayDialog": "linear_array_dialog",
+    "NewProjectDialog": "new_project_dialog",
+    "PestLogDialog": "pest_log_dialog",
+    "PlantSearchDialog": "plant_search_dialog",
+    "PreferencesDialog": "preferences_dialog",
+    "GardenPrintManager": "print_dialog",
+    "PrintOptionsDialog": "print_dialog",
+    "PropertiesDialog": "properties_dialog",
+    "SeasonManagerDialog": "season_manager_dialog",
+    "ShoppingListDialog": "shopping_list_dialog",
+    "ShortcutsDialog": "shortcuts_dialog",
+    "SoilTestDialog": "soil_test_dialog",
+    "WelcomeDialog": "welcome_dialog",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the dialog module behind an export on first access."""
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f"{__name__}.{module}"), name)
@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
     QCheckBox,
     QDialog,
@@ -38,9 +38,14 @@ class DxfImportDialog(QDialog):
         self.setMinimumWidth(420)
 
         self._setup_ui()
-        # Defer layer parsing so the dialog (with its "Loading layers…"
-        # placeholder) is painted before ezdxf.readfile() blocks the UI thread.
-        QTimer.singleShot(0, self._load_layers)
+        # Layer names come from a scan of every entity; run it on a worker so
+        # a large survey does not freeze the dialog ("Loading layers…" shows).
+        from open_garden_planner.services.dxf_service import DxfLayerScanWorker
+
+        self._layer_scan = DxfLayerScanWorker(self._file_path, self)
+        self._layer_scan.layers_ready.connect(self._show_layers)
+        self._layer_scan.failed.connect(self._show_scan_error)
+        self._layer_scan.start()
 
     def _setup_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -65,6 +70,27 @@ class DxfImportDialog(QDialog):
         scale_form.addRow(self.tr("Scale (DXF units → cm):"), self._scale_spin)
         layout.addWidget(scale_group)
 
+        # Geometry reduction (large survey drawings)
+        geometry_group = QGroupBox(self.tr("Geometry"))
+        geometry_form = QFormLayout(geometry_group)
+        self._merge_lines_check = QCheckBox(self.tr("Merge connected lines into polylines"))
+        self._merge_lines_check.setChecked(False)
+        self._merge_lines_check.setToolTip(
+            self.tr("Join LINE entities that meet end to end into one object per chain.")
+        )
+        geometry_form.addRow(self._merge_lines_check)
+        self._simplify_spin = QDoubleSpinBox()
+        self._simplify_spin.setRange(0.0, 100.0)
+        self._simplify_spin.setValue(0.0)
+        self._simplify_spin.setDecimals(1)
+        self._simplify_spin.setSuffix(" cm")
+        self._simplify_spin.setSpecialValueText(self.tr("Off"))
+        self._simplify_spin.setToolTip(
+            self.tr("Drop polyline vertices that deviate less than this from the outline.")
+        )
+        geometry_form.addRow(self.tr("Simplify tolerance:"), self._simplify_spin)
+        layout.addWidget(geometry_group)
+
         # Layer selection
         self._layers_group = QGroupBox(self.tr("Layers to Import"))
         layers_outer = QVBoxLayout(self._layers_group)
@@ -101,15 +127,10 @@ class DxfImportDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
-    def _load_layers(self) -> None:
-        from open_garden_planner.services.dxf_service import DxfImportService
-
-        try:
-            layers = DxfImportService.get_dxf_layers(self._file_path)
-        except Exception as exc:
-            self._loading_label.setText(self.tr("Failed to read DXF: {error}").format(error=exc))
-            return
+    def _show_scan_error(self, error: str) -> None:
+        self._loading_label.setText(self.tr("Failed to read DXF: {error}").format(error=error))
 
+    def _show_layers(self, layers: list[str]) -> None:
         # Remove loading label
         self._loading_label.setParent(None)  # type: ignore[arg-type]
 
@@ -130,6 +151,11 @@ class DxfImportDialog(QDialog):
             self.tr("{n} layer(s) found.").format(n=len(layers))
         )
 
+    def done(self, result: int) -> None:
+        """Stop a layer scan still in flight before the dialog goes away."""
+        self._layer_scan.shutdown()
+        super().done(result)
+
     @property
     def scale_factor(self) -> float:
         """Scale factor to apply to DXF coordinates."""
@@ -141,3 +167,13 @@ class DxfImportDialog(QDialog):
         if not self._layer_checkboxes:
             return None
         return [name for name, cb in self._layer_checkboxes.items() if cb.isChecked()]
+
+    @property
+    def merge_lines(self) -> bool:
+        """Whether connected LINE entities are merged into polylines."""
+        return self._merge_lines_check.isChecked()
+
+    @property
+    def simplify_tolerance(self) -> float:
+        """Vertex simplification tolerance in cm (0 = off)."""
+        return self._simplify_spin.value()
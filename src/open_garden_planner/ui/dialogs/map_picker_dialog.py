@@ -10,6 +10,7 @@ background can be created with an exact pixel→meter scale.
 
 from __future__ import annotations
 
+import math
 from pathlib import Path
 
 from PyQt6.QtCore import (
@@ -20,6 +21,7 @@ from PyQt6.QtCore import (
     pyqtSignal,
     pyqtSlot,
 )
+from PyQt6.QtGui import QImage, QPixmap
 from PyQt6.QtWebChannel import QWebChannel
 from PyQt6.QtWebEngineCore import QWebEngineSettings
 from PyQt6.QtWebEngineWidgets import QWebEngineView
@@ -100,17 +102,25 @@ class _MapBridge(QObject):
         self.errorReported.emit(_scrub_key(message, self._api_key))
 
 
+# Longest side of the live mosaic preview, in pixels.
+_PREVIEW_PX = 160
+
+
 class _FetchWorker(QThread):
     """Runs ``fetch_bbox`` in a background thread.
 
     Cancellation: the dialog calls :meth:`requestInterruption`; the worker
     passes its ``isInterruptionRequested`` as the service's ``cancel_check``
-    callback, which raises :class:`FetchCancelled` between tiles.
+    callback, which raises :class:`FetchCancelled` while tiles are in flight.
+
+    Progress: after every tile, a small downscaled copy of the mosaic so far
+    is emitted for the dialog's preview.
     """
 
     finished_ok = pyqtSignal(object)  # FetchResult
     failed = pyqtSignal(str)
     cancelled = pyqtSignal()
+    progress = pyqtSignal(QImage, int, int)  # preview, tiles done, tiles total
 
     def __init__(self, bbox: BoundingBox, parent: QObject | None = None) -> None:
         super().__init__(parent)
@@ -119,7 +129,9 @@ class _FetchWorker(QThread):
     def run(self) -> None:  # noqa: D401 - QThread API
         try:
             result = fetch_bbox(
-                self._bbox, cancel_check=self.isInterruptionRequested
+                self._bbox,
+                cancel_check=self.isInterruptionRequested,
+                on_progress=self._emit_progress,
             )
         except FetchCancelled:
             self.cancelled.emit()
@@ -132,6 +144,18 @@ class _FetchWorker(QThread):
             return
         self.finished_ok.emit(result)
 
+    def _emit_progress(self, mosaic, done: int, total: int) -> None:
+        factor = max(1, math.ceil(max(mosaic.size) / _PREVIEW_PX))
+        preview = mosaic.reduce(factor)
+        image = QImage(
+            preview.tobytes("raw", "RGB"),
+            preview.width,
+            preview.height,
+            preview.width * 3,
+            QImage.Format.Format_RGB888,
+        ).copy()  # detach from the Python buffer before crossing threads
+        self.progress.emit(image, done, total)
+
 
 class MapPickerDialog(QDialog):
     """Embedded Google Maps picker with rectangle selection."""
@@ -177,6 +201,11 @@ class MapPickerDialog(QDialog):
             self,
         )
         status_row.addWidget(self._status, 1)
+        # Live preview of the mosaic while tiles arrive.
+        self._preview = QLabel(self)
+        self._preview.setFixedSize(_PREVIEW_PX, _PREVIEW_PX)
+        self._preview.hide()
+        status_row.addWidget(self._preview)
         layout.addLayout(status_row)
 
         self._buttons = QDialogButtonBox(
@@ -283,6 +312,7 @@ class MapPickerDialog(QDialog):
         self._worker.finished_ok.connect(self._on_fetch_success)
         self._worker.failed.connect(self._on_fetch_failure)
         self._worker.cancelled.connect(self._on_fetch_cancelled)
+        self._worker.progress.connect(self._on_fetch_progress)
         # Detach the worker before it goes out of scope so the dialog can
         # close before the thread fully wraps up — avoids the dreaded
         # "QThread: Destroyed while thread is still running" crash.
@@ -298,26 +328,39 @@ class MapPickerDialog(QDialog):
             return
         self.reject()
 
+    def _on_fetch_progress(self, preview: QImage, done: int, total: int) -> None:
+        if self._worker is not None and self._worker.isInterruptionRequested():
+            return  # keep "Cancelling..." up until the worker stops
+        self._preview.setPixmap(QPixmap.fromImage(preview))
+        self._preview.show()
+        self._status.setText(
+            self.tr("Fetching satellite image... {done}/{total} tiles").format(
+                done=done, total=total
+            )
+        )
+
     def _on_fetch_success(self, result: FetchResult) -> None:
         self._fetch_result = result
         self.accept()
 
     def _on_fetch_failure(self, message: str) -> None:
+        self._preview.hide()
         QMessageBox.critical(self, self.tr("Failed to fetch image"), message)
         self._ok_button.setEnabled(True)
         self._cancel_button.setEnabled(True)
         self._status.setText(self.tr("Try again, or pick a smaller area."))
 
     def _on_fetch_cancelled(self) -> None:
+        self._preview.hide()
         self._ok_button.setEnabled(self._bbox is not None)
         self._cancel_button.setEnabled(True)
         self._status.setText(self.tr("Fetch cancelled."))
 
     def closeEvent(self, event) -> None:  # type: ignore[override]
         # ``requests.get(timeout=10)`` is uninterruptible from the GUI thread
-        # — ``cancel_check`` is only consulted *between* tiles, never during
-        # a single in-flight HTTP call. So in the single-call path a slow
-        # server can keep the worker running for the full HTTP timeout.
+        # — ``cancel_check`` lets ``fetch_bbox`` stop waiting, but never
+        # aborts a single in-flight HTTP call, and the worker may be between
+        # polls when the dialog closes.
         # Detach the worker from the dialog so Qt does NOT destroy a child
         # QThread that's still in ``run()`` — ``finished → deleteLater``
         # (wired in ``_on_accept``) takes care of the cleanup whenever the
@@ -3,7 +3,7 @@
 import logging
 from dataclasses import MISSING, fields, replace
 
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -20,10 +20,13 @@ from PyQt6.QtWidgets import (
 
 from open_garden_planner.models.plant_data import PlantSpeciesData
 from open_garden_planner.services.plant_api import (
-    PlantAPIError,
     PlantAPIManager,
     PlantDetailUnavailableError,
+    PlantSearchJob,
+    PlantSearchOutcome,
 )
+from open_garden_planner.services.plant_api.search_job import LOCAL_SOURCE
+from open_garden_planner.services.species_search_index import plant_key
 from open_garden_planner.ui.plant_species_assignment import plant_source_label
 from open_garden_planner.ui.theme import set_text_role, theme_color
 
@@ -33,10 +36,13 @@ logger = logging.getLogger(__name__)
 class PlantSearchDialog(QDialog):
     """Dialog for searching plant species from online databases.
 
-    Allows users to search for plants using the PlantAPIManager,
-    which automatically tries multiple APIs with fallback.
+    Allows users to search for plants using the PlantAPIManager; every
+    configured database is asked at once and results stream in.
     """
 
+    #: Emitted once a search has heard back from every source.
+    search_finished = pyqtSignal()
+
     _ONLINE_PROVIDERS = frozenset({"trefle", "perenual", "permapeople"})
 
     def __init__(
@@ -54,6 +60,10 @@ class PlantSearchDialog(QDialog):
 
         self._api_manager = api_manager
         self._selected_plant: PlantSpeciesData | None = None
+        self._search_job: PlantSearchJob | None = None
+        self._source_order: list[str] = []
+        self._source_rows: dict[str, int] = {}
+        self._shown_keys: dict[str, str] = {}  # plant_key -> source
         # PARENTED to the dialog: an unparented QTimer outlives the C++ widget
         # (qtbot/close deletes the dialog, the Python-owned timer keeps ticking)
         # and 500 ms later fires _perform_search() on a dead dialog — which
@@ -152,16 +162,23 @@ class PlantSearchDialog(QDialog):
             self.status_label.setStyleSheet(f"color: {theme_color('text_secondary')};")
 
     def _perform_search(self) -> None:
-        """Perform plant search using the API manager.
+        """Start a search of every source using the API manager.
 
         Settles the debounce first: a search that runs NOW (typed-and-waited,
         Enter, or a direct call) must not run again 500 ms later — an armed
         timer that outlives its moment fired into unrelated tests (#310, §11.4).
+
+        The custom library, local matches and cached answers show up at once; the online
+        databases are asked concurrently off the GUI thread (``PlantSearchJob``)
+        and their rows stream in as each one answers. A new query drops the
+        previous one, so a slow answer to an old query never lands in the list.
+        ``search_finished`` fires once every source has reported.
         """
         self._search_timer.stop()
         query = self.search_input.text().strip()
         if not query:
             return
+        self._cancel_search()
 
         # Clear previous results
         self.results_list.clear()
@@ -174,89 +191,154 @@ class PlantSearchDialog(QDialog):
         self.status_label.setStyleSheet(f"color: {theme_color('info')};")
         self.search_button.setEnabled(False)
 
-        try:
-            # Search using API manager (with automatic fallback)
-            results = self._api_manager.search(query, limit=20)
-
-            if results:
-                # Every row shows the store it came from: the custom plant
-                # library is searched first (PlantAPIManager.search()) and is
-                # not deduplicated against API results, so a stale or bogus
-                # custom entry with the same common/scientific name as a live
-                # record would otherwise be indistinguishable in this list
-                # before the user picks one (#297 manual-test finding: a
-                # leftover custom "Tomato" record with wrong sun/water values
-                # was picked instead of Trefle's).
-                for plant_data in results:
-                    item = QListWidgetItem(
-                        self.tr("{name} ({scientific}) — {source}").format(
-                            name=plant_data.common_name,
-                            scientific=plant_data.scientific_name,
-                            source=plant_source_label(plant_data.data_source),
-                        )
-                    )
-                    item.setData(Qt.ItemDataRole.UserRole, plant_data)
-                    self.results_list.addItem(item)
+        job = PlantSearchJob(self._api_manager, query, limit=20, parent=self)
+        self._search_job = job
+        self._source_order = job.sources
+        self._source_rows = dict.fromkeys(self._source_order, 0)
+        self._shown_keys = {}
+        job.source_answered.connect(self._on_source_answered)
+        job.finished.connect(self._on_search_finished)
+        job.start()
+
+    def _cancel_search(self) -> None:
+        job = self._search_job
+        self._search_job = None
+        if job is not None:
+            job.shutdown()
+            job.deleteLater()
+
+    def _on_source_answered(self, source: str, results: list[PlantSpeciesData]) -> None:
+        """Insert one source's rows, keeping the list in source order.
+
+        Sources answer in any order, but the list always reads custom library
+        first, then the databases in fallback order, then local matches — and
+        inserting (rather than rebuilding) keeps whatever the user already
+        selected. A local match is a cached copy of a database record at best,
+        so it gives way to the same record arriving from the database itself.
+        """
+        if source == LOCAL_SOURCE:
+            results = [plant for plant in results if plant_key(plant) not in self._shown_keys]
+        else:
+            for plant in results:
+                self._drop_local_row(plant_key(plant))
+        if not results:
+            return
+        row = 0
+        for name in self._source_order:
+            if name == source:
+                break
+            row += self._source_rows[name]
+        self._source_rows[source] += len(results)
+        # Every row shows the store it came from: the custom plant library is
+        # searched too and is not deduplicated against API results, so a
+        # stale or bogus custom entry with the same common/scientific name as
+        # a live record would otherwise be indistinguishable in this list
+        # before the user picks one (#297 manual-test finding: a leftover
+        # custom "Tomato" record with wrong sun/water values was picked
+        # instead of Trefle's).
+        for plant_data in results:
+            item = QListWidgetItem(
+                self.tr("{name} ({scientific}) — {source}").format(
+                    name=plant_data.common_name,
+                    scientific=plant_data.scientific_name,
+                    source=plant_source_label(plant_data.data_source),
+                )
+            )
+            item.setData(Qt.ItemDataRole.UserRole, plant_data)
+            self.results_list.insertItem(row, item)
+            self._shown_keys[plant_key(plant_data)] = source
+            row += 1
+
+        job = self._search_job
+        if job is not None and job.is_running:
+            self.status_label.setText(
+                self.tr("Found {count} results so far...").format(count=self.results_list.count())
+            )
+            self.status_label.setStyleSheet(f"color: {theme_color('info')};")
 
-                self.status_label.setText(self.tr("Found {count} results").format(count=len(results)))
-                self.status_label.setStyleSheet(f"color: {theme_color('success')};")
-            else:
-                # An empty result list is now a distinct, honest state: every
-                # configured API answered cleanly but matched nothing (#302 --
-                # previously PlantAPIManager.search() raised
-                # "All plant APIs failed" for this exact case, which showed a
-                # scary credentials-hint QMessageBox for a perfectly normal
-                # zero-match search, e.g. a mango variety no database lists).
-                # Distinguish "nothing is configured" from "nothing matched"
-                # since only the former is actionable via Preferences. The
-                # app's own entry point (_on_search_plant_database) refuses to
-                # open this dialog without credentials, so this branch is
-                # belt-and-braces for other/future callers of the dialog --
-                # not a live path today.
-                if self._api_manager.configured_source_count == 0:
-                    self.status_label.setText(
-                        self.tr(
-                            "No plant databases are configured. Add API credentials "
-                            "in Preferences to search online."
-                        )
-                    )
-                else:
-                    text = self.tr(
-                        "No plants matched '{query}'. Try another spelling or "
-                        "the scientific name."
-                    ).format(query=query)
-                    # A zero-result answered by one provider while another
-                    # raised is still an honest "no match" (no failure
-                    # dialog), but the user should learn a configured
-                    # provider is down rather than only in Preferences.
-                    failed = self._api_manager.last_search_failed_sources
-                    if failed:
-                        text += " " + self.tr(
-                            "({sources} unavailable — check Preferences.)"
-                        ).format(sources=", ".join(failed))
-                    self.status_label.setText(text)
-                self.status_label.setStyleSheet(f"color: {theme_color('warning')};")
-
-        except PlantAPIError as e:
-            self.status_label.setText(self.tr("Search failed: {error}").format(error=str(e)))
+    def _drop_local_row(self, key: str) -> None:
+        if self._shown_keys.get(key) != LOCAL_SOURCE:
+            return
+        del self._shown_keys[key]
+        local_rows = self._source_rows[LOCAL_SOURCE]
+        first = self.results_list.count() - local_rows  # local rows come last
+        for row in range(first, first + local_rows):
+            plant = self.results_list.item(row).data(Qt.ItemDataRole.UserRole)
+            if plant_key(plant) == key:
+                self.results_list.takeItem(row)
+                self._source_rows[LOCAL_SOURCE] -= 1
+                return
+
+    def _on_search_finished(self, outcome: PlantSearchOutcome) -> None:
+        """Settle the status line once every source has reported."""
+        job = self._search_job
+        self._search_job = None
+        if job is not None:
+            job.deleteLater()
+        self.search_button.setEnabled(True)
+
+        if self.results_list.count():
+            self.status_label.setText(
+                self.tr("Found {count} results").format(count=self.results_list.count())
+            )
+            self.status_label.setStyleSheet(f"color: {theme_color('success')};")
+        elif outcome.failed:
+            error = self.tr("All plant APIs failed: {error}").format(error=outcome.last_error)
+            self.status_label.setText(self.tr("Search failed: {error}").format(error=error))
             self.status_label.setStyleSheet(f"color: {theme_color('error')};")
-            logger.error(f"Plant search failed: {e}")
+            logger.error(f"Plant search failed: {error}")
 
             # Show error dialog
             QMessageBox.warning(
                 self,
                 self.tr("Search Failed"),
                 self.tr("Failed to search plant database:\n{error}\n\n"
-                "Please check your internet connection and API credentials.").format(error=str(e)),
+                "Please check your internet connection and API credentials.").format(error=error),
             )
-
-        finally:
-            self.search_button.setEnabled(True)
+        else:
+            # An empty result list is now a distinct, honest state: every
+            # configured API answered cleanly but matched nothing (#302 --
+            # previously PlantAPIManager.search() raised
+            # "All plant APIs failed" for this exact case, which showed a
+            # scary credentials-hint QMessageBox for a perfectly normal
+            # zero-match search, e.g. a mango variety no database lists).
+            # Distinguish "nothing is configured" from "nothing matched"
+            # since only the former is actionable via Preferences. The
+            # app's own entry point (_on_search_plant_database) refuses to
+            # open this dialog without credentials, so this branch is
+            # belt-and-braces for other/future callers of the dialog --
+            # not a live path today.
+            if outcome.configured_count == 0:
+                self.status_label.setText(
+                    self.tr(
+                        "No plant databases are configured. Add API credentials "
+                        "in Preferences to search online."
+                    )
+                )
+            else:
+                text = self.tr(
+                    "No plants matched '{query}'. Try another spelling or "
+                    "the scientific name."
+                ).format(query=outcome.query)
+                # A zero-result answered by one provider while another
+                # raised is still an honest "no match" (no failure
+                # dialog), but the user should learn a configured
+                # provider is down rather than only in Preferences.
+                if outcome.failed_sources:
+                    text += " " + self.tr(
+                        "({sources} unavailable — check Preferences.)"
+                    ).format(sources=", ".join(outcome.failed_sources))
+                self.status_label.setText(text)
+            self.status_label.setStyleSheet(f"color: {theme_color('warning')};")
+
+        self.search_finished.emit()
 
     def done(self, result: int) -> None:  # noqa: N802 — Qt override
         """Settle the debounced search before the dialog goes away — a pending
-        timer must never fire into a closed dialog (see __init__)."""
+        timer must never fire into a closed dialog (see __init__) — and drop
+        a search still in flight."""
         self._search_timer.stop()
+        self._cancel_search()
         super().done(result)
 
     def _on_selection_changed(self) -> None:
@@ -36,7 +36,6 @@ from open_garden_planner.models.shopping_list import (
     ShoppingListItem,
 )
 from open_garden_planner.services.export_service import ExportService
-from open_garden_planner.services.pdf_report_service import PdfReportService
 from open_garden_planner.ui.theme import ThemeColors
 
 if TYPE_CHECKING:
@@ -474,6 +473,8 @@ class ShoppingListDialog(QDialog):
         )
         if not path:
             return
+        from open_garden_planner.services.pdf_report_service import PdfReportService
+
         try:
             PdfReportService.export_shopping_list_to_pdf(
                 self._exportable_items(), path
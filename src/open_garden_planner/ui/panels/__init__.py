@@ -3,18 +3,28 @@
 The object gallery now lives in the top toolbar
 (open_garden_planner.ui.widgets.toolbar) as category dropdowns + global
 search, so it is no longer exported here.
+
+Each panel module is imported on first access of its export: the main window
+builds the constraints, plant search, journal, pest overview and smart symbol
+panels only when they are first opened.
 """
 
-from .companion_panel import CompanionPanel
-from .constraints_panel import ConstraintsPanel
-from .crop_rotation_panel import CropRotationPanel
-from .journal_panel import JournalPanel
-from .layers_panel import LayersPanel
-from .pest_overview_panel import PestOverviewPanel
-from .plant_database_panel import PlantDatabasePanel
-from .plant_search_panel import PlantSearchPanel
-from .properties_panel import PropertiesPanel
-from .smart_symbols_panel import SmartSymbolsPanel
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from open_garden_planner.ui.panels.companion_panel import CompanionPanel
+    from open_garden_planner.ui.panels.constraints_panel import ConstraintsPanel
+    from open_garden_planner.ui.panels.crop_rotation_panel import CropRotationPanel
+    from open_garden_planner.ui.panels.journal_panel import JournalPanel
+    from open_garden_planner.ui.panels.layers_panel import LayersPanel
+    from open_garden_planner.ui.panels.pest_overview_panel import PestOverviewPanel
+    from open_garden_planner.ui.panels.plant_database_panel import PlantDatabasePanel
+    from open_garden_planner.ui.panels.plant_search_panel import PlantSearchPanel
+    from open_garden_planner.ui.panels.properties_panel import PropertiesPanel
+    from open_garden_planner.ui.panels.smart_symbols_panel import SmartSymbolsPanel
 
 __all__ = [
     "CompanionPanel",
@@ -28,3 +38,24 @@ __all__ = [
     "PropertiesPanel",
     "SmartSymbolsPanel",
 ]
+
+_LAZY = {
+    "CompanionPanel": "companion_panel",
+    "ConstraintsPanel": "constraints_panel",
+    "CropRotationPanel": "crop_rotation_panel",
+    "JournalPanel": "journal_panel",
+    "LayersPanel": "layers_panel",
+    "PestOverviewPanel": "pest_overview_panel",
+    "PlantDatabasePanel": "plant_database_panel",
+    "PlantSearchPanel": "plant_search_panel",
+    "PropertiesPanel": "properties_panel",
+    "SmartSymbolsPanel": "smart_symbols_panel",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the panel module behind an export on first access."""
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f"{__name__}.{module}"), name)
@@ -1,8 +1,9 @@
 """Qt3D engine adapter (US-E6, #261) — the ONLY ``PyQt6.Qt3D*`` importer.
 
 ADR-038's import boundary: if the engine is ever swapped, this file is the
-blast radius. It packs the Qt-free ``core/scene3d`` triangle soup into GPU
-buffers, owns the scene graph (ground plane, prisms, sun light, camera),
+blast radius. It packs the Qt-free ``core/scene3d`` mesh batches into GPU
+buffers (one geometry + material per colour, patched in place when only
+some records change), owns the scene graph (ground plane, prisms, sun light, camera),
 and exposes plain-Python instruments (``last_sun_scene`` /
 ``last_light_engine``) so tests can assert light updates without rendering.
 
@@ -32,8 +33,10 @@ from PyQt6.QtGui import QColor, QVector3D
 from PyQt6.QtWidgets import QWidget
 
 from open_garden_planner.core.scene3d import (
+    BatchKey,
+    MeshBatch,
     Scene3DRecord,
-    extrude_footprint,
+    diff_batches,
     sun_direction_scene,
     to_engine_frame,
 )
@@ -60,7 +63,10 @@ _WALK_RIGHT = frozenset({int(Qt.Key.Key_D), int(Qt.Key.Key_Right)})
 _WALK_LEFT = frozenset({int(Qt.Key.Key_A), int(Qt.Key.Key_Left)})
 
 
-def _scene_to_engine_array(triples: list[float]) -> np.ndarray:
+_STRIDE = 6 * 4  # interleaved position + normal, float32
+
+
+def _scene_to_engine_array(triples: list[float] | np.ndarray) -> np.ndarray:
     """(x, y=N, z=up) rows → engine (x, y=up, z=−N); float32 (n, 3).
 
     The mapping matrix has determinant +1 (a rotation), so triangle
@@ -72,6 +78,68 @@ def _scene_to_engine_array(triples: list[float]) -> np.ndarray:
     )
 
 
+def _interleaved_bytes(batch: MeshBatch, first: int, count: int) -> QByteArray:
+    """Engine-frame interleaved vertex bytes for ``batch[first:first+count]``."""
+    stop = first + count
+    positions = _scene_to_engine_array(batch.positions[first:stop])
+    normals = _scene_to_engine_array(batch.normals[first:stop])
+    return QByteArray(np.hstack([positions, normals]).tobytes())
+
+
+class _BatchMesh:
+    """The Qt3D objects of one material batch: one entity, one draw call."""
+
+    def __init__(self, parent: QEntity, key: BatchKey) -> None:
+        self.entity = QEntity(parent)
+        geometry = QGeometry(self.entity)
+        self.buffer = QBuffer(geometry)
+        self.attributes: list[QAttribute] = []
+        for name, offset in (
+            (QAttribute.defaultPositionAttributeName(), 0),
+            (QAttribute.defaultNormalAttributeName(), 3 * 4),
+        ):
+            attribute = QAttribute(geometry)
+            attribute.setName(name)
+            attribute.setVertexBaseType(QAttribute.VertexBaseType.Float)
+            attribute.setVertexSize(3)
+            attribute.setAttributeType(QAttribute.AttributeType.VertexAttribute)
+            attribute.setBuffer(self.buffer)
+            attribute.setByteStride(_STRIDE)
+            attribute.setByteOffset(offset)
+            geometry.addAttribute(attribute)
+            self.attributes.append(attribute)
+
+        self.renderer = QGeometryRenderer(self.entity)
+        self.renderer.setGeometry(geometry)
+        self.renderer.setPrimitiveType(QGeometryRenderer.PrimitiveType.Triangles)
+
+        material = QPhongMaterial(self.entity)
+        r, g, b = key
+        material.setDiffuse(QColor(r, g, b))
+        # Lift ambient toward the diffuse so unlit faces read as shaded
+        # surfaces, not black holes.
+        material.setAmbient(QColor(int(r * 0.35), int(g * 0.35), int(b * 0.35)))
+
+        self.entity.addComponent(self.renderer)
+        self.entity.addComponent(material)
+
+    def upload(self, batch: MeshBatch) -> None:
+        """Replace the whole buffer (new batch, or records added/resized)."""
+        count = batch.vertex_count
+        self.buffer.setData(_interleaved_bytes(batch, 0, count))
+        for attribute in self.attributes:
+            attribute.setCount(count)
+        self.renderer.setVertexCount(count)
+
+    def patch(self, batch: MeshBatch, first: int, count: int) -> None:
+        """Rewrite one record's vertex range in place."""
+        self.buffer.updateData(first * _STRIDE, _interleaved_bytes(batch, first, count))
+
+    def dispose(self) -> None:
+        self.entity.setParent(None)
+        self.entity.deleteLater()
+
+
 class Garden3DView:
     """Owns the Qt3DWindow and its scene graph; rebuildable from records."""
 
@@ -79,7 +147,11 @@ class Garden3DView:
         self._view = Qt3DWindow()
         self._view.defaultFrameGraph().setClearColor(_SKY)
         self._root = QEntity()
-        self._content: QEntity | None = None
+        self._content = QEntity(self._root)
+        self._ground_mesh: QPlaneMesh | None = None
+        self._ground_transform: QTransform | None = None
+        self._batches: dict[BatchKey, MeshBatch] = {}
+        self._meshes: dict[BatchKey, _BatchMesh] = {}
         self._container: QWidget | None = None
 
         light_entity = QEntity(self._root)
@@ -127,6 +199,10 @@ class Garden3DView:
         self.last_light_engine: tuple[float, float, float] | None = None
         #: Rebuild counter (test instrument).
         self.rebuild_count = 0
+        #: Vertices sent by the last rebuild: whole-buffer uploads vs in-place
+        #: range patches (test instruments — an unchanged plan sends neither).
+        self.last_uploaded_vertices = 0
+        self.last_patched_vertices = 0
 
     # ── public API ─────────────────────────────────────────────
 
@@ -149,32 +225,33 @@ class Garden3DView:
         width_cm: float,
         height_cm: float,
     ) -> None:
-        """Replace the content subtree from a fresh snapshot."""
-        if self._content is not None:
-            self._content.setParent(None)
-            self._content.deleteLater()
-        content = QEntity(self._root)
-
-        ground = QEntity(content)
-        ground_mesh = QPlaneMesh()
-        ground_mesh.setWidth(width_cm)
-        ground_mesh.setHeight(height_cm)
-        ground_transform = QTransform()
-        # QPlaneMesh lies in the engine XZ plane; scene center (w/2, h/2)
-        # maps to engine (w/2, 0, −h/2).
-        ground_transform.setTranslation(
-            QVector3D(width_cm / 2.0, 0.0, -height_cm / 2.0)
-        )
-        ground_material = QPhongMaterial()
-        ground_material.setDiffuse(_GROUND)
-        ground.addComponent(ground_mesh)
-        ground.addComponent(ground_transform)
-        ground.addComponent(ground_material)
+        """Bring the content up to date with a fresh snapshot.
 
-        for record in records:
-            self._add_prism(content, record)
+        Records are merged into one mesh per material (``diff_batches``):
+        a batch whose layout is unchanged only has the vertex ranges of its
+        changed records rewritten; other batches are re-uploaded, created or
+        dropped. Untouched batches cost nothing.
+        """
+        self._update_ground(width_cm, height_cm)
+
+        diff = diff_batches(self._batches, records)
+        uploaded = patched = 0
+        for key in diff.removed:
+            self._meshes.pop(key).dispose()
+        for key in diff.uploads:
+            mesh = self._meshes.get(key)
+            if mesh is None:
+                mesh = self._meshes[key] = _BatchMesh(self._content, key)
+            mesh.upload(diff.batches[key])
+            uploaded += diff.batches[key].vertex_count
+        for key, ranges in diff.patches.items():
+            for first, count in ranges:
+                self._meshes[key].patch(diff.batches[key], first, count)
+                patched += count
+        self._batches = diff.batches
+        self.last_uploaded_vertices = uploaded
+        self.last_patched_vertices = patched
 
-        self._content = content
         self._plan_size = (width_cm, height_cm)
         if self._camera_mode == "orbit":
             self._frame_camera(width_cm, height_cm)
@@ -184,6 +261,11 @@ class Garden3DView:
             self._clamp_walk_camera()
         self.rebuild_count += 1
 
+    @property
+    def draw_batch_count(self) -> int:
+        """Prism meshes in the scene graph — one per material (instrument)."""
+        return len(self._meshes)
+
     def set_sun(self, elevation_deg: float, azimuth_deg: float) -> None:
         """Point the directional light along the US-E1 solar vector.
 
@@ -352,63 +434,23 @@ class Garden3DView:
 
     # ── internals ──────────────────────────────────────────────
 
-    def _add_prism(self, parent: QEntity, record: Scene3DRecord) -> None:
-        positions, normals = extrude_footprint(
-            list(record.footprint), record.height_cm, base_cm=record.base_cm
-        )
-        if not positions:
-            return
-        pos_engine = _scene_to_engine_array(positions)
-        nor_engine = _scene_to_engine_array(normals)
-        vertex_count = pos_engine.shape[0]
-        interleaved = np.hstack([pos_engine, nor_engine]).astype(np.float32)
-
-        entity = QEntity(parent)
-        geometry = QGeometry(entity)
-        buffer = QBuffer(geometry)
-        buffer.setData(QByteArray(interleaved.tobytes()))
-
-        stride = 6 * 4  # 6 floats per vertex
-        position_attribute = QAttribute(geometry)
-        position_attribute.setName(QAttribute.defaultPositionAttributeName())
-        position_attribute.setVertexBaseType(QAttribute.VertexBaseType.Float)
-        position_attribute.setVertexSize(3)
-        position_attribute.setAttributeType(
-            QAttribute.AttributeType.VertexAttribute
-        )
-        position_attribute.setBuffer(buffer)
-        position_attribute.setByteStride(stride)
-        position_attribute.setByteOffset(0)
-        position_attribute.setCount(vertex_count)
-        geometry.addAttribute(position_attribute)
-
-        normal_attribute = QAttribute(geometry)
-        normal_attribute.setName(QAttribute.defaultNormalAttributeName())
-        normal_attribute.setVertexBaseType(QAttribute.VertexBaseType.Float)
-        normal_attribute.setVertexSize(3)
-        normal_attribute.setAttributeType(
-            QAttribute.AttributeType.VertexAttribute
+    def _update_ground(self, width_cm: float, height_cm: float) -> None:
+        if self._ground_mesh is None:
+            ground = QEntity(self._content)
+            self._ground_mesh = QPlaneMesh()
+            self._ground_transform = QTransform()
+            ground_material = QPhongMaterial()
+            ground_material.setDiffuse(_GROUND)
+            ground.addComponent(self._ground_mesh)
+            ground.addComponent(self._ground_transform)
+            ground.addComponent(ground_material)
+        self._ground_mesh.setWidth(width_cm)
+        self._ground_mesh.setHeight(height_cm)
+        # QPlaneMesh lies in the engine XZ plane; scene center (w/2, h/2)
+        # maps to engine (w/2, 0, −h/2).
+        self._ground_transform.setTranslation(
+            QVector3D(width_cm / 2.0, 0.0, -height_cm / 2.0)
         )
-        normal_attribute.setBuffer(buffer)
-        normal_attribute.setByteStride(stride)
-        normal_attribute.setByteOffset(3 * 4)
-        normal_attribute.setCount(vertex_count)
-        geometry.addAttribute(normal_attribute)
-
-        renderer = QGeometryRenderer(entity)
-        renderer.setGeometry(geometry)
-        renderer.setPrimitiveType(QGeometryRenderer.PrimitiveType.Triangles)
-        renderer.setVertexCount(vertex_count)
-
-        material = QPhongMaterial(entity)
-        r, g, b, _a = record.color_rgba
-        material.setDiffuse(QColor(r, g, b))
-        # Lift ambient toward the diffuse so unlit faces read as shaded
-        # surfaces, not black holes.
-        material.setAmbient(QColor(int(r * 0.35), int(g * 0.35), int(b * 0.35)))
-
-        entity.addComponent(renderer)
-        entity.addComponent(material)
 
     def _update_aspect_ratio(self) -> None:
         width, height = self._view.width(), self._view.height()
@@ -3,6 +3,7 @@
 from .category_toolbar import CategoryToolbar
 from .collapsible_panel import CollapsiblePanel
 from .constraint_toolbar import ConstraintToolbar
+from .deferred_widget import DeferredWidget
 from .minimap_widget import MinimapWidget
 from .panel_stack import PanelState, PinSource, SidebarController
 from .soil_sparkline_widget import SoilSparklineWidget
@@ -14,6 +15,7 @@ __all__ = [
     "CategoryToolbar",
     "CollapsiblePanel",
     "ConstraintToolbar",
+    "DeferredWidget",
     "MinimapWidget",
     "MainToolbar",
     "PanelState",
@@ -26,6 +26,7 @@ from open_garden_planner.core.plant_renderer import (
     _SPECIES_DIR,
     PlantCategory,
 )
+from open_garden_planner.core.sprite_disk_cache import disk_sprite_cache
 from open_garden_planner.core.tools import ToolType
 from open_garden_planner.ui.icons import get_pixmap
 
@@ -85,9 +86,15 @@ def render_svg_thumbnail(svg_path: Path, size: int = THUMB_SIZE) -> QPixmap | No
     Non-square art (bench 180x60, lounger 70x190, ...) is letterboxed inside
     the square instead of being stretched to fill it (#308) — the viewBox
     aspect is the object's real footprint, so the thumbnail must keep it.
+    Thumbnails persist across launches in ``core/sprite_disk_cache``.
     """
     if not svg_path.exists():
         return None
+    disk = disk_sprite_cache()
+    if disk is not None:
+        cached = disk.load(svg_path, size, size, "thumb")
+        if cached is not None:
+            return QPixmap.fromImage(cached)
     renderer = QSvgRenderer(str(svg_path))
     if not renderer.isValid():
         return None
@@ -105,6 +112,8 @@ def render_svg_thumbnail(svg_path: Path, size: int = THUMB_SIZE) -> QPixmap | No
         target = QRectF(0, 0, size, size)
     renderer.render(painter, target)
     painter.end()
+    if disk is not None:
+        disk.store(svg_path, size, size, "thumb", image)
     return QPixmap.fromImage(image)
 
 
@@ -42,6 +42,8 @@ class SunSimToolbar(QToolBar):
     heatmap_requested = pyqtSignal()
     #: Heatmap button unchecked — the app should hide the heatmap.
     heatmap_cleared = pyqtSignal()
+    #: Animate toggled — the app precomputes the day's frames while True.
+    animation_toggled = pyqtSignal(bool)
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__("", parent)
@@ -158,6 +160,15 @@ class SunSimToolbar(QToolBar):
     def stop_animation(self) -> None:
         self._animate_button.setChecked(False)
 
+    @property
+    def is_animating(self) -> bool:
+        return self._animate_button.isChecked()
+
+    @property
+    def animate_step_minutes(self) -> int:
+        """Sim minutes advanced per animation tick (the playback frame step)."""
+        return _ANIMATE_STEP_MINUTES
+
     def set_heatmap_busy(self, busy: bool) -> None:
         """Busy indication while the worker computes."""
         self._heatmap_button.setEnabled(not busy)
@@ -188,6 +199,7 @@ class SunSimToolbar(QToolBar):
             self._animate_timer.start()
         else:
             self._animate_timer.stop()
+        self.animation_toggled.emit(checked)
 
     def _on_heatmap_toggled(self, checked: bool) -> None:
         if checked:
@@ -7,7 +7,6 @@ import html
 import logging
 import subprocess
 import tempfile
-import urllib.request
 from pathlib import Path
 
 from PyQt6.QtCore import QObject, Qt, QThread, pyqtSignal
@@ -55,6 +54,8 @@ class _DownloadWorker(QThread):
         self._cancelled = True
 
     def run(self) -> None:
+        import urllib.request  # only when an update is downloaded, not at startup
+
         try:
             req = urllib.request.Request(
                 self._url,
@@ -52,6 +52,19 @@ _app_settings.ORGANIZATION_NAME = TEST_ORGANIZATION
 _app_settings.APPLICATION_NAME = TEST_APPLICATION
 
 
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip ``@pytest.mark.benchmark`` tests unless ``OGP_BENCHMARKS=1``.
+
+    They assert wall-clock budgets, which a loaded CI runner misses at random.
+    """
+    if os.environ.get("OGP_BENCHMARKS") == "1":
+        return
+    skip = pytest.mark.skip(reason="wall-clock benchmark; set OGP_BENCHMARKS=1 to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 @pytest.fixture(autouse=True, scope="session")
 def isolate_qsettings():
     """Session bookkeeping for the import-time redirection above.
@@ -227,6 +240,31 @@ def _no_weather_network():
         yield
 
 
+@pytest.fixture(autouse=True)
+def _isolate_app_cache_dir(tmp_path_factory: pytest.TempPathFactory):
+    """Point every on-disk cache at an empty per-test directory.
+
+    Plant-API answers, weather/frost data, rendered sprites and satellite
+    tiles all live under `app.paths.get_cache_dir()`, and each cache accessor
+    reopens its store once that directory moves. Per test, not per session:
+    tests mock different answers for the same query ("carrot") or the same
+    coordinates, and a cached answer from an earlier test would mask their
+    mock. The local species index is fed from the plant-API cache, so it is
+    dropped too. Local imports for the same reason as
+    `_isolate_plant_api_credentials`.
+    """
+    from open_garden_planner.app import paths
+    from open_garden_planner.services.species_search_index import (
+        reset_species_search_index,
+    )
+
+    paths.set_cache_dir(tmp_path_factory.mktemp("app_cache"))
+    reset_species_search_index()
+    yield
+    paths.set_cache_dir(None)
+    reset_species_search_index()
+
+
 @pytest.fixture(autouse=True)
 def _disable_agent_api_server(_reset_app_settings):
     """Never auto-start the embedded Agent API server during tests.
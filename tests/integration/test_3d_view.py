@@ -284,6 +284,24 @@ class TestAdapter:
         adapter.rebuild(records, 1000.0, 800.0)  # replace path — no crash
         assert adapter.rebuild_count == 2
 
+    def test_rebuild_batches_by_colour_and_patches_moves(
+        self, qtbot, plan_scene  # noqa: ARG002
+    ) -> None:
+        from open_garden_planner.ui.view3d.qt3d_adapter import Garden3DView
+
+        adapter = Garden3DView()
+        records = collect_scene3d_records(plan_scene)
+        adapter.rebuild(records, 1000.0, 800.0)
+        assert adapter.draw_batch_count == len({r.color_rgba[:3] for r in records})
+        adapter.rebuild(records, 1000.0, 800.0)
+        assert adapter.last_uploaded_vertices == 0
+        assert adapter.last_patched_vertices == 0
+        shed = next(i for i in plan_scene.items() if i.object_type == ObjectType.TOOL_SHED)
+        shed.moveBy(25.0, 0.0)
+        adapter.rebuild(collect_scene3d_records(plan_scene), 1000.0, 800.0)
+        assert adapter.last_uploaded_vertices == 0
+        assert adapter.last_patched_vertices > 0
+
 
 @requires_windows_3d
 class TestWalkthrough:
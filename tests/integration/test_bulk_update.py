@@ -0,0 +1,150 @@
+"""Integration tests for ``CanvasScene.bulk_update()``.
+
+Loads, pastes, arrays and DXF imports add items inside one bulk block: a
+hidden target layer is revealed once, ``changed`` listeners get a single
+scene rect instead of one per item, and auto-parenting plants no longer
+walks every item per plant.
+"""
+
+from __future__ import annotations
+
+import pytest
+from PyQt6.QtWidgets import QGraphicsView
+
+from open_garden_planner.core import object_types
+from open_garden_planner.core.commands import CreateItemsCommand, GridArrayCommand
+from open_garden_planner.core.object_types import ObjectType, is_plant_parent_type
+from open_garden_planner.core.project import ProjectManager
+from open_garden_planner.models.layer import Layer
+from open_garden_planner.ui.canvas.canvas_scene import CanvasScene
+from open_garden_planner.ui.canvas.items import GardenItemMixin, RectangleItem
+from open_garden_planner.ui.canvas.items.circle_item import CircleItem
+
+
+@pytest.fixture()
+def layer() -> Layer:
+    return Layer(name="Beds", z_order=0)
+
+
+@pytest.fixture()
+def scene(qtbot, layer) -> CanvasScene:  # noqa: ARG001
+    scene = CanvasScene(width_cm=5000, height_cm=3000)
+    scene.set_layers([layer])
+    return scene
+
+
+def _beds_and_plants(layer: Layer, count: int) -> tuple[list[RectangleItem], list[CircleItem]]:
+    beds = [
+        RectangleItem(i % 50 * 60, i // 50 * 60, 50, 50, object_type=ObjectType.RAISED_BED, layer_id=layer.id)
+        for i in range(count)
+    ]
+    plants = [
+        CircleItem(i % 50 * 60 + 25, i // 50 * 60 + 25, 5, object_type=ObjectType.PERENNIAL, layer_id=layer.id)
+        for i in range(count)
+    ]
+    return beds, plants
+
+
+def _changed_rect_counts(qtbot, scene: CanvasScene, action) -> list[int]:
+    view = QGraphicsView(scene)
+    qtbot.addWidget(view)
+    view.show()
+    qtbot.wait(10)
+    counts: list[int] = []
+    scene.changed.connect(lambda rects: counts.append(len(rects)))
+    action()
+    qtbot.wait(50)
+    return [n for n in counts if n]
+
+
+class TestBulkUpdate:
+    def test_blocks_nest(self, scene, layer) -> None:
+        layer.visible = False
+        revealed: list[object] = []
+        scene.layer_auto_unhidden.connect(revealed.append)
+        with scene.bulk_update():
+            with scene.bulk_update():
+                scene.addItem(RectangleItem(0, 0, 50, 50, layer_id=layer.id))
+            assert not revealed  # only the outermost block finishes the batch
+        assert revealed == [layer.id]
+
+    def test_hidden_layer_is_revealed_once_at_the_end(self, qtbot, scene, layer) -> None:
+        layer.visible = False
+        revealed: list[object] = []
+        scene.layer_auto_unhidden.connect(revealed.append)
+        items = [RectangleItem(i * 60, 0, 50, 50, layer_id=layer.id) for i in range(5)]
+        with scene.bulk_update():
+            for item in items:
+                scene.addItem(item)
+            assert not revealed
+        assert revealed == [layer.id]
+        assert layer.visible and all(item.isVisible() for item in items)
+
+    def test_listeners_get_one_rect_for_a_large_batch(self, qtbot, scene, layer) -> None:
+        def add_in_bulk() -> None:
+            with scene.bulk_update():
+                for i in range(200):
+                    scene.addItem(RectangleItem(i * 20, 0, 10, 10, layer_id=layer.id))
+
+        assert _changed_rect_counts(qtbot, scene, add_in_bulk) == [1]
+
+    def test_small_batches_keep_their_dirty_rects(self, qtbot, scene, layer) -> None:
+        def add_two() -> None:
+            with scene.bulk_update():
+                scene.addItem(RectangleItem(0, 0, 10, 10, layer_id=layer.id))
+                scene.addItem(RectangleItem(500, 0, 10, 10, layer_id=layer.id))
+
+        assert _changed_rect_counts(qtbot, scene, add_two) == [2]
+
+
+class TestCallSites:
+    def test_create_items_parents_plants_and_undoes(self, scene, layer) -> None:
+        beds, plants = _beds_and_plants(layer, 20)
+        command = CreateItemsCommand(scene, beds + plants)
+        command.execute()
+        assert [p.parent_bed_id for p in plants] == [b.item_id for b in beds]
+        assert all(p.zValue() > b.zValue() for b, p in zip(beds, plants, strict=True))
+        command.undo()
+        assert not scene.items()
+        assert all(p.parent_bed_id is None for p in plants)
+
+    def test_grid_array_reveals_its_layer_once(self, scene, layer) -> None:
+        layer.visible = False
+        revealed: list[object] = []
+        scene.layer_auto_unhidden.connect(revealed.append)
+        GridArrayCommand(scene, [RectangleItem(i * 60, 0, 50, 50, layer_id=layer.id) for i in range(9)]).execute()
+        assert revealed == [layer.id]
+
+    def test_load_reports_one_rect(self, qtbot, scene, layer) -> None:
+        beds, plants = _beds_and_plants(layer, 100)
+        CreateItemsCommand(scene, beds + plants).execute()
+        snapshot = ProjectManager().snapshot_dict(scene)
+        target = CanvasScene(width_cm=5000, height_cm=3000)
+
+        counts = _changed_rect_counts(
+            qtbot, target, lambda: ProjectManager().load_scene_snapshot(target, snapshot)
+        )
+        assert counts == [1]
+        assert sum(isinstance(item, GardenItemMixin) for item in target.items()) == 200
+
+
+class TestScaling:
+    def test_pasting_many_plants_into_many_beds_is_not_quadratic(
+        self, scene, layer, monkeypatch
+    ) -> None:
+        """2,000 beds and 2,000 plants: each plant's parent lookup asks the
+        BSP index for the items under it instead of scanning every item."""
+        visited = 0
+
+        def counting(object_type: object) -> bool:
+            nonlocal visited
+            visited += 1
+            return is_plant_parent_type(object_type)
+
+        monkeypatch.setattr(object_types, "is_plant_parent_type", counting)
+        beds, plants = _beds_and_plants(layer, 2_000)
+        CreateItemsCommand(scene, beds + plants).execute()
+
+        assert all(p.parent_bed_id == b.item_id for b, p in zip(beds, plants, strict=True))
+        # A full scan per plant would visit ~4,000 items each.
+        assert visited < 5 * len(plants), f"{visited} items visited for {len(plants)} plants"
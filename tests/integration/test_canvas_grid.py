@@ -0,0 +1,142 @@
+"""Integration tests for the batched canvas grid of CanvasView.
+
+The grid is drawn as one ``drawLines`` batch per pen from line sets that
+are reused while panning and rebuilt when the step changes. Minor lines
+under a major line are skipped.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from PyQt6.QtCore import QPointF, QRectF
+from PyQt6.QtGui import QImage, QPainter, QPen
+
+from open_garden_planner.ui.canvas.canvas_scene import CanvasScene
+from open_garden_planner.ui.canvas.canvas_view import CanvasView
+
+
+@pytest.fixture
+def view(qtbot) -> CanvasView:
+    view = CanvasView(CanvasScene(width_cm=5000, height_cm=3000))
+    qtbot.addWidget(view)
+    view.resize(800, 600)
+    view.show()
+    qtbot.waitExposed(view)
+    view.set_grid_visible(True)
+    return view
+
+
+def _visible(view: CanvasView) -> QRectF:
+    return view.mapToScene(view.viewport().rect()).boundingRect()
+
+
+def _paint(view: CanvasView, rect: QRectF, ratio: float = 1.0) -> None:
+    image = QImage(int(800 * ratio), int(600 * ratio), QImage.Format.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(ratio)
+    image.fill(0)
+    painter = QPainter(image)
+    painter.setTransform(view.viewportTransform())
+    view._draw_grid(painter, rect)
+    painter.end()
+
+
+def _per_line_grid(view: CanvasView, painter: QPainter, rect: QRectF, grid_size: float) -> None:
+    """The previous implementation: one drawLine per minor and major line."""
+    pen = QPen(view._grid_color)
+    pen.setWidth(0)
+    painter.setPen(pen)
+    x = int(rect.left() / grid_size) * grid_size
+    while x <= rect.right():
+        painter.drawLine(QPointF(x, rect.top()), QPointF(x, rect.bottom()))
+        x += grid_size
+    y = int(rect.top() / grid_size) * grid_size
+    while y <= rect.bottom():
+        painter.drawLine(QPointF(rect.left(), y), QPointF(rect.right(), y))
+        y += grid_size
+    major_pen = QPen(view._grid_major_color)
+    major_pen.setWidth(0)
+    painter.setPen(major_pen)
+    major = grid_size * 5
+    x = int(rect.left() / major) * major
+    while x <= rect.right():
+        painter.drawLine(QPointF(x, rect.top()), QPointF(x, rect.bottom()))
+        x += major
+    y = int(rect.top() / major) * major
+    while y <= rect.bottom():
+        painter.drawLine(QPointF(rect.left(), y), QPointF(rect.right(), y))
+        y += major
+
+
+class TestGridLines:
+    def test_minor_lines_skip_major_positions(self, view) -> None:
+        _paint(view, _visible(view))
+        lines = view._grid_lines
+        assert lines.minor_v[0] and lines.major_v[0]
+        for family in (lines.major_v, lines.major_h):
+            assert all(round(pos / lines.step) % 5 == 0 for pos in family[0])
+        for family in (lines.minor_v, lines.minor_h):
+            assert all(round(pos / lines.step) % 5 != 0 for pos in family[0])
+
+    def test_small_exposure_draws_only_its_lines(self, view) -> None:
+        rect = _visible(view)
+        _paint(view, rect)
+        lines = view._grid_lines
+        strip = QRectF(rect.center().x(), rect.top(), lines.step * 2.5, rect.height())
+        assert len(lines._within(lines.minor_v, strip.left(), strip.right())) <= 3
+
+    def test_panning_reuses_the_line_sets(self, view) -> None:
+        rect = _visible(view)
+        _paint(view, rect)
+        cached = view._grid_lines
+        _paint(view, rect.translated(rect.width() / 4, rect.height() / 4))
+        assert view._grid_lines is cached
+
+    def test_panning_far_rebuilds(self, view) -> None:
+        rect = _visible(view)
+        _paint(view, rect)
+        cached = view._grid_lines
+        _paint(view, rect.translated(rect.width() * 3, 0))
+        assert view._grid_lines is not cached
+
+    def test_grid_size_change_rebuilds(self, view) -> None:
+        view.set_zoom(1.0)
+        _paint(view, _visible(view))
+        step = view._grid_lines.step
+        view.set_grid_size(20.0)
+        _paint(view, _visible(view))
+        assert view._grid_lines.step != step
+
+
+class TestBenchmark:
+    @pytest.mark.benchmark
+    def test_batched_grid_is_faster_at_high_dpi(self, view) -> None:
+        """Zoomed out to the densest step, on a 2x device: the batched grid
+        beats one drawLine call per line."""
+        view.fit_in_view()
+        rect = _visible(view)
+        _paint(view, rect, ratio=2.0)  # warm the line sets
+        step = view._grid_lines.step
+
+        image = QImage(1600, 1200, QImage.Format.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(2.0)
+
+        def timed(draw) -> float:
+            """Best of five runs of 20 frames (the first run warms up)."""
+            painter = QPainter(image)
+            painter.setTransform(view.viewportTransform())
+            runs = []
+            for _ in range(5):
+                start = time.perf_counter()
+                for _ in range(20):
+                    draw(painter)
+                runs.append(time.perf_counter() - start)
+            painter.end()
+            return min(runs)
+
+        batched = timed(lambda p: view._draw_grid(p, rect))
+        per_line = timed(lambda p: _per_line_grid(view, p, rect, step))
+        assert batched < per_line, (
+            f"batched {batched * 1000:.1f} ms vs per-line {per_line * 1000:.1f} ms"
+        )
@@ -0,0 +1,213 @@
+"""Integration tests for the threaded, streaming DXF import.
+
+``DxfImportService.parse_file`` turns modelspace entities into plain
+``DxfShape`` geometry (optionally chaining LINEs and simplifying vertices),
+``DxfImportWorker`` runs it off the GUI thread with progress and cancel, and
+``build_items`` creates the items in one batch on the GUI thread.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import ezdxf
+import pytest
+from PyQt6.QtCore import QTimer
+
+from open_garden_planner.services.dxf_service import (
+    DxfImportCancelled,
+    DxfImportService,
+    DxfImportWorker,
+    DxfLayerScanWorker,
+)
+from open_garden_planner.ui.canvas.canvas_scene import CanvasScene
+from open_garden_planner.ui.canvas.items.polygon_item import PolygonItem
+from open_garden_planner.ui.canvas.items.polyline_item import PolylineItem
+
+_WORKER_TIMEOUT_MS = 45_000
+
+
+@pytest.fixture()
+def scene(qtbot: object) -> CanvasScene:  # noqa: ARG001
+    return CanvasScene(width_cm=5000, height_cm=3000)
+
+
+def _write_survey(path: Path, entities: int, per_row: int = 100) -> None:
+    """A synthetic survey: rows of ``per_row`` collinear LINEs, 5 layers.
+
+    Written as raw DXF text — building 100k entities through ezdxf takes
+    longer than importing them.
+    """
+    parts = ["0\nSECTION\n2\nENTITIES\n"]
+    for i in range(entities):
+        row, col = divmod(i, per_row)
+        parts.append(
+            f"0\nLINE\n8\nSurvey{row % 5}\n10\n{col * 10}\n20\n{row * 10}\n30\n0\n"
+            f"11\n{(col + 1) * 10}\n21\n{row * 10}\n31\n0\n"
+        )
+    parts.append("0\nENDSEC\n0\nEOF\n")
+    path.write_text("".join(parts))
+
+
+def _lines_dxf(path: Path, segments: list[tuple[tuple[float, float], tuple[float, float]]]) -> None:
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for start, end in segments:
+        msp.add_line(start, end)
+    doc.saveas(str(path))
+
+
+class TestParse:
+    def test_shapes_are_plain_geometry_in_scene_units(self, tmp_path) -> None:
+        path = tmp_path / "mixed.dxf"
+        doc = ezdxf.new()
+        msp = doc.modelspace()
+        msp.add_circle((100, 50), radius=20)
+        msp.add_lwpolyline([(0, 0), (10, 0), (10, 10)], close=True)
+        doc.saveas(str(path))
+        parsed = DxfImportService.parse_file(path, scale_factor=2.0)
+        kinds = {shape.kind: shape for shape in parsed.shapes}
+        assert kinds["circle"].center == (200.0, 100.0) and kinds["circle"].radius == 40.0
+        assert kinds["polygon"].points == ((0.0, 0.0), (20.0, 0.0), (20.0, 20.0))
+        assert parsed.layers == ["0"]
+
+    def test_binary_dxf_is_read_too(self, tmp_path) -> None:
+        path = tmp_path / "binary.dxf"
+        doc = ezdxf.new()
+        doc.modelspace().add_circle((0, 0), radius=5)
+        doc.saveas(str(path), fmt="bin")
+        assert [s.kind for s in DxfImportService.parse_file(path).shapes] == ["circle"]
+
+    def test_merge_chains_lines_and_drops_collinear_vertices(self, tmp_path) -> None:
+        path = tmp_path / "chain.dxf"
+        # Ten collinear pieces, given out of order and partly reversed.
+        pieces = [((i * 10.0, 0.0), ((i + 1) * 10.0, 0.0)) for i in range(10)]
+        pieces = pieces[5:] + [(b, a) for a, b in pieces[:5]]
+        _lines_dxf(path, pieces)
+        parsed = DxfImportService.parse_file(path, merge_lines=True)
+        assert len(parsed.shapes) == 1
+        assert sorted(parsed.shapes[0].points) == [(0.0, 0.0), (100.0, 0.0)]
+        assert parsed.merged_lines == 9
+
+    def test_merge_keeps_corners_and_stops_at_branches(self, tmp_path) -> None:
+        path = tmp_path / "tee.dxf"
+        # An L-shaped chain, and a third segment branching off its corner.
+        _lines_dxf(path, [((0, 0), (10, 0)), ((10, 0), (10, 10)), ((10, 0), (20, 0))])
+        parsed = DxfImportService.parse_file(path, merge_lines=True)
+        assert len(parsed.shapes) == 3
+
+        path = tmp_path / "ell.dxf"
+        _lines_dxf(path, [((0, 0), (10, 0)), ((10, 0), (10, 10))])
+        (shape,) = DxfImportService.parse_file(path, merge_lines=True).shapes
+        assert len(shape.points) == 3
+
+    def test_closed_loop_becomes_a_closed_polyline(self, tmp_path) -> None:
+        path = tmp_path / "square.dxf"
+        corners = [(0, 0), (10, 0), (10, 10), (0, 10)]
+        _lines_dxf(path, [(corners[i], corners[(i + 1) % 4]) for i in range(4)])
+        (shape,) = DxfImportService.parse_file(path, merge_lines=True).shapes
+        assert len(shape.points) == 5 and shape.points[0] == shape.points[-1]
+
+    def test_simplify_tolerance_thins_polylines(self, tmp_path) -> None:
+        path = tmp_path / "wiggle.dxf"
+        doc = ezdxf.new()
+        doc.modelspace().add_lwpolyline([(x, 0.05 * (x % 2)) for x in range(50)])
+        doc.saveas(str(path))
+        exact = DxfImportService.parse_file(path).shapes[0]
+        thinned = DxfImportService.parse_file(path, simplify_tolerance=1.0).shapes[0]
+        assert len(exact.points) == 50
+        assert thinned.points == (exact.points[0], exact.points[-1])
+
+    def test_progress_and_cancel(self, tmp_path) -> None:
+        path = tmp_path / "survey.dxf"
+        _write_survey(path, 3000)
+        calls: list[tuple[int, int]] = []
+        DxfImportService.parse_file(path, progress_callback=lambda r, s: calls.append((r, s)))
+        assert len(calls) > 2
+        assert calls[-1][0] == calls[-1][1] == path.stat().st_size
+        assert [r for r, _ in calls] == sorted(r for r, _ in calls)
+        with pytest.raises(DxfImportCancelled):
+            DxfImportService.parse_file(path, cancel_check=lambda: True)
+
+    def test_build_items_matches_shapes(self, scene, tmp_path) -> None:
+        path = tmp_path / "survey.dxf"
+        _write_survey(path, 500, per_row=50)
+        parsed = DxfImportService.parse_file(path, merge_lines=True)
+        result = DxfImportService.build_items(scene, parsed)
+        assert len(result.items) == len(parsed.shapes) == 10
+        assert all(isinstance(item, PolylineItem) for item in result.items)
+        assert {layer.name for layer in scene.layers} >= {f"Survey{i}" for i in range(5)}
+        assert not isinstance(result.items[0], PolygonItem)
+
+
+class TestWorker:
+    def test_worker_delivers_the_parse(self, qtbot, tmp_path) -> None:
+        path = tmp_path / "survey.dxf"
+        _write_survey(path, 2000)
+        worker = DxfImportWorker(path, merge_lines=True)
+        progress: list[tuple[int, int]] = []
+        worker.progress.connect(lambda r, s: progress.append((r, s)))
+        with qtbot.waitSignal(worker.parsed, timeout=_WORKER_TIMEOUT_MS) as blocker:
+            worker.start()
+        worker.wait()
+        assert len(blocker.args[0].shapes) == 20
+        assert progress and progress[-1][0] == progress[-1][1]
+
+    def test_cancelled_worker_emits_nothing(self, qtbot, tmp_path) -> None:
+        path = tmp_path / "survey.dxf"
+        _write_survey(path, 20_000)
+        worker = DxfImportWorker(path)
+        delivered: list[object] = []
+        worker.parsed.connect(delivered.append)
+        worker.failed.connect(delivered.append)
+        worker.start()
+        worker.shutdown()
+        assert worker.isFinished()
+        qtbot.wait(50)
+        assert not delivered
+
+    def test_layer_scan_runs_off_the_gui_thread(self, qtbot, tmp_path) -> None:
+        path = tmp_path / "survey.dxf"
+        _write_survey(path, 1000)
+        worker = DxfLayerScanWorker(path)
+        with qtbot.waitSignal(worker.layers_ready, timeout=_WORKER_TIMEOUT_MS) as blocker:
+            worker.start()
+        worker.wait()
+        assert blocker.args[0] == [f"Survey{i}" for i in range(5)]
+
+
+class TestBenchmark:
+    @pytest.mark.benchmark
+    def test_100k_entity_survey_keeps_the_gui_responsive(self, qtbot, scene, tmp_path) -> None:
+        """100,000 LINEs: the parse runs on the worker while the GUI event
+        loop keeps ticking, and merging leaves 1,000 items to create."""
+        path = tmp_path / "survey.dxf"
+        _write_survey(path, 100_000)
+
+        ticks: list[float] = []
+        timer = QTimer()
+        timer.setInterval(10)
+        timer.timeout.connect(lambda: ticks.append(time.perf_counter()))
+        worker = DxfImportWorker(path, merge_lines=True)
+        timer.start()
+        started = time.perf_counter()
+        with qtbot.waitSignal(worker.parsed, timeout=_WORKER_TIMEOUT_MS) as blocker:
+            worker.start()
+        parse_seconds = time.perf_counter() - started
+        timer.stop()
+        worker.wait()
+        parsed = blocker.args[0]
+
+        gaps = [b - a for a, b in zip(ticks, ticks[1:], strict=False)]
+        assert parsed.entity_count == 100_000
+        assert len(parsed.shapes) == 1_000
+        assert max(gaps) < 0.25, f"GUI stalled {max(gaps) * 1000:.0f} ms during a {parse_seconds:.1f} s parse"
+
+        started = time.perf_counter()
+        result = DxfImportService.build_items(scene, parsed)
+        gui_seconds = time.perf_counter() - started
+        assert len(result.items) == 1_000
+        assert gui_seconds < parse_seconds / 5, (
+            f"GUI-thread item creation {gui_seconds:.2f} s vs parse {parse_seconds:.2f} s"
+        )
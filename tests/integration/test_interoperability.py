@@ -364,6 +364,98 @@ class TestPdfReport:
         finally:
             tmp.unlink(missing_ok=True)
 
+    def test_pdf_bed_pages_share_one_render_session(
+        self, scene: CanvasScene, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from open_garden_planner.services import pdf_report_service
+
+        beds = [
+            RectangleItem(100 + i * 150, 100, 120, 90, object_type=ObjectType.GARDEN_BED)
+            for i in range(5)
+        ]
+        for bed in beds:
+            scene.addItem(bed)
+        beds[0].setSelected(True)
+
+        entered: list[object] = []
+        original = pdf_report_service.export_render_state
+
+        def counting(*args: object, **kwargs: object):  # noqa: ANN202
+            entered.append(args[0])
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(pdf_report_service, "export_render_state", counting)
+        opts = PdfReportOptions(
+            include_cover=False,
+            include_overview=True,
+            include_bed_details=True,
+            include_plant_list=False,
+            include_legend=False,
+        )
+        PdfReportService.generate(scene, opts, tmp_path / "beds.pdf")
+        assert entered == [scene]
+        assert scene.selectedItems() == [beds[0]]
+
+    def test_pdf_per_page_timing_breakdown(self, scene: CanvasScene, tmp_path: Path) -> None:
+        scene.addItem(RectangleItem(100, 100, 300, 200, object_type=ObjectType.GARDEN_BED))
+        opts = PdfReportOptions(
+            include_cover=True,
+            include_overview=True,
+            include_bed_details=True,
+            include_plant_list=False,
+            include_legend=False,
+        )
+        reported = []
+        timings = PdfReportService.generate(
+            scene, opts, tmp_path / "t.pdf", timing_callback=reported.append
+        )
+        assert reported == timings
+        assert [t.page_type for t in timings] == ["cover", "overview", "bed"]
+        assert [t.scene_renders for t in timings] == [0, 1, 1]
+        assert all(t.seconds >= t.scene_seconds >= 0 for t in timings)
+
+    def test_pdf_bed_page_text_is_sized_for_its_own_scale(
+        self, qtbot: object, tmp_path: Path, monkeypatch: pytest.MonkeyPatch  # noqa: ARG002
+    ) -> None:
+        """Labels on a bed page use the bed page's scale, not the overview's."""
+        from PyQt6.QtWidgets import QGraphicsSimpleTextItem
+
+        from open_garden_planner.services import pdf_report_service
+        from open_garden_planner.services.scene_rendering import compute_export_font_size
+
+        large = CanvasScene(width_cm=6000, height_cm=4000)
+        large.addItem(RectangleItem(100, 100, 120, 90, object_type=ObjectType.GARDEN_BED))
+        label = QGraphicsSimpleTextItem("Tomatoes")
+        label.setPos(150, 150)
+        large.addItem(label)
+        original_size = label.font().pointSize()
+
+        rendered: list[tuple[float, int]] = []
+        original_image = pdf_report_service._RenderSession.image
+
+        def recording(session, source, dest):  # noqa: ANN001, ANN202
+            img = original_image(session, source, dest)
+            rendered.append((source.width(), label.font().pointSize()))
+            return img
+
+        monkeypatch.setattr(pdf_report_service._RenderSession, "image", recording)
+        opts = PdfReportOptions(
+            include_cover=False,
+            include_overview=True,
+            include_bed_details=True,
+            include_plant_list=False,
+            include_legend=False,
+        )
+        PdfReportService.generate(large, opts, tmp_path / "labels.pdf")
+
+        (_, overview_size), (bed_width, bed_size) = rendered
+        page_width_cm = 273 / 10  # A4 landscape minus 12 mm margins
+        assert bed_size == compute_export_font_size(
+            page_width_cm / bed_width, pdf_report_service._PDF_DPI
+        )
+        assert bed_size > overview_size  # one size for the report had shrunk it
+        assert label.font().pointSize() == original_size
+
 
 # ---------------------------------------------------------------------------
 # SVG export — Qt texture-fill clipping post-process (regression coverage)
@@ -0,0 +1,155 @@
+"""Integration tests for the layer membership index of CanvasScene.
+
+The scene keeps ``layer_id -> items`` and ``layer_id -> Layer`` maps so a
+layer toggle touches only that layer's items. These tests pin that the index
+follows adds, removals, ``layer_id`` changes and group children, that layer
+operations still reach every member, and the win on a 20k-item plan.
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+
+import pytest
+from PyQt6.QtCore import QPointF
+from PyQt6.QtWidgets import QGraphicsItem
+
+from open_garden_planner.core.object_types import ObjectType
+from open_garden_planner.models.layer import Layer
+from open_garden_planner.ui.canvas.canvas_scene import CanvasScene
+from open_garden_planner.ui.canvas.items import GroupItem, RectangleItem
+from open_garden_planner.ui.canvas.items.circle_item import CircleItem
+from open_garden_planner.ui.canvas.items.polygon_item import PolygonItem
+
+
+@pytest.fixture()
+def layers() -> tuple[Layer, Layer]:
+    return Layer(name="Plants", z_order=1), Layer(name="Ground", z_order=0)
+
+
+@pytest.fixture()
+def scene(qtbot, layers) -> CanvasScene:  # noqa: ARG001
+    scene = CanvasScene(width_cm=5000, height_cm=3000)
+    scene.set_layers(list(layers))
+    return scene
+
+
+def _rect(layer: Layer, x: float = 0.0) -> RectangleItem:
+    return RectangleItem(x, 0, 50, 50, layer_id=layer.id)
+
+
+class TestMembership:
+    def test_added_items_are_indexed(self, scene, layers) -> None:
+        plants, ground = layers
+        a, b = _rect(plants), _rect(ground)
+        scene.addItem(a)
+        scene.addItem(b)
+        assert scene.items_in_layer(plants.id) == [a]
+        assert scene.items_in_layer(ground.id) == [b]
+
+    def test_removed_items_leave_the_index(self, scene, layers) -> None:
+        plants, _ground = layers
+        a = _rect(plants)
+        scene.addItem(a)
+        scene.removeItem(a)
+        assert scene.items_in_layer(plants.id) == []
+
+    def test_layer_id_change_moves_the_item(self, scene, layers) -> None:
+        plants, ground = layers
+        a = _rect(plants)
+        scene.addItem(a)
+        a.layer_id = ground.id
+        assert scene.items_in_layer(plants.id) == []
+        assert scene.items_in_layer(ground.id) == [a]
+
+    def test_group_children_are_indexed(self, scene, layers) -> None:
+        plants, _ground = layers
+        a, b = _rect(plants), _rect(plants, 100)
+        group = GroupItem()
+        a.setParentItem(group)
+        b.setParentItem(group)
+        scene.addItem(group)
+        assert set(scene.items_in_layer(plants.id)) == {a, b}
+
+    def test_clear_empties_the_index(self, scene, layers) -> None:
+        plants, _ground = layers
+        scene.addItem(_rect(plants))
+        scene.clear()
+        assert scene.items_in_layer(plants.id) == []
+
+    def test_layer_lookup_follows_in_place_list_edits(self, scene) -> None:
+        extra = Layer(name="Extra")
+        scene.layers.append(extra)
+        assert scene.get_layer_by_id(extra.id) is extra
+        scene.layers.remove(extra)
+        scene.layers_changed.emit()
+        assert scene.get_layer_by_id(extra.id) is None
+        assert scene.get_layer_by_id(uuid.uuid4()) is None
+
+
+class TestLayerOperations:
+    def test_toggling_a_layer_touches_only_its_items(self, scene, layers) -> None:
+        plants, ground = layers
+        a, b = _rect(plants), _rect(ground)
+        scene.addItem(a)
+        scene.addItem(b)
+        scene.update_layer_visibility(plants.id, False)
+        scene.update_layer_lock(ground.id, True)
+        scene.update_layer_opacity(ground.id, 0.5)
+        assert not a.isVisible() and b.isVisible()
+        assert a.flags() & QGraphicsItem.GraphicsItemFlag.ItemIsMovable
+        assert not b.flags() & QGraphicsItem.GraphicsItemFlag.ItemIsMovable
+        assert a.opacity() == 1.0 and b.opacity() == 0.5
+
+    def test_remove_layer_moves_its_items(self, scene, layers) -> None:
+        plants, ground = layers
+        a = _rect(ground)
+        scene.addItem(a)
+        assert scene.remove_layer(ground.id)
+        assert a.layer_id == plants.id
+        assert scene.items_in_layer(plants.id) == [a]
+
+    def test_reorder_restacks_and_keeps_ridges_and_plants_on_top(self, scene, layers) -> None:
+        plants, ground = layers
+        roof = PolygonItem([QPointF(0, 0), QPointF(100, 0), QPointF(100, 100)], layer_id=ground.id)
+        ridge = PolygonItem(
+            [QPointF(10, 10), QPointF(20, 10), QPointF(20, 20)],
+            object_type=ObjectType.ROOF_RIDGE,
+            layer_id=ground.id,
+        )
+        ridge.set_metadata("owner_polygon_id", str(roof.item_id))
+        bed = RectangleItem(0, 0, 400, 400, object_type=ObjectType.RAISED_BED, layer_id=plants.id)
+        plant = CircleItem(50, 50, 10, object_type=ObjectType.PERENNIAL, layer_id=plants.id)
+        plant._parent_bed_id = bed.item_id
+        for item in (ridge, roof, plant, bed):
+            scene.addItem(item)
+        scene.reorder_layers([ground, plants])
+        assert roof.zValue() == 100 and bed.zValue() == 0
+        assert ridge.zValue() > roof.zValue()
+        assert plant.zValue() > bed.zValue()
+
+
+class TestBenchmark:
+    @pytest.mark.benchmark
+    def test_toggling_one_layer_of_a_large_plan_is_fast(self, scene, layers) -> None:
+        """20,000 items, 200 of them on the toggled layer: the toggle visits
+        only those, where the old pass walked every item."""
+        plants, ground = layers
+        for i in range(19_800):
+            scene.addItem(_rect(ground, i))
+        for i in range(200):
+            scene.addItem(_rect(plants, i))
+
+        start = time.perf_counter()
+        for _ in range(10):
+            scene.update_layer_visibility(plants.id, False)
+            scene.update_layer_visibility(plants.id, True)
+        indexed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(10):
+            scene._update_items_visibility()
+            scene._update_items_visibility()
+        full = time.perf_counter() - start
+        assert indexed * 10 < full, f"indexed {indexed * 1000:.1f} ms vs full {full * 1000:.1f} ms"
@@ -185,3 +185,19 @@ class TestFetchFlow:
         assert dialog.result() != dialog.DialogCode.Accepted
         assert dialog._ok_button.isEnabled() is True
         assert dialog._cancel_button.isEnabled() is True
+
+    def test_progress_shows_preview_and_tile_count(
+        self, qtbot, with_api_key, mock_web_view
+    ) -> None:
+        from PyQt6.QtGui import QImage
+
+        from open_garden_planner.ui.dialogs.map_picker_dialog import MapPickerDialog
+        dialog = MapPickerDialog()
+        qtbot.addWidget(dialog)
+        preview = QImage(40, 30, QImage.Format.Format_RGB888)
+        preview.fill(0)
+        dialog._on_fetch_progress(preview, 3, 12)
+        assert dialog._preview.isVisibleTo(dialog)
+        assert "3/12" in dialog._status.text()
+        dialog._on_fetch_cancelled()
+        assert not dialog._preview.isVisibleTo(dialog)
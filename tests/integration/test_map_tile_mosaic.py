@@ -0,0 +1,159 @@
+"""Integration tests for the concurrent, cached satellite mosaic fetch.
+
+``fetch_bbox`` fetches the grid-aligned Static Maps tiles of a mosaic on a
+bounded pool, keeps every tile in ``map_tile_cache`` and reports the mosaic
+after each tile. Static Maps here is a real HTTP server on loopback with a
+configurable latency, so the real ``requests`` client, threads and sockets
+are used.
+"""
+
+from __future__ import annotations
+
+import io
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from PIL import Image
+
+from open_garden_planner.services import google_maps_service as gms
+from open_garden_planner.services.map_tile_cache import MapTileCache, map_tile_cache
+
+# 3x2 grid-aligned calls at zoom 17.
+_BBOX = gms.BoundingBox(nw_lat=52.52, nw_lng=13.40, se_lat=52.515, se_lng=13.41)
+
+
+def _png(color: tuple[int, int, int]) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", (gms._TILE_EFFECTIVE_PX,) * 2, color).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+class _StaticMaps:
+    """Loopback stand-in for the Static Maps API; counts calls and concurrency."""
+
+    def __init__(self) -> None:
+        self.delay = 0.0
+        self.centers: list[str] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+        self._body = _png((40, 120, 40))
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 — http.server API
+                with stub._lock:
+                    stub.centers.append(parse_qs(urlparse(self.path).query)["center"][0])
+                    stub.active += 1
+                    stub.peak = max(stub.peak, stub.active)
+                time.sleep(stub.delay)
+                with stub._lock:
+                    stub.active -= 1
+                self.send_response(200)
+                self.send_header("Content-Type", "image/png")
+                self.send_header("Content-Length", str(len(stub._body)))
+                self.end_headers()
+                self.wfile.write(stub._body)
+
+            def log_message(self, *_args: object) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/staticmap"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+
+@pytest.fixture()
+def stub(monkeypatch) -> Iterator[_StaticMaps]:
+    stub = _StaticMaps()
+    monkeypatch.setattr(gms, "_STATIC_MAPS_URL", stub.url)
+    monkeypatch.setenv("OGP_GOOGLE_MAPS_KEY", "TEST_KEY")
+    yield stub
+    stub.server.shutdown()
+    stub.server.server_close()
+
+
+def test_tiles_are_fetched_concurrently(stub) -> None:
+    stub.delay = 0.4
+    start = time.monotonic()
+    result = gms.fetch_bbox(_BBOX)
+    elapsed = time.monotonic() - start
+
+    assert result.tile_grid == (3, 2)
+    assert len(stub.centers) == 6
+    assert 1 < stub.peak <= gms._MAX_CONCURRENT_TILES
+    assert elapsed < 6 * stub.delay * 0.75  # serial would take 6 * delay
+    assert result.image.getpixel((10, 10)) == (40, 120, 40)
+
+
+def test_refetch_is_served_from_cache(stub) -> None:
+    first = gms.fetch_bbox(_BBOX)
+    stub.centers.clear()
+
+    second = gms.fetch_bbox(_BBOX)
+
+    assert stub.centers == []
+    assert second.image.size == first.image.size
+    assert map_tile_cache().hits == 6
+
+
+def test_overlapping_bbox_fetches_only_new_tiles(stub) -> None:
+    gms.fetch_bbox(_BBOX)
+    stub.centers.clear()
+
+    shifted = gms.BoundingBox(
+        nw_lat=_BBOX.nw_lat, nw_lng=_BBOX.nw_lng + 0.006,
+        se_lat=_BBOX.se_lat, se_lng=_BBOX.se_lng + 0.006,
+    )
+    result = gms.fetch_bbox(shifted)
+
+    cols, rows = result.tile_grid
+    assert 0 < len(stub.centers) < cols * rows
+
+
+def test_progress_reports_every_tile(stub) -> None:
+    calls: list[tuple[int, int, tuple[int, int]]] = []
+
+    gms.fetch_bbox(
+        _BBOX, on_progress=lambda mosaic, done, total: calls.append((done, total, mosaic.size))
+    )
+
+    assert [done for done, _, _ in calls] == list(range(1, 7))
+    assert {total for _, total, _ in calls} == {6}
+    assert {size for _, _, size in calls} == {(3 * 1280, 2 * 1280)}
+
+
+def test_cancel_while_tiles_are_in_flight(stub) -> None:
+    stub.delay = 0.5
+    cancel = threading.Event()
+    threading.Timer(0.1, cancel.set).start()
+
+    start = time.monotonic()
+    with pytest.raises(gms.FetchCancelled):
+        gms.fetch_bbox(_BBOX, cancel_check=cancel.is_set)
+
+    assert time.monotonic() - start < 0.5
+    assert len(stub.centers) <= gms._MAX_CONCURRENT_TILES
+
+
+def test_corrupt_cached_tile_is_refetched(stub) -> None:
+    gms.fetch_bbox(_BBOX)
+    for file in map_tile_cache().root.rglob("*.png"):
+        file.write_bytes(b"not a png")
+    stub.centers.clear()
+
+    gms.fetch_bbox(_BBOX)
+
+    assert len(stub.centers) == 6
+
+
+def test_overwritten_tile_is_counted_once(tmp_path) -> None:
+    cache = MapTileCache(tmp_path / "tiles")
+    for size in (300, 500, 400):
+        cache.store(52.52, 13.40, 17, 2, b"x" * size)
+    assert cache.nbytes == 400
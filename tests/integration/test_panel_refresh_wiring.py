@@ -13,6 +13,10 @@ the *wiring* side that #222 left on the table:
 
 ``can_undo/redo_changed`` stay wired to the toolbar Undo/Redo action enablement
 only (their real job).
+
+Panels refresh only while they are showing (a collapsed Constraints panel, a
+hidden Plant Details bar), so each test first makes the panels under test
+visible.
 """
 
 # ruff: noqa: ARG001, ARG002, ARG005
@@ -21,7 +25,8 @@ from PyQt6.QtCore import QPointF
 from PyQt6.QtWidgets import QApplication, QMessageBox
 
 from open_garden_planner.core.commands import MoveItemsCommand
-from open_garden_planner.ui.canvas.items import RectangleItem
+from open_garden_planner.core.object_types import ObjectType
+from open_garden_planner.ui.canvas.items import CircleItem, RectangleItem
 from open_garden_planner.ui.panels import ConstraintsPanel
 from open_garden_planner.ui.panels.companion_panel import CompanionPanel
 from open_garden_planner.ui.panels.crop_rotation_panel import CropRotationPanel
@@ -65,8 +70,11 @@ class TestStackChangedDrivesPanels:
         monkeypatch.setattr(ConstraintsPanel, "refresh", _spy_refresh)
 
         win = _make_app(qtbot, monkeypatch)
+        win.show()
+        qtbot.waitExposed(win)
+        win._sidebar_controller.panel("constraints").header.pin_toggled.emit(True)
 
-        item = RectangleItem(0, 0, 100, 50)
+        item = CircleItem(0, 0, 50, object_type=ObjectType.TREE)
         win.canvas_scene.addItem(item)
         item.setSelected(True)
 
@@ -147,16 +155,26 @@ class TestCompanionCropRotationRefreshOnUndoRedo:
         monkeypatch.setattr(CropRotationPanel, "update_for_bed", _spy_crop)
 
         win = _make_app(qtbot, monkeypatch)
-        item = RectangleItem(0, 0, 100, 50)
-        win.canvas_scene.addItem(item)
-        item.setSelected(True)
+        plant = CircleItem(
+            0, 0, 30,
+            object_type=ObjectType.PERENNIAL,
+            metadata={"plant_species": {"common_name": "Tomato"}},
+        )
+        bed = RectangleItem(200, 0, 100, 50, object_type=ObjectType.GARDEN_BED)
+        win.canvas_scene.addItem(plant)
+        win.canvas_scene.addItem(bed)
         mgr = win.canvas_view.command_manager
 
-        mgr.execute(MoveItemsCommand([item], QPointF(10, 0)))
-        for action in ("undo", "redo"):
-            companion_calls.clear()
-            crop_calls.clear()
-            getattr(mgr, action)()
-            qtbot.waitUntil(lambda: bool(companion_calls) and bool(crop_calls))
-            assert companion_calls, f"companion panel must refresh on {action} (#225)"
-            assert crop_calls, f"crop-rotation panel must refresh on {action} (#225)"
+        # Each panel's bar shows only for its own kind of selection.
+        for item, calls, name in (
+            (plant, companion_calls, "companion"),
+            (bed, crop_calls, "crop-rotation"),
+        ):
+            win.canvas_scene.clearSelection()
+            item.setSelected(True)
+            mgr.execute(MoveItemsCommand([item], QPointF(10, 0)))
+            for action in ("undo", "redo"):
+                calls.clear()
+                getattr(mgr, action)()
+                qtbot.waitUntil(lambda calls=calls: bool(calls))
+                assert calls, f"{name} panel must refresh on {action} (#225)"
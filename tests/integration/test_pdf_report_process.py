@@ -0,0 +1,192 @@
+"""Integration tests for background-process PDF reports.
+
+``PdfReportJob`` rebuilds the plan from a ``snapshot_dict`` in a spawned
+offscreen worker and runs the same ``PdfReportService.generate`` there. The
+report it writes must match the one generated from the live scene: same
+page count, same text on every page.
+"""
+
+from __future__ import annotations
+
+import re
+import zlib
+from pathlib import Path
+
+import pytest
+
+from open_garden_planner.core.object_types import ObjectType
+from open_garden_planner.core.project import ProjectManager
+from open_garden_planner.services.pdf_report_process import (
+    PdfReportJob,
+    render_report_from_snapshot,
+)
+from open_garden_planner.services.pdf_report_service import PdfReportOptions, PdfReportService
+from open_garden_planner.ui.canvas.canvas_scene import CanvasScene
+from open_garden_planner.ui.canvas.items.circle_item import CircleItem
+from open_garden_planner.ui.canvas.items.rectangle_item import RectangleItem
+
+#: Spawning the worker imports Qt and the app from scratch.
+_WORKER_TIMEOUT_MS = 45_000
+
+
+# ---------------------------------------------------------------------------
+# Minimal text extraction for the PDFs QPdfWriter produces: Identity-H fonts
+# with a ToUnicode bfrange/bfchar CMap, text shown as ``<hex> Tj``.
+# ---------------------------------------------------------------------------
+
+def _objects(pdf: bytes) -> dict[int, bytes]:
+    return {
+        int(m.group(1)): m.group(2)
+        for m in re.finditer(rb"(?:^|\n)(\d+) 0 obj(.*?)endobj", pdf, re.S)
+    }
+
+
+def _stream(body: bytes) -> bytes:
+    data = re.search(rb"stream\r?\n(.*?)\r?\nendstream", body, re.S).group(1)
+    return zlib.decompress(data) if b"/FlateDecode" in body.split(b"stream")[0] else data
+
+
+def _ref(body: bytes, key: bytes) -> int:
+    return int(re.search(rb"/" + key + rb"\s+(\d+) 0 R", body).group(1))
+
+
+def _cmap(text: bytes) -> dict[int, str]:
+    mapping: dict[int, str] = {}
+    for block in re.findall(rb"beginbfrange(.*?)endbfrange", text, re.S):
+        for lo, hi, dst in re.findall(rb"<(\w+)>\s*<(\w+)>\s*(\[.*?\]|<\w+>)", block, re.S):
+            targets = re.findall(rb"<(\w+)>", dst)
+            for offset, code in enumerate(range(int(lo, 16), int(hi, 16) + 1)):
+                uni = int(targets[offset if dst.startswith(b"[") else 0], 16)
+                mapping[code] = chr(uni if dst.startswith(b"[") else uni + offset)
+    for block in re.findall(rb"beginbfchar(.*?)endbfchar", text, re.S):
+        for code, uni in re.findall(rb"<(\w+)>\s*<(\w+)>", block):
+            mapping[int(code, 16)] = chr(int(uni, 16))
+    return mapping
+
+
+def _pdf_pages_text(path: Path) -> list[str]:
+    objects = _objects(path.read_bytes())
+    pages_root = next(b for b in objects.values() if re.search(rb"/Type\s*/Pages\b", b))
+    kids = [int(n) for n in re.findall(rb"(\d+) 0 R", pages_root.split(b"/Kids")[1].split(b"]")[0])]
+    texts = []
+    for page_id in kids:
+        page = objects[page_id]
+        resources = objects[_ref(page, b"Resources")]
+        font_block = resources.split(b"/Font")[1].split(b">>")[0] if b"/Font" in resources else b""
+        fonts = {
+            name: _cmap(_stream(objects[_ref(objects[int(ref)], b"ToUnicode")]))
+            for name, ref in re.findall(rb"/(\w+)\s+(\d+) 0 R", font_block)
+        }
+        content = _stream(objects[_ref(page, b"Contents")])
+        font: dict[int, str] = {}
+        chars = []
+        for tf, glyphs in re.findall(rb"/(\w+) [\d.]+ Tf|<(\w+)> Tj", content):
+            if tf:
+                font = fonts[tf]
+            else:
+                chars.extend(font.get(int(glyphs[i:i + 4], 16), "?") for i in range(0, len(glyphs), 4))
+        # Qt maps the space glyph to U+0009 in its ToUnicode CMaps.
+        texts.append("".join(chars).replace("\t", " "))
+    return texts
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture()
+def scene(qtbot: object) -> CanvasScene:  # noqa: ARG001
+    scene = CanvasScene(width_cm=1200, height_cm=900)
+    for i in range(3):
+        bed = RectangleItem(100 + i * 350, 100, 300, 200, object_type=ObjectType.RAISED_BED)
+        bed.name = f"Bed {i + 1}"
+        scene.addItem(bed)
+    for i, kind in enumerate((ObjectType.TREE, ObjectType.SHRUB, ObjectType.PERENNIAL)):
+        plant = CircleItem(200 + i * 300, 600, 40, object_type=kind)
+        plant.name = f"Plant {i + 1}"
+        scene.addItem(plant)
+    return scene
+
+
+@pytest.fixture()
+def opts() -> PdfReportOptions:
+    return PdfReportOptions(
+        include_bed_details=True,
+        project_name="Background Garden",
+        author="Tester",
+        export_date="2026-10-18",
+    )
+
+
+def _run_job(qtbot, job: PdfReportJob) -> list[tuple[int, int]]:
+    progress: list[tuple[int, int]] = []
+    job.progress.connect(lambda c, t: progress.append((c, t)))
+    with qtbot.waitSignal(job.finished, timeout=_WORKER_TIMEOUT_MS):
+        job.start()
+    return progress
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+class TestSnapshotPath:
+    def test_snapshot_scene_matches_live_report(self, scene, opts, tmp_path) -> None:
+        live, rebuilt = tmp_path / "live.pdf", tmp_path / "rebuilt.pdf"
+        PdfReportService.generate(scene, opts, live)
+        render_report_from_snapshot(ProjectManager().snapshot_dict(scene), opts, rebuilt)
+        assert _pdf_pages_text(rebuilt) == _pdf_pages_text(live)
+
+
+class TestPdfReportJob:
+    def test_worker_report_matches_in_process_report(self, qtbot, scene, opts, tmp_path) -> None:
+        in_process, background = tmp_path / "in_process.pdf", tmp_path / "background.pdf"
+        timings = PdfReportService.generate(scene, opts, in_process)
+
+        job = PdfReportJob(ProjectManager().snapshot_dict(scene), opts, background)
+        progress = _run_job(qtbot, job)
+
+        expected = _pdf_pages_text(in_process)
+        actual = _pdf_pages_text(background)
+        assert len(actual) == len(expected) == len(timings)
+        assert actual == expected
+        assert "Background Garden" in actual[0]
+        assert any("Plant 2" in page for page in actual)
+        assert progress[-1] == (len(timings), len(timings))
+        assert not (tmp_path / "background.pdf.part").exists()
+
+    def test_editing_the_scene_does_not_change_a_started_report(
+        self, qtbot, scene, opts, tmp_path
+    ) -> None:
+        expected = tmp_path / "expected.pdf"
+        PdfReportService.generate(scene, opts, expected)
+        job = PdfReportJob(ProjectManager().snapshot_dict(scene), opts, tmp_path / "out.pdf")
+        with qtbot.waitSignal(job.finished, timeout=_WORKER_TIMEOUT_MS):
+            job.start()
+            scene.addItem(CircleItem(900, 700, 30, object_type=ObjectType.TREE))
+        assert _pdf_pages_text(tmp_path / "out.pdf") == _pdf_pages_text(expected)
+
+    def test_failure_is_reported(self, qtbot, scene, opts, tmp_path) -> None:
+        target = tmp_path / "missing" / "report.pdf"
+        job = PdfReportJob(ProjectManager().snapshot_dict(scene), opts, target)
+        with qtbot.waitSignal(job.failed, timeout=_WORKER_TIMEOUT_MS):
+            job.start()
+        assert not job.is_running
+        assert not target.exists()
+
+    def test_cancel_stops_the_worker_and_removes_the_partial_file(
+        self, qtbot, scene, opts, tmp_path
+    ) -> None:
+        target = tmp_path / "cancelled.pdf"
+        job = PdfReportJob(ProjectManager().snapshot_dict(scene), opts, target)
+        finished: list[int] = []
+        job.finished.connect(finished.append)
+        job.start()
+        process = job._process
+        job.cancel()
+        assert not job.is_running
+        assert not process.is_alive()
+        qtbot.wait(200)
+        assert not finished
+        assert not target.exists()
+        assert not (tmp_path / "cancelled.pdf.part").exists()
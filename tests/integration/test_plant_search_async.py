@@ -0,0 +1,281 @@
+"""Integration tests for the concurrent, cached plant search.
+
+``PlantSearchJob`` asks every configured database at once on worker threads
+and streams answers back; ``PlantApiCache`` keeps answers in a TTL'd SQLite
+file so a repeated query or a re-confirmed plant never goes back to the
+network. The providers here are real HTTP servers on loopback with
+configurable latency, so the real clients, threads and sockets are used.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+import pytest
+
+from open_garden_planner.services.plant_api import PlantAPIManager, PlantSearchJob
+from open_garden_planner.services.plant_api.cache import PlantApiCache, plant_api_cache
+from open_garden_planner.services.plant_api.perenual_client import PerenualClient
+from open_garden_planner.services.plant_api.trefle_client import TrefleClient
+from open_garden_planner.ui.dialogs.plant_search_dialog import PlantSearchDialog
+
+_TIMEOUT_MS = 10_000
+
+
+class _Provider:
+    """Loopback stand-in for Trefle (``/trefle``) and Perenual (``/perenual``)."""
+
+    def __init__(self) -> None:
+        self.delays = {"trefle": 0.0, "perenual": 0.0}
+        # Cleared gates hold a source's answer until the test releases it.
+        self.gates = {"trefle": threading.Event(), "perenual": threading.Event()}
+        for gate in self.gates.values():
+            gate.set()
+        self.failing: set[str] = set()
+        self.requests: list[str] = []
+        provider = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 — http.server API
+                url = urlparse(self.path)
+                source = url.path.split("/")[1]
+                query = dict(p.split("=", 1) for p in url.query.split("&") if "=" in p).get("q", "")
+                provider.requests.append(f"{source} {url.path} {query}")
+                provider.gates[source].wait(_TIMEOUT_MS / 1000)
+                time.sleep(provider.delays[source])
+                if source in provider.failing:
+                    self.send_response(500)
+                    self.end_headers()
+                    return
+                body = json.dumps(provider.answer(source, url.path, query)).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_args: object) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    @staticmethod
+    def answer(source: str, path: str, query: str) -> dict:
+        if source == "trefle" and path.startswith("/trefle/plants/") and not path.endswith("/search"):
+            plant_id = int(path.rsplit("/", 1)[1])
+            return {"data": {"main_species": {
+                "id": plant_id, "common_name": "Carrot", "scientific_name": "Daucus carota",
+                "growth": {"light": 8},
+            }}}
+        if source == "trefle":
+            return {"data": [{"id": 171170, "common_name": f"{query} (T)", "scientific_name": "Daucus carota"}]}
+        return {"data": [{"id": 3384, "common_name": f"{query} (P)", "scientific_name": ["Helianthus annuus"]}]}
+
+    def count(self, source: str) -> int:
+        return sum(r.startswith(source) for r in self.requests)
+
+
+@pytest.fixture()
+def provider(monkeypatch: pytest.MonkeyPatch) -> Iterator[_Provider]:
+    provider = _Provider()
+    monkeypatch.setattr(TrefleClient, "BASE_URL", f"{provider.url}/trefle")
+    monkeypatch.setattr(PerenualClient, "BASE_URL", f"{provider.url}/perenual")
+    monkeypatch.setattr(
+        "open_garden_planner.services.plant_library.get_plant_library",
+        lambda: type("_NoLibrary", (), {"search_plants": lambda _self, _q: []})(),
+    )
+    yield provider
+    for gate in provider.gates.values():
+        gate.set()
+    provider.server.shutdown()
+    provider.server.server_close()
+
+
+def _manager() -> PlantAPIManager:
+    return PlantAPIManager(trefle_api_token="fake-token", perenual_api_key="fake-key")
+
+
+def _run(qtbot, job: PlantSearchJob) -> tuple[list[str], object]:
+    answered: list[str] = []
+    job.source_answered.connect(lambda source, _results: answered.append(source))
+    with qtbot.waitSignal(job.finished, timeout=_TIMEOUT_MS) as blocker:
+        job.start()
+    return answered, blocker.args[0]
+
+
+class TestConcurrentSearch:
+    def test_sources_are_asked_at_once_and_stream_in(self, qtbot, provider) -> None:
+        for gate in provider.gates.values():
+            gate.clear()
+        job = PlantSearchJob(_manager(), "zyzzyva")
+        answered: list[str] = []
+        job.source_answered.connect(lambda source, _results: answered.append(source))
+        job.start()
+
+        # Neither source can answer yet, so both requests are in flight at once.
+        qtbot.waitUntil(lambda: provider.count("trefle") == provider.count("perenual") == 1)
+        assert answered == ["custom", "local"]
+
+        provider.gates["perenual"].set()
+        qtbot.waitUntil(lambda: "Perenual" in answered, timeout=_TIMEOUT_MS)
+        assert "Trefle" not in answered
+        with qtbot.waitSignal(job.finished, timeout=_TIMEOUT_MS) as blocker:
+            provider.gates["trefle"].set()
+        assert answered == ["custom", "local", "Perenual", "Trefle"]
+        assert blocker.args[0].result_count == 2 and not blocker.args[0].failed
+
+    def test_a_failed_source_is_reported_and_not_cached(self, qtbot, provider) -> None:
+        provider.failing.add("perenual")
+        manager = _manager()
+        _, outcome = _run(qtbot, PlantSearchJob(manager, "zyzzyva"))
+        assert outcome.failed_sources == ("Perenual",)
+        assert manager.last_search_failed_sources == ["Perenual"]
+
+        provider.failing.clear()
+        _, outcome = _run(qtbot, PlantSearchJob(manager, "zyzzyva"))
+        assert outcome.failed_sources == ()
+        assert provider.count("perenual") == 2  # retried
+        assert provider.count("trefle") == 1  # cached
+
+    def test_everything_failing_is_a_failure(self, qtbot, provider) -> None:
+        provider.failing.update({"trefle", "perenual"})
+        _, outcome = _run(qtbot, PlantSearchJob(_manager(), "zyzzyva"))
+        assert outcome.failed and outcome.last_error
+
+
+class TestCache:
+    def test_repeated_query_is_served_without_the_network(self, qtbot, provider) -> None:
+        _run(qtbot, PlantSearchJob(_manager(), "Zyzzyva"))
+        assert len(provider.requests) == 2
+
+        # A fresh manager (the next dialog) shares the cache; case and
+        # spacing do not matter. Closed gates would hold any network call.
+        for gate in provider.gates.values():
+            gate.clear()
+        answered, outcome = _run(qtbot, PlantSearchJob(_manager(), "  zyzzyva "))
+        assert len(provider.requests) == 2
+        assert answered == ["custom", "local", "Trefle", "Perenual"]
+        assert outcome.result_count == 2
+
+    def test_cache_outlives_the_process_and_expires(self, provider, tmp_path) -> None:
+        path = tmp_path / "cache.sqlite3"
+        PlantAPIManager(trefle_api_token="fake-token", cache=PlantApiCache(path)).search_source(
+            "Trefle", "zyzzyva"
+        )
+        reopened = PlantApiCache(path)
+        assert reopened.get_search("Trefle", "zyzzyva", 10)[0].source_id == "171170"
+
+        expired = PlantApiCache(path, search_ttl_s=0)
+        time.sleep(0.01)
+        assert expired.get_search("Trefle", "zyzzyva", 10) is None
+        PlantAPIManager(trefle_api_token="fake-token", cache=expired).search_source("Trefle", "zyzzyva")
+        assert provider.count("trefle") == 2
+
+    def test_damaged_cache_file_falls_back_to_the_network(self, qtbot, provider) -> None:
+        path = plant_api_cache().path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"not a database" * 100)
+
+        answered, outcome = _run(qtbot, PlantSearchJob(_manager(), "zyzzyva"))
+
+        assert set(answered) == {"custom", "local", "Perenual", "Trefle"}
+        assert outcome.result_count == 2 and not outcome.failed
+        assert len(provider.requests) == 2
+
+    def test_detail_records_are_cached(self, provider) -> None:
+        manager = _manager()
+        first = manager.get_by_id("171170", "trefle")
+        second = _manager().get_by_id("171170", "trefle")
+        assert first == second and first.source_id == "171170"
+        assert provider.count("trefle") == 1
+        assert plant_api_cache().hits == 1
+
+
+class TestDialog:
+    def test_superseded_query_never_reaches_the_list(self, qtbot, provider) -> None:
+        provider.delays.update(trefle=0.4, perenual=0.4)
+        dlg = PlantSearchDialog(_manager())
+        qtbot.addWidget(dlg)
+        dlg.search_input.setText("zyzzyva")
+        dlg._perform_search()
+        assert not dlg.search_button.isEnabled()
+        qtbot.waitUntil(lambda: len(provider.requests) == 2, timeout=_TIMEOUT_MS)  # in flight
+
+        provider.delays.update(trefle=0.0, perenual=0.0)
+        dlg.search_input.setText("quokkaweed")
+        with qtbot.waitSignal(dlg.search_finished, timeout=_TIMEOUT_MS):
+            dlg._perform_search()
+        qtbot.wait(700)  # the zyzzyva answers arrive, and are dropped
+
+        rows = [dlg.results_list.item(i).text() for i in range(dlg.results_list.count())]
+        assert len(rows) == 2 and all("quokkaweed" in row for row in rows)
+        assert dlg.status_label.text() == "Found 2 results"
+        assert dlg.search_button.isEnabled()
+        # The dropped answers that were already in flight still landed in the cache.
+        assert plant_api_cache().get_search("Trefle", "zyzzyva", 20) is not None
+
+    def test_rows_keep_source_order_and_selection(self, qtbot, provider) -> None:
+        provider.delays.update(trefle=0.5, perenual=0.0)
+        dlg = PlantSearchDialog(_manager())
+        qtbot.addWidget(dlg)
+        dlg.search_input.setText("zyzzyva")
+        with qtbot.waitSignal(dlg.search_finished, timeout=_TIMEOUT_MS):
+            dlg._perform_search()
+            qtbot.waitUntil(lambda: dlg.results_list.count() == 1, timeout=_TIMEOUT_MS)
+            assert "so far" in dlg.status_label.text()
+            dlg.results_list.setCurrentRow(0)
+
+        assert "Trefle" in dlg.results_list.item(0).text()
+        assert "Perenual" in dlg.results_list.item(1).text()
+        assert dlg.selected_plant is not None and dlg.selected_plant.data_source == "perenual"
+
+    def test_local_matches_show_before_any_network_answer(self, qtbot, provider) -> None:
+        provider.delays.update(trefle=0.3, perenual=0.3)
+        dlg = PlantSearchDialog(_manager())
+        qtbot.addWidget(dlg)
+        dlg.search_input.setText("carot")  # a typo, fuzzy-matched locally
+        with qtbot.waitSignal(dlg.search_finished, timeout=_TIMEOUT_MS):
+            dlg._perform_search()
+            assert [dlg.results_list.item(i).text() for i in range(dlg.results_list.count())] == [
+                "Carrot (Daucus carota) — Bundled"
+            ]
+        # The databases' rows go above the local match.
+        assert "Bundled" in dlg.results_list.item(dlg.results_list.count() - 1).text()
+
+    def test_cached_copy_gives_way_to_the_live_record(self, qtbot, provider) -> None:
+        _run(qtbot, PlantSearchJob(_manager(), "zyzzyva"))
+        provider.delays.update(trefle=0.2, perenual=0.2)
+        dlg = PlantSearchDialog(_manager())
+        qtbot.addWidget(dlg)
+        dlg.search_input.setText("zyzzyv")
+        with qtbot.waitSignal(dlg.search_finished, timeout=_TIMEOUT_MS):
+            dlg._perform_search()
+            # Both records fetched for "zyzzyva" match from the local index.
+            assert dlg.results_list.count() == 2
+        rows = [dlg.results_list.item(i).text() for i in range(dlg.results_list.count())]
+        assert rows == [
+            "zyzzyv (T) (Daucus carota) — Trefle",
+            "zyzzyv (P) (Helianthus annuus) — Perenual",
+        ]
+        assert dlg.status_label.text() == "Found 2 results"
+
+    def test_closing_mid_search_drops_the_search(self, qtbot, provider) -> None:
+        provider.delays.update(trefle=0.3, perenual=0.3)
+        dlg = PlantSearchDialog(_manager())
+        qtbot.addWidget(dlg)
+        finished: list[object] = []
+        dlg.search_finished.connect(lambda: finished.append(True))
+        dlg.search_input.setText("zyzzyva")
+        dlg._perform_search()
+        dlg.reject()
+        qtbot.wait(600)
+        assert not finished
+        assert dlg.results_list.count() == 0
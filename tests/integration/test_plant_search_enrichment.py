@@ -34,6 +34,9 @@ from PyQt6.QtCore import Qt
 from open_garden_planner.services.plant_api import PlantAPIManager
 from open_garden_planner.ui.dialogs.plant_search_dialog import PlantSearchDialog
 
+#: The dialog searches on worker threads; every search here answers from mocks.
+_SEARCH_TIMEOUT_MS = 5_000
+
 # Trimmed to the fields these tests exercise; shape verified live against
 # Trefle's real /plants/search and /plants/{id} responses during the #297
 # investigation (search has no growth/specifications/foliage at all).
@@ -123,7 +126,8 @@ def dialog(qtbot, monkeypatch):
     dlg = PlantSearchDialog(manager)
     qtbot.addWidget(dlg)
     dlg.search_input.setText("carrot")
-    dlg._perform_search()
+    with qtbot.waitSignal(dlg.search_finished, timeout=_SEARCH_TIMEOUT_MS):
+        dlg._perform_search()
     dlg.results_list.setCurrentRow(0)
     return dlg
 
@@ -290,7 +294,8 @@ class TestSearchResultEnrichment:
         dlg = PlantSearchDialog(manager)
         qtbot.addWidget(dlg)
         dlg.search_input.setText("veg")
-        dlg._perform_search()
+        with qtbot.waitSignal(dlg.search_finished, timeout=_SEARCH_TIMEOUT_MS):
+            dlg._perform_search()
         assert dlg.results_list.count() == 3
 
         # Browse all three rows -- selection-change must not itself enrich.
@@ -452,7 +457,8 @@ class TestSearchResultEnrichment:
         dlg = PlantSearchDialog(manager)
         qtbot.addWidget(dlg)
         dlg.search_input.setText("sunflower")
-        dlg._perform_search()
+        with qtbot.waitSignal(dlg.search_finished, timeout=_SEARCH_TIMEOUT_MS):
+            dlg._perform_search()
         dlg.results_list.setCurrentRow(0)
         assert dlg.selected_plant.sun_requirement.value == "full_sun"  # from search itself
 
@@ -531,9 +537,13 @@ class TestResultListSourceLabel:
         dlg = PlantSearchDialog(manager)
         qtbot.addWidget(dlg)
         dlg.search_input.setText("carrot")
-        dlg._perform_search()
+        with qtbot.waitSignal(dlg.search_finished, timeout=_SEARCH_TIMEOUT_MS):
+            dlg._perform_search()
 
-        assert dlg.results_list.count() == 2
+        # Custom first, then Trefle; the bundled "Carrot" matched from the
+        # local species index comes last.
+        assert dlg.results_list.count() == 3
+        assert "Bundled" in dlg.results_list.item(2).text()
         row_texts = [dlg.results_list.item(i).text() for i in range(2)]
         # Same common/scientific name on both rows -- only the source label
         # tells them apart.
@@ -567,9 +577,10 @@ class TestResultListSourceLabel:
         dlg = PlantSearchDialog(manager)
         qtbot.addWidget(dlg)
         dlg.search_input.setText("carrot")
-        dlg._perform_search()
+        with qtbot.waitSignal(dlg.search_finished, timeout=_SEARCH_TIMEOUT_MS):
+            dlg._perform_search()
 
-        assert dlg.results_list.count() == 1
+        assert dlg.results_list.count() == 2  # + the bundled "Carrot", listed last
         assert "Legacy Carrot" in dlg.results_list.item(0).text()
         assert "Unknown source" in dlg.results_list.item(0).text()
 
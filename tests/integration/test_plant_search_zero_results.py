@@ -27,6 +27,9 @@ from open_garden_planner.services.plant_api.permapeople_client import Permapeopl
 from open_garden_planner.services.plant_api.trefle_client import TrefleClient
 from open_garden_planner.ui.dialogs.plant_search_dialog import PlantSearchDialog
 
+#: The dialog searches on worker threads; every search here answers from mocks.
+_SEARCH_TIMEOUT_MS = 5_000
+
 EMPTY_SEARCH_RESPONSE = {"data": []}
 
 
@@ -74,7 +77,8 @@ class TestZeroResultsIsNotReportedAsFailure:
             "open_garden_planner.ui.dialogs.plant_search_dialog.QMessageBox.warning"
         ) as mock_warn:
             dlg.search_input.setText("mahachanok")
-            dlg._perform_search()
+            with qtbot.waitSignal(dlg.search_finished, timeout=_SEARCH_TIMEOUT_MS):
+                dlg._perform_search()
 
         assert "No plants matched" in dlg.status_label.text()
         assert "unavailable" not in dlg.status_label.text()
@@ -115,7 +119,8 @@ class TestZeroResultsIsNotReportedAsFailure:
             "open_garden_planner.ui.dialogs.plant_search_dialog.QMessageBox.warning"
         ) as mock_warn:
             dlg.search_input.setText("mahachanok")
-            dlg._perform_search()
+            with qtbot.waitSignal(dlg.search_finished, timeout=_SEARCH_TIMEOUT_MS):
+                dlg._perform_search()
 
         text = dlg.status_label.text()
         assert "No plants matched" in text
@@ -149,7 +154,8 @@ class TestZeroResultsIsNotReportedAsFailure:
             "open_garden_planner.ui.dialogs.plant_search_dialog.QMessageBox.warning"
         ) as mock_warn:
             dlg.search_input.setText("mahachanok")
-            dlg._perform_search()
+            with qtbot.waitSignal(dlg.search_finished, timeout=_SEARCH_TIMEOUT_MS):
+                dlg._perform_search()
 
         assert dlg.status_label.text().startswith("Search failed")
         mock_warn.assert_called_once()
@@ -185,7 +191,8 @@ class TestZeroResultsIsNotReportedAsFailure:
             "open_garden_planner.ui.dialogs.plant_search_dialog.QMessageBox.warning"
         ) as mock_warn:
             dlg.search_input.setText("mahachanok")
-            dlg._perform_search()
+            with qtbot.waitSignal(dlg.search_finished, timeout=_SEARCH_TIMEOUT_MS):
+                dlg._perform_search()
 
         assert "No plant databases are configured" in dlg.status_label.text()
         mock_warn.assert_not_called()
@@ -37,6 +37,7 @@ from open_garden_planner.ui.canvas.sun_shadow_controller import (
     STATE_NO_LOCATION,
     SunShadowController,
     SunShadowOverlayItem,
+    day_instants,
 )
 from open_garden_planner.ui.widgets.sun_sim_toolbar import SunSimToolbar
 
@@ -529,6 +530,101 @@ class TestPerf:
         # Campaign gate: < 50 ms on dev hardware; ×4 slack for CI runners.
         assert elapsed < 0.200, f"200-item recompute took {elapsed * 1000:.1f} ms"
 
+    def test_scrubbing_back_reuses_cached_sweeps(self, qtbot, scene) -> None:  # noqa: ARG002
+        """Dragging the slider back over visited minutes rebuilds no caster's
+        footprint or sweep; moving one item re-sweeps only that item."""
+        items = []
+        for i in range(50):
+            item = RectangleItem(
+                (i % 10) * 45.0, (i // 10) * 90.0, 30, 30,
+                object_type=ObjectType.GENERIC_RECTANGLE,
+            )
+            item.metadata[METADATA_KEY] = 120.0
+            scene.addItem(item)
+            items.append(item)
+        controller = SunShadowController(scene, lambda: BERLIN)
+        controller.set_sim_datetime(JUNE_NOON_UTC)
+        controller.set_enabled(True)
+        minutes = [datetime(2026, 6, 21, 9, m, tzinfo=UTC) for m in range(0, 60, 5)]
+        for instant in minutes:
+            controller.set_sim_datetime(instant)
+        engine = controller._engine
+        builds, sweeps = engine.builds, engine.sweeps_computed
+        for instant in reversed(minutes):
+            controller.set_sim_datetime(instant)
+        assert (engine.builds, engine.sweeps_computed) == (builds, sweeps)
+
+        items[0].setPos(items[0].pos().x() + 5.0, items[0].pos().y())
+        controller.recompute_now()
+        assert engine.builds == builds + 1
+        assert engine.sweeps_computed == sweeps + 1
+
+
+class TestPlayback:
+    """Animate precomputes frames off the GUI thread; ticks hit the cache."""
+
+    def _start(self, qtbot, scene, instants) -> SunShadowController:
+        controller = SunShadowController(scene, lambda: BERLIN)
+        controller.set_sim_datetime(instants[0])
+        controller.set_enabled(True)
+        assert controller.start_playback(instants)
+        qtbot.waitUntil(lambda: not controller.is_precomputing, timeout=10000)
+        qtbot.wait(50)  # drain the queued frame_ready deliveries
+        return controller
+
+    def test_day_instants_cover_the_day_from_start(self) -> None:
+        start = datetime(2026, 6, 21, 13, 20, tzinfo=UTC)
+        instants = day_instants(start, 10)
+        assert len(instants) == 144
+        assert instants[0] == start
+        assert instants[-1] == datetime(2026, 6, 21, 13, 10, tzinfo=UTC)
+        assert len(set(instants)) == 144
+
+    def test_ticks_are_served_from_precomputed_frames(self, qtbot, scene) -> None:
+        _make_caster(scene)
+        instants = [datetime(2026, 6, 21, 10, m, tzinfo=UTC) for m in range(0, 60, 10)]
+        controller = self._start(qtbot, scene, instants)
+        assert controller.cached_frame_count() == len(instants)
+        sweeps = controller._engine.sweeps_computed
+        hits = controller.frame_hits
+        for instant in instants[1:]:
+            controller.set_sim_datetime(instant)
+        assert controller.frame_hits == hits + len(instants) - 1
+        assert controller._engine.sweeps_computed == sweeps
+
+    def test_frame_matches_on_demand_shadow(self, qtbot, scene) -> None:
+        _make_caster(scene)
+        instant = datetime(2026, 6, 21, 9, 0, tzinfo=UTC)
+        controller = self._start(qtbot, scene, [JUNE_NOON_UTC, instant])
+        controller.set_sim_datetime(instant)
+        cached = QRectF(controller._overlay.path().boundingRect())
+        controller.stop_playback()
+        controller._frames.clear()
+        controller._last_key = None
+        controller.recompute_now()
+        on_demand = controller._overlay.path().boundingRect()
+        assert cached == on_demand
+
+    def test_edit_invalidates_and_recomputes_frames(self, qtbot, scene) -> None:
+        item = _make_caster(scene)
+        instants = [datetime(2026, 6, 21, 10, m, tzinfo=UTC) for m in range(0, 60, 10)]
+        controller = self._start(qtbot, scene, instants)
+        item.setPos(item.pos().x() + 30.0, item.pos().y())
+        controller.recompute_now()  # the debounced edit path
+        assert controller.cached_frame_count() == 0
+        qtbot.waitUntil(
+            lambda: controller.cached_frame_count() == len(instants), timeout=10000
+        )
+
+    def test_disable_stops_the_worker(self, qtbot, scene) -> None:
+        _make_caster(scene)
+        controller = SunShadowController(scene, lambda: BERLIN)
+        controller.set_sim_datetime(JUNE_NOON_UTC)
+        controller.set_enabled(True)
+        controller.start_playback(day_instants(JUNE_NOON_UTC, 1))
+        controller.set_enabled(False)
+        assert not controller.is_precomputing
+
 
 class TestSunSimToolbar:
     def test_datetime_round_trip(self, qtbot) -> None:
@@ -550,6 +646,16 @@ class TestSunSimToolbar:
         assert emitted.tzinfo is not None
         assert emitted.hour == 15
 
+    def test_animate_toggle_emits_playback_signal(self, qtbot) -> None:
+        toolbar = SunSimToolbar()
+        qtbot.addWidget(toolbar)
+        with qtbot.waitSignal(toolbar.animation_toggled) as blocker:
+            toolbar._animate_button.setChecked(True)
+        assert blocker.args == [True]
+        assert toolbar.is_animating
+        toolbar.stop_animation()
+        assert not toolbar.is_animating
+
     def test_animate_advances_time(self, qtbot) -> None:
         toolbar = SunSimToolbar()
         qtbot.addWidget(toolbar)
@@ -0,0 +1,279 @@
+"""Integration tests for the shared weather/climate site data cache.
+
+``WeatherService`` and ``ClimateService`` keep their answers in one SQLite
+store and look them up through ``SiteLookup``: identical lookups in flight
+share one request, several sites are fetched in one multi-coordinate
+request, and an entry close to expiry is refreshed in the background. The
+Open-Meteo endpoints here are a real HTTP server on loopback with a
+configurable latency, so the real clients, threads and sockets are used.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from open_garden_planner.services.climate_service import ClimateService
+from open_garden_planner.services.site_data_cache import SiteDataCache, SiteLookup
+from open_garden_planner.services.weather_service import WeatherService
+
+
+def _forecast_answer() -> dict:
+    return {"daily": {
+        "time": ["2024-06-01", "2024-06-02"],
+        "temperature_2m_max": [22.5, 24.0],
+        "temperature_2m_min": [1.0, 14.5],
+        "precipitation_sum": [0.0, 2.3],
+        "weathercode": [0, 61],
+    }}
+
+
+def _archive_answer() -> dict:
+    dates, temps = [], []
+    for year in (2022, 2023):
+        for month in range(1, 13):
+            for day in (1, 15):
+                dates.append(f"{year}-{month:02d}-{day:02d}")
+                temps.append(-1.0 if (month, day) in ((4, 15), (10, 15)) else 8.0)
+    return {"daily": {"time": dates, "temperature_2m_min": temps}}
+
+
+class _OpenMeteo:
+    """Loopback stand-in for the forecast (``/forecast``) and archive (``/archive``) APIs."""
+
+    def __init__(self) -> None:
+        self.delay = 0.0
+        self.failing = False
+        self.requests: list[tuple[str, list[str]]] = []  # (endpoint, latitudes)
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 — http.server API
+                url = urlparse(self.path)
+                endpoint = url.path.strip("/")
+                latitudes = parse_qs(url.query)["latitude"][0].split(",")
+                stub.requests.append((endpoint, latitudes))
+                time.sleep(stub.delay)
+                if stub.failing:
+                    self.send_response(500)
+                    self.end_headers()
+                    return
+                one = _forecast_answer() if endpoint == "forecast" else _archive_answer()
+                body = json.dumps(one if len(latitudes) == 1 else [one] * len(latitudes)).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_args: object) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def count(self, endpoint: str) -> int:
+        return sum(e == endpoint for e, _ in self.requests)
+
+
+@pytest.fixture()
+def stub() -> Iterator[_OpenMeteo]:
+    stub = _OpenMeteo()
+    yield stub
+    stub.server.shutdown()
+    stub.server.server_close()
+
+
+@pytest.fixture()
+def store(tmp_path: Path) -> SiteDataCache:
+    return SiteDataCache(tmp_path / "site_data.sqlite3")
+
+
+def _wait_until(predicate, timeout_s: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+class TestWeather:
+    def test_identical_lookups_in_flight_share_one_request(self, stub, store) -> None:
+        stub.delay = 0.3
+        svc = WeatherService(base_url=f"{stub.url}/forecast", cache=store)
+        results: list[object] = []
+        threads = [
+            threading.Thread(target=lambda: results.append(svc.fetch_forecast(52.5, 13.4)))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert stub.count("forecast") == 1
+        assert len(results) == 4
+        assert all(r is not None and r.days[0].max_c == 22.5 for r in results)
+
+    def test_batch_fetches_only_missing_sites_in_one_request(self, stub, store) -> None:
+        svc = WeatherService(base_url=f"{stub.url}/forecast", cache=store)
+        assert svc.fetch_forecast(52.5, 13.4) is not None
+
+        sites = [(52.5, 13.4), (48.1, 11.6), (53.6, 10.0)]
+        forecasts = svc.fetch_forecasts(sites)
+
+        assert set(forecasts) == set(sites)
+        assert all(f is not None for f in forecasts.values())
+        assert stub.requests[-1] == ("forecast", ["48.1", "53.6"])
+        assert stub.count("forecast") == 2
+
+        # Everything is cached now: no further request.
+        svc.fetch_forecasts(sites)
+        assert stub.count("forecast") == 2
+
+    def test_failed_batch_maps_sites_to_none(self, stub, store) -> None:
+        stub.failing = True
+        svc = WeatherService(base_url=f"{stub.url}/forecast", cache=store)
+
+        assert svc.fetch_forecasts([(1.0, 2.0), (3.0, 4.0)]) == {(1.0, 2.0): None, (3.0, 4.0): None}
+
+    def test_cache_is_shared_between_service_instances(self, stub, store) -> None:
+        WeatherService(base_url=f"{stub.url}/forecast", cache=store).fetch_forecast(52.5, 13.4)
+        WeatherService(base_url=f"{stub.url}/forecast", cache=store).fetch_forecast(52.5, 13.4)
+
+        assert stub.count("forecast") == 1
+
+    def test_plain_http_is_refused_for_remote_hosts(self, store) -> None:
+        svc = WeatherService(base_url="http://example.com/v1/forecast", cache=store)
+
+        assert svc.fetch_forecast(52.5, 13.4) is None
+
+
+class TestClimate:
+    def test_batch_lookup_in_one_request(self, stub, store) -> None:
+        svc = ClimateService(base_url=f"{stub.url}/archive", cache=store)
+        sites = [(51.5, 10.2), (48.1, 11.6)]
+
+        data = svc.lookup_frost_dates_many(sites)
+
+        assert stub.count("archive") == 1
+        assert all(d is not None and d.last_spring_frost == "04-15" for d in data.values())
+        assert data[(48.1, 11.6)].latitude == 48.1
+        assert svc.lookup_frost_dates(51.5, 10.2).data_source == "cached"
+        assert stub.count("archive") == 1
+
+    def test_sites_in_one_cell_are_fetched_once(self, stub, store) -> None:
+        svc = ClimateService(base_url=f"{stub.url}/archive", cache=store)
+
+        data = svc.lookup_frost_dates_many([(51.5, 10.2), (51.6, 10.1)])
+
+        assert stub.requests == [("archive", ["51.5"])]
+        assert data[(51.6, 10.1)].longitude == 10.1
+
+
+class TestSiteLookup:
+    def _lookup(self, store: SiteDataCache, calls: list[list], ttl_s: float, ahead_s: float) -> SiteLookup:
+        def fetch(sites: list) -> list:
+            calls.append(sites)
+            return [{"n": len(calls)} for _ in sites]
+
+        return SiteLookup(
+            "test",
+            key=lambda lat, lon: f"{lat}_{lon}",
+            fetch=fetch,
+            ttl_s=ttl_s,
+            refresh_ahead_s=ahead_s,
+            batch_size=2,
+            cache=store,
+        )
+
+    def test_expiring_entry_is_returned_and_refreshed_in_background(self, store) -> None:
+        calls: list[list] = []
+        lookup = self._lookup(store, calls, ttl_s=100, ahead_s=10)
+        store.put("test", "1.0_2.0", {"n": 0}, stored_at=time.time() - 95)
+
+        entry = lookup.get(1.0, 2.0)
+
+        assert entry.payload == {"n": 0}
+        assert not entry.fetched
+        _wait_until(lambda: store.get("test", "1.0_2.0").payload == {"n": 1})
+        assert calls == [[(1.0, 2.0)]]
+
+    def test_expired_entry_is_refetched(self, store) -> None:
+        calls: list[list] = []
+        lookup = self._lookup(store, calls, ttl_s=100, ahead_s=10)
+        store.put("test", "1.0_2.0", {"n": 0}, stored_at=time.time() - 200)
+
+        entry = lookup.get(1.0, 2.0)
+
+        assert entry.fetched
+        assert entry.payload == {"n": 1}
+
+    def test_batches_are_split_by_batch_size(self, store) -> None:
+        calls: list[list] = []
+        lookup = self._lookup(store, calls, ttl_s=100, ahead_s=10)
+
+        entries = lookup.get_many([(float(i), 0.0) for i in range(5)])
+
+        assert len(entries) == 5
+        assert sorted(len(batch) for batch in calls) == [1, 2, 2]
+
+    def test_unusable_store_degrades_to_fetching(self, tmp_path: Path) -> None:
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("x", encoding="utf-8")
+        calls: list[list] = []
+        lookup = self._lookup(SiteDataCache(blocker / "cache.sqlite3"), calls, ttl_s=100, ahead_s=10)
+
+        assert lookup.get(1.0, 2.0).payload == {"n": 1}
+        assert lookup.get(1.0, 2.0).payload == {"n": 2}
+
+    def test_failed_store_settles_the_lookup(self, store, monkeypatch) -> None:
+        calls: list[list] = []
+        lookup = self._lookup(store, calls, ttl_s=100, ahead_s=10)
+
+        def broken_put(*_args: object, **_kwargs: object) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(store, "put", broken_put)
+        with pytest.raises(OSError, match="disk full"):
+            lookup.get(1.0, 2.0)
+        assert lookup._in_flight == {}
+
+        monkeypatch.undo()
+        assert lookup.get(1.0, 2.0).payload == {"n": 2}
+
+
+class TestStore:
+    @pytest.fixture()
+    def corrupt(self, tmp_path: Path) -> SiteDataCache:
+        path = tmp_path / "site_data.sqlite3"
+        path.write_bytes(b"not a database" * 100)
+        return SiteDataCache(path)
+
+    def test_corrupt_file_reads_as_a_miss(self, corrupt) -> None:
+        assert corrupt.get("test", "1.0_2.0") is None
+        assert corrupt.misses == 1
+
+    def test_corrupt_file_drops_writes(self, corrupt) -> None:
+        corrupt.put("test", "1.0_2.0", {"n": 1})
+        assert corrupt.get("test", "1.0_2.0") is None
+
+    def test_lookup_over_a_corrupt_file_fetches(self, corrupt) -> None:
+        lookup = SiteLookup(
+            "test",
+            key=lambda lat, lon: f"{lat}_{lon}",
+            fetch=lambda sites: [{"n": 1} for _ in sites],
+            ttl_s=100,
+            refresh_ahead_s=10,
+            batch_size=2,
+            cache=corrupt,
+        )
+        assert lookup.get(1.0, 2.0).payload == {"n": 1}
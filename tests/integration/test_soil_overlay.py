@@ -10,6 +10,7 @@ These tests cover:
   * CanvasView state setters & visibility wiring
   * The overlay is invoked from CanvasView.drawForeground only when active
   * scene.render() does NOT trigger the overlay (export-exclusion guarantee)
+  * The overlay geometry is cached across repaints and rebuilt on change
   * Param combo updates the view via the application's wiring
 """
 from __future__ import annotations
@@ -220,6 +221,71 @@ class TestOverlayPainting:
         painter.end()
 
 
+class TestOverlayCache:
+    """The overlay geometry is built once and reused until something changes."""
+
+    def test_repaint_reuses_cached_geometry(self, view_with_service: tuple) -> None:
+        view, svc, _ = view_with_service
+        view.set_soil_overlay_visible(True)
+        TestOverlayPainting._render_view(view)
+        with patch.object(
+            svc, "get_effective_record", wraps=svc.get_effective_record
+        ) as spy:
+            view.horizontalScrollBar().setValue(view.horizontalScrollBar().value() + 40)
+            TestOverlayPainting._render_view(view)
+            spy.assert_not_called()
+
+    def test_soil_test_change_rebuilds(self, view_with_service: tuple) -> None:
+        view, svc, _ = view_with_service
+        view.set_soil_overlay_visible(True)
+        TestOverlayPainting._render_view(view)
+        svc.add_record(GLOBAL_TARGET_ID, SoilTestRecord(date="2026-01-01", ph=6.5))
+        with patch.object(
+            svc, "get_effective_record", wraps=svc.get_effective_record
+        ) as spy:
+            TestOverlayPainting._render_view(view)
+            assert spy.call_count == 1
+
+    def test_param_change_rebuilds(self, view_with_service: tuple) -> None:
+        view, svc, _ = view_with_service
+        view.set_soil_overlay_visible(True)
+        TestOverlayPainting._render_view(view)
+        view.set_soil_overlay_param(PARAM_PH)
+        with patch.object(
+            svc, "get_effective_record", wraps=svc.get_effective_record
+        ) as spy:
+            TestOverlayPainting._render_view(view)
+            assert spy.call_count == 1
+
+    def test_replacing_the_service_drops_the_old_connection(
+        self, view_with_service: tuple
+    ) -> None:
+        view, old_svc, _ = view_with_service
+        view.set_soil_service(old_svc)  # re-injecting must not connect twice
+        new_svc = SoilService(ProjectManager())
+        view.set_soil_service(new_svc)
+        view.set_soil_overlay_visible(True)
+        TestOverlayPainting._render_view(view)
+        old_svc.add_record(GLOBAL_TARGET_ID, SoilTestRecord(date="2026-01-01", ph=6.5))
+        assert view._soil_overlay_cache is not None
+        new_svc.add_record(GLOBAL_TARGET_ID, SoilTestRecord(date="2026-01-01", ph=6.5))
+        assert view._soil_overlay_cache is None
+
+    def test_moving_a_bed_moves_the_tint(self, view_with_service: tuple, qtbot) -> None:
+        view, _, _ = view_with_service
+        view.set_soil_overlay_visible(True)
+        TestOverlayPainting._render_view(view)
+        bed = next(
+            i for i in view.scene().items()
+            if getattr(i, "object_type", None) is ObjectType.GARDEN_BED
+        )
+        bed.setPos(500, 0)
+        qtbot.waitUntil(lambda: view._soil_overlay_cache is None, timeout=1000)
+        TestOverlayPainting._render_view(view)
+        (path, _bounds, _brush), = view._soil_overlay_cache
+        assert path.boundingRect().left() >= 590
+
+
 # ---------------------------------------------------------------------------
 # Effective record drives the colour bucket
 # ---------------------------------------------------------------------------
@@ -0,0 +1,115 @@
+"""Integration tests for background plant-sprite pre-rasterization.
+
+Covers the worker pool on a real scene: sprites land in the shared cache
+off the GUI thread, pending items paint a placeholder disc (no synchronous
+SVG render), only waiting items are repainted, and cancel/shutdown joins
+the workers (#230 teardown class).
+"""
+
+from __future__ import annotations
+
+from PyQt6.QtGui import QImage, QPainter
+from PyQt6.QtWidgets import QStyleOptionGraphicsItem
+
+from open_garden_planner.core.object_types import ObjectType
+from open_garden_planner.core.plant_renderer import (
+    clear_plant_cache,
+    is_plant_sprite_pending,
+    plant_cache,
+)
+from open_garden_planner.ui.canvas.canvas_scene import CanvasScene
+from open_garden_planner.ui.canvas.items.circle_item import CircleItem
+from open_garden_planner.ui.canvas.sprite_prerender import SpritePrerenderer
+
+SPECIES = ["rose", "lavender", "apple", "tomato", "basil", "oak"]
+
+
+def _plant_scene() -> CanvasScene:
+    scene = CanvasScene(2000.0, 1000.0)
+    for index, species in enumerate(SPECIES):
+        item = CircleItem(150.0 + index * 250.0, 300.0, 60.0, object_type=ObjectType.SHRUB)
+        item.plant_species = species
+        scene.addItem(item)
+    # Same species twice: one sprite serves both items.
+    twin = CircleItem(150.0, 700.0, 60.0, object_type=ObjectType.SHRUB)
+    twin.plant_species = SPECIES[0]
+    scene.addItem(twin)
+    return scene
+
+
+def _paint(item: CircleItem) -> None:
+    image = QImage(200, 200, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(0)
+    painter = QPainter(image)
+    painter.translate(100.0 - item.rect().center().x(), 100.0 - item.rect().center().y())
+    item.paint(painter, QStyleOptionGraphicsItem(), None)
+    painter.end()
+
+
+class TestPrerender:
+    def test_sprites_land_in_cache_off_the_gui_thread(self, qtbot) -> None:
+        clear_plant_cache()
+        scene = _plant_scene()
+        prerenderer = SpritePrerenderer()
+        with qtbot.waitSignal(prerenderer.finished, timeout=20000):
+            queued = prerenderer.prerender_scene(scene, 1.0)
+        assert queued == len(SPECIES)
+        keys = {item.plant_sprite_key(1.0) for item in scene.items()}
+        assert all(key in plant_cache() for key in keys)
+        assert not any(is_plant_sprite_pending(key) for key in keys)
+        prerenderer.shutdown()
+
+    def test_cached_sprites_are_not_requeued(self, qtbot) -> None:
+        clear_plant_cache()
+        scene = _plant_scene()
+        prerenderer = SpritePrerenderer()
+        with qtbot.waitSignal(prerenderer.finished, timeout=20000):
+            prerenderer.prerender_scene(scene, 1.0)
+        assert prerenderer.prerender_scene(scene, 1.0) == 0
+        prerenderer.shutdown()
+
+    def test_pending_item_paints_placeholder_without_rendering(self, qtbot) -> None:  # noqa: ARG002
+        clear_plant_cache()
+        scene = _plant_scene()
+        prerenderer = SpritePrerenderer(max_workers=1)
+        prerenderer.prerender_scene(scene, 1.0)
+        prerenderer.shutdown()  # cancel: nothing rendered, nothing pending
+        item = next(i for i in scene.items() if isinstance(i, CircleItem))
+        key = item.plant_sprite_key(1.0)
+        assert key not in plant_cache()
+        # A cancelled run drops the pending flags: paint renders synchronously.
+        _paint(item)
+        assert key in plant_cache()
+
+    def test_updates_only_waiting_items(self, qtbot, monkeypatch) -> None:
+        clear_plant_cache()
+        scene = _plant_scene()
+        updated: list[str] = []
+        monkeypatch.setattr(
+            CircleItem, "update", lambda self, *_args: updated.append(self.plant_species)
+        )
+        prerenderer = SpritePrerenderer()
+        with qtbot.waitSignal(prerenderer.finished, timeout=20000):
+            prerenderer.prerender_scene(scene, 1.0)
+        assert sorted(updated) == sorted([*SPECIES, SPECIES[0]])
+        prerenderer.shutdown()
+
+
+class TestPlaceholder:
+    def test_pending_sprite_is_not_rendered_synchronously(self, qtbot) -> None:  # noqa: ARG002
+        from open_garden_planner.core.plant_renderer import (
+            clear_pending_plant_sprites,
+            mark_plant_sprites_pending,
+        )
+
+        clear_plant_cache()
+        item = CircleItem(100.0, 100.0, 60.0, object_type=ObjectType.SHRUB)
+        item.plant_species = "rose"
+        # The painter in _paint runs at scale 1: the key matches lod 1.0.
+        key = item.plant_sprite_key(1.0)
+        mark_plant_sprites_pending([key])
+        misses = plant_cache().misses
+        _paint(item)
+        assert key not in plant_cache()
+        assert plant_cache().misses == misses
+        clear_pending_plant_sprites()
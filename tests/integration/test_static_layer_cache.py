@@ -0,0 +1,237 @@
+"""Integration tests for the static-layer tile cache of CanvasView.
+
+Locked-layer content is rasterized into device tiles once per zoom and
+composited under the live items (``ui/canvas/static_layer_cache.py``).
+These tests pin that the cached picture matches the uncached one, that a
+drag over the cache re-renders no tiles, that a change to a static item
+invalidates only the tiles it touches, that exports still draw static
+items, and the paint-time win on a large plan.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from PyQt6.QtCore import QPointF, QRectF
+from PyQt6.QtGui import QColor, QImage, QPainter
+
+from open_garden_planner.core.fill_patterns import FillPattern
+from open_garden_planner.core.object_types import ObjectType
+from open_garden_planner.models.layer import Layer
+from open_garden_planner.ui.canvas.canvas_scene import CanvasScene
+from open_garden_planner.ui.canvas.canvas_view import CanvasView
+from open_garden_planner.ui.canvas.items import BackgroundImageItem
+from open_garden_planner.ui.canvas.items.circle_item import CircleItem
+from open_garden_planner.ui.canvas.items.rectangle_item import RectangleItem
+from open_garden_planner.ui.canvas.static_layer_cache import StaticLayerCache
+
+
+@pytest.fixture
+def layers() -> tuple[Layer, Layer]:
+    return Layer(name="Plants", z_order=1), Layer(name="Ground", z_order=0)
+
+
+@pytest.fixture
+def view(qtbot, layers) -> CanvasView:
+    plants, ground = layers
+    scene = CanvasScene(width_cm=2000, height_cm=1500)
+    scene.set_layers([plants, ground])
+    view = CanvasView(scene)
+    qtbot.addWidget(view)
+    view.resize(800, 600)
+    view.show()
+    qtbot.waitExposed(view)
+    return view
+
+
+def _populate(view: CanvasView, layers, beds: int = 20) -> tuple[list[RectangleItem], CircleItem]:
+    plants, ground = layers
+    scene = view.scene()
+    rects = []
+    for i in range(beds):
+        rect = RectangleItem(
+            (i % 5) * 300.0 + 50, (i // 5) * 300.0 + 50, 250, 200,
+            object_type=ObjectType.GENERIC_RECTANGLE,
+            fill_pattern=FillPattern.GRASS,
+            layer_id=ground.id,
+        )
+        scene.addItem(rect)
+        rects.append(rect)
+    plant = CircleItem(600, 500, 60, object_type=ObjectType.SHRUB, layer_id=plants.id)
+    scene.addItem(plant)
+    scene.update_layer_lock(ground.id, True)
+    view.static_layer.refresh_membership()
+    view.fit_in_view()
+    return rects, plant
+
+
+def _grab(view: CanvasView) -> QImage:
+    view.viewport().repaint()
+    return view.viewport().grab().toImage()
+
+
+def _differing_fraction(a: QImage, b: QImage) -> float:
+    step, diff, total = 4, 0, 0
+    for y in range(0, a.height(), step):
+        for x in range(0, a.width(), step):
+            ca, cb = a.pixelColor(x, y), b.pixelColor(x, y)
+            total += 1
+            if max(abs(ca.red() - cb.red()), abs(ca.green() - cb.green()),
+                   abs(ca.blue() - cb.blue())) > 24:
+                diff += 1
+    return diff / total
+
+
+class TestMembership:
+    def test_locked_layer_below_live_items_is_static(self, view, layers) -> None:
+        rects, plant = _populate(view, layers)
+        static = view.static_layer.static_items
+        assert set(rects) <= static
+        assert plant not in static
+
+    def test_locked_layer_above_a_live_layer_is_not_cached(self, view, layers) -> None:
+        plants, ground = layers
+        rects, _plant = _populate(view, layers)
+        view.scene().update_layer_lock(ground.id, False)
+        view.scene().update_layer_lock(plants.id, True)
+        view.static_layer.refresh_membership()
+        # The locked plants sit above the unlocked ground: compositing them
+        # under the live pass would change the stacking.
+        assert not view.static_layer.static_items
+
+    def test_selected_background_leaves_the_cache(self, view, layers, tmp_path) -> None:
+        _populate(view, layers)
+        image = QImage(400, 300, QImage.Format.Format_RGB32)
+        image.fill(QColor("navy"))
+        path = tmp_path / "bg.png"
+        image.save(str(path))
+        background = BackgroundImageItem(str(path))
+        view.scene().addItem(background)
+        background.locked = True
+        view.static_layer.refresh_membership()
+        assert background in view.static_layer.static_items
+        background.setSelected(True)
+        assert background not in view.static_layer.static_items
+
+
+    def test_scene_change_alone_does_not_rescan_membership(
+        self, view, layers, qtbot, monkeypatch
+    ) -> None:
+        _rects, plant = _populate(view, layers)
+        qtbot.wait(20)
+        scans: list[int] = []
+        monkeypatch.setattr(
+            StaticLayerCache, "_is_candidate", staticmethod(lambda item: scans.append(1))
+        )
+        plant.setPos(QPointF(30.0, 0.0))
+        qtbot.wait(20)
+        assert scans == []
+
+    def test_added_item_joins_membership(self, view, layers, qtbot) -> None:
+        _plants, ground = layers
+        _populate(view, layers)
+        bed = RectangleItem(
+            50, 1300, 200, 100, object_type=ObjectType.GENERIC_RECTANGLE, layer_id=ground.id
+        )
+        view.scene().addItem(bed)
+        bed.setFlag(bed.GraphicsItemFlag.ItemIsMovable, False)
+        qtbot.waitUntil(lambda: bed in view.static_layer.static_items, timeout=1000)
+
+
+class TestCompositing:
+    def test_cached_picture_matches_uncached(self, view, layers) -> None:
+        _populate(view, layers)
+        cached = _grab(view)
+        assert view.static_layer.last_tiles_drawn > 0
+        view.static_layer.set_enabled(False)
+        uncached = _grab(view)
+        assert _differing_fraction(cached, uncached) < 0.01
+
+    def test_moving_a_live_item_renders_no_tiles(self, view, layers, qtbot) -> None:
+        _rects, plant = _populate(view, layers)
+        _grab(view)
+        rendered = view.static_layer.tiles_rendered
+        view.static_layer.begin_interaction()
+        for step in range(5):
+            plant.setPos(QPointF(step * 20.0, 0.0))
+            qtbot.wait(5)
+            view.viewport().repaint()
+        assert view.static_layer.tiles_rendered == rendered
+        view.static_layer.end_interaction()
+
+    def test_changing_a_static_item_invalidates_only_its_tiles(self, view, layers, qtbot) -> None:
+        rects, _plant = _populate(view, layers)
+        _grab(view)
+        before = view.static_layer.tile_count
+        rendered = view.static_layer.tiles_rendered
+        rects[0].setOpacity(0.5)
+        # scene.changed drops the touched tiles; the repaint it schedules
+        # renders just those again.
+        qtbot.waitUntil(lambda: view.static_layer.tiles_rendered > rendered, timeout=1000)
+        _grab(view)
+        assert 0 < view.static_layer.tiles_rendered - rendered < before
+        assert view.static_layer.tile_count == before
+
+    def test_tiles_stay_within_the_byte_budget(self, view, layers, monkeypatch) -> None:
+        _populate(view, layers)
+        tiles = view.static_layer._tiles
+        monkeypatch.setattr(tiles, "max_bytes", 4 * 256 * 256 * 4)
+        for _ in range(3):
+            view.zoom_in(1.5)
+            _grab(view)
+        assert tiles.nbytes <= tiles.max_bytes
+        assert tiles.evictions > 0
+
+    def test_zoom_starts_a_fresh_tile_set(self, view, layers) -> None:
+        _populate(view, layers)
+        _grab(view)
+        rendered = view.static_layer.tiles_rendered
+        view.zoom_in(2.0)
+        _grab(view)
+        assert view.static_layer.tiles_rendered > rendered
+
+    def test_exports_still_draw_static_items(self, view, layers) -> None:
+        rects, _plant = _populate(view, layers)
+        target = rects[0].sceneBoundingRect()
+        out = QImage(64, 64, QImage.Format.Format_ARGB32_Premultiplied)
+        out.fill(0)
+        painter = QPainter(out)
+        view.scene().render(painter, QRectF(out.rect()), target.adjusted(20, 20, -20, -20))
+        painter.end()
+        assert out.pixelColor(32, 32).alpha() == 255
+
+
+class TestBenchmark:
+    @pytest.mark.benchmark
+    def test_dragging_over_a_large_static_plan_is_faster(self, view, layers, tmp_path) -> None:
+        """1,000 textured shapes and a 4000x3000 photo on locked layers: a
+        repaint of the region under a dragged plant blits tiles instead."""
+        image = QImage(4000, 3000, QImage.Format.Format_RGB32)
+        image.fill(QColor("olive"))
+        path = tmp_path / "photo.png"
+        image.save(str(path))
+        background = BackgroundImageItem(str(path))
+        view.scene().addItem(background)
+        background.locked = True
+        _rects, plant = _populate(view, layers, beds=1000)
+        _grab(view)  # warm: tiles rendered outside the timed window
+
+        def drag_frames() -> float:
+            view.static_layer.begin_interaction()
+            start = time.perf_counter()
+            for step in range(10):
+                plant.setPos(QPointF(step * 15.0, 0.0))
+                region = view.mapFromScene(plant.sceneBoundingRect()).boundingRect()
+                view.viewport().repaint(region.adjusted(-40, -40, 40, 40))
+            elapsed = time.perf_counter() - start
+            view.static_layer.end_interaction()
+            return elapsed
+
+        cached = drag_frames()
+        view.static_layer.set_enabled(False)
+        _grab(view)
+        uncached = drag_frames()
+        assert cached < uncached, (
+            f"cached {cached * 1000:.1f} ms vs uncached {uncached * 1000:.1f} ms"
+        )
@@ -26,7 +26,10 @@ from open_garden_planner.core import ProjectManager
 from open_garden_planner.core.object_height import METADATA_KEY
 from open_garden_planner.core.object_types import ObjectType
 from open_garden_planner.core.shade_aggregation import (
+    AdaptiveHeatmap,
     HeatmapGrid,
+    compute_heatmap,
+    compute_heatmap_adaptive,
     point_rasterizer_reference,
 )
 from open_garden_planner.services.scene_rendering import render_scene_region
@@ -422,3 +425,49 @@ class TestPerf:
         grid = controller.last_grid
         assert grid.cols * grid.rows == 60_000
         assert elapsed < 6.0, f"60k-cell full-day heatmap took {elapsed:.2f}s"
+
+    def test_adaptive_vs_uniform_large_property(self) -> None:
+        """100 m × 60 m property, a few sheds in one corner: the adaptive grid
+        rasterizes and stores a fraction of the uniform grid's cells and
+        agrees with it everywhere but along shadow edges."""
+        grid = HeatmapGrid.for_rect(0.0, 0.0, 10_000.0, 6_000.0, cell_cm=10.0)
+        casters = [
+            (
+                [
+                    (500.0 + i * 400.0, 500.0),
+                    (700.0 + i * 400.0, 500.0),
+                    (700.0 + i * 400.0, 600.0),
+                    (500.0 + i * 400.0, 600.0),
+                ],
+                250.0,
+            )
+            for i in range(5)
+        ]
+        evaluated = {"uniform": 0, "adaptive": 0}
+
+        def counting(mode: str):
+            def rasterize(polygons, target: HeatmapGrid) -> np.ndarray:
+                evaluated[mode] += target.rows * target.cols
+                return rasterize_polygons_qimage(polygons, target)
+
+            return rasterize
+
+        args = (casters, BERLIN["latitude"], BERLIN["longitude"], SUMMER, grid)
+        uniform = compute_heatmap(*args, counting("uniform"), step_minutes=60)
+        adaptive = compute_heatmap_adaptive(
+            *args, counting("adaptive"), step_minutes=60
+        )
+        assert uniform is not None and adaptive is not None
+        assert evaluated["adaptive"] < 0.2 * evaluated["uniform"]
+        assert adaptive.nbytes < 0.2 * uniform.nbytes
+        mismatch = np.mean(adaptive.to_dense() != uniform)
+        assert mismatch < 0.001, f"mismatch fraction {mismatch:.5f}"
+
+    def test_controller_runs_adaptive_by_default(self, qtbot, wall_scene) -> None:
+        controller = SunHeatmapController(wall_scene, lambda: BERLIN)
+        _run_and_wait(qtbot, controller, SUMMER)
+        assert isinstance(controller.last_result, AdaptiveHeatmap)
+        assert controller.last_minutes.shape == (
+            controller.last_grid.rows,
+            controller.last_grid.cols,
+        )
@@ -0,0 +1,82 @@
+"""Tests for the build-on-first-show DeferredWidget placeholder."""
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtWidgets import QLabel
+
+from open_garden_planner.ui.widgets import DeferredWidget
+
+
+class _Source(QObject):
+    changed = pyqtSignal(int)
+
+
+def _make(qtbot, built: list, refreshed: list) -> DeferredWidget:
+    def factory() -> QLabel:
+        label = QLabel("content")
+        built.append(label)
+        return label
+
+    placeholder = DeferredWidget(factory, refreshed.append)
+    qtbot.addWidget(placeholder)
+    return placeholder
+
+
+def test_content_built_on_first_show(qtbot):
+    """Nothing is built until the placeholder is shown."""
+    built: list = []
+    placeholder = _make(qtbot, built, [])
+
+    assert not placeholder.is_built
+    assert built == []
+
+    placeholder.show()
+    assert placeholder.is_built
+    assert built == [placeholder.widget()]
+
+
+def test_widget_builds_once_on_demand(qtbot):
+    """widget() builds a hidden placeholder's content, exactly once."""
+    built: list = []
+    placeholder = _make(qtbot, built, [])
+
+    first = placeholder.widget()
+    assert placeholder.widget() is first
+    assert len(built) == 1
+
+
+def test_watched_signal_ignored_while_hidden(qtbot):
+    """Changes while hidden are folded into one refresh on the next show."""
+    refreshed: list = []
+    placeholder = _make(qtbot, [], refreshed)
+    source = _Source()
+    placeholder.watch(source.changed)
+
+    placeholder.show()
+    assert refreshed == []  # a just-built widget is already current
+
+    source.changed.emit(1)
+    assert refreshed == [placeholder.widget()]
+
+    placeholder.hide()
+    refreshed.clear()
+    for n in range(5):
+        source.changed.emit(n)
+    assert refreshed == []
+
+    placeholder.show()
+    assert refreshed == [placeholder.widget()]
+
+
+def test_watch_with_custom_slot(qtbot):
+    """A custom slot runs instead of the refresh, and only while visible."""
+    calls: list = []
+    placeholder = _make(qtbot, [], [])
+    source = _Source()
+    placeholder.watch(source.changed, lambda: calls.append("slot"))
+
+    source.changed.emit(1)
+    assert calls == []
+
+    placeholder.show()
+    source.changed.emit(2)
+    assert calls == ["slot"]
@@ -1,10 +1,11 @@
 """Unit tests for BackgroundImageItem."""
 
+import base64
 from pathlib import Path
 
 import pytest
-from PyQt6.QtCore import QPointF
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import QPointF, QRectF
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap
 from PyQt6.QtWidgets import QGraphicsItem
 
 from open_garden_planner.ui.canvas.items import BackgroundImageItem
@@ -264,3 +265,71 @@ class TestBackgroundImageItem:
         assert not restored.pixmap().isNull()
         assert restored.opacity == pytest.approx(0.5)
         assert restored.scale_factor == pytest.approx(0.5)
+
+
+class TestTiledPainting:
+    """The item paints only the pyramid tiles the view needs."""
+
+    @staticmethod
+    def _render(item: BackgroundImageItem, source: QRectF, target_px: int) -> QImage:
+        from PyQt6.QtWidgets import QGraphicsScene
+
+        scene = QGraphicsScene()
+        scene.addItem(item)
+        out = QImage(target_px, target_px, QImage.Format.Format_ARGB32_Premultiplied)
+        out.fill(0)
+        painter = QPainter(out)
+        scene.render(painter, QRectF(out.rect()), source)
+        painter.end()
+        scene.removeItem(item)
+        return out
+
+    @pytest.fixture
+    def large_item(self, qtbot, tmp_path: Path) -> BackgroundImageItem:
+        image = QImage(2048, 1024, QImage.Format.Format_RGB32)
+        image.fill(QColor("blue"))
+        image.setPixelColor(0, 0, QColor("red"))  # top-left of the photo
+        path = tmp_path / "large.png"
+        image.save(str(path))
+        return BackgroundImageItem(str(path))
+
+    def test_zoomed_out_uses_a_coarse_level(self, large_item: BackgroundImageItem) -> None:
+        self._render(large_item, large_item.boundingRect(), 256)
+        assert large_item.last_painted_tiles == 1  # 2048 px shown at 256: level 3
+
+    def test_zoomed_in_draws_only_visible_tiles(self, large_item: BackgroundImageItem) -> None:
+        self._render(large_item, QRectF(10, 10, 200, 200), 200)
+        assert large_item.last_painted_tiles == 1
+        assert large_item.pyramid.tiles_built == 1
+
+    def test_image_is_flipped_for_the_y_up_view(self, large_item: BackgroundImageItem) -> None:
+        # Photo row 0 sits at item y = height (the top of the Y-flipped view).
+        out = self._render(large_item, QRectF(0, 1023, 1, 1), 1)
+        assert out.pixelColor(0, 0) == QColor("red")
+
+    def test_tiles_are_cached_across_paints(self, large_item: BackgroundImageItem) -> None:
+        self._render(large_item, QRectF(0, 0, 512, 512), 512)
+        built = large_item.pyramid.tiles_built
+        self._render(large_item, QRectF(0, 0, 512, 512), 512)
+        assert large_item.pyramid.tiles_built == built
+
+    def test_full_resolution_pixels_are_dropped_when_zoomed_out(
+        self, qtbot, tmp_path: Path
+    ) -> None:
+        image = QImage(4096, 3072, QImage.Format.Format_RGB32)  # 48 MiB decoded
+        image.fill(QColor("blue"))
+        image.setPixelColor(0, 0, QColor("red"))
+        path = tmp_path / "huge.png"
+        image.save(str(path))
+        item = BackgroundImageItem(str(path))
+        del image
+
+        self._render(item, item.boundingRect(), 256)
+        assert 0 not in item.pyramid.resident_levels
+
+        # Zooming back in decodes the embedded bytes again.
+        out = self._render(item, QRectF(0, 3071, 1, 1), 1)
+        assert out.pixelColor(0, 0) == QColor("red")
+        assert item.pyramid.reloads == 1
+        assert item.to_dict()["image_data"] == base64.b64encode(path.read_bytes()).decode()
+
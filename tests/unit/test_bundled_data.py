@@ -0,0 +1,114 @@
+"""Tests for the precompiled bundled data archive (``services/bundled_data``)."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import pickle
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from open_garden_planner.services.bundled_data import (
+    COMPILED_FILENAME,
+    DATA_DIR,
+    compile_bundled_data,
+    load_bundled_json,
+    reset_bundled_data_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_archives() -> Iterator[None]:
+    reset_bundled_data_cache()
+    yield
+    reset_bundled_data_cache()
+
+
+@pytest.fixture()
+def data_dir(tmp_path: Path) -> Path:
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "plants.json").write_text('{"plants": [{"name": "Carrot"}]}', encoding="utf-8")
+    (tmp_path / "nested" / "symbol.json").write_text('{"id": "bay", "n": 3}', encoding="utf-8")
+    compile_bundled_data(tmp_path)
+    reset_bundled_data_cache()
+    return tmp_path
+
+
+class TestShippedArchive:
+    def test_archive_is_current(self) -> None:
+        """Editing a data file without re-running the compile script leaves
+        the app parsing JSON again."""
+        with open(DATA_DIR / COMPILED_FILENAME, "rb") as f:
+            documents = pickle.load(f)["documents"]
+        sources = {p.relative_to(DATA_DIR).as_posix(): p for p in DATA_DIR.rglob("*.json")}
+        assert set(documents) == set(sources), "run scripts/compile_bundled_data.py"
+        for key, path in sources.items():
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            assert documents[key][1] == digest, f"{key} changed: run scripts/compile_bundled_data.py"
+
+    def test_every_file_loads_as_its_json(self) -> None:
+        for path in DATA_DIR.rglob("*.json"):
+            with open(path, encoding="utf-8") as f:
+                assert load_bundled_json(path) == json.load(f), path
+
+    def test_startup_loads_are_faster_than_json(self) -> None:
+        paths = sorted(DATA_DIR.rglob("*.json"))
+
+        def best_of(load) -> float:
+            times = []
+            for _ in range(7):
+                started = time.perf_counter()
+                for path in paths:
+                    load(path)
+                times.append(time.perf_counter() - started)
+            return min(times)
+
+        def parse(path: Path) -> object:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+
+        load_bundled_json(paths[0])  # reads the archive once
+        assert best_of(load_bundled_json) < best_of(parse)
+
+
+class TestLoading:
+    def test_documents_come_from_the_archive(self, data_dir: Path) -> None:
+        (data_dir / "plants.json").touch()  # a checkout resets mtimes; content decides
+        assert load_bundled_json(data_dir / "plants.json", data_dir) == {"plants": [{"name": "Carrot"}]}
+        assert load_bundled_json(data_dir / "nested" / "symbol.json", data_dir) == {"id": "bay", "n": 3}
+
+    def test_each_call_returns_a_fresh_object(self, data_dir: Path) -> None:
+        first = load_bundled_json(data_dir / "plants.json", data_dir)
+        first["plants"].clear()
+        assert load_bundled_json(data_dir / "plants.json", data_dir)["plants"]
+
+    def test_edited_file_is_parsed_again(self, data_dir: Path) -> None:
+        (data_dir / "plants.json").write_text('{"plants": []}', encoding="utf-8")
+        assert load_bundled_json(data_dir / "plants.json", data_dir) == {"plants": []}
+        (data_dir / "plants.json").write_text("{broken", encoding="utf-8")
+        with pytest.raises(json.JSONDecodeError):
+            load_bundled_json(data_dir / "plants.json", data_dir)
+
+    def test_files_outside_the_archive_are_parsed(self, data_dir: Path, tmp_path_factory) -> None:
+        (data_dir / "new.json").write_text("[1, 2]", encoding="utf-8")
+        assert load_bundled_json(data_dir / "new.json", data_dir) == [1, 2]
+        other = tmp_path_factory.mktemp("other") / "x.json"
+        other.write_text('"x"', encoding="utf-8")
+        assert load_bundled_json(other, data_dir) == "x"
+        with pytest.raises(FileNotFoundError):
+            load_bundled_json(data_dir / "missing.json", data_dir)
+
+    @pytest.mark.parametrize(
+        "archive",
+        [
+            b"not a pickle",
+            pickle.dumps({"version": 0, "documents": {}}),
+            pickle.dumps(Path("objects are refused")),
+        ],
+    )
+    def test_unusable_archive_falls_back_to_json(self, data_dir: Path, archive: bytes) -> None:
+        (data_dir / COMPILED_FILENAME).write_bytes(archive)
+        assert load_bundled_json(data_dir / "plants.json", data_dir) == {"plants": [{"name": "Carrot"}]}
@@ -1,7 +1,5 @@
 """Tests for US-8.2: ClimateService frost date & hardiness zone lookup."""
 
-import json
-import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -16,6 +14,7 @@ from open_garden_planner.services.climate_service import (
     _estimate_usda_zone,
     _median_date,
 )
+from open_garden_planner.services.site_data_cache import SiteDataCache
 
 
 # ---------------------------------------------------------------------------
@@ -135,9 +134,7 @@ class TestClimateServiceCompute:
 
     @pytest.fixture
     def service(self, tmp_path: Path) -> ClimateService:
-        svc = ClimateService.__new__(ClimateService)
-        svc._cache_dir = tmp_path
-        return svc
+        return ClimateService(cache=SiteDataCache(tmp_path / "site_data.sqlite3"))
 
     def _make_dates_temps(
         self, start_year: int, end_year: int, frost_date_by_year: dict[int, tuple[str, str]]
@@ -229,70 +226,80 @@ class TestClimateServiceCompute:
 
 
 class TestClimateServiceCache:
-    @pytest.fixture
-    def service(self, tmp_path: Path) -> ClimateService:
-        svc = ClimateService.__new__(ClimateService)
-        svc._cache_dir = tmp_path
-        return svc
-
-    def _write_cache(
-        self, svc: ClimateService, lat: float, lon: float, data: dict[str, Any]
-    ) -> None:
-        key = svc._cache_key(lat, lon)
-        (svc._cache_dir / f"{key}.json").write_text(
-            json.dumps(data), encoding="utf-8"
-        )
+    """The cache seen through ``lookup_frost_dates`` with a store at tmp_path."""
 
-    def test_cache_miss_returns_none(self, service: ClimateService) -> None:
-        assert service._load_cache(51.5, 10.2) is None
+    @pytest.fixture
+    def store(self, tmp_path: Path) -> SiteDataCache:
+        return SiteDataCache(tmp_path / "site_data.sqlite3")
 
-    def test_cache_hit_returns_frost_data(self, service: ClimateService) -> None:
+    @staticmethod
+    def _seed(store: SiteDataCache, key: str, age_days: float) -> None:
         payload = {
-            "cached_at": datetime.now().isoformat(),
             "last_spring_frost": "04-15",
             "first_fall_frost": "10-20",
             "hardiness_zone": "7b",
         }
-        self._write_cache(service, 51.5, 10.2, payload)
+        stored_at = (datetime.now() - timedelta(days=age_days)).timestamp()
+        store.put("frost", key, payload, stored_at=stored_at)
+
+    @staticmethod
+    def _api_response() -> MagicMock:
+        dates = [f"2020-{m:02d}-01" for m in range(1, 13)]
+        temps = [-1.0, -1.0, 0.0, 5.0, 10.0, 15.0, 18.0, 16.0, 10.0, 0.0, -2.0, -4.0]
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = {"daily": {"time": dates, "temperature_2m_min": temps}}
+        mock_resp.raise_for_status.return_value = None
+        return mock_resp
+
+    def test_cache_miss_queries_the_archive(self, store: SiteDataCache) -> None:
+        with patch("open_garden_planner.services.climate_service.requests.get") as mock_get:
+            mock_get.return_value = self._api_response()
+            result = ClimateService(cache=store).lookup_frost_dates(51.5, 10.2)
+        assert mock_get.call_count == 1
+        assert result.data_source == "open-meteo"
+
+    def test_cache_hit_returns_frost_data(self, store: SiteDataCache) -> None:
+        self._seed(store, "51.5_10.0", age_days=1)
+
+        with patch("open_garden_planner.services.climate_service.requests.get") as mock_get:
+            result = ClimateService(cache=store).lookup_frost_dates(51.5, 10.2)
+            mock_get.assert_not_called()
 
-        result = service._load_cache(51.5, 10.2)
-        assert result is not None
         assert result.last_spring_frost == "04-15"
         assert result.first_fall_frost == "10-20"
         assert result.hardiness_zone == "7b"
         assert result.data_source == "cached"
 
-    def test_expired_cache_returns_none(self, service: ClimateService) -> None:
-        old_date = (datetime.now() - timedelta(days=400)).isoformat()
-        payload = {
-            "cached_at": old_date,
-            "last_spring_frost": "04-15",
-            "first_fall_frost": "10-20",
-            "hardiness_zone": "7b",
-        }
-        self._write_cache(service, 51.5, 10.2, payload)
+    def test_expired_cache_is_refetched(self, store: SiteDataCache) -> None:
+        self._seed(store, "51.5_10.0", age_days=400)
 
-        assert service._load_cache(51.5, 10.2) is None
+        with patch("open_garden_planner.services.climate_service.requests.get") as mock_get:
+            mock_get.return_value = self._api_response()
+            result = ClimateService(cache=store).lookup_frost_dates(51.5, 10.2)
 
-    def test_save_then_load_roundtrip(self, service: ClimateService) -> None:
-        frost = FrostData(
-            last_spring_frost="05-01",
-            first_fall_frost="09-30",
-            hardiness_zone="6b",
-            data_source="open-meteo",
-            latitude=55.0,
-            longitude=13.0,
+        assert mock_get.call_count == 1
+        assert result.data_source == "open-meteo"
+        assert result.last_spring_frost == "03-01"
+
+    def test_fetched_data_is_served_from_the_store_later(self, store: SiteDataCache) -> None:
+        with patch("open_garden_planner.services.climate_service.requests.get") as mock_get:
+            mock_get.return_value = self._api_response()
+            fetched = ClimateService(cache=store).lookup_frost_dates(55.0, 13.0)
+            loaded = ClimateService(cache=store).lookup_frost_dates(55.0, 13.0)
+
+        assert mock_get.call_count == 1
+        assert loaded.data_source == "cached"
+        assert (loaded.last_spring_frost, loaded.first_fall_frost, loaded.hardiness_zone) == (
+            fetched.last_spring_frost, fetched.first_fall_frost, fetched.hardiness_zone,
         )
-        service._save_cache(55.0, 13.0, frost)
-        loaded = service._load_cache(55.0, 13.0)
-        assert loaded is not None
-        assert loaded.last_spring_frost == "05-01"
-        assert loaded.first_fall_frost == "09-30"
-        assert loaded.hardiness_zone == "6b"
 
-    def test_cache_key_rounds_to_half_degree(self, service: ClimateService) -> None:
-        # 51.37 rounds to 51.5
-        assert service._cache_key(51.37, 10.12) == "51.5_10.0"
+    def test_cache_key_rounds_to_half_degree(self, store: SiteDataCache) -> None:
+        # 51.37 rounds to 51.5, 10.12 to 10.0
+        self._seed(store, "51.5_10.0", age_days=1)
+        with patch("open_garden_planner.services.climate_service.requests.get") as mock_get:
+            result = ClimateService(cache=store).lookup_frost_dates(51.37, 10.12)
+            mock_get.assert_not_called()
+        assert result.hardiness_zone == "7b"
 
 
 # ---------------------------------------------------------------------------
@@ -303,9 +310,7 @@ class TestClimateServiceCache:
 class TestClimateServiceLookup:
     @pytest.fixture
     def service(self, tmp_path: Path) -> ClimateService:
-        svc = ClimateService.__new__(ClimateService)
-        svc._cache_dir = tmp_path
-        return svc
+        return ClimateService(cache=SiteDataCache(tmp_path / "site_data.sqlite3"))
 
     def _make_api_response(self) -> dict[str, Any]:
         """Build a minimal synthetic Open-Meteo response with frost dates."""
@@ -375,17 +380,15 @@ class TestClimateServiceLookup:
             with pytest.raises(ClimateServiceError, match="No temperature data"):
                 service.lookup_frost_dates(51.5, 10.2)
 
-    def test_cache_hit_skips_network_call(self, service: ClimateService) -> None:
+    def test_cache_hit_skips_network_call(self, tmp_path: Path) -> None:
+        store = SiteDataCache(tmp_path / "seeded.sqlite3")
         cached_payload = {
-            "cached_at": datetime.now().isoformat(),
             "last_spring_frost": "04-01",
             "first_fall_frost": "11-01",
             "hardiness_zone": "8a",
         }
-        key = service._cache_key(51.5, 10.2)
-        (service._cache_dir / f"{key}.json").write_text(
-            json.dumps(cached_payload), encoding="utf-8"
-        )
+        store.put("frost", "51.5_10.0", cached_payload)
+        service = ClimateService(cache=store)
 
         with patch("open_garden_planner.services.climate_service.requests.get") as mock_get:
             result = service.lookup_frost_dates(51.5, 10.2)
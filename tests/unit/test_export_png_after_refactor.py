@@ -8,12 +8,18 @@ exists to catch any regression that breaks the existing PNG export.
 from __future__ import annotations
 
 import pytest
-from PyQt6.QtCore import QPointF
-from PyQt6.QtGui import QImage
+from PyQt6.QtCore import QPointF, QRectF
+from PyQt6.QtGui import QColor, QImage, QPainter
 
-from open_garden_planner.services.export_service import ExportService
+from open_garden_planner.core.fill_patterns import FillPattern
+from open_garden_planner.core.object_types import ObjectType
+from open_garden_planner.services.export_service import ExportCancelled, ExportService
+from open_garden_planner.services.scene_rendering import (
+    compute_export_font_size,
+    render_scene_region,
+)
 from open_garden_planner.ui.canvas.canvas_scene import CanvasScene
-from open_garden_planner.ui.canvas.items import CircleItem, PolylineItem
+from open_garden_planner.ui.canvas.items import CircleItem, PolylineItem, RectangleItem
 
 
 @pytest.fixture()
@@ -41,6 +47,109 @@ class TestExportPng:
         # 15 cm × 300 DPI / 2.54 = ~1771 px wide.
         assert image.width() > 1500
 
+    def test_export_records_dpi(self, scene: CanvasScene, tmp_path) -> None:
+        out = tmp_path / "dpi.png"
+        ExportService.export_to_png(scene, out, dpi=300, output_width_cm=5.0)
+        assert QImage(str(out)).dotsPerMeterX() == round(300 / 0.0254)
+
+
+def _single_shot(scene: CanvasScene, dpi: int, output_width_cm: float) -> QImage:
+    """The pre-banding export: one image, one render call."""
+    rect = scene.canvas_rect
+    width_px, height_px = ExportService.calculate_image_size(
+        rect.width(), rect.height(), output_width_cm, dpi
+    )
+    image = QImage(width_px, height_px, QImage.Format.Format_ARGB32)
+    image.fill(QColor(scene.CANVAS_COLOR))
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+    render_scene_region(
+        scene=scene,
+        painter=painter,
+        target_rect=QRectF(0, 0, width_px, height_px),
+        source_rect=rect,
+        text_point_size=compute_export_font_size(output_width_cm / rect.width(), dpi),
+    )
+    painter.end()
+    return image
+
+
+class TestBandedExport:
+    @pytest.fixture()
+    def textured(self, scene: CanvasScene) -> CanvasScene:
+        scene.addItem(RectangleItem(
+            150, 250, 500, 300,
+            object_type=ObjectType.GENERIC_RECTANGLE, fill_pattern=FillPattern.GRASS,
+        ))
+        return scene
+
+    def test_bands_match_single_shot_pixels(self, textured: CanvasScene, tmp_path) -> None:
+        out = tmp_path / "banded.png"
+        ExportService.export_to_png(
+            textured, out, dpi=150, output_width_cm=15.0, band_height_px=37
+        )
+        banded = QImage(str(out)).convertToFormat(QImage.Format.Format_ARGB32)
+        reference = _single_shot(textured, 150, 15.0)
+        assert banded.size() == reference.size()
+        assert banded == reference
+
+    def test_reports_progress_per_band(self, scene: CanvasScene, tmp_path) -> None:
+        calls: list[tuple[int, int]] = []
+        ExportService.export_to_png(
+            scene, tmp_path / "p.png", dpi=72, output_width_cm=10.0,
+            band_height_px=100, progress_callback=lambda c, t: calls.append((c, t)),
+        )
+        # 10 cm wide, 8 cm tall at 72 DPI → 226 rows → 3 bands
+        assert calls == [(1, 3), (2, 3), (3, 3)]
+
+    def test_cancel_leaves_no_file(self, scene: CanvasScene, tmp_path) -> None:
+        out = tmp_path / "cancelled.png"
+        polls = iter([False, False, True])
+        with pytest.raises(ExportCancelled):
+            ExportService.export_to_png(
+                scene, out, dpi=72, output_width_cm=10.0,
+                band_height_px=50, cancel_check=lambda: next(polls),
+            )
+        assert list(tmp_path.iterdir()) == []
+
+    def test_default_bands_stay_within_budget(
+        self, scene: CanvasScene, tmp_path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        sizes: list[int] = []
+        original = QImage.convertToFormat
+
+        def spy(image: QImage, *args: object) -> QImage:
+            sizes.append(image.sizeInBytes())
+            return original(image, *args)
+
+        monkeypatch.setattr(ExportService, "MAX_BAND_BYTES", 1_000_000)
+        monkeypatch.setattr(QImage, "convertToFormat", spy)
+        ExportService.export_to_png(scene, tmp_path / "b.png", dpi=300, output_width_cm=15.0)
+        assert len(sizes) > 1
+        assert max(sizes) <= 1_000_000
+
+    def test_each_band_paints_only_its_slice(
+        self, qtbot: object, tmp_path  # noqa: ARG002
+    ) -> None:
+        painted: list[int] = []
+
+        class Counted(RectangleItem):
+            def paint(self, painter, option, widget=None) -> None:
+                painted.append(id(self))
+                super().paint(painter, option, widget)
+
+        tall = CanvasScene(width_cm=200, height_cm=2000)
+        for row in range(20):
+            tall.addItem(Counted(50, row * 100 + 20, 100, 60))
+        ExportService.export_to_png(
+            tall, tmp_path / "tall.png", dpi=72, output_width_cm=5.0, band_height_px=100
+        )
+        # 1417 rows in 15 bands; an item is ~42 rows tall, so it lands in one
+        # or two bands (rendering the whole scene per band would paint 300).
+        assert 20 <= len(painted) <= 40
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
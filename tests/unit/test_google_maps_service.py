@@ -75,6 +75,27 @@ class TestBboxAndZoomPicking:
         _, cols, rows = gms.pick_zoom_and_grid(bbox)
         assert cols <= 3 and rows <= 3
 
+    @pytest.mark.parametrize("shift", [0.0, 0.0002, 0.0004, 0.0007, 0.0011])
+    def test_box_fitting_one_call_is_one_call_wherever_it_sits(self, shift: float) -> None:
+        # ~34 m: one call at zoom 20, though most shifts straddle aligned
+        # grid lines (2x1 or 2x2 aligned calls).
+        bbox = gms.BoundingBox(
+            nw_lat=52.5200 + shift, nw_lng=13.4000 + shift,
+            se_lat=52.5197 + shift, se_lng=13.4005 + shift,
+        )
+        assert gms.pick_zoom_and_grid(bbox) == (20, 1, 1)
+
+    @pytest.mark.parametrize("span", [0.003, 0.006, 0.01, 0.02, 0.05])
+    def test_fetched_aligned_grid_fits_max_grid(self, span: float) -> None:
+        bbox = gms.BoundingBox(
+            nw_lat=52.5200, nw_lng=13.4000,
+            se_lat=52.5200 - span * 0.8, se_lng=13.4000 + span,
+        )
+        zoom, cols, rows = gms.pick_zoom_and_grid(bbox)
+        if (cols, rows) != (1, 1):
+            assert gms.aligned_tile_grid(bbox, zoom)[2:] == (cols, rows)
+        assert cols <= gms._MAX_GRID and rows <= gms._MAX_GRID
+
 
 class TestUrlBuilding:
     def test_contains_all_params(self) -> None:
@@ -136,6 +157,8 @@ class TestFetchBbox:
             result = gms.fetch_bbox(bbox)
         assert mock_requests.get.call_count == 1
         assert result.tile_grid == (1, 1)
+        center = mock_requests.get.call_args[0][0].split("center=")[1].split("&")[0]
+        assert center == "52.51985%2C13.4053"  # centred on the bbox
         # Image is cropped to the bbox — its pixel size is the bbox extent
         # divided by mpp. Just check it's a positive non-zero rectangle.
         assert result.image.size[0] > 0
@@ -0,0 +1,113 @@
+"""Unit tests for the tiled image pyramid."""
+
+from __future__ import annotations
+
+import pytest
+from PyQt6.QtCore import QRectF
+from PyQt6.QtGui import QColor, QImage
+
+from open_garden_planner.core.image_pyramid import ImagePyramid
+
+
+def _image(width: int, height: int) -> QImage:
+    image = QImage(width, height, QImage.Format.Format_RGB32)
+    image.fill(QColor("darkgreen"))
+    return image
+
+
+class TestLevels:
+    def test_level_count_stops_at_one_tile(self) -> None:
+        assert ImagePyramid(_image(200, 100)).level_count == 1
+        assert ImagePyramid(_image(1000, 300)).level_count == 3  # 1000 → 500 → 250
+
+    @pytest.mark.parametrize(
+        ("scale", "level"),
+        [(2.0, 0), (1.0, 0), (0.6, 0), (0.5, 1), (0.3, 1), (0.25, 2), (0.001, 2), (0.0, 2)],
+    )
+    def test_level_for_scale(self, scale: float, level: int) -> None:
+        assert ImagePyramid(_image(1000, 1000)).level_for_scale(scale) == level
+
+    def test_level_images_halve_rounding_up(self) -> None:
+        pyramid = ImagePyramid(_image(1001, 301))
+        assert pyramid.level_image(1).size().width() == 501
+        assert pyramid.level_image(2).size().height() == 76
+
+
+class TestTiles:
+    def test_only_tiles_meeting_the_rect(self) -> None:
+        pyramid = ImagePyramid(_image(1000, 600))
+        assert pyramid.tiles_in(0, QRectF(300, 10, 10, 10)) == [(1, 0)]
+        assert pyramid.tiles_in(0, QRectF(250, 250, 20, 20)) == [
+            (0, 0), (1, 0), (0, 1), (1, 1),
+        ]
+        assert len(pyramid.tiles_in(0, QRectF(0, 0, 1000, 600))) == 4 * 3
+        assert pyramid.tiles_in(1, QRectF(0, 0, 1000, 600)) == [(0, 0), (1, 0), (0, 1), (1, 1)]
+        assert pyramid.tiles_in(0, QRectF(2000, 0, 10, 10)) == []
+
+    def test_edge_tiles_are_clipped(self) -> None:
+        pyramid = ImagePyramid(_image(1000, 600))
+        assert pyramid.tile_rect(0, 3, 2) == QRectF(768, 512, 232, 88)
+        tile = pyramid.tile_image(0, 3, 2)
+        assert (tile.width(), tile.height()) == (232, 88)
+        coarse = pyramid.tile_image(1, 1, 1)
+        assert (coarse.width(), coarse.height()) == (500 - 256, 300 - 256)
+        assert pyramid.tiles_built == 2
+
+    def test_tile_keys_are_unique_per_pyramid(self) -> None:
+        a, b = ImagePyramid(_image(10, 10)), ImagePyramid(_image(10, 10))
+        assert a.tile_key(0, 0, 0) != b.tile_key(0, 0, 0)
+
+    def test_null_image_is_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            ImagePyramid(QImage())
+
+
+class TestResidency:
+    @staticmethod
+    def _reloadable(width: int, height: int, budget: int) -> tuple[ImagePyramid, list[int]]:
+        loads: list[int] = []
+
+        def reload() -> QImage:
+            loads.append(1)
+            return _image(width, height)
+
+        pyramid = ImagePyramid(
+            _image(width, height), reload=reload, max_resident_bytes=budget
+        )
+        return pyramid, loads
+
+    def test_source_is_dropped_once_a_coarser_level_is_built(self) -> None:
+        pyramid, loads = self._reloadable(1024, 1024, budget=1024 * 1024)
+        pyramid.tile_image(2, 0, 0)
+        assert pyramid.resident_levels == [2]
+        assert pyramid.resident_bytes <= 1024 * 1024
+        assert loads == []
+
+    def test_levels_unused_at_the_current_zoom_are_evicted(self) -> None:
+        # Room for levels 1 and 2 (512² + 256² RGB32) but not a third.
+        pyramid, _ = self._reloadable(1024, 1024, budget=1280 * 1024)
+        pyramid.level_image(1)
+        pyramid.level_image(2)
+        assert pyramid.resident_levels == [1, 2]
+        pyramid.level_image(3)
+        assert pyramid.resident_levels == [2, 3]
+
+    def test_dropped_source_is_reloaded_for_finer_levels(self) -> None:
+        pyramid, loads = self._reloadable(1024, 1024, budget=0)
+        pyramid.level_image(3)
+        assert pyramid.level_image(1).size().width() == 512
+        assert (loads, pyramid.reloads) == ([1], 1)
+        assert pyramid.resident_levels == [1]
+        assert pyramid.tile_image(0, 3, 3).pixelColor(0, 0) == QColor("darkgreen")
+
+    def test_source_property_does_not_keep_a_reload(self) -> None:
+        pyramid, _ = self._reloadable(1024, 1024, budget=0)
+        pyramid.level_image(2)
+        assert pyramid.source.width() == 1024
+        assert pyramid.resident_levels == [2]
+
+    def test_source_without_reload_stays_resident(self) -> None:
+        pyramid = ImagePyramid(_image(1024, 1024), max_resident_bytes=0)
+        pyramid.level_image(1)
+        pyramid.level_image(2)
+        assert pyramid.resident_levels == [0, 2]
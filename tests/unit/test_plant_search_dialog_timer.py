@@ -43,8 +43,9 @@ def test_direct_search_settles_the_pending_debounce(qtbot, monkeypatch) -> None:
 
     dlg = PlantSearchDialog(PlantAPIManager(trefle_api_token="fake-token"))
     qtbot.addWidget(dlg)
-    monkeypatch.setattr(dlg._api_manager, "search", MagicMock(return_value=[]))
+    monkeypatch.setattr(dlg._api_manager, "search_source", MagicMock(return_value=[]))
     dlg.search_input.setText("carrot")
     assert dlg._search_timer.isActive()
-    dlg._perform_search()
-    assert not dlg._search_timer.isActive(), "a synchronous search must disarm the debounce"
+    with qtbot.waitSignal(dlg.search_finished, timeout=5_000):
+        dlg._perform_search()
+        assert not dlg._search_timer.isActive(), "a direct search must disarm the debounce"
@@ -0,0 +1,55 @@
+"""Unit tests for the incremental PNG encoder."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from PyQt6.QtGui import QColor, QImage
+
+from open_garden_planner.services.png_stream import PngStreamWriter
+
+
+def _band(width: int, rows: int, color: str) -> QImage:
+    image = QImage(width, rows, QImage.Format.Format_RGBA8888)
+    image.fill(QColor(color))
+    return image
+
+
+def _write(writer: PngStreamWriter, band: QImage) -> None:
+    writer.write_rows(
+        band.constBits().asstring(band.sizeInBytes()), band.height(), band.bytesPerLine()
+    )
+
+
+class TestPngStreamWriter:
+    def test_bands_decode_as_one_image(self, tmp_path: Path, qtbot) -> None:  # noqa: ARG002
+        out = tmp_path / "out.png"
+        writer = PngStreamWriter(out, 13, 10)
+        _write(writer, _band(13, 4, "red"))
+        _write(writer, _band(13, 6, "#8000ff00"))
+        writer.close()
+        image = QImage(str(out))
+        assert (image.width(), image.height()) == (13, 10)
+        assert image.pixelColor(5, 3) == QColor("red")
+        assert image.pixelColor(5, 9) == QColor(0, 255, 0, 128)
+
+    def test_incomplete_image_is_rejected(self, tmp_path: Path) -> None:
+        out = tmp_path / "short.png"
+        writer = PngStreamWriter(out, 4, 4)
+        writer.write_rows(bytes(4 * 4 * 2), 2)
+        with pytest.raises(ValueError, match="incomplete"):
+            writer.close()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_too_many_rows_is_rejected(self, tmp_path: Path) -> None:
+        writer = PngStreamWriter(tmp_path / "x.png", 4, 2)
+        with pytest.raises(ValueError):
+            writer.write_rows(bytes(4 * 4 * 3), 3)
+        writer.abort()
+
+    def test_abort_removes_partial_file(self, tmp_path: Path) -> None:
+        writer = PngStreamWriter(tmp_path / "x.png", 4, 4)
+        writer.write_rows(bytes(4 * 4 * 2), 2)
+        writer.abort()
+        assert list(tmp_path.iterdir()) == []
@@ -218,6 +218,21 @@ class TestSerialization:
         assert loaded.rect().width() == 300
         assert loaded.rect().height() == 150
 
+    def test_round_trip_keeps_stacking_of_equal_z_items(
+        self, manager, scene, tmp_path
+    ) -> None:
+        """Overlapping items sharing a z-value keep their order across loads."""
+        for x in (0, 40, 80):
+            scene.addItem(RectangleItem(x, 0, 100, 100))
+        expected = [i.rect().x() for i in scene.items()]  # topmost first
+
+        file_path = tmp_path / "stack.ogp"
+        for _ in range(2):  # a flip would undo itself on an even count
+            manager.save(scene, file_path)
+            scene.clear()
+            manager.load(scene, file_path)
+            assert [i.rect().x() for i in scene.items()] == expected
+
     def test_save_and_load_polygon(self, manager, scene, tmp_path) -> None:
         """Test saving and loading a polygon."""
         # Create a polygon
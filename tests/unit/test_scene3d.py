@@ -15,11 +15,13 @@ import pytest
 
 from open_garden_planner.core.scene3d import (
     FLAT_THICKNESS_CM,
+    diff_batches,
     extrude_footprint,
     records_from_raw,
     sun_direction_scene,
     to_engine_frame,
     triangulate_polygon,
+    triangulation_cache_info,
 )
 from open_garden_planner.core.shadow_geometry import shadow_direction_scene
 from open_garden_planner.core.solar import solar_position
@@ -62,6 +64,27 @@ class TestTriangulation:
     def test_degenerate_returns_empty(self) -> None:
         assert triangulate_polygon([(0.0, 0.0), (1.0, 1.0)]) == []
 
+    def test_moved_footprint_reuses_cached_triangulation(self) -> None:
+        shape = [(x + 1234.5, y - 77.0) for x, y in L_SHAPE]
+        triangulate_polygon(shape)
+        hits = triangulation_cache_info().hits
+        moved = [(x + 300.0, y + 40.0) for x, y in shape]
+        assert triangulate_polygon(moved) == triangulate_polygon(shape)
+        assert triangulation_cache_info().hits == hits + 2
+
+    def test_prism_with_hole(self) -> None:
+        hole = [(25.0, 25.0), (75.0, 25.0), (75.0, 75.0), (25.0, 75.0)]
+        positions, normals = extrude_footprint(SQUARE, 100.0, holes=[hole])
+        # 8 wall quads × 6 verts + 8 cap triangles × 3 verts = 72 vertices.
+        assert len(positions) == 72 * 3
+        # Hole walls face into the hole (toward its centre).
+        for i in range(24 * 3, 48 * 3, 3):
+            px, py = positions[i], positions[i + 1]
+            nx, ny = normals[i], normals[i + 1]
+            assert (px + nx - 50.0) ** 2 + (py + ny - 50.0) ** 2 < (
+                px - 50.0
+            ) ** 2 + (py - 50.0) ** 2
+
 
 class TestExtrusion:
     def test_square_prism_vertex_counts(self) -> None:
@@ -208,3 +231,54 @@ class TestSunLight:
         assert to_engine_frame(1.0, 2.0, 3.0) == (1.0, 3.0, -2.0)
         # North (0,1,0) maps to −z; up stays y — one flip, applied once.
         assert to_engine_frame(0.0, 1.0, 0.0) == (0.0, 0.0, -1.0)
+
+
+class TestBatching:
+    @staticmethod
+    def _records(shed_x: float = 0.0, colors=None):
+        colors = colors or [(200, 100, 50, 255)] * 3
+        return records_from_raw(
+            [
+                {"footprint": [(x + shed_x, y) for x, y in SQUARE],
+                 "height_cm": 250.0, "name": "shed", "color_rgba": colors[0]},
+                {"footprint": L_SHAPE, "height_cm": 200.0, "name": "wall",
+                 "color_rgba": colors[1]},
+                {"footprint": SQUARE, "height_cm": None, "name": "lawn",
+                 "color_rgba": colors[2]},
+            ]
+        )
+
+    def test_one_batch_per_colour_with_record_ranges(self) -> None:
+        records = self._records(
+            colors=[(200, 100, 50, 255), (10, 20, 30, 255), (200, 100, 50, 128)]
+        )
+        diff = diff_batches({}, records)
+        assert sorted(diff.uploads) == [(10, 20, 30), (200, 100, 50)]
+        batch = diff.batches[(200, 100, 50)]
+        assert [r.name for r in batch.records] == ["shed", "lawn"]
+        assert batch.ranges == [(0, 30), (30, 30)]
+        positions, normals = extrude_footprint(SQUARE, FLAT_THICKNESS_CM, 1.0)
+        assert batch.positions[30:].ravel().tolist() == pytest.approx(positions)
+        assert batch.normals[30:].ravel().tolist() == pytest.approx(normals)
+
+    def test_unchanged_records_produce_no_work(self) -> None:
+        first = diff_batches({}, self._records())
+        again = diff_batches(first.batches, self._records())
+        assert again.uploads == [] and again.patches == {} and again.removed == []
+
+    def test_moved_record_patches_only_its_range(self) -> None:
+        first = diff_batches({}, self._records())
+        moved = diff_batches(first.batches, self._records(shed_x=40.0))
+        assert moved.uploads == []
+        assert moved.patches == {(200, 100, 50): [(0, 30)]}
+        xs = moved.batches[(200, 100, 50)].positions[:30, 0]
+        assert xs.min() == pytest.approx(40.0)
+
+    def test_recolour_moves_record_between_batches(self) -> None:
+        first = diff_batches({}, self._records())
+        recoloured = diff_batches(
+            first.batches,
+            self._records(colors=[(0, 0, 255, 255)] * 3),
+        )
+        assert recoloured.uploads == [(0, 0, 255)]
+        assert recoloured.removed == [(200, 100, 50)]
@@ -17,13 +17,17 @@ from __future__ import annotations
 
 from datetime import date
 
+import numpy as np
 import pytest
 
+from open_garden_planner.core.heatmap_render import sun_fraction
 from open_garden_planner.core.shade_aggregation import (
     BAND_THRESHOLDS_MINUTES,
     SAMPLE_STEP_MINUTES,
+    AdaptiveHeatmap,
     HeatmapGrid,
     compute_heatmap,
+    compute_heatmap_adaptive,
     daylight_samples,
     point_rasterizer_reference,
 )
@@ -167,3 +171,56 @@ class TestPlumbing:
         )
         assert calls
         assert calls[-1][0] == calls[-1][1] == len(calls)
+
+
+class TestAdaptive:
+    """Coarse-first tiling must reproduce the uniform grid cell for cell."""
+
+    # A 2 m × 1 m shed, 150 cm high, in the middle of a 12 m × 8 m plot.
+    SHED = [([(500.0, 350.0), (700.0, 350.0), (700.0, 450.0), (500.0, 450.0)], 150.0)]
+    GRID = HeatmapGrid.for_rect(0.0, 0.0, 1200.0, 800.0, cell_cm=20.0)
+
+    def _both(self, tile_cells: int) -> tuple[np.ndarray, AdaptiveHeatmap]:
+        day = date(2026, 6, 21)
+        uniform = compute_heatmap(
+            self.SHED, BERLIN_LAT, BERLIN_LON, day, self.GRID,
+            point_rasterizer_reference, step_minutes=60,
+        )
+        adaptive = compute_heatmap_adaptive(
+            self.SHED, BERLIN_LAT, BERLIN_LON, day, self.GRID,
+            point_rasterizer_reference, step_minutes=60, tile_cells=tile_cells,
+        )
+        assert uniform is not None and adaptive is not None
+        return uniform, adaptive
+
+    @pytest.mark.parametrize("tile_cells", [1, 4, 7])
+    def test_matches_uniform_grid(self, tile_cells: int) -> None:
+        uniform, adaptive = self._both(tile_cells)
+        dense = adaptive.to_dense()
+        assert dense.shape == uniform.shape
+        assert np.array_equal(dense, uniform)
+
+    def test_refines_only_near_shadows(self) -> None:
+        # Low dawn/dusk shadows sweep most of a small plot, so the refined SET
+        # is large here; the per-sample raster work still shrinks.
+        _uniform, adaptive = self._both(4)
+        assert adaptive.refined
+        assert adaptive.refined_fraction < 1.0
+        samples = len(
+            daylight_samples(BERLIN_LAT, BERLIN_LON, date(2026, 6, 21), 60)
+        )
+        assert adaptive.rasterized_cells < samples * self.GRID.rows * self.GRID.cols
+
+    def test_consumable_as_dense_array(self) -> None:
+        uniform, adaptive = self._both(4)
+        assert np.asarray(adaptive).shape == (self.GRID.rows, self.GRID.cols)
+        assert np.array_equal(
+            sun_fraction(adaptive, 1000.0), sun_fraction(uniform, 1000.0)
+        )
+
+    def test_cancel_returns_none(self) -> None:
+        result = compute_heatmap_adaptive(
+            WALL_CASTERS, BERLIN_LAT, BERLIN_LON, date(2026, 6, 21),
+            POINT_GRID, point_rasterizer_reference, should_cancel=lambda: True,
+        )
+        assert result is None
@@ -0,0 +1,114 @@
+"""Unit tests for the memoizing shadow engine (Qt-free)."""
+
+from __future__ import annotations
+
+import pyclipper
+import pytest
+
+from open_garden_planner.core.shadow_engine import ShadowEngine
+from open_garden_planner.core.shadow_geometry import (
+    CLIPPER_SCALE,
+    compute_scene_shadows,
+)
+
+
+def _square(x: float, y: float, size: float = 100.0) -> list[tuple[float, float]]:
+    return [(x, y), (x + size, y), (x + size, y + size), (x, y + size)]
+
+
+def _area(polygons) -> float:
+    # Signed: CW holes subtract from CCW outers.
+    return sum(
+        pyclipper.Area([(round(px * CLIPPER_SCALE), round(py * CLIPPER_SCALE)) for px, py in p])
+        for p in polygons
+    ) / CLIPPER_SCALE**2
+
+
+def _entries(casters: dict[str, tuple[list[tuple[float, float]], float]], calls: list[str]):
+    def build(key: str):
+        calls.append(key)
+        return [casters[key]]
+
+    return [
+        (key, (tuple(casters[key][0]), casters[key][1]), lambda key=key: build(key))
+        for key in casters
+    ]
+
+
+# Two overlapping sheds and one far away: two union components.
+CASTERS = {
+    "a": (_square(0.0, 0.0), 200.0),
+    "b": (_square(80.0, 40.0), 250.0),
+    "far": (_square(5000.0, 5000.0), 150.0),
+}
+ELEVATION, AZIMUTH = 35.0, 160.0
+
+
+class TestEquivalence:
+    def test_matches_compute_scene_shadows(self) -> None:
+        engine = ShadowEngine(bucket_deg=1.0)
+        engine.sync(_entries(CASTERS, []))
+        got = engine.shadows(ELEVATION, AZIMUTH)
+        expected = compute_scene_shadows(CASTERS.values(), ELEVATION, AZIMUTH)
+        assert _area(got) == pytest.approx(_area(expected), rel=1e-6)
+        assert len(got) == len(expected) == 2
+
+    def test_night_is_empty(self) -> None:
+        engine = ShadowEngine()
+        engine.sync(_entries(CASTERS, []))
+        assert engine.shadows(-5.0, 180.0) == []
+
+
+class TestCaching:
+    def test_build_runs_only_for_new_or_revised_casters(self) -> None:
+        engine = ShadowEngine()
+        calls: list[str] = []
+        assert engine.sync(_entries(CASTERS, calls))
+        assert sorted(calls) == ["a", "b", "far"]
+        calls.clear()
+        assert not engine.sync(_entries(CASTERS, calls))
+        assert calls == []
+        moved = dict(CASTERS, far=(_square(5100.0, 5000.0), 150.0))
+        assert engine.sync(_entries(moved, calls))
+        assert calls == ["far"]
+
+    def test_revisiting_a_sun_position_is_a_cache_hit(self) -> None:
+        engine = ShadowEngine()
+        engine.sync(_entries(CASTERS, []))
+        first = engine.shadows(ELEVATION, AZIMUTH)
+        sweeps, unions = engine.sweeps_computed, engine.unions_computed
+        engine.shadows(ELEVATION + 10.0, AZIMUTH)
+        assert engine.shadows(ELEVATION, AZIMUTH) is first
+        assert engine.sweeps_computed == sweeps + 3
+        assert engine.unions_computed == unions + 2
+
+    def test_only_the_changed_component_is_reunioned(self) -> None:
+        engine = ShadowEngine()
+        engine.sync(_entries(CASTERS, []))
+        engine.shadows(ELEVATION, AZIMUTH)
+        sweeps, unions = engine.sweeps_computed, engine.unions_computed
+        taller = dict(CASTERS, far=(_square(5000.0, 5000.0), 300.0))
+        engine.sync(_entries(taller, []))
+        engine.shadows(ELEVATION, AZIMUTH)
+        assert engine.sweeps_computed == sweeps + 1
+        assert engine.unions_computed == unions + 1
+
+    def test_removed_caster_drops_its_shadow(self) -> None:
+        engine = ShadowEngine()
+        engine.sync(_entries(CASTERS, []))
+        assert len(engine.shadows(ELEVATION, AZIMUTH)) == 2
+        engine.sync(_entries({"far": CASTERS["far"]}, []))
+        assert len(engine.shadows(ELEVATION, AZIMUTH)) == 1
+
+    def test_buckets_are_lru_bounded(self) -> None:
+        engine = ShadowEngine(bucket_deg=1.0, max_buckets=2)
+        engine.sync(_entries(CASTERS, []))
+        engine.shadows(30.0, 100.0)
+        engine.shadows(31.0, 100.0)
+        engine.shadows(30.0, 100.0)  # refresh: 31° is now least recent
+        engine.shadows(32.0, 100.0)
+        sweeps = engine.sweeps_computed
+        engine.shadows(30.0, 100.0)
+        assert engine.sweeps_computed == sweeps
+        engine.shadows(31.0, 100.0)
+        assert engine.sweeps_computed == sweeps + 3
@@ -0,0 +1,149 @@
+"""Tests for the fuzzy species name index (``services/species_search_index``)."""
+
+from __future__ import annotations
+
+import random
+import time
+
+import pytest
+
+from open_garden_planner.models.plant_data import PlantSpeciesData
+from open_garden_planner.services.plant_api.cache import plant_api_cache
+from open_garden_planner.services.plant_library import PlantLibrary
+from open_garden_planner.services.species_search_index import (
+    SpeciesSearchIndex,
+    normalize_name,
+    species_search_index,
+)
+
+
+def _plant(common: str, scientific: str, family: str = "", source_id: str = "") -> PlantSpeciesData:
+    return PlantSpeciesData(
+        scientific_name=scientific,
+        common_name=common,
+        family=family,
+        data_source="custom",
+        source_id=source_id or common,
+    )
+
+
+@pytest.fixture()
+def index() -> SpeciesSearchIndex:
+    index = SpeciesSearchIndex()
+    for plant in (
+        _plant("Carrot", "Daucus carota", "Apiaceae"),
+        _plant("Wild Carrot", "Daucus carota subsp. carota", "Apiaceae"),
+        _plant("Tomato", "Solanum lycopersicum", "Solanaceae"),
+        _plant("Cherry Tomato", "Solanum lycopersicum var. cerasiforme", "Solanaceae"),
+        _plant("Potato", "Solanum tuberosum", "Solanaceae"),
+        _plant("Crème Brûlée Rose", "Rosa 'Creme Brulee'", "Rosaceae"),
+    ):
+        index.add(plant.source_id, plant)
+    return index
+
+
+def _names(plants: list[PlantSpeciesData]) -> list[str]:
+    return [p.common_name for p in plants]
+
+
+class TestSearch:
+    def test_ranks_exact_then_prefix_then_word_prefix(self, index) -> None:
+        assert _names(index.search("tomato")) == ["Tomato", "Cherry Tomato"]
+        assert _names(index.search("carrot"))[:2] == ["Carrot", "Wild Carrot"]
+
+    def test_typos_are_tolerated(self, index) -> None:
+        assert _names(index.search("carot"))[0] == "Carrot"
+        assert _names(index.search("tomatoe"))[0] == "Tomato"
+        assert _names(index.search("solanum tuberosom")) == ["Potato"]
+
+    def test_unrelated_query_matches_nothing(self, index) -> None:
+        assert index.search("mahachanok") == []
+        assert index.search("   ") == []
+
+    def test_every_substring_match_is_kept(self, index) -> None:
+        """From three characters on, the custom library's old ``in`` scan is a
+        subset of the index."""
+        for query in ("arr", "ato", "anaceae", "lyc"):
+            expected = {
+                p.common_name
+                for p in (entry.plant for entry in index._entries.values())
+                if any(query in normalize_name(n) for n in (p.common_name, p.scientific_name, p.family))
+            }
+            assert expected <= set(_names(index.search(query, limit=None))), query
+
+    def test_short_queries_match_word_starts(self, index) -> None:
+        assert _names(index.search("ca")) == ["Carrot", "Wild Carrot"]
+        assert _names(index.search("c"))[:3] == ["Carrot", "Cherry Tomato", "Crème Brûlée Rose"]
+        assert index.search("ar") == []
+
+    def test_family_matches_rank_below_names(self, index) -> None:
+        index.add("x", _plant("Solanaceae Hybrid", "Hybridus"))
+        assert _names(index.search("solanaceae"))[0] == "Solanaceae Hybrid"
+
+    def test_accents_and_case_are_ignored(self, index) -> None:
+        assert _names(index.search("CREME brulee")) == ["Crème Brûlée Rose"]
+
+    def test_update_and_discard(self, index) -> None:
+        index.add("Carrot", _plant("Parsnip", "Pastinaca sativa", source_id="Carrot"))
+        assert "Carrot" not in _names(index.search("carrot"))
+        assert _names(index.search("parsnip")) == ["Parsnip"]
+        index.discard("Carrot")
+        assert index.search("parsnip") == []
+        assert len(index) == 5
+
+
+class TestLibraryAndSharedIndex:
+    def test_library_search_follows_edits(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+        monkeypatch.setattr("sys.platform", "linux")
+        library = PlantLibrary()
+        plant_id = library.add_plant(_plant("Carrot", "Daucus carota", source_id=""))
+        assert _names(library.search_plants("carot")) == ["Carrot"]
+
+        library.update_plant(plant_id, _plant("Parsnip", "Pastinaca sativa"))
+        assert library.search_plants("carrot") == []
+        assert _names(library.search_plants("parsnip")) == ["Parsnip"]
+        library.remove_plant(plant_id)
+        assert library.search_plants("parsnip") == []
+
+    def test_shared_index_holds_bundled_and_cached_species(self) -> None:
+        index = species_search_index()
+        (carrot,) = [p for p in index.search("carrot") if p.data_source == "bundled"]
+        assert carrot.scientific_name == "Daucus carota"
+        # Aliases from plant_species.json are searchable too.
+        assert "Coriander" in _names(index.search("cilantro"))
+
+        fetched = PlantSpeciesData(
+            scientific_name="Mangifera indica", common_name="Mango",
+            data_source="trefle", source_id="123",
+        )
+        plant_api_cache().put_search("Trefle", "mango", 20, [fetched])
+        assert [(p.data_source, p.source_id) for p in index.search("mango")] == [("trefle", "123")]
+
+
+class TestBenchmark:
+    @pytest.mark.benchmark
+    def test_queries_over_thousands_of_species_take_under_a_millisecond(self) -> None:
+        """5,000 species — the bundled set plus a long-used API cache, many
+        times over — answered from memory in under a millisecond each."""
+        rng = random.Random(7)
+
+        def word() -> str:
+            return "".join(rng.choice("bcdfghklmnprstvz") + rng.choice("aeiou") for _ in range(rng.randint(2, 5)))
+
+        index = SpeciesSearchIndex()
+        names = []
+        for i in range(5_000):
+            names.append(f"{word().title()} {word()}")
+            index.add(str(i), _plant(names[-1], f"{word().title()} {word()}", f"{word().title()}aceae", str(i)))
+
+        # Typos (last letter wrong), prefixes, two-letter starts.
+        queries = [name.split()[0].lower()[:-1] + "x" for name in names[:20]]
+        queries += [name.split()[1][:4] for name in names[20:30]] + ["ca", "mo", "tomato"]
+        index.search("warm up")
+        started = time.perf_counter()
+        for _ in range(5):
+            for query in queries:
+                index.search(query)
+        per_query = (time.perf_counter() - started) / (5 * len(queries))
+        assert per_query < 1e-3, f"{per_query * 1e6:.0f} µs per query"
@@ -0,0 +1,103 @@
+"""Unit tests for the byte-bounded LRU sprite cache and mip-level sprites."""
+
+from __future__ import annotations
+
+import pytest
+from PyQt6.QtGui import QColor, QPixmap
+
+from open_garden_planner.core.furniture_renderer import (
+    clear_furniture_cache,
+    furniture_cache,
+    render_furniture_sprite,
+)
+from open_garden_planner.core.object_types import ObjectType
+from open_garden_planner.core.plant_renderer import (
+    clear_plant_cache,
+    plant_cache,
+    render_plant_sprite,
+)
+from open_garden_planner.core.sprite_cache import (
+    MAX_MIP_PX,
+    MIN_MIP_PX,
+    SpriteCache,
+    mip_size,
+)
+
+
+class TestMipSize:
+    @pytest.mark.parametrize(
+        ("device_px", "expected"),
+        [(1.0, MIN_MIP_PX), (16.0, 16), (17.0, 32), (100.0, 128), (128.0, 128),
+         (3000.0, MAX_MIP_PX), (1e9, MAX_MIP_PX), (float("inf"), MAX_MIP_PX)],
+    )
+    def test_rounds_up_to_power_of_two(self, device_px: float, expected: int) -> None:
+        assert mip_size(device_px) == expected
+
+
+class TestSpriteCache:
+    def test_lru_eviction_by_bytes(self, qtbot: object) -> None:
+        cache = SpriteCache(max_bytes=3 * 32 * 32 * 4)
+        for key in ("a", "b", "c"):
+            cache.put(key, QPixmap(32, 32))
+        assert cache.get("a") is not None  # refresh: "b" is now least recent
+        cache.put("d", QPixmap(32, 32))
+        assert "b" not in cache
+        assert all(key in cache for key in ("a", "c", "d"))
+        assert cache.evictions == 1
+        assert cache.nbytes <= cache.max_bytes
+
+    def test_large_sprite_evicts_several_small_ones(self, qtbot: object) -> None:
+        cache = SpriteCache(max_bytes=64 * 64 * 4)
+        for key in range(4):
+            cache.put(key, QPixmap(32, 32))
+        cache.put("big", QPixmap(64, 64))
+        assert len(cache) == 1
+        assert cache.evictions == 4
+
+    def test_counters(self, qtbot: object) -> None:
+        cache = SpriteCache(max_bytes=1 << 20)
+        assert cache.get("x") is None
+        cache.put("x", QPixmap(8, 8))
+        assert cache.get("x") is not None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_clear_resets_the_counters(self, qtbot: object) -> None:
+        cache = SpriteCache(max_bytes=8 * 8 * 4)
+        cache.get("x")
+        cache.put("x", QPixmap(8, 8))
+        cache.put("y", QPixmap(8, 8))
+        cache.get("y")
+        cache.clear()
+        assert (len(cache), cache.nbytes) == (0, 0)
+        assert (cache.hits, cache.misses, cache.evictions) == (0, 0, 0)
+
+    def test_plant_budget_holds_several_largest_sprites(self) -> None:
+        assert plant_cache().max_bytes >= 4 * MAX_MIP_PX * MAX_MIP_PX * 4
+
+
+class TestMipSprites:
+    def test_nearby_diameters_share_one_plant_sprite(self, qtbot: object) -> None:
+        clear_plant_cache()
+        tint = QColor(80, 160, 60)
+        first = render_plant_sprite(ObjectType.TREE, 90.0, species="rose", tint_color=tint)
+        misses = plant_cache().misses
+        for device_px in (70.0, 100.0, 128.0):
+            assert render_plant_sprite(
+                ObjectType.TREE, device_px, species="rose", tint_color=tint
+            ) is first
+        assert plant_cache().misses == misses
+        assert first.width() == first.height() == 128
+
+    def test_zooming_past_a_level_renders_the_next_one(self, qtbot: object) -> None:
+        clear_plant_cache()
+        small = render_plant_sprite(ObjectType.TREE, 100.0)
+        large = render_plant_sprite(ObjectType.TREE, 200.0)
+        assert (small.width(), large.width()) == (128, 256)
+
+    def test_furniture_axes_round_independently(self, qtbot: object) -> None:
+        clear_furniture_cache()
+        bench = render_furniture_sprite(ObjectType.BENCH, 180.0, 60.0)
+        assert (bench.width(), bench.height()) == (256, 64)
+        hits = furniture_cache().hits
+        assert render_furniture_sprite(ObjectType.BENCH, 200.0, 50.0) is bench
+        assert furniture_cache().hits == hits + 1
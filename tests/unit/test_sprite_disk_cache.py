@@ -0,0 +1,124 @@
+"""Unit tests for the on-disk sprite/thumbnail cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from PyQt6.QtGui import QColor, QImage
+
+from open_garden_planner.core import plant_renderer, sprite_disk_cache
+from open_garden_planner.core.object_types import ObjectType
+from open_garden_planner.core.sprite_disk_cache import FORMAT_VERSION, DiskSpriteCache
+
+_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 10 10">'
+    '<circle cx="5" cy="5" r="4" fill="{}"/></svg>'
+)
+
+
+def _svg(tmp_path: Path, name: str = "a.svg", fill: str = "green") -> Path:
+    path = tmp_path / name
+    path.write_text(_SVG.format(fill))
+    return path
+
+
+def _image(size: int, color: str = "red") -> QImage:
+    image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(QColor(color))
+    return image
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> DiskSpriteCache:
+    return DiskSpriteCache(tmp_path / "cache")
+
+
+class TestDiskSpriteCache:
+    def test_round_trip(self, cache: DiskSpriteCache, tmp_path: Path) -> None:
+        svg = _svg(tmp_path)
+        assert cache.load(svg, 32, 32, "plant") is None
+        cache.store(svg, 32, 32, "plant", _image(32))
+        loaded = cache.load(svg, 32, 32, "plant")
+        assert loaded is not None
+        assert loaded.pixelColor(5, 5) == QColor("red")
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_key_is_size_tint_and_variant(self, cache: DiskSpriteCache, tmp_path: Path) -> None:
+        svg = _svg(tmp_path)
+        cache.store(svg, 32, 32, "plant", _image(32))
+        assert cache.load(svg, 64, 64, "plant") is None
+        assert cache.load(svg, 32, 32, "thumb") is None
+        assert cache.load(svg, 32, 32, "plant", tint=0xFF00FF00) is None
+
+    def test_keyed_by_content_not_path(self, cache: DiskSpriteCache, tmp_path: Path) -> None:
+        svg = _svg(tmp_path)
+        cache.store(svg, 16, 16, "plant", _image(16))
+        twin = _svg(tmp_path, "copy.svg")
+        assert cache.load(twin, 16, 16, "plant") is not None
+        svg.write_text(_SVG.format("blue") + " ")  # content (and size) changed
+        assert cache.load(svg, 16, 16, "plant") is None
+
+    def test_survives_a_new_instance(self, cache: DiskSpriteCache, tmp_path: Path) -> None:
+        svg = _svg(tmp_path)
+        cache.store(svg, 16, 16, "furniture", _image(16))
+        assert DiskSpriteCache(cache.root).load(svg, 16, 16, "furniture") is not None
+
+    def test_overwrite_does_not_inflate_the_byte_count(
+        self, cache: DiskSpriteCache, tmp_path: Path
+    ) -> None:
+        svg = _svg(tmp_path)
+        for color in ("red", "blue", "red"):
+            cache.store(svg, 32, 32, "plant", _image(32, color))
+        on_disk = sum(f.stat().st_size for f in cache.root.rglob("*.png"))
+        assert cache.nbytes == on_disk
+
+    def test_prune_drops_least_recently_used(self, cache: DiskSpriteCache, tmp_path: Path) -> None:
+        svgs = [_svg(tmp_path, f"{i}.svg", f"#00000{i}") for i in range(3)]
+        for svg in svgs:
+            cache.store(svg, 64, 64, "plant", _image(64))
+        files = sorted((cache.root / f"v{FORMAT_VERSION}").rglob("*.png"))
+        for age, file in enumerate(files):
+            os.utime(file, (1_000_000 + age, 1_000_000 + age))
+        # Loading the oldest makes it the most recently used.
+        oldest = min(svgs, key=lambda s: cache._file(s, 64, 64, "plant", 0).stat().st_mtime)
+        assert cache.load(oldest, 64, 64, "plant") is not None
+        cache.prune(target_bytes=cache.nbytes - 1)
+        assert cache.pruned == 1
+        assert cache.load(oldest, 64, 64, "plant") is not None
+
+    def test_old_format_versions_are_removed(self, cache: DiskSpriteCache) -> None:
+        stale = cache.root / "v0" / "ab"
+        stale.mkdir(parents=True)
+        (stale / "x.png").write_bytes(b"old")
+        cache.prune()
+        assert not (cache.root / "v0").exists()
+
+    def test_corrupt_file_is_a_miss(self, cache: DiskSpriteCache, tmp_path: Path) -> None:
+        svg = _svg(tmp_path)
+        cache.store(svg, 16, 16, "plant", _image(16))
+        file = cache._file(svg, 16, 16, "plant", 0)
+        file.write_bytes(b"not a png")
+        assert cache.load(svg, 16, 16, "plant") is None
+        assert not file.exists()
+
+
+class TestRendererIntegration:
+    def test_plant_sprite_reloads_from_disk_after_restart(self, qtbot) -> None:
+        # The shared disk cache is empty: conftest gives each test its own
+        # app cache directory.
+        try:
+            plant_renderer.clear_plant_cache()
+            first = plant_renderer.render_plant_sprite(ObjectType.TREE, 60.0)
+            disk = sprite_disk_cache.disk_sprite_cache()
+            assert first is not None and disk is not None
+            assert disk.misses == 1 and disk.nbytes > 0
+
+            plant_renderer.clear_plant_cache()  # a "new launch"
+            again = plant_renderer.render_plant_sprite(ObjectType.TREE, 60.0)
+            assert again is not None
+            assert disk.hits == 1
+            assert again.toImage() == first.toImage()
+        finally:
+            plant_renderer.clear_plant_cache()
@@ -0,0 +1,122 @@
+"""Startup import budget and the ``--profile-startup`` profiler."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+from PyQt6.QtWidgets import QLabel
+
+from open_garden_planner.startup_profile import (
+    DEFERRED_MODULES,
+    IMPORT_BUDGET_S,
+    StartupProfiler,
+)
+
+_COLD_START = textwrap.dedent(
+    """
+    import json, sys, time
+
+    started = time.perf_counter()
+    import open_garden_planner.app.application as application
+    seconds = time.perf_counter() - started
+
+    from open_garden_planner.startup_profile import DEFERRED_MODULES
+    after_import = [m for m in DEFERRED_MODULES if m in sys.modules]
+
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication([])
+    window = application.GardenPlannerApp()
+    after_window = [m for m in DEFERRED_MODULES if m in sys.modules]
+    print(json.dumps({
+        "seconds": seconds, "after_import": after_import, "after_window": after_window,
+    }))
+    """
+)
+
+
+@pytest.fixture(scope="module")
+def cold_start(tmp_path_factory) -> dict:
+    """Import and build the main window in a fresh interpreter."""
+    home = tmp_path_factory.mktemp("cold_start")
+    src = Path(__file__).resolve().parents[2] / "src"
+    env = dict(
+        os.environ,
+        PYTHONPATH=os.pathsep.join(filter(None, [str(src), os.environ.get("PYTHONPATH")])),
+        QT_QPA_PLATFORM="offscreen",
+        XDG_CONFIG_HOME=str(home),
+        XDG_DATA_HOME=str(home),
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", _COLD_START],
+        capture_output=True, text=True, env=env, timeout=120, check=False,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestStartupBudget:
+    @pytest.mark.benchmark
+    def test_main_window_imports_within_budget(self, cold_start) -> None:
+        assert cold_start["seconds"] < IMPORT_BUDGET_S, (
+            f"cold import took {cold_start['seconds']:.2f} s; "
+            "run with --profile-startup to see where it went"
+        )
+
+    def test_heavy_subsystems_stay_off_the_startup_path(self, cold_start) -> None:
+        assert cold_start["after_import"] == []
+        assert cold_start["after_window"] == []
+
+
+class TestProfiler:
+    def test_times_imports_with_and_without_their_children(self, tmp_path, monkeypatch) -> None:
+        pkg = tmp_path / "ogp_profiled"
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text("import time\ntime.sleep(0.02)\nfrom . import child\n")
+        (pkg / "child.py").write_text("import time\ntime.sleep(0.1)\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        profiler = StartupProfiler()
+        profiler.install()
+        try:
+            import ogp_profiled  # noqa: F401
+        finally:
+            profiler.uninstall()
+            for name in ("ogp_profiled.child", "ogp_profiled"):
+                sys.modules.pop(name, None)
+        profiler.mark("imports")
+
+        timings = {t.name: t for t in profiler.imports}
+        parent, child = timings["ogp_profiled"], timings["ogp_profiled.child"]
+        assert child.self_s >= 0.1 and child.cumulative_s == child.self_s
+        assert 0.02 <= parent.self_s < 0.08
+        assert parent.cumulative_s >= parent.self_s + child.cumulative_s - 1e-6
+        report = profiler.report()
+        assert "imports" in report and "ogp_profiled.child" in report
+
+    def test_reports_after_the_first_paint(self, qtbot) -> None:
+        window = QLabel("garden")
+        qtbot.addWidget(window)
+        reports: list[str] = []
+        profiler = StartupProfiler()
+        profiler.report_after_first_paint(window, reports.append)
+        window.show()
+        qtbot.waitUntil(lambda: bool(reports), timeout=5_000)
+
+        phases = [phase for phase, _at in profiler.marks]
+        assert phases == ["first paint", "first frame"]
+        assert "first frame" in reports[0]
+
+
+def test_deferred_modules_are_real_modules() -> None:
+    """A typo in DEFERRED_MODULES would make the startup check vacuous."""
+    import importlib.util
+
+    for name in DEFERRED_MODULES:
+        if name.startswith("open_garden_planner"):
+            assert importlib.util.find_spec(name) is not None, name
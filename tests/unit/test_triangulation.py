@@ -0,0 +1,71 @@
+"""Unit tests for the z-order ear clipper (Qt-free)."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from open_garden_planner.core.triangulation import ZORDER_MIN_VERTICES, triangulate
+
+SQUARE = [(0.0, 0.0), (100.0, 0.0), (100.0, 100.0), (0.0, 100.0)]
+HOLE = [(25.0, 25.0), (75.0, 25.0), (75.0, 75.0), (25.0, 75.0)]
+
+
+def _signed(a, b, c) -> float:
+    return ((b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])) / 2.0
+
+
+def _ring_area(ring) -> float:
+    return sum(
+        _signed((0.0, 0.0), ring[i], ring[(i + 1) % len(ring)])
+        for i in range(len(ring))
+    )
+
+
+def _wavy_ring(n: int) -> list[tuple[float, float]]:
+    """A concave 'flower' bed with ``n`` vertices."""
+    return [
+        (
+            (100.0 + 40.0 * math.sin(14.0 * math.pi * k / n)) * math.cos(2.0 * math.pi * k / n),
+            (100.0 + 40.0 * math.sin(14.0 * math.pi * k / n)) * math.sin(2.0 * math.pi * k / n),
+        )
+        for k in range(n)
+    ]
+
+
+class TestTriangulate:
+    def test_triangles_are_ccw_and_cover_the_area(self) -> None:
+        for ring in (SQUARE, list(reversed(SQUARE))):
+            triangles = triangulate(ring)
+            assert len(triangles) == 2
+            areas = [_signed(ring[i], ring[j], ring[k]) for i, j, k in triangles]
+            assert all(a > 0 for a in areas)
+            assert sum(areas) == pytest.approx(10000.0)
+
+    def test_hole_is_excluded(self) -> None:
+        for hole in (HOLE, list(reversed(HOLE))):
+            triangles = triangulate(SQUARE, [hole])
+            points = SQUARE + hole
+            area = sum(_signed(points[i], points[j], points[k]) for i, j, k in triangles)
+            assert area == pytest.approx(10000.0 - 2500.0)
+            # Indices address the concatenated outer + hole vertices.
+            assert {i for t in triangles for i in t} == set(range(8))
+
+    @pytest.mark.parametrize("n", [ZORDER_MIN_VERTICES // 2, 2000])
+    def test_many_vertex_concave_ring(self, n: int) -> None:
+        ring = _wavy_ring(n)
+        triangles = triangulate(ring)
+        assert len(triangles) == n - 2
+        area = sum(_signed(ring[i], ring[j], ring[k]) for i, j, k in triangles)
+        assert area == pytest.approx(_ring_area(ring))
+
+    def test_duplicate_and_collinear_points_are_tolerated(self) -> None:
+        ring = [(0.0, 0.0), (50.0, 0.0), (50.0, 0.0), (100.0, 0.0), (100.0, 100.0), (0.0, 100.0)]
+        triangles = triangulate(ring)
+        area = sum(_signed(ring[i], ring[j], ring[k]) for i, j, k in triangles)
+        assert area == pytest.approx(10000.0)
+
+    def test_degenerate_returns_empty(self) -> None:
+        assert triangulate([(0.0, 0.0), (1.0, 1.0)]) == []
+        assert triangulate([(0.0, 0.0), (1.0, 1.0), (2.0, 2.0)]) == []
@@ -10,11 +10,11 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from open_garden_planner.services.site_data_cache import SiteDataCache
 from open_garden_planner.services.weather_service import (
     DayForecast,
     WeatherForecast,
     WeatherService,
-    WeatherServiceError,
     _wmo_to_description,
     wmo_to_icon,
 )
@@ -37,13 +37,27 @@ SAMPLE_API_RESPONSE = {
 # ─── Fixtures ─────────────────────────────────────────────────────────────────
 
 @pytest.fixture()
-def svc() -> WeatherService:
-    return WeatherService()
+def store(tmp_path: Path) -> SiteDataCache:
+    return SiteDataCache(tmp_path / "site_data.sqlite3")
 
 
 @pytest.fixture()
-def tmp_cache_dir(tmp_path: Path) -> Path:
-    return tmp_path
+def svc(store: SiteDataCache) -> WeatherService:
+    return WeatherService(cache=store)
+
+
+def _seed(store: SiteDataCache, forecast: WeatherForecast) -> None:
+    """Store ``forecast`` for (52.5, 13.4), aged from its ``fetched_at``."""
+    stored_at = datetime.fromisoformat(forecast.fetched_at).timestamp()
+    store.put("forecast", "52.5000_13.4000", forecast.to_dict(), stored_at=stored_at)
+
+
+def _api_response(body: bytes) -> MagicMock:
+    mock_response = MagicMock()
+    mock_response.__enter__ = MagicMock(return_value=mock_response)
+    mock_response.__exit__ = MagicMock(return_value=False)
+    mock_response.read.return_value = body
+    return mock_response
 
 
 # ─── WMO code mapping tests ───────────────────────────────────────────────────
@@ -123,151 +137,88 @@ class TestParseResponse:
         assert parsed.tzinfo is not None
 
 
-# ─── Cache tests ──────────────────────────────────────────────────────────────
-
-class TestCache:
-    def test_save_and_load_cache(self, svc: WeatherService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setattr(
-            "open_garden_planner.services.weather_service.get_app_data_dir",
-            lambda: tmp_path,
-        )
-
-        forecast = WeatherForecast(
-            days=[
-                DayForecast(date="2024-06-01", max_c=20.0, min_c=10.0, precipitation_mm=0.0, weathercode=0),
-            ],
-            fetched_at=datetime.now(UTC).isoformat(),
-        )
-
-        svc._save_cache(52.5, 13.4, forecast)
-        loaded = svc._load_cache(52.5, 13.4)
-
-        assert loaded is not None
-        assert len(loaded.days) == 1
-        assert loaded.days[0].max_c == 20.0
-
-    def test_stale_cache_returns_none(self, svc: WeatherService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setattr(
-            "open_garden_planner.services.weather_service.get_app_data_dir",
-            lambda: tmp_path,
-        )
-
-        old_time = datetime.now(UTC) - timedelta(hours=4)
-        forecast = WeatherForecast(
-            days=[DayForecast(date="2024-06-01", max_c=20.0, min_c=10.0, precipitation_mm=0.0, weathercode=0)],
-            fetched_at=old_time.isoformat(),
-        )
-
-        svc._save_cache(52.5, 13.4, forecast)
-        loaded = svc._load_cache(52.5, 13.4)
-        assert loaded is None
-
-    def test_missing_cache_returns_none(self, svc: WeatherService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setattr(
-            "open_garden_planner.services.weather_service.get_app_data_dir",
-            lambda: tmp_path,
-        )
-        loaded = svc._load_cache(0.0, 0.0)
-        assert loaded is None
-
-    def test_corrupt_cache_returns_none(self, svc: WeatherService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setattr(
-            "open_garden_planner.services.weather_service.get_app_data_dir",
-            lambda: tmp_path,
-        )
-        cache_path = tmp_path / "weather_cache_0.0000_0.0000.json"
-        cache_path.write_text("not json", encoding="utf-8")
-        loaded = svc._load_cache(0.0, 0.0)
-        assert loaded is None
+# ─── Cache tests (through fetch_forecast) ─────────────────────────────────────
 
+def _forecast(max_c: float, age: timedelta) -> WeatherForecast:
+    return WeatherForecast(
+        days=[DayForecast(date="2024-06-01", max_c=max_c, min_c=10.0, precipitation_mm=0.0, weathercode=0)],
+        fetched_at=(datetime.now(UTC) - age).isoformat(),
+    )
 
-# ─── API fetch tests ──────────────────────────────────────────────────────────
 
-class TestFetchFromApi:
-    def test_successful_fetch(self, svc: WeatherService) -> None:
-        mock_response = MagicMock()
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
-        mock_response.read.return_value = json.dumps(SAMPLE_API_RESPONSE).encode()
-
-        with patch("urllib.request.urlopen", return_value=mock_response):
-            result = svc._fetch_from_api(52.5, 13.4)
-
-        assert len(result.days) == 3
-        assert result.days[0].date == "2024-06-01"
-
-    def test_network_error_raises(self, svc: WeatherService) -> None:
-        with (patch("urllib.request.urlopen", side_effect=urllib.error.URLError("Network error")),
-              pytest.raises(WeatherServiceError)):
-            svc._fetch_from_api(52.5, 13.4)
+class TestCache:
+    def test_fresh_cache_is_used_without_a_request(
+        self, svc: WeatherService, store: SiteDataCache
+    ) -> None:
+        _seed(store, _forecast(20.0, timedelta(0)))
 
-    def test_invalid_json_raises(self, svc: WeatherService) -> None:
-        mock_response = MagicMock()
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
-        mock_response.read.return_value = b"invalid json"
+        with patch("urllib.request.urlopen") as mock_urlopen:
+            result = svc.fetch_forecast(52.5, 13.4)
+            mock_urlopen.assert_not_called()
 
-        with (patch("urllib.request.urlopen", return_value=mock_response),
-              pytest.raises(WeatherServiceError)):
-            svc._fetch_from_api(52.5, 13.4)
+        assert result is not None
+        assert result.days[0].max_c == 20.0
 
+    def test_stale_cache_is_refetched(self, svc: WeatherService, store: SiteDataCache) -> None:
+        _seed(store, _forecast(10.0, timedelta(hours=4)))
 
-# ─── Integration: fetch_forecast ──────────────────────────────────────────────
+        with patch(
+            "urllib.request.urlopen",
+            return_value=_api_response(json.dumps(SAMPLE_API_RESPONSE).encode()),
+        ):
+            result = svc.fetch_forecast(52.5, 13.4)
 
-class TestFetchForecast:
-    def test_uses_cache_when_fresh(self, svc: WeatherService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setattr(
-            "open_garden_planner.services.weather_service.get_app_data_dir",
-            lambda: tmp_path,
-        )
+        assert result is not None
+        assert result.days[0].max_c == 22.5
 
-        cached = WeatherForecast(
-            days=[DayForecast(date="2024-06-01", max_c=20.0, min_c=10.0, precipitation_mm=0.0, weathercode=0)],
-            fetched_at=datetime.now(UTC).isoformat(),
-        )
-        svc._save_cache(52.5, 13.4, cached)
+    def test_fetched_forecast_is_stored(self, svc: WeatherService, store: SiteDataCache) -> None:
+        with patch(
+            "urllib.request.urlopen",
+            return_value=_api_response(json.dumps(SAMPLE_API_RESPONSE).encode()),
+        ):
+            svc.fetch_forecast(52.5, 13.4)
 
         with patch("urllib.request.urlopen") as mock_urlopen:
-            result = svc.fetch_forecast(52.5, 13.4)
+            result = WeatherService(cache=store).fetch_forecast(52.5, 13.4)
             mock_urlopen.assert_not_called()
-
         assert result is not None
-        assert result.days[0].max_c == 20.0
+        assert len(result.days) == 3
 
-    def test_fetches_when_cache_stale(self, svc: WeatherService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setattr(
-            "open_garden_planner.services.weather_service.get_app_data_dir",
-            lambda: tmp_path,
-        )
+    def test_corrupt_cache_returns_none(self, svc: WeatherService, store: SiteDataCache) -> None:
+        store.put("forecast", "0.0000_0.0000", "not a forecast")
+        with patch("urllib.request.urlopen") as mock_urlopen:
+            assert svc.fetch_forecast(0.0, 0.0) is None
+            mock_urlopen.assert_not_called()
 
-        old = datetime.now(UTC) - timedelta(hours=4)
-        stale = WeatherForecast(
-            days=[DayForecast(date="2024-06-01", max_c=10.0, min_c=5.0, precipitation_mm=0.0, weathercode=0)],
-            fetched_at=old.isoformat(),
-        )
-        svc._save_cache(52.5, 13.4, stale)
 
-        mock_response = MagicMock()
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
-        mock_response.read.return_value = json.dumps(SAMPLE_API_RESPONSE).encode()
+# ─── API fetch tests ──────────────────────────────────────────────────────────
 
-        with patch("urllib.request.urlopen", return_value=mock_response):
+class TestFetchForecast:
+    def test_successful_fetch(self, svc: WeatherService) -> None:
+        with patch(
+            "urllib.request.urlopen",
+            return_value=_api_response(json.dumps(SAMPLE_API_RESPONSE).encode()),
+        ):
             result = svc.fetch_forecast(52.5, 13.4)
 
         assert result is not None
-        assert result.days[0].max_c == 22.5
-
-    def test_returns_none_on_complete_failure(self, svc: WeatherService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setattr(
-            "open_garden_planner.services.weather_service.get_app_data_dir",
-            lambda: tmp_path,
-        )
+        assert len(result.days) == 3
+        assert result.days[0].date == "2024-06-01"
 
+    def test_network_error_returns_none(self, svc: WeatherService) -> None:
         with patch("urllib.request.urlopen", side_effect=urllib.error.URLError("offline")):
-            result = svc.fetch_forecast(52.5, 13.4)
+            assert svc.fetch_forecast(52.5, 13.4) is None
+
+    def test_invalid_json_returns_none(self, svc: WeatherService) -> None:
+        with patch("urllib.request.urlopen", return_value=_api_response(b"invalid json")):
+            assert svc.fetch_forecast(52.5, 13.4) is None
 
-        assert result is None
+    def test_failed_fetch_leaves_nothing_cached(
+        self, svc: WeatherService, store: SiteDataCache
+    ) -> None:
+        with patch("urllib.request.urlopen", side_effect=urllib.error.URLError("offline")):
+            svc.fetch_forecast(52.5, 13.4)
+        assert store.get("forecast", "52.5000_13.4000") is None
 
 
 # ─── Dataclass serialization ──────────────────────────────────────────────────